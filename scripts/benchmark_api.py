@@ -0,0 +1,132 @@
+"""Load-test the threading and asyncio API front ends against the same stub agent."""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import requests
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from seven import config  # noqa: E402
+from seven.ui import api_server  # noqa: E402
+
+
+class StubTools:
+    def names(self):
+        return ["stub"]
+
+
+class StubAgent:
+    """Constant-time agent so the numbers measure HTTP handling, not the LLM."""
+
+    tools = StubTools()
+
+    def handle(self, message, on_event=None, cancel=None):
+        return "ok:" + message
+
+    def start_heartbeat(self):
+        pass
+
+    def shutdown(self):
+        pass
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))] if ordered else 0.0
+
+
+def load(base: str, token: str, clients: int, requests_per_client: int) -> dict:
+    headers = {"Authorization": f"Bearer {token}"}
+
+    def client(_):
+        session = requests.Session()
+        latencies = []
+        for i in range(requests_per_client):
+            started = time.perf_counter()
+            if i % 2:
+                response = session.post(base + "/chat", headers=headers, json={"message": str(i)}, timeout=10)
+            else:
+                response = session.get(base + "/tools", headers=headers, timeout=10)
+            response.raise_for_status()
+            latencies.append((time.perf_counter() - started) * 1000)
+        session.close()
+        return latencies
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        latencies = [ms for batch in pool.map(client, range(clients)) for ms in batch]
+    elapsed = time.perf_counter() - started
+    return {
+        "requests": len(latencies),
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies), 2),
+        "p99_ms": round(_percentile(latencies, 0.99), 2),
+    }
+
+
+def idle(port: int, base: str, connections: int) -> dict:
+    """Hold many idle sockets open, then time one health request past them."""
+    threads_before = threading.active_count()
+    sockets = []
+    try:
+        for _ in range(connections):
+            sockets.append(socket.create_connection(("127.0.0.1", port), timeout=5))
+        time.sleep(0.5)
+        started = time.perf_counter()
+        ok = requests.get(base + "/health", timeout=10).status_code == 200
+        return {
+            "idle_connections": connections,
+            "health_ok": ok,
+            "health_ms": round((time.perf_counter() - started) * 1000, 2),
+            "server_threads": threading.active_count() - threads_before,
+        }
+    finally:
+        for sock in sockets:
+            sock.close()
+
+
+def benchmark(clients: int = 16, requests_per_client: int = 200, idle_connections: int = 500) -> dict:
+    report = {}
+    with tempfile.TemporaryDirectory(prefix="seven-api-bench-") as data_dir:
+        config.DATA_DIR = Path(data_dir)
+        os.environ.pop("SEVEN_API_TOKEN", None)
+        config.API_MAX_CONCURRENT_REQUESTS = max(config.API_MAX_CONCURRENT_REQUESTS, clients)
+        for backend in ("threading", "asyncio"):
+            server = api_server.start_api_server(port=0, agent=StubAgent(), backend=backend)
+            port = server.server_address[1]
+            base = f"http://127.0.0.1:{port}"
+            try:
+                report[backend] = {
+                    "load": load(base, server.seven_api_token, clients, requests_per_client),
+                    "idle": idle(port, base, idle_connections),
+                }
+            finally:
+                server.shutdown_cleanly()
+    report["speedup_rps"] = round(report["asyncio"]["load"]["rps"] / max(1e-9, report["threading"]["load"]["rps"]), 2)
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=200, help="requests per client")
+    parser.add_argument("--idle", type=int, default=500, help="idle connections to hold open")
+    args = parser.parse_args()
+    print(json.dumps(benchmark(args.clients, args.requests, args.idle), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,118 @@
+"""Compare browser_get page-text latency with a cold browser per call against the warm pool, using a local HTTP server."""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from seven.runtime.browser_pool import BrowserPool  # noqa: E402
+
+
+def make_page(images: int) -> bytes:
+    """An article with images and a web font, so blocking heavy resources has something to skip."""
+    imgs = "".join(f'<img src="/img/{i}.png" width="64" height="64">' for i in range(images))
+    paras = "".join(f"<p>Paragraph {i} of the benchmark article.</p>" for i in range(200))
+    return (
+        "<html><head><title>Bench</title><style>@font-face{font-family:b;src:url(/font.woff2)}"
+        f"body{{font-family:b}}</style></head><body><h1>Benchmark</h1>{imgs}{paras}</body></html>"
+    ).encode("utf-8")
+
+
+def serve(page: bytes, asset_ms: float):
+    counts = {"assets": 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            body, kind = page, "text/html; charset=utf-8"
+            if self.path != "/":
+                counts["assets"] += 1
+                time.sleep(asset_ms / 1000)
+                body, kind = b"\0" * 20_000, "application/octet-stream"
+            self.send_response(200)
+            self.send_header("Content-Type", kind)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd, f"http://127.0.0.1:{httpd.server_address[1]}/", counts
+
+
+def cold_get(url: str) -> str:
+    """browser_get before the pool: start Playwright and Chromium, read one page, close everything."""
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        page = browser.new_page()
+        page.goto(url, timeout=30000, wait_until="domcontentloaded")
+        text = page.inner_text("body")
+        browser.close()
+        return text
+
+
+def _summary(samples: list) -> dict:
+    return {
+        "first_ms": round(samples[0], 1),
+        "median_ms": round(statistics.median(samples), 1),
+        "median_after_first_ms": round(statistics.median(samples[1:] or samples), 1),
+    }
+
+
+def _measure(func, count: int, counts: dict) -> dict:
+    samples, before = [], counts["assets"]
+    for _ in range(count):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {**_summary(samples), "asset_requests": counts["assets"] - before}
+
+
+def benchmark(count: int, images: int, asset_ms: float) -> dict:
+    httpd, url, counts = serve(make_page(images), asset_ms)
+
+    async def read(page):
+        await page.goto(url, timeout=30000, wait_until="domcontentloaded")
+        return await page.inner_text("body")
+
+    report: dict = {"pages": count, "images": images, "asset_ms": asset_ms}
+    try:
+        report["cold_browser_per_call"] = _measure(lambda: cold_get(url), count, counts)
+        for name, block in (("warm_pool", False), ("warm_pool_blocking_heavy", True)):
+            pool = BrowserPool(size=2, pages_per_context=50, idle_seconds=0, max_rss_mb=0)
+            try:
+                report[name] = _measure(lambda: pool.run(read, block_heavy=block), count, counts)
+            finally:
+                pool.close()
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--images", type=int, default=20, help="images on the page")
+    parser.add_argument("--asset-ms", type=float, default=20.0, help="server delay per image/font request")
+    args = parser.parse_args()
+    print(json.dumps(benchmark(args.pages, args.images, args.asset_ms), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,58 @@
+"""Webcam capture latency: opening the device per capture versus a camera session."""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from seven.sensors import camera_session  # noqa: E402
+from seven.sensors.camera import capture_frame, list_cameras  # noqa: E402
+
+
+def timed_captures(index: int, count: int, out: Path) -> list:
+    times = []
+    for _ in range(count):
+        started = time.perf_counter()
+        ok, msg = capture_frame(path=str(out), camera_index=index)
+        if not ok:
+            raise SystemExit(msg)
+        times.append((time.perf_counter() - started) * 1000)
+    return times
+
+
+def summary(times: list) -> dict:
+    return {"first_ms": round(times[0], 1), "median_ms": round(statistics.median(times), 1), "max_ms": round(max(times), 1)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--camera", type=int, default=0)
+    parser.add_argument("--captures", type=int, default=10)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    cameras = list_cameras()
+    report = {"list_cameras_ms": round((time.perf_counter() - started) * 1000, 1), "cameras": cameras}
+    with tempfile.TemporaryDirectory() as tmp:
+        out = Path(tmp) / "frame.jpg"
+        report["per_capture_open"] = summary(timed_captures(args.camera, args.captures, out))
+        started = time.perf_counter()
+        camera_session.start_session(camera_index=args.camera, seconds=120)
+        report["session_start_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        try:
+            report["session"] = summary(timed_captures(args.camera, args.captures, out))
+        finally:
+            camera_session.stop_session()
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,125 @@
+"""Time read_document on a generated many-page PDF and a large XLSX: cold, windowed and cached reads."""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+import zipfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from seven import config  # noqa: E402
+from seven.tools import documents  # noqa: E402
+
+
+def make_pdf(path: Path, pages: int, lines: int) -> None:
+    from pypdf import PdfWriter
+    from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+    writer = PdfWriter()
+    font = DictionaryObject({
+        NameObject("/Type"): NameObject("/Font"),
+        NameObject("/Subtype"): NameObject("/Type1"),
+        NameObject("/BaseFont"): NameObject("/Helvetica"),
+    })
+    resources = DictionaryObject({NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})})
+    for number in range(1, pages + 1):
+        page = writer.add_blank_page(width=612, height=792)
+        ops = ["BT /F1 9 Tf 40 760 Td 11 TL"]
+        ops += [f"(Page {number} line {line}: quarterly figures and commentary for the benchmark.) '" for line in range(lines)]
+        content = DecodedStreamObject()
+        content.set_data(("\n".join(ops) + "\nET").encode("ascii"))
+        page[NameObject("/Contents")] = writer._add_object(content)
+        page[NameObject("/Resources")] = resources
+    with path.open("wb") as stream:
+        writer.write(stream)
+
+
+def make_xlsx(path: Path, rows: int) -> None:
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        with archive.open("xl/worksheets/sheet1.xml", "w") as sheet:
+            sheet.write(b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>')
+            for n in range(1, rows + 1):
+                sheet.write(f'<row r="{n}"><c r="A{n}"><v>{n}</v></c><c r="B{n}" t="inlineStr"><is><t>item {n}</t></is></c><c r="C{n}"><v>{n * 1.5}</v></c></row>'.encode())
+            sheet.write(b"</sheetData></worksheet>")
+
+
+def old_xlsx_rows(path: Path) -> int:
+    """The previous reader: the whole worksheet parsed with ElementTree.fromstring."""
+    from xml.etree import ElementTree as ET
+
+    with zipfile.ZipFile(path) as archive:
+        root = ET.fromstring(archive.read("xl/worksheets/sheet1.xml"))
+    return sum(1 for node in root.iter() if node.tag.endswith("}row"))
+
+
+def timed(func) -> dict:
+    started = time.perf_counter()
+    result = func()
+    elapsed = (time.perf_counter() - started) * 1000
+    header = json.loads(result.split("\n\n", 1)[0]) if isinstance(result, str) else {}
+    return {"ms": round(elapsed, 1), "cache": header.get("cache")}
+
+
+def peak_mb(func) -> float:
+    """Peak Python allocation while func runs (traced separately: tracemalloc slows parsing several-fold)."""
+    tracemalloc.start()
+    try:
+        func()
+        return round(tracemalloc.get_traced_memory()[1] / 2**20, 1)
+    finally:
+        tracemalloc.stop()
+
+
+def benchmark(pages: int, rows: int, workers: int) -> dict:
+    report: dict = {"pdf_pages": pages, "xlsx_rows": rows, "workers": workers}
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp)
+        pdf, xlsx = base / "report.pdf", base / "table.xlsx"
+        make_pdf(pdf, pages, 40)
+        make_xlsx(xlsx, rows)
+        report["pdf_mb"] = round(pdf.stat().st_size / 2**20, 1)
+        report["xlsx_mb"] = round(xlsx.stat().st_size / 2**20, 1)
+        for label, count in (("pdf_sequential", 1), ("pdf_parallel", workers)):
+            config.DOCUMENT_CACHE_PATH = base / f"{label}.db"
+            config.DOCUMENT_WORKERS = count
+            report[label] = {
+                "cold_all_pages": timed(lambda: documents.read_document(str(pdf), max_chars=200_000)),
+                "cached_all_pages": timed(lambda: documents.read_document(str(pdf), max_chars=200_000)),
+            }
+        config.DOCUMENT_CACHE_PATH = base / "window.db"
+        report["pdf_window"] = {
+            "cold_pages_10_19": timed(lambda: documents.read_document(str(pdf), pages="10-19")),
+            "cached_pages_10_19": timed(lambda: documents.read_document(str(pdf), pages="10-19")),
+        }
+        report["xlsx"] = {
+            "old_fromstring_all_rows": timed(lambda: old_xlsx_rows(xlsx)),
+            "cold_first_1000_rows": timed(lambda: documents.read_document(str(xlsx), rows="1-1000")),
+            "cold_all_rows": timed(lambda: documents.read_document(str(xlsx))),
+            "cached_middle_1000_rows": timed(lambda: documents.read_document(str(xlsx), rows=f"{rows // 2}-{rows // 2 + 999}")),
+        }
+        config.DOCUMENT_CACHE_PATH = base / "memory.db"
+        report["xlsx_peak_python_mb"] = {
+            "old_fromstring_all_rows": peak_mb(lambda: old_xlsx_rows(xlsx)),
+            "streamed_all_rows": peak_mb(lambda: documents.read_document(str(xlsx))),
+        }
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    print(json.dumps(benchmark(args.pages, args.rows, args.workers), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,63 @@
+"""Time the workspace index: first build, refreshes, find_indexed and workspace_changes_since, versus a raw walk."""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from benchmark_file_search import build_tree  # noqa: E402
+from seven.memory.file_index import FileIndex  # noqa: E402
+from seven.tools.file_search import walk  # noqa: E402
+
+
+def _ms(func) -> float:
+    started = time.perf_counter()
+    func()
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+def benchmark(total: int) -> dict:
+    report: dict = {"files": total}
+    with tempfile.TemporaryDirectory(prefix="seven-index-bench-") as work:
+        root = Path(work) / "tree"
+        root.mkdir()
+        report["layout"] = build_tree(root, total)
+        report["list_every_file_ms"] = _ms(lambda: sum(1 for entry in walk(str(root)) if not entry.is_dir))
+        for watch in (False, True):
+            name = "inotify" if watch else "mtime_walk"
+            index = FileIndex(root, db_path=Path(work) / f"{name}.db", watch=watch)
+            try:
+                row = {"first_build_ms": _ms(lambda: index.refresh(max_age=0))}
+                row["indexed_files"] = index.summary()["files"]
+                row["refresh_unchanged_ms"] = _ms(lambda: index.refresh(max_age=0))
+                edited = next(root.glob("src/d0/e0/*.py"))
+                edited.write_text("rewritten FRESH_TOKEN\n", encoding="utf-8")
+                os.utime(edited, None)
+                time.sleep(0.2)
+                row["refresh_one_edit_ms"] = _ms(lambda: index.refresh(max_age=0))
+                row["find_indexed_ms"] = _ms(lambda: index.find("FRESH_TOKEN"))
+                row["find_hit"] = [hit["path"] for hit in index.find("FRESH_TOKEN")]
+                row["changes_since_ms"] = _ms(lambda: index.changes_since(0))
+                report[name] = row
+            finally:
+                index.close()
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=100_000)
+    args = parser.parse_args()
+    print(json.dumps(benchmark(args.files), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,106 @@
+"""Compare search_files against the old rglob-then-truncate search on a synthetic tree, and time grep_files."""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from seven import config  # noqa: E402
+from seven.tools import files  # noqa: E402
+
+FILES_PER_DIR = 100
+DIRS_PER_LEVEL = 50
+
+
+def build_tree(root: Path, total: int) -> dict:
+    """total small files: 30% source under src/, 70% under a .gitignore'd node_modules/."""
+    (root / ".gitignore").write_text("node_modules/\n", encoding="utf-8")
+    counts = {"src": int(total * 0.3), "node_modules": total - int(total * 0.3)}
+    for top, count in counts.items():
+        for index in range(count):
+            directory = root / top / f"d{index // (FILES_PER_DIR * DIRS_PER_LEVEL)}" / f"e{(index // FILES_PER_DIR) % DIRS_PER_LEVEL}"
+            if index % FILES_PER_DIR == 0:
+                directory.mkdir(parents=True, exist_ok=True)
+            suffix = ".py" if index % 10 == 0 else ".txt"
+            body = f"line one {index}\nvalue = {index}\n"
+            if index == count // 2:
+                body += "NEEDLE_TOKEN here\n"
+            (directory / f"f{index}{suffix}").write_text(body, encoding="utf-8")
+    return counts
+
+
+def _drop_caches() -> None:
+    """Linux as root only: start from a cold page and dentry cache."""
+    os.sync()
+    Path("/proc/sys/vm/drop_caches").write_text("3\n")
+
+
+def _time(func, repeat: int = 3, cold: bool = False) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        if cold:
+            _drop_caches()
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return round(best * 1000, 1)
+
+
+def _with_workers(count: int, func):
+    def run():
+        config.FILE_SEARCH_WORKERS = count
+        try:
+            return func()
+        finally:
+            config.FILE_SEARCH_WORKERS = 1
+    return run
+
+
+def benchmark(total: int, workers: int, cold: bool = False) -> dict:
+    report: dict = {"files": total, "cold_cache": cold}
+    with tempfile.TemporaryDirectory(prefix="seven-search-bench-") as work:
+        root = Path(work)
+        started = time.perf_counter()
+        report["layout"] = build_tree(root, total)
+        report["build_seconds"] = round(time.perf_counter() - started, 1)
+        repeat = 1 if cold else 3
+        for name, pattern in (("first_50_py", "*.py"), ("full_walk_no_match", "*.md")):
+            report[name] = {
+                "rglob_then_truncate_ms": _time(lambda: list(root.rglob(pattern))[:50], 1, cold),
+                "search_files_ms": _time(lambda: files.search_files(str(root), pattern, 50), repeat, cold),
+                f"search_files_{workers}_workers_ms": _time(
+                    _with_workers(workers, lambda: files.search_files(str(root), pattern, 50)), repeat, cold
+                ),
+                "search_files_include_ignored_ms": _time(
+                    lambda: files.search_files(str(root), pattern, 50, include_ignored=True), repeat, cold
+                ),
+            }
+        report["grep_one_needle"] = {
+            "grep_files_ms": _time(lambda: files.grep_files(str(root), "NEEDLE_TOKEN"), repeat, cold),
+            f"grep_files_{workers}_workers_ms": _time(
+                _with_workers(workers, lambda: files.grep_files(str(root), "NEEDLE_TOKEN")), repeat, cold
+            ),
+            "found": "NEEDLE_TOKEN here" in files.grep_files(str(root), "NEEDLE_TOKEN"),
+        }
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=500_000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--cold", action="store_true", help="drop the page cache before each run (Linux, root)")
+    args = parser.parse_args()
+    print(json.dumps(benchmark(args.files, args.workers, args.cold), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,116 @@
+"""Measure ingest_documents throughput (chunks per second) and search latency on a generated corpus."""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import random
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from seven import config  # noqa: E402
+from seven.memory import vector  # noqa: E402
+from seven.memory.document_index import DocumentIndex, chunk_text  # noqa: E402
+from seven.memory.store import Memory  # noqa: E402
+from seven.memory.vector import SemanticMemory  # noqa: E402
+from seven.tools.documents import document_units  # noqa: E402
+
+WORDS = (
+    "turbine maintenance schedule revenue quarter region north south invoice contract supplier delivery "
+    "warranty battery inverter voltage sensor calibration report meeting budget forecast audit policy "
+    "customer order shipment inventory pallet warehouse safety inspection training manual procedure"
+).split()
+
+
+def paragraph(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def make_corpus(base: Path, files: int, seed: int = 7) -> None:
+    rng = random.Random(seed)
+    for n in range(files):
+        body = "\n\n".join(paragraph(rng, rng.randint(40, 120)) for _ in range(rng.randint(8, 30)))
+        if n % 5 == 4:
+            paras = "".join(f"<w:p><w:r><w:t>{p}</w:t></w:r></w:p>" for p in body.split("\n\n"))
+            with zipfile.ZipFile(base / f"doc{n}.docx", "w") as archive:
+                archive.writestr("word/document.xml", f'<w:document xmlns:w="urn:w"><w:body>{paras}</w:body></w:document>')
+        else:
+            (base / f"doc{n}.md").write_text(body, encoding="utf-8")
+
+
+def old_embed(text: str) -> list:
+    """embed_text before token slots were cached: one MD5 per token occurrence."""
+    vec = [0.0] * 256
+    for t in vector._TOKEN.findall(text.lower()):
+        h = int(hashlib.md5(t.encode("utf-8")).hexdigest(), 16)
+        vec[h % 256] += 1.0 if (h >> 8) & 1 else -1.0
+    norm = sum(v * v for v in vec) ** 0.5 or 1.0
+    return [v / norm for v in vec]
+
+
+def per_chunk_index(memory: Memory, corpus: Path) -> int:
+    """The only path before ingest_documents: SemanticMemory.index per chunk, a transaction and JSON vector each."""
+    count = 0
+    for path in sorted(corpus.iterdir()):
+        for _, body in document_units(path):
+            for _, _, text in chunk_text(body):
+                memory.add_embedding("document", None, text[:2000], old_embed(text))
+                count += 1
+    return count
+
+
+def benchmark(files: int, queries: int) -> dict:
+    report: dict = {"files": files}
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp)
+        corpus = base / "corpus"
+        corpus.mkdir()
+        make_corpus(corpus, files)
+        config.DOCUMENT_CACHE_PATH = base / "document_cache.db"
+
+        memory = Memory(base / "old.db")
+        started = time.perf_counter()
+        count = per_chunk_index(memory, corpus)
+        elapsed = time.perf_counter() - started
+        report["per_chunk_index"] = {"chunks": count, "seconds": round(elapsed, 2), "chunks_per_second": round(count / elapsed)}
+
+        memory = Memory(base / "seven.db")
+        index = DocumentIndex(memory)
+        vector._slot.cache_clear()
+        cold = index.ingest(corpus)
+        report["ingest_cold"] = {k: cold[k] for k in ("chunks", "seconds", "extract_embed_seconds", "chunks_per_second")}
+        warm = index.ingest(corpus)
+        report["ingest_unchanged"] = {"files": warm["unchanged"], "seconds": warm["seconds"]}
+        for path in sorted(corpus.glob("*.md"))[: max(1, files // 10)]:
+            path.write_text(path.read_text(encoding="utf-8") + " appended", encoding="utf-8")
+        changed = index.ingest(corpus)
+        report["ingest_10pct_edited"] = {"files": changed["changed"], "chunks": changed["chunks"], "seconds": changed["seconds"]}
+
+        rng = random.Random(3)
+        phrases = [" ".join(rng.sample(WORDS, 3)) for _ in range(queries)]
+        semantic = SemanticMemory(Memory(base / "old.db"))
+        for label, search in (("search_documents", index.search), ("semantic_search_latest_800", semantic.search)):
+            started = time.perf_counter()
+            for phrase in phrases:
+                search(phrase)
+            report[label + "_ms"] = round((time.perf_counter() - started) * 1000 / queries, 1)
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=500)
+    parser.add_argument("--queries", type=int, default=50)
+    args = parser.parse_args()
+    print(json.dumps(benchmark(args.files, args.queries), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,98 @@
+"""Measure MCP tool-call throughput under parallel read calls and the list_tools spec cache."""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from seven import config  # noqa: E402
+from seven.mcp_server import SevenMCP  # noqa: E402
+from seven.memory.store import Memory  # noqa: E402
+from seven.tools.registry import Tool, ToolRegistry, build_default_registry  # noqa: E402
+
+
+def _adapter(data_dir: Path, io_ms: float, read_limit: int) -> SevenMCP:
+    memory = Memory(data_dir / f"mcp-{read_limit}.db")
+    registry = ToolRegistry(memory=memory, tier="full")
+    registry.register(Tool(
+        name="read_probe",
+        description="Read-only probe with fixed I/O latency.",
+        parameters={"type": "object", "properties": {}},
+        handler=lambda: time.sleep(io_ms / 1000) or "ok",
+        tags=["concurrency:read"],
+    ))
+    config.MCP_READ_CONCURRENCY = read_limit
+    return SevenMCP(memory=memory, registry=registry)
+
+
+async def _fire(adapter: SevenMCP, calls: int, parallel: bool) -> float:
+    started = time.perf_counter()
+    if parallel:
+        await asyncio.gather(*(adapter.call_async("read_probe") for _ in range(calls)))
+    else:
+        for _ in range(calls):
+            await adapter.call_async("read_probe")
+    return time.perf_counter() - started
+
+
+def throughput(calls: int, io_ms: float, limits: tuple[int, ...]) -> dict:
+    out = {}
+    with tempfile.TemporaryDirectory(prefix="seven-mcp-bench-") as data_dir:
+        adapter = _adapter(Path(data_dir), io_ms, 1)
+        elapsed = asyncio.run(_fire(adapter, calls, parallel=False))
+        out["sequential_client"] = {"calls_per_s": round(calls / elapsed, 1)}
+        for limit in limits:
+            adapter = _adapter(Path(data_dir), io_ms, limit)
+            elapsed = asyncio.run(_fire(adapter, calls, parallel=True))
+            out[f"parallel_read_limit_{limit}"] = {"calls_per_s": round(calls / elapsed, 1)}
+    return out
+
+
+def spec_cache(repeats: int) -> dict:
+    with tempfile.TemporaryDirectory(prefix="seven-mcp-bench-") as data_dir:
+        config.DATA_DIR = Path(data_dir)
+        memory = Memory(Path(data_dir) / "specs.db")
+        adapter = SevenMCP(memory=memory, registry=build_default_registry(memory, tier="full"))
+        started = time.perf_counter()
+        for _ in range(repeats):
+            [schema["function"] for schema in adapter.registry.schemas()]
+        rebuilt = time.perf_counter() - started
+        adapter.tool_specs()
+        started = time.perf_counter()
+        for _ in range(repeats):
+            adapter.tool_specs()
+        cached = time.perf_counter() - started
+    return {
+        "tools": len(adapter.tool_specs()),
+        "rebuild_us": round(rebuilt / repeats * 1e6, 2),
+        "cached_us": round(cached / repeats * 1e6, 2),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--io-ms", type=float, default=20.0, help="simulated I/O latency per read call")
+    parser.add_argument("--limits", default="1,4,16", help="read-class concurrency limits to compare")
+    parser.add_argument("--spec-repeats", type=int, default=2000)
+    args = parser.parse_args()
+    limits = tuple(int(x) for x in args.limits.split(",") if x.strip())
+    report = {
+        "io_ms": args.io_ms,
+        "calls": args.calls,
+        "throughput": throughput(args.calls, args.io_ms, limits),
+        "list_tools": spec_cache(args.spec_repeats),
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
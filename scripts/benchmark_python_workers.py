@@ -0,0 +1,80 @@
+"""Compare run_python per-call latency: a fresh interpreter per call versus warm workers."""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from seven import config  # noqa: E402
+from seven.runtime import python_pool  # noqa: E402
+from seven.tools import code_run  # noqa: E402
+
+SCRIPTS = {
+    "trivial": "print(1)",
+    "numpy": "import numpy as np\nprint(float(np.arange(1000).mean()))",
+}
+
+
+def _wait_warm(pool: python_pool.PythonPool, timeout: float = 120) -> None:
+    deadline = time.monotonic() + timeout
+    while len(pool.idle) < pool.size and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+
+def _latencies(code: str, calls: int) -> list[float]:
+    out = []
+    for _ in range(calls):
+        started = time.perf_counter()
+        result = code_run.run_python(code, timeout=60)
+        out.append((time.perf_counter() - started) * 1000)
+        if not result.startswith("exit_code=0"):
+            raise RuntimeError(result)
+    return out
+
+
+def _summary(values: list[float]) -> dict:
+    return {"p50_ms": round(statistics.median(values), 1), "mean_ms": round(statistics.fmean(values), 1)}
+
+
+def benchmark(calls: int = 20) -> dict:
+    report = {}
+    with tempfile.TemporaryDirectory(prefix="seven-python-bench-") as work:
+        config.WORKSPACE_DIR = Path(work)
+        for mode, workers in (("cold", 0), ("warm", 1)):
+            config.PYTHON_WORKERS = workers
+            python_pool._POOL = None
+            pool = python_pool.get_pool()
+            if pool is not None:
+                _wait_warm(pool)
+            try:
+                report[mode] = {name: _summary(_latencies(code, calls)) for name, code in SCRIPTS.items()}
+            finally:
+                if pool is not None:
+                    pool.close()
+    report["speedup"] = {
+        name: round(report["cold"][name]["p50_ms"] / max(0.01, report["warm"][name]["p50_ms"]), 1)
+        for name in SCRIPTS
+    }
+    report["preload"] = config.PYTHON_PRELOAD
+    report["fork"] = hasattr(os, "fork")
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=20)
+    args = parser.parse_args()
+    print(json.dumps(benchmark(args.calls), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
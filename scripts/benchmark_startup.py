@@ -0,0 +1,108 @@
+"""Measure cold agent startup with -X importtime and fail when it exceeds a budget."""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_BUDGET_MS = float(os.getenv("SEVEN_STARTUP_BUDGET_MS", "3000"))
+IMPORTTIME = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+# Tool modules whose import must be deferred until one of their tools runs.
+DEFERRED_MODULES = (
+    "seven.tools.screen", "seven.tools.vision", "seven.tools.browser",
+    "seven.tools.music", "seven.tools.documents", "seven.tools.desktop_windows",
+    "seven.tools.coding_agent", "seven.tools.ssh", "seven.tools.github_reader",
+)
+
+CHILD = r"""
+import json, time
+started = time.perf_counter()
+from seven.agent.loop import Seven
+imported = time.perf_counter()
+agent = Seven()
+built = time.perf_counter()
+agent.wait_ready(30)
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "construct_ms": (built - imported) * 1000,
+    "ready_ms": (time.perf_counter() - imported) * 1000,
+    "tools": len(agent.tools.all_names()),
+}))
+"""
+
+
+def _child_env(data_dir: str) -> dict:
+    env = dict(os.environ)
+    env.update({
+        "SEVEN_DATA_DIR": data_dir,
+        "SEVEN_WORKSPACE": str(Path(data_dir) / "workspace"),
+        "SEVEN_EXTENSIONS_DIR": str(Path(data_dir) / "extensions"),
+        # Unroutable local port: the boot ping fails fast instead of finding a real Ollama.
+        "OLLAMA_URL": "http://127.0.0.1:9",
+        "PYTHONPATH": str(ROOT) + os.pathsep + env.get("PYTHONPATH", ""),
+    })
+    return env
+
+
+def run_once(data_dir: str) -> dict:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD],
+        cwd=str(ROOT), env=_child_env(data_dir), capture_output=True, text=True, timeout=120,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"startup child failed ({proc.returncode}): {proc.stderr[-2000:]}")
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    modules = {}
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME.match(line)
+        if match:
+            modules[match.group(4)] = int(match.group(2))
+    result["imported_modules"] = len(modules)
+    result["slowest_imports_ms"] = [
+        [name, round(us / 1000, 1)]
+        for name, us in sorted(modules.items(), key=lambda item: -item[1])
+        if "." not in name or name.startswith("seven")
+    ][:8]
+    result["deferred_imported"] = sorted(m for m in DEFERRED_MODULES if m in modules)
+    return result
+
+
+def benchmark(budget_ms: float = DEFAULT_BUDGET_MS) -> dict:
+    """Cold run writes the tool manifest; the warm run is what users pay on every start."""
+    with tempfile.TemporaryDirectory(prefix="seven-startup-") as data_dir:
+        cold = run_once(data_dir)
+        warm = run_once(data_dir)
+    total = warm["import_ms"] + warm["construct_ms"]
+    failures = []
+    if total > budget_ms:
+        failures.append(f"warm startup {total:.0f} ms exceeds budget {budget_ms:.0f} ms")
+    if warm["deferred_imported"]:
+        failures.append(f"tool modules imported at startup: {', '.join(warm['deferred_imported'])}")
+    return {"budget_ms": budget_ms, "startup_ms": round(total, 1), "cold": cold, "warm": warm, "failures": failures}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    args = parser.parse_args()
+    report = benchmark(args.budget_ms)
+    print(json.dumps(report, indent=2))
+    if report["failures"]:
+        print("Startup benchmark failed:")
+        for failure in report["failures"]:
+            print(f"- {failure}")
+        return 1
+    print(f"OK startup {report['startup_ms']} ms within {args.budget_ms:.0f} ms budget")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
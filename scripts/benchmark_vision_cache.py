@@ -0,0 +1,109 @@
+"""dHash cost, Hamming distances for typical screen changes, and vision calls a polling loop avoids."""
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from seven.tools import vision, vision_cache  # noqa: E402
+from seven.tools.vision_cache import VisionCache, dhash, hamming  # noqa: E402
+
+
+def screen(seed: int, label: str = "Inbox (3)", cursor=(600, 400), clock: str = "10:41") -> Image.Image:
+    rng = random.Random(seed)
+    img = Image.new("RGB", (1280, 800), (240, 240, 240))
+    draw = ImageDraw.Draw(img)
+    for _ in range(25):
+        x, y = rng.randint(0, 1200), rng.randint(0, 760)
+        draw.rectangle([x, y, x + rng.randint(40, 400), y + rng.randint(20, 200)], fill=tuple(rng.randint(0, 255) for _ in range(3)))
+    for _ in range(40):
+        draw.text((rng.randint(0, 1200), rng.randint(0, 780)), "lorem ipsum dolor", fill=(0, 0, 0))
+    draw.text((50, 50), label, fill=(0, 0, 0))
+    draw.text((1200, 780), clock, fill=(0, 0, 0))
+    x, y = cursor
+    draw.polygon([(x, y), (x + 10, y + 15), (x, y + 18)], fill=(0, 0, 0))
+    return img
+
+
+def jpeg(img: Image.Image, quality: int) -> Image.Image:
+    buf = io.BytesIO()
+    img.save(buf, format="JPEG", quality=quality)
+    return Image.open(io.BytesIO(buf.getvalue()))
+
+
+def sensor_noise(img: Image.Image, amplitude: int = 6) -> Image.Image:
+    pixels = np.asarray(img).astype(np.int16)
+    pixels += np.random.default_rng(0).integers(-amplitude, amplitude + 1, size=pixels.shape, dtype=np.int16)
+    return Image.fromarray(np.clip(pixels, 0, 255).astype(np.uint8))
+
+
+class SlowBrain:
+    vision_model = "benchmark-vision"
+
+    def __init__(self):
+        self.calls = 0
+
+    def vision(self, prompt, image_b64, system=None):
+        self.calls += 1
+        return "answer"
+
+
+def benchmark(frames: int, change_every: int) -> dict:
+    base = screen(1)
+    bits = dhash(base)
+    started = time.perf_counter()
+    for _ in range(50):
+        dhash(base)
+    report: dict = {"dhash_ms": round((time.perf_counter() - started) * 1000 / 50, 2)}
+    report["distance_bits_of_256"] = {
+        "same_screen_jpeg_q75": hamming(bits, dhash(jpeg(base, 75))),
+        "same_screen_jpeg_q50": hamming(bits, dhash(jpeg(base, 50))),
+        "sensor_noise_6": hamming(bits, dhash(sensor_noise(base))),
+        "clock_changed": hamming(bits, dhash(screen(1, clock="10:42"))),
+        "label_changed": hamming(bits, dhash(screen(1, label="Inbox (4) new mail from Bob"))),
+        "cursor_moved": hamming(bits, dhash(screen(1, cursor=(100, 100)))),
+        "different_screen": hamming(bits, dhash(screen(2))),
+    }
+    brain = SlowBrain()
+    vision._brain = brain
+    vision_cache._CACHE = VisionCache(max_distance=4, ttl=600)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "shot.jpg"
+        started = time.perf_counter()
+        for frame in range(frames):
+            scene = frame // change_every
+            screen(scene, cursor=(300 + frame * 7 % 500, 300), clock=f"10:{frame % 60:02d}").save(path, quality=75)
+            vision.analyze_image(str(path), "What is on screen?")
+        elapsed = time.perf_counter() - started
+    report["polling_loop"] = {
+        "frames": frames,
+        "scene_changes": -(-frames // change_every),
+        "vision_calls": brain.calls,
+        "vision_calls_skipped": frames - brain.calls,
+        "loop_overhead_ms_per_frame": round(elapsed * 1000 / frames, 1),
+    }
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--change-every", type=int, default=10, help="frames between real scene changes")
+    args = parser.parse_args()
+    print(json.dumps(benchmark(args.frames, args.change_every), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
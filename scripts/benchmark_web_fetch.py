@@ -0,0 +1,150 @@
+"""Compare web_fetch against the old requests.get-and-regex fetch, using a local HTTP server."""
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from seven import config  # noqa: E402
+from seven.tools import http_client, web  # noqa: E402
+
+
+def make_page(kib: int) -> bytes:
+    """About kib KiB of article-like HTML, with scripts and styles the extractor must skip."""
+    head = "<html><head><title>Bench</title><style>body{margin:0}</style><script>var a=1;</script></head><body>"
+    para = "<p>Lorem ipsum <b>dolor</b> sit amet, consectetur &amp; adipiscing elit, sed do eiusmod.</p>\n"
+    script = "<script>window.x = [" + ",".join(str(i) for i in range(40)) + "];</script>\n"
+    parts, size = [head], len(head)
+    while size < kib * 1024:
+        chunk = para * 8 + script
+        parts.append(chunk)
+        size += len(chunk)
+    parts.append("</body></html>")
+    return "".join(parts).encode("utf-8")
+
+
+def serve(page: bytes, connect_ms: float, request_ms: float):
+    """A keep-alive server; connect_ms stands in for TCP+TLS setup, request_ms for the round trip."""
+    counts = {"connections": 0, "requests": 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def setup(self):
+            counts["connections"] += 1
+            time.sleep(connect_ms / 1000)
+            super().setup()
+
+        def do_GET(self):
+            counts["requests"] += 1
+            time.sleep(request_ms / 1000)
+            headers = {"Content-Type": "text/html; charset=utf-8", "ETag": '"v1"'}
+            if self.path.startswith("/fresh"):
+                headers["Cache-Control"] = "max-age=3600"
+            else:
+                headers["Cache-Control"] = "no-cache"
+                if self.headers.get("If-None-Match") == '"v1"':
+                    self.send_response(304)
+                    self.send_header("ETag", '"v1"')
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+            self.send_response(200)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(page)))
+            self.end_headers()
+            self.wfile.write(page)
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd, f"http://127.0.0.1:{httpd.server_address[1]}", counts
+
+
+def old_web_fetch(url: str, max_chars: int = 12000) -> str:
+    """web_fetch before the pooled client: a new connection, the whole body, regex stripping."""
+    r = requests.get(url, timeout=30, headers={"User-Agent": "SevenAI/4.0 (+local-agent)"})
+    r.raise_for_status()
+    return regex_text(r.text, max_chars)
+
+
+def regex_text(text: str, max_chars: int) -> str:
+    text = re.sub(r"(?is)<script.*?>.*?</script>", " ", text)
+    text = re.sub(r"(?is)<style.*?>.*?</style>", " ", text)
+    text = re.sub(r"(?is)<[^>]+>", " ", text)
+    return re.sub(r"\s+", " ", text).strip()[:max_chars]
+
+
+def _loop(func, count: int) -> float:
+    started = time.perf_counter()
+    for _ in range(count):
+        func()
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+def benchmark(kib: int, loop: int, connect_ms: float, request_ms: float) -> dict:
+    page = make_page(kib)
+    httpd, base, counts = serve(page, connect_ms, request_ms)
+    report: dict = {"page_kib": len(page) // 1024, "loop": loop, "connect_ms": connect_ms, "request_ms": request_ms}
+    try:
+        with tempfile.TemporaryDirectory(prefix="seven-web-bench-") as work:
+            config.HTTP_CACHE_DIR = Path(work)
+            http_client._CACHE = None
+
+            def phase(name, func, url):
+                before = dict(counts)
+                report[name] = {
+                    "ms": _loop(lambda: func(url), loop),
+                    "connections": counts["connections"] - before["connections"],
+                    "requests": counts["requests"] - before["requests"],
+                }
+
+            phase("old_requests_get_regex", old_web_fetch, base + "/fresh")
+            phase("web_fetch_no_cache", lambda u: web.web_fetch(u + f"?n={time.perf_counter_ns()}"), base + "/nocache")
+            web.web_fetch(base + "/fresh")
+            phase("web_fetch_fresh_hits", web.web_fetch, base + "/fresh")
+            web.web_fetch(base + "/etag")
+            phase("web_fetch_revalidated", web.web_fetch, base + "/etag")
+            report["text_chars"] = {
+                "old": len(old_web_fetch(base + "/fresh", 10**9)),
+                "new": len(http_client.html_to_text(page, {"content-type": "text/html"}, 10**9)[0]),
+            }
+            report["extract_12k_chars_ms"] = {
+                "regex_whole_page": _loop(lambda: regex_text(page.decode("utf-8"), 12000), 10),
+                "html_parser_streaming": _loop(
+                    lambda: http_client.html_to_text(page, {"content-type": "text/html"}, 12000), 10
+                ),
+            }
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--kib", type=int, default=512, help="page size")
+    parser.add_argument("--loop", type=int, default=20, help="fetches per phase, like a plan loop")
+    parser.add_argument("--connect-ms", type=float, default=30.0, help="simulated connection setup")
+    parser.add_argument("--request-ms", type=float, default=10.0, help="simulated round trip")
+    args = parser.parse_args()
+    print(json.dumps(benchmark(args.kib, args.loop, args.connect_ms, args.request_ms), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
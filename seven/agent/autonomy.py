@@ -205,7 +205,7 @@ class AutonomyEngine:
             f"Last action: {last}\n\n"
             f"Living context:\n{living}\n\n"
             "Rules:\n"
-            "1. You MUST use tools (run_shell, read_file, write_file, run_python, web_search, etc.) "
+            "1. You MUST use tools (run_shell, read_file, edit_file, write_file, run_python, web_search, etc.) "
             "to do ONE concrete step of real work.\n"
             "2. Do NOT only describe what you would do.\n"
             "3. After tools, briefly report results and what to try next.\n"
@@ -7,10 +7,12 @@ from __future__ import annotations
 import logging
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
-from seven import config
+from seven import config, metrics
 from seven.agent.autonomy import AutonomyEngine, format_audit
 from seven.agent.prompt import build_system_prompt
 from seven.brain.llm import Brain, BrainError
@@ -19,13 +21,35 @@ from seven.mind.episodic import EpisodicMemory
 from seven.mind.freewill import FreeWill
 from seven.mind.planner import Planner
 from seven.mind.preferences import learn_from_utterance
+from seven.mind.sensors import SensorHub
 from seven.mind.state import LivingState
+from seven.mind.world import ollama_from_ping
 from seven.memory.vector import SemanticMemory
 from seven.tools.registry import ToolRegistry, build_default_registry
-from seven.tools import mind_tools as mind_tools_mod
+
+if TYPE_CHECKING:  # seven.runtime imports this module
+    from seven.runtime.progress import ProgressSink
 
 logger = logging.getLogger("seven.agent")
 
+# on_event(kind, data) hook for streaming front ends. Kinds: round, token,
+# tool_call, tool_progress, tool_result.
+TurnEvents = Callable[[str, Dict[str, Any]], None]
+
+
+HANDLE_SECONDS = metrics.histogram(
+    "seven_handle_seconds",
+    "Seven.handle() time per turn by phase (wait, prepare, local, build, llm, tools, persist, total).",
+    ("phase",),
+)
+TICK_SECONDS = metrics.histogram(
+    "seven_heartbeat_tick_seconds", "Background tick duration by loop (autonomy, daemon_sense).", ("loop",)
+)
+
+
+class TurnCancelled(Exception):
+    """The caller set the cancel event (e.g. a streaming client disconnected)."""
+
 
 class Seven:
     """The living agent process — companion with free will, not a command shell."""
@@ -34,43 +58,71 @@ class Seven:
         self.memory = Memory()
         self.brain = Brain()
         tier = tool_tier or config.TOOL_TIER
-        # tools need agent ref for plan/skill runners — build twice lightly
+        # Built once; schemas come from the tool manifest, modules load on first use.
         self.tools: ToolRegistry = build_default_registry(
             self.memory, brain=self.brain, tier=tier, agent=None
         )
         self.living = LivingState()
+        self.sensors = SensorHub(memory=self.memory, brain=self.brain)
         self.autonomy = AutonomyEngine(self)
         self.freewill = FreeWill(self)
         self.planner = Planner(self)
         self.episodic = EpisodicMemory(self)
         self.semantic = SemanticMemory(self.memory)
-        # re-bind mind tools with agent
-        mind_tools_mod.set_context(memory=self.memory, agent=self)
-        self.tools = build_default_registry(
-            self.memory, brain=self.brain, tier=tier, agent=self
-        )
+        # late-bind the agent for plan/skill runners
+        self.tools.bind_context(agent=self)
         self._lock = threading.RLock()
         self._heartbeat_stop = threading.Event()
         self._heartbeat_thread: Optional[threading.Thread] = None
         self.last_user_ts = time.time()
         self.session_started = datetime.now(timezone.utc).isoformat()
-        self._boot_checks()
+        self.ready = threading.Event()
+        self._status_counts: Dict[str, Any] = {}
+        # Model auto-select + Ollama ping run off the startup path.
+        self._boot_thread = threading.Thread(target=self._boot, name="seven-boot", daemon=True)
+        self._boot_thread.start()
+
+    def _boot(self):
+        try:
+            self._boot_checks()
+        except Exception:
+            logger.exception("boot checks failed")
         try:
             self.refresh_living_state()
         except Exception:
             logger.exception("initial living state failed")
+        finally:
+            self.ready.set()
 
-    def _boot_checks(self):
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until background boot checks and the first living sense finish."""
+        return self.ready.wait(timeout)
+
+    def _auto_select_model(self) -> Optional[str]:
         # Pick best local model (qwen2.5:7b preferred for tools)
-        if getattr(config, "AUTO_SELECT_MODEL", True):
-            try:
-                from seven.brain.models import apply_best_model_to_config
-                picked = apply_best_model_to_config()
-                self.brain.model = config.OLLAMA_MODEL
-                logger.info("Model auto-select: %s", picked)
-            except Exception:
-                logger.debug("model auto-select failed", exc_info=True)
-        health = self.brain.ping()
+        try:
+            from seven.brain.models import apply_best_model_to_config
+            picked = apply_best_model_to_config()
+            self.brain.model = config.OLLAMA_MODEL
+            logger.info("Model auto-select: %s", picked)
+            return picked
+        except Exception:
+            logger.debug("model auto-select failed", exc_info=True)
+            return None
+
+    def _boot_checks(self):
+        # Selection and health ping hit Ollama concurrently; the ping's model
+        # fields are reconciled with the selected model afterwards.
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="seven-boot") as pool:
+            picking = pool.submit(self._auto_select_model) if getattr(config, "AUTO_SELECT_MODEL", True) else None
+            pinging = pool.submit(self.brain.ping)
+            if picking is not None:
+                picking.result()
+            health = pinging.result()
+        if health.get("ok") and health.get("model") != self.brain.model:
+            health["model"] = self.brain.model
+            health["has_primary"] = any(self.brain.model in (m or "") for m in health.get("models") or [])
+        self.sensors.seed("ollama", ollama_from_ping(health))
         if not health.get("ok"):
             logger.error("LLM not reachable: %s", health)
         else:
@@ -91,8 +143,14 @@ class Seven:
             ", ".join(self.tools.names()),
         )
 
-    def refresh_living_state(self) -> dict:
-        """Sense world + self; used by heartbeat and daemon."""
+    def refresh_living_state(self, max_age: float = 0.0) -> dict:
+        """
+        Sense world + self; used by heartbeat and daemon.
+        Probes come from the TTL-cached sensor hub. With max_age, a living
+        snapshot younger than that many seconds is returned as-is.
+        """
+        if max_age and self.living.world and time.time() - self.living.last_tick_ts < max_age:
+            return {"world": self.living.world, "self": self.living.self_state, "tick": self.living.tick_count}
         ws = None
         if self.autonomy.session and self.autonomy.session.active():
             ws = self.autonomy.session_status().split("\n")[0]
@@ -103,17 +161,37 @@ class Seven:
             tools_active=self.tools.names(),
             tools_total=len(self.tools.all_names()),
             work_session=ws,
+            sensors=self.sensors,
         )
 
     # ── conversation ───────────────────────────────────────────────────
 
-    def handle(self, user_text: str) -> str:
-        """Process one user message end-to-end with tool rounds."""
+    def handle(
+        self,
+        user_text: str,
+        on_event: Optional[TurnEvents] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> str:
+        """
+        Process one user message end-to-end with tool rounds.
+        on_event streams the turn as it happens; setting cancel stops it at the
+        next token or tool boundary and stops a running tool's subprocesses.
+        """
         user_text = (user_text or "").strip()
         if not user_text:
             return ""
 
+        def emit(kind: str, **data: Any):
+            if cancel is not None and cancel.is_set():
+                raise TurnCancelled()
+            if on_event is not None:
+                on_event(kind, data)
+
+        started = time.perf_counter()
+        phase = {"llm": 0.0, "tools": 0.0}
         with self._lock:
+            mark = time.perf_counter()
+            HANDLE_SECONDS.labels("wait").observe(mark - started)
             self.last_user_ts = time.time()
             user_message_id = self.memory.add_message("user", user_text)
             if getattr(config, "ACTION_CAPTURE_MODE", "suggest") != "off":
@@ -132,67 +210,36 @@ class Seven:
                 pass
             self._maybe_compact()
 
+            now = time.perf_counter()
+            HANDLE_SECONDS.labels("prepare").observe(now - mark)
+            mark = now
+
             # Local slash commands (no LLM) — power user only
             local = self._local_commands(user_text)
             if local is not None:
                 self.memory.add_message("assistant", local)
+                HANDLE_SECONDS.labels("local").observe(time.perf_counter() - mark)
+                HANDLE_SECONDS.labels("total").observe(time.perf_counter() - started)
                 return local
 
             messages = self._build_messages()
             tools = self.tools.schemas()
+            now = time.perf_counter()
+            HANDLE_SECONDS.labels("build").observe(now - mark)
             final_text = ""
             tool_trace: List[str] = []
 
+            stream = {"on_token": lambda delta: emit("token", delta=delta)} if on_event else {}
+            # Progress goes straight to on_event: it must never raise TurnCancelled inside a tool.
+            progress = (lambda data: on_event("tool_progress", data)) if on_event else None
+
             try:
-                for round_i in range(config.MAX_TOOL_ROUNDS):
-                    result = self.brain.chat(messages, tools=tools)
-                    content = result.get("content")
-                    tool_calls = result.get("tool_calls") or []
-                    if not tool_calls and content:
-                        from seven.brain.llm import Brain as _B
-                        recovered = _B._extract_text_tool_calls(content)
-                        if recovered:
-                            tool_calls = recovered
-                            content = None
-
-                    if tool_calls:
-                        messages.append({
-                            "role": "assistant",
-                            "content": content or "",
-                            "tool_calls": [
-                                {
-                                    "id": tc["id"],
-                                    "type": "function",
-                                    "function": {
-                                        "name": tc["name"],
-                                        "arguments": tc["arguments"],
-                                    },
-                                }
-                                for tc in tool_calls
-                            ],
-                        })
-                        for tc in tool_calls:
-                            name = tc["name"]
-                            args = tc.get("arguments") or {}
-                            if not isinstance(args, dict):
-                                args = {"value": args}
-                            logger.info("tool[%s] %s(%s)", round_i, name, args)
-                            out = self.tools.execute(name, args)
-                            tool_trace.append(f"{name}: {out[:300]}")
-                            messages.append({
-                                "role": "tool",
-                                "name": name,
-                                "content": out,
-                            })
-                        continue
-
-                    final_text = (content or "").strip()
-                    break
-                else:
-                    final_text = (
-                        "I hit the tool-round limit. Here's what I did:\n"
-                        + "\n".join(tool_trace[-8:])
-                    )
+                final_text = self._tool_rounds(
+                    messages, tools, emit, stream, phase, tool_trace, cancel=cancel, progress=progress
+                )
+            except TurnCancelled:
+                logger.info("turn cancelled after %s tool call(s)", len(tool_trace))
+                final_text = "Cancelled." + ("\n" + "\n".join(tool_trace[-5:]) if tool_trace else "")
             except BrainError as e:
                 final_text = (
                     f"Brain error: {e}\n"
@@ -209,6 +256,7 @@ class Seven:
                 else:
                     final_text = "…"
 
+            mark = time.perf_counter()
             self.memory.add_message("assistant", final_text, meta={"tools": tool_trace})
             try:
                 self.semantic.index_message("assistant", final_text)
@@ -223,8 +271,149 @@ class Seven:
                     )
                 except Exception:
                     pass
+            HANDLE_SECONDS.labels("persist").observe(time.perf_counter() - mark)
+            HANDLE_SECONDS.labels("llm").observe(phase["llm"])
+            HANDLE_SECONDS.labels("tools").observe(phase["tools"])
+            HANDLE_SECONDS.labels("total").observe(time.perf_counter() - started)
             return final_text
 
+    def run_ephemeral(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        use_tools: bool = True,
+        cancel: Optional[threading.Event] = None,
+    ) -> Dict[str, Any]:
+        """
+        One isolated turn: no conversation history in, nothing written to it
+        after, and no turn lock, so many can run beside a chat. Tool calls are
+        still executed and audited. system is appended to the persona prompt.
+        """
+        def emit(kind: str, **data: Any):
+            if cancel is not None and cancel.is_set():
+                raise TurnCancelled()
+
+        started = time.perf_counter()
+        base = build_system_prompt(
+            memory_block=self.memory.context_block(),
+            tool_names=self.tools.names() if use_tools else [],
+        )
+        if system:
+            base += "\n\n## Instructions for this request\n" + system.strip()
+        messages: List[Dict[str, Any]] = [{"role": "system", "content": base}, {"role": "user", "content": prompt}]
+        phase = {"llm": 0.0, "tools": 0.0}
+        tool_trace: List[str] = []
+        status = "ok"
+        try:
+            reply = self._tool_rounds(
+                messages, self.tools.schemas() if use_tools else None, emit, {}, phase, tool_trace,
+                cancel=cancel,
+            ) or "…"
+        except TurnCancelled:
+            status, reply = "cancelled", "Cancelled."
+        except BrainError as e:
+            status, reply = "error", f"Brain error: {e}"
+        return {
+            "status": status,
+            "reply": reply,
+            "tools": tool_trace,
+            "seconds": round(time.perf_counter() - started, 3),
+        }
+
+    def _tool_rounds(
+        self,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]],
+        emit: Callable[..., None],
+        stream: Dict[str, Any],
+        phase: Dict[str, float],
+        tool_trace: List[str],
+        cancel: Optional[threading.Event] = None,
+        progress: Optional[ProgressSink] = None,
+    ) -> str:
+        """LLM/tool rounds until a plain reply. Raises TurnCancelled and BrainError."""
+        for round_i in range(config.MAX_TOOL_ROUNDS):
+            emit("round", round=round_i)
+            mark = time.perf_counter()
+            try:
+                result = self.brain.chat(messages, tools=tools, **stream)
+            finally:
+                phase["llm"] += time.perf_counter() - mark
+            content = result.get("content")
+            tool_calls = result.get("tool_calls") or []
+            if not tool_calls and content and tools is not None:
+                from seven.brain.llm import Brain as _B
+                recovered = _B._extract_text_tool_calls(content)
+                if recovered:
+                    tool_calls = recovered
+                    content = None
+
+            if tool_calls:
+                messages.append({
+                    "role": "assistant",
+                    "content": content or "",
+                    "tool_calls": [
+                        {
+                            "id": tc["id"],
+                            "type": "function",
+                            "function": {
+                                "name": tc["name"],
+                                "arguments": tc["arguments"],
+                            },
+                        }
+                        for tc in tool_calls
+                    ],
+                })
+                for tc in tool_calls:
+                    name = tc["name"]
+                    args = tc.get("arguments") or {}
+                    if not isinstance(args, dict):
+                        args = {"value": args}
+                    logger.info("tool[%s] %s(%s)", round_i, name, args)
+                    emit("tool_call", round=round_i, id=tc["id"], name=name, arguments=args)
+                    mark = time.perf_counter()
+                    sink = self._tagged(progress, round=round_i, id=tc["id"], name=name) if progress else None
+                    out = self._run_tool(name, args, cancel, sink)
+                    phase["tools"] += time.perf_counter() - mark
+                    self.sensors.invalidate("work")
+                    tool_trace.append(f"{name}: {out[:300]}")
+                    emit(
+                        "tool_result", round=round_i, id=tc["id"], name=name,
+                        ok=not out.startswith("ERROR"), preview=out[:300],
+                    )
+                    messages.append({
+                        "role": "tool",
+                        "name": name,
+                        "content": out,
+                    })
+                continue
+
+            return (content or "").strip()
+        return "I hit the tool-round limit. Here's what I did:\n" + "\n".join(tool_trace[-8:])
+
+    @staticmethod
+    def _tagged(progress: ProgressSink, **call: Any) -> ProgressSink:
+        return lambda update: progress({**call, **update})
+
+    def _run_tool(
+        self,
+        name: str,
+        args: Dict[str, Any],
+        cancel: Optional[threading.Event],
+        progress: Optional[ProgressSink],
+    ) -> str:
+        """Execute with the turn's cancel event and progress sink in scope; either may be
+        None, leaving whatever scope the caller (the talk UI, an MCP call) opened."""
+        from seven.runtime.process import cancel_scope
+        from seven.runtime.progress import progress_scope
+
+        with ExitStack() as scopes:
+            if cancel is not None:
+                scopes.enter_context(cancel_scope(cancel))
+            if progress is not None:
+                scopes.enter_context(progress_scope(progress))
+            return self.tools.execute(name, args)
+
     def _maybe_compact(self):
         try:
             n = self.memory.message_count()
@@ -250,41 +439,21 @@ class Seven:
                 "  /world   — world model snapshot\n"
                 "  /self    — self-model snapshot\n"
                 "  /live    — living state (world+self)\n"
+                "  /cadence [hours] — tick cadence + uptime from the living journal\n"
                 "  /work <goal_id> [minutes] — start focused work session\n"
                 "  /workstep [goal_id] — run one real goal step now\n"
                 "  /workstatus — work session status\n"
                 "  /stopwork — end work session\n"
+                "  /camera on [seconds] [index] — keep the webcam open for instant captures\n"
+                "  /camera off — release the webcam\n"
+                "  /camera  — camera session status\n"
                 "  /clear   — clear chat history (keeps facts)\n"
                 "  /quit    — exit\n"
                 "Anything else is handled by the agent with real tools."
             )
         if t == "/status":
-            from seven import __version__
             self.refresh_living_state()
-            h = self.brain.ping()
-            goals = len(self.memory.active_goals())
-            tasks = len(self.memory.open_tasks())
-            mode = (self.living.self_state.get("state") or {}).get("mode")
-            energy = (self.living.self_state.get("state") or {}).get("energy")
-            lines = [
-                f"Seven Real {__version__}",
-                f"provider={h.get('provider')} ok={h.get('ok')}",
-                f"model={h.get('model')}",
-                f"has_primary={h.get('has_primary')} has_vision={h.get('has_vision')}",
-                f"loaded_in_vram={h.get('loaded')}",
-                f"tool_tier={self.tools.tier} schemas={len(self.tools.names())} total_tools={len(self.tools.all_names())}",
-                f"goals={goals} tasks={tasks} messages={self.memory.message_count()}",
-                f"mode={mode} energy={energy} living_ticks={self.living.tick_count}",
-                f"intent={self.living.self_state.get('intent')}",
-                f"work_session={self.autonomy.session_status().split(chr(10))[0]}",
-                f"data={config.DATA_DIR}",
-                f"workspace={config.WORKSPACE_DIR}",
-            ]
-            if h.get("hint"):
-                lines.append(f"HINT: {h['hint']}")
-            if h.get("error"):
-                lines.append(f"ERROR: {h['error']}")
-            return "\n".join(lines)
+            return self.status_text(self.status_snapshot(max_age=0))
         if t == "/world":
             self.refresh_living_state()
             from seven.mind.world import world_summary
@@ -296,6 +465,11 @@ class Seven:
         if t in ("/live", "/living"):
             self.refresh_living_state()
             return self.living.status_text()
+        if t.startswith("/cadence"):
+            parts = t.split()
+            hours = float(parts[1]) if len(parts) == 2 and parts[1].replace(".", "", 1).isdigit() else 24.0
+            stats = self.living.cadence(since=time.time() - hours * 3600)
+            return f"last {hours:g}h: " + " ".join(f"{k}={v}" for k, v in stats.items())
         if t.startswith("/tools"):
             parts = t.split()
             if len(parts) == 2 and parts[1] in ("core", "full"):
@@ -303,12 +477,7 @@ class Seven:
                 return f"Tool schema tier set to '{parts[1]}'. Active schemas: {len(self.tools.names())}\n" + (
                     "- " + "\n- ".join(self.tools.names())
                 )
-            return (
-                f"tier={self.tools.tier} (schemas shown to model)\n"
-                f"Active ({len(self.tools.names())}):\n- "
-                + "\n- ".join(self.tools.names())
-                + f"\n\nAll registered ({len(self.tools.all_names())}) still executable if named."
-            )
+            return self.tools_listing()
         if t == "/memory":
             return self.memory.context_block()
         if t == "/goals":
@@ -340,6 +509,20 @@ class Seven:
             return self.autonomy.session_status()
         if t == "/stopwork":
             return self.autonomy.stop_session()
+        if t == "/camera" or t.startswith("/camera "):
+            # The only way to start a camera session: a command the user typed.
+            from seven.tools.vision import camera_session_start, camera_session_status, camera_session_stop
+            parts = t.split()
+            if len(parts) == 1:
+                return camera_session_status()
+            if parts[1] == "off" and len(parts) == 2:
+                return camera_session_stop()
+            numbers = parts[2:]
+            if parts[1] != "on" or len(numbers) > 2 or not all(n.replace(".", "", 1).isdigit() for n in numbers):
+                return "Usage: /camera on [seconds] [index] | /camera off | /camera"
+            seconds = float(numbers[0]) if numbers else None
+            index = int(float(numbers[1])) if len(numbers) > 1 else None
+            return camera_session_start(camera_index=index, seconds=seconds)
         if t in ("/clear", "/reset"):
             self.memory.clear_session_messages()
             return "Session chat cleared. Long-term facts/goals kept."
@@ -347,6 +530,88 @@ class Seven:
             return "__QUIT__"
         return None
 
+    # ── read-only snapshots (API /status, /tools) ──────────────────────
+
+    def status_snapshot(self, max_age: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Status from cached state only: never takes the turn lock, never senses
+        inline. Counts are re-read at most every max_age seconds. Freshness
+        holds the unix time each part was last sampled.
+        """
+        from seven import __version__
+        limit = config.STATUS_SNAPSHOT_TTL if max_age is None else max_age
+        counts = self._status_counts
+        if not counts or time.time() - counts["at"] >= limit:
+            counts = {
+                "goals": len(self.memory.active_goals()),
+                "tasks": len(self.memory.open_tasks()),
+                "messages": self.memory.message_count(),
+                "at": round(time.time(), 3),
+            }
+            self._status_counts = counts
+        ollama, ollama_at = self.sensors.cached("ollama")
+        if not ollama_at:
+            ollama = self.living.world.get("ollama") or {}
+        state = self.living.self_state.get("state") or {}
+        return {
+            "version": __version__,
+            "ollama": {
+                k: ollama.get(k)
+                for k in ("provider", "ok", "model", "has_primary", "has_vision", "loaded", "hint", "error")
+            },
+            "tools": {"tier": self.tools.tier, "schemas": len(self.tools.names()), "total": len(self.tools.all_names())},
+            "counts": {k: counts[k] for k in ("goals", "tasks", "messages")},
+            "living": {
+                "mode": state.get("mode"),
+                "energy": state.get("energy"),
+                "ticks": self.living.tick_count,
+                "intent": self.living.self_state.get("intent"),
+            },
+            "work_session": self.autonomy.session_status().split("\n")[0],
+            "data": str(config.DATA_DIR),
+            "workspace": str(config.WORKSPACE_DIR),
+            "freshness": {
+                "ollama": round(ollama_at or self.living.last_tick_ts, 3),
+                "living": round(self.living.last_tick_ts, 3),
+                "counts": counts["at"],
+            },
+        }
+
+    @staticmethod
+    def status_text(snap: Dict[str, Any]) -> str:
+        h = snap["ollama"]
+        living = snap["living"]
+        counts = snap["counts"]
+        tools = snap["tools"]
+        lines = [
+            f"Seven Real {snap['version']}",
+            f"provider={h.get('provider')} ok={h.get('ok')}",
+            f"model={h.get('model')}",
+            f"has_primary={h.get('has_primary')} has_vision={h.get('has_vision')}",
+            f"loaded_in_vram={h.get('loaded')}",
+            f"tool_tier={tools['tier']} schemas={tools['schemas']} total_tools={tools['total']}",
+            f"goals={counts['goals']} tasks={counts['tasks']} messages={counts['messages']}",
+            f"mode={living['mode']} energy={living['energy']} living_ticks={living['ticks']}",
+            f"intent={living['intent']}",
+            f"work_session={snap['work_session']}",
+            f"data={snap['data']}",
+            f"workspace={snap['workspace']}",
+        ]
+        if h.get("hint"):
+            lines.append(f"HINT: {h['hint']}")
+        if h.get("error"):
+            lines.append(f"ERROR: {h['error']}")
+        return "\n".join(lines)
+
+    def tools_listing(self) -> str:
+        names = self.tools.names()
+        return (
+            f"tier={self.tools.tier} (schemas shown to model)\n"
+            f"Active ({len(names)}):\n- "
+            + "\n- ".join(names)
+            + f"\n\nAll registered ({len(self.tools.all_names())}) still executable if named."
+        )
+
     def _build_messages(self) -> List[Dict[str, Any]]:
         living_block = ""
         try:
@@ -375,6 +640,7 @@ class Seven:
     def start_heartbeat(self):
         if not config.ENABLE_HEARTBEAT:
             return
+        self.sensors.start()
         if self._heartbeat_thread and self._heartbeat_thread.is_alive():
             return
         self._heartbeat_stop.clear()
@@ -386,11 +652,13 @@ class Seven:
 
     def stop_heartbeat(self):
         self._heartbeat_stop.set()
+        self.sensors.stop()
 
     def _heartbeat_loop(self):
         while not self._heartbeat_stop.wait(config.HEARTBEAT_SECONDS):
             try:
-                self._autonomous_tick()
+                with TICK_SECONDS.labels("autonomy").time():
+                    self._autonomous_tick()
             except Exception:
                 logger.exception("heartbeat tick failed")
 
@@ -405,6 +673,8 @@ class Seven:
 
         if self._deliver_due_reminders():
             return
+        if self._announce_finished_jobs():
+            return
 
         # Episodic digest once per day when possible
         try:
@@ -490,10 +760,41 @@ class Seven:
                 logger.exception("reminder delivery failed task=%s", task["id"])
         return delivered
 
+    def on_job_finished(self, job: dict):
+        """Job manager listener: announce at once instead of on the next heartbeat."""
+        try:
+            self._announce_finished_jobs()
+        except Exception:
+            logger.exception("job announcement failed job=%s", job.get("id"))
+
+    def _announce_finished_jobs(self) -> bool:
+        """Tell the user once about each finished background job, from any process."""
+        callback = self.freewill.on_utter
+        if callback is None:
+            return False
+        delivered = False
+        for job in self.memory.unannounced_jobs():
+            if not self.memory.claim_job_announcement(int(job["id"])):
+                continue
+            preview = (job.get("result_preview") or "").strip().splitlines()
+            message = f"Background job #{job['id']} ({job['tool']}) {job['status']}" + (f": {preview[0][:200]}" if preview else ".")
+            try:
+                callback(message)
+                self.memory.add_note(message, title="job finished")
+                delivered = True
+            except Exception:
+                logger.exception("job announcement failed job=%s", job["id"])
+        return delivered
+
     def shutdown(self):
         self.stop_heartbeat()
+        jobs = getattr(self.tools, "jobs", None)
+        if jobs is not None:
+            # Running jobs stop their process trees and are recorded as cancelled.
+            jobs.close()
         try:
             self.living.record_action("shutdown", reflection="Agent process stopping.")
+            self.living.save()
         except Exception:
             pass
         logger.info("Seven shut down")
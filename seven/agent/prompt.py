@@ -57,6 +57,7 @@ Name: {config.USER_NAME}
 
 ## Workspace
 {config.WORKSPACE_DIR}
+Indexed: find_indexed locates files by name or opening text; workspace_changes_since lists what changed.
 
 ## Memory
 {memory_block}
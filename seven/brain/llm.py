@@ -6,15 +6,43 @@ from __future__ import annotations
 
 import json
 import logging
+import sys
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import requests
 
-from seven import config
+from seven import config, metrics
 
 logger = logging.getLogger("seven.brain")
 
+LLM_SECONDS = metrics.histogram("seven_llm_seconds", "LLM call latency by caller module and model.", ("caller", "model"))
+LLM_TOKENS = metrics.counter(
+    "seven_llm_tokens_total", "LLM tokens by caller, model and kind (prompt|completion).", ("caller", "model", "kind")
+)
+LLM_ERRORS = metrics.counter("seven_llm_errors_total", "Failed LLM calls by caller and model.", ("caller", "model"))
+
+
+def _caller() -> str:
+    """Module outside this file that made the LLM call, e.g. 'agent.loop'."""
+    frame = sys._getframe(1)
+    while frame is not None and frame.f_globals.get("__name__") == __name__:
+        frame = frame.f_back
+    name = frame.f_globals.get("__name__", "unknown") if frame is not None else "unknown"
+    return name[6:] if name.startswith("seven.") else name
+
+
+def _usage(raw: Any) -> Tuple[int, int]:
+    """(prompt, completion) token counts from an Ollama, OpenAI or Anthropic response."""
+    if not isinstance(raw, dict):
+        return 0, 0
+    if "prompt_eval_count" in raw or "eval_count" in raw:
+        return int(raw.get("prompt_eval_count") or 0), int(raw.get("eval_count") or 0)
+    usage = raw.get("usage") or {}
+    prompt = usage.get("prompt_tokens", usage.get("input_tokens")) or 0
+    completion = usage.get("completion_tokens", usage.get("output_tokens")) or 0
+    return int(prompt), int(completion)
+
 
 class BrainError(Exception):
     pass
@@ -44,8 +72,12 @@ class Brain:
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
         model: Optional[str] = None,
+        on_token: Optional[Callable[[str], None]] = None,
     ) -> Dict[str, Any]:
         """
+        on_token receives content deltas as they arrive (Ollama streams them;
+        other providers deliver the whole reply as one delta).
+
         Returns:
           {
             "role": "assistant",
@@ -57,9 +89,52 @@ class Brain:
         temperature = config.LLM_TEMPERATURE if temperature is None else temperature
         max_tokens = config.LLM_MAX_TOKENS if max_tokens is None else max_tokens
         model = model or self.model
+        return self._observed(
+            model, lambda: self._chat(messages, tools, temperature, max_tokens, model, on_token)
+        )
 
+    def _observed(self, model: str, call: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        caller = _caller()
+        started = time.perf_counter()
+        try:
+            result = call()
+        except Exception:
+            LLM_SECONDS.labels(caller, model).observe(time.perf_counter() - started)
+            LLM_ERRORS.labels(caller, model).inc()
+            raise
+        served = result.get("model") or model
+        LLM_SECONDS.labels(caller, served).observe(time.perf_counter() - started)
+        prompt, completion = _usage(result.get("raw"))
+        if prompt:
+            LLM_TOKENS.labels(caller, served, "prompt").inc(prompt)
+        if completion:
+            LLM_TOKENS.labels(caller, served, "completion").inc(completion)
+        return result
+
+    def _chat(
+        self,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]],
+        temperature: float,
+        max_tokens: int,
+        model: str,
+        on_token: Optional[Callable[[str], None]],
+    ) -> Dict[str, Any]:
         if self.provider == "ollama":
-            return self._ollama_chat(messages, tools, temperature, max_tokens, model)
+            return self._ollama_chat(messages, tools, temperature, max_tokens, model, on_token=on_token)
+        result = self._provider_chat(messages, tools, temperature, max_tokens, model)
+        if on_token and result.get("content"):
+            on_token(result["content"])
+        return result
+
+    def _provider_chat(
+        self,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]],
+        temperature: float,
+        max_tokens: int,
+        model: str,
+    ) -> Dict[str, Any]:
         if self.provider == "openai":
             return self._openai_chat(
                 messages, tools, temperature, max_tokens, model or config.OPENAI_MODEL,
@@ -106,8 +181,9 @@ class Brain:
             keep = getattr(config, "VISION_KEEP_ALIVE", "2m")
             payload_model = self.vision_model
             try:
-                result = self._ollama_chat(
-                    messages, None, 0.2, 1024, payload_model, keep_alive=keep
+                result = self._observed(
+                    payload_model,
+                    lambda: self._ollama_chat(messages, None, 0.2, 1024, payload_model, keep_alive=keep),
                 )
                 return (result.get("content") or "").strip()
             except BrainError as e:
@@ -236,11 +312,12 @@ class Brain:
         max_tokens: int,
         model: str,
         keep_alive: Optional[str] = None,
+        on_token: Optional[Callable[[str], None]] = None,
     ) -> Dict[str, Any]:
         payload: Dict[str, Any] = {
             "model": model,
             "messages": self._normalize_messages_for_ollama(messages),
-            "stream": False,
+            "stream": on_token is not None,
             "options": {
                 "temperature": temperature,
                 "num_predict": max_tokens,
@@ -253,14 +330,17 @@ class Brain:
         # Default keep_alive warms text model; vision passes short keep_alive
         payload["keep_alive"] = keep_alive if keep_alive is not None else "30m"
         try:
-            r = self._session.post(url, json=payload, timeout=config.LLM_TIMEOUT)
+            r = self._session.post(url, json=payload, timeout=config.LLM_TIMEOUT, stream=on_token is not None)
             if r.status_code >= 400:
                 # Retry without tools if model rejects tool schema
                 if tools and r.status_code in (400, 404, 500):
                     logger.warning("Ollama tools rejected (%s); retrying tool-free + text protocol", r.status_code)
-                    return self._ollama_text_tool_fallback(messages, tools, temperature, max_tokens, model)
+                    result = self._ollama_text_tool_fallback(messages, tools, temperature, max_tokens, model)
+                    if on_token and result.get("content"):
+                        on_token(result["content"])
+                    return result
                 raise BrainError(f"Ollama HTTP {r.status_code}: {r.text[:500]}")
-            data = r.json()
+            data = self._read_ollama_stream(r, on_token) if on_token else r.json()
         except requests.Timeout as e:
             # Cold load / model swap on 8GB VRAM can exceed one shot — try loaded model
             loaded = self._ollama_loaded_model()
@@ -268,9 +348,9 @@ class Brain:
                 logger.warning("Timeout on %s — retrying with already-loaded %s", model, loaded)
                 payload["model"] = loaded
                 try:
-                    r = self._session.post(url, json=payload, timeout=config.LLM_TIMEOUT)
+                    r = self._session.post(url, json=payload, timeout=config.LLM_TIMEOUT, stream=on_token is not None)
                     r.raise_for_status()
-                    data = r.json()
+                    data = self._read_ollama_stream(r, on_token) if on_token else r.json()
                     model = loaded
                 except requests.RequestException as e2:
                     raise BrainError(
@@ -304,6 +384,38 @@ class Brain:
             "model": model,
         }
 
+    @staticmethod
+    def _read_ollama_stream(r, on_token: Callable[[str], None]) -> Dict[str, Any]:
+        """Fold an NDJSON /api/chat stream into the non-streaming response shape."""
+        parts: List[str] = []
+        tool_calls: List[Dict[str, Any]] = []
+        last: Dict[str, Any] = {}
+        # Closing the response on any exit (including a cancelling on_token)
+        # aborts generation instead of draining it.
+        with r:
+            for line in r.iter_lines():
+                if not line:
+                    continue
+                try:
+                    chunk = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if chunk.get("error"):
+                    raise BrainError(f"Ollama stream error: {chunk['error']}")
+                msg = chunk.get("message") or {}
+                delta = msg.get("content") or ""
+                if delta:
+                    parts.append(delta)
+                    on_token(delta)
+                tool_calls.extend(msg.get("tool_calls") or [])
+                last = chunk
+                if chunk.get("done"):
+                    break
+        message: Dict[str, Any] = {"role": "assistant", "content": "".join(parts)}
+        if tool_calls:
+            message["tool_calls"] = tool_calls
+        return {**last, "message": message}
+
     def _ollama_text_tool_fallback(
         self,
         messages: List[Dict[str, Any]],
@@ -58,6 +58,8 @@ MAX_TOOL_ROUNDS = int(os.getenv("SEVEN_MAX_TOOL_ROUNDS", "12"))
 # Execution is still L4 — tier only limits what the model *sees* in schemas.
 # full = expose all tools to the model (user wants full capability; no artificial schema gate)
 TOOL_TIER = os.getenv("SEVEN_TOOL_TIER", "full").lower()  # core | full
+# Serve built-in tool schemas from a cached manifest; import tool modules on first use
+LAZY_TOOLS = os.getenv("SEVEN_LAZY_TOOLS", "1") != "0"
 
 # ── Autonomy (L4) ─────────────────────────────────────────────────────
 # User requested unrestricted L4. Tools execute. Audit log still written.
@@ -65,6 +67,44 @@ AUTONOMY_LEVEL = 4
 REQUIRE_CONFIRMATION = False  # L4: act, don't nag
 SHELL_TIMEOUT = int(os.getenv("SEVEN_SHELL_TIMEOUT", "120"))
 SHELL_DEFAULT_CWD = str(WORKSPACE_DIR)
+# Streaming subprocess output keeps the first/last this many bytes of each pipe.
+PROCESS_OUTPUT_HEAD_BYTES = int(os.getenv("SEVEN_OUTPUT_HEAD_BYTES", "32768"))
+PROCESS_OUTPUT_TAIL_BYTES = int(os.getenv("SEVEN_OUTPUT_TAIL_BYTES", "65536"))
+# run_python warm workers (0 = a fresh interpreter per call). Modules that fail to import are skipped.
+PYTHON_WORKERS = int(os.getenv("SEVEN_PYTHON_WORKERS", "0"))
+PYTHON_PRELOAD = os.getenv("SEVEN_PYTHON_PRELOAD", "json,re,math,statistics,datetime,collections,csv,numpy,pandas")
+PYTHON_WORKER_MAX_RUNS = int(os.getenv("SEVEN_PYTHON_WORKER_MAX_RUNS", "200"))
+PYTHON_WORKER_MAX_RSS_MB = float(os.getenv("SEVEN_PYTHON_WORKER_MAX_RSS_MB", "1024"))
+# Threads listing directories for search_files/grep_files (1 = walk on the calling thread).
+FILE_SEARCH_WORKERS = int(os.getenv("SEVEN_SEARCH_WORKERS", "1"))
+# Background jobs (start_job) running at once; later ones queue. Logs live in DATA_DIR/jobs.
+JOB_WORKERS = int(os.getenv("SEVEN_JOB_WORKERS", "2"))
+# Workspace file index (find_indexed, workspace_changes_since): a rebuildable
+# SQLite cache per root. Without the inotify watcher, a query older than
+# MAX_AGE seconds re-walks the tree (stat only; changed files are re-read).
+FILE_INDEX_DIR = Path(os.getenv("SEVEN_INDEX_DIR", DATA_DIR / "index"))
+FILE_INDEX_MAX_AGE = float(os.getenv("SEVEN_INDEX_MAX_AGE", "30"))
+FILE_INDEX_WATCH = os.getenv("SEVEN_INDEX_WATCH", "1") != "0"
+# Web tools: pooled HTTP connections per host, the byte cap on a downloaded
+# body, and an on-disk HTTP cache honouring ETag/Last-Modified/Cache-Control.
+HTTP_POOL_SIZE = int(os.getenv("SEVEN_HTTP_POOL", "16"))
+WEB_MAX_BYTES = int(os.getenv("SEVEN_WEB_MAX_BYTES", str(2 * 1024 * 1024)))
+HTTP_CACHE_DIR = Path(os.getenv("SEVEN_HTTP_CACHE_DIR", DATA_DIR / "http_cache"))
+HTTP_CACHE_MB = float(os.getenv("SEVEN_HTTP_CACHE_MB", "200"))
+# web_search_many: searches and page prefetches in flight at once.
+WEB_SEARCH_WORKERS = int(os.getenv("SEVEN_WEB_SEARCH_WORKERS", "4"))
+# browser_get/browser_screenshot: a warm Chromium with this many isolated
+# contexts, each replaced after PAGES_PER_CONTEXT pages or above MAX_RSS_MB;
+# the browser shuts down after IDLE_SECONDS without a page (0 = never).
+BROWSER_CONTEXTS = int(os.getenv("SEVEN_BROWSER_CONTEXTS", "2"))
+BROWSER_PAGES_PER_CONTEXT = int(os.getenv("SEVEN_BROWSER_PAGES_PER_CONTEXT", "50"))
+BROWSER_IDLE_SECONDS = float(os.getenv("SEVEN_BROWSER_IDLE_SECONDS", "300"))
+BROWSER_MAX_RSS_MB = float(os.getenv("SEVEN_BROWSER_MAX_RSS_MB", "1500"))
+# read_document: extracted text cached per page/slide/sheet block (0 MB keeps
+# nothing between calls); large PDFs are extracted on this many processes.
+DOCUMENT_CACHE_PATH = Path(os.getenv("SEVEN_DOCUMENT_CACHE", DATA_DIR / "document_cache.db"))
+DOCUMENT_CACHE_MB = float(os.getenv("SEVEN_DOCUMENT_CACHE_MB", "500"))
+DOCUMENT_WORKERS = int(os.getenv("SEVEN_DOCUMENT_WORKERS", str(min(4, os.cpu_count() or 1))))
 
 # ── Memory ─────────────────────────────────────────────────────────────
 MAX_HISTORY_TURNS = int(os.getenv("SEVEN_MAX_HISTORY", "40"))
@@ -104,11 +144,19 @@ DEFAULT_SPEECH_RATE = int(os.getenv("SEVEN_SPEECH_RATE", "165"))
 # ── Sensors ────────────────────────────────────────────────────────────
 ENABLE_CAMERA = os.getenv("SEVEN_CAMERA", "0") == "1"
 CAMERA_INDEX = int(os.getenv("SEVEN_CAMERA_INDEX", "0"))
+# /camera on keeps the webcam open for this long by default (capped
+# at MAX_SECONDS); captures then reuse its latest frame instead of reopening.
+CAMERA_SESSION_SECONDS = float(os.getenv("SEVEN_CAMERA_SESSION_SECONDS", "300"))
+CAMERA_SESSION_MAX_SECONDS = float(os.getenv("SEVEN_CAMERA_SESSION_MAX_SECONDS", "3600"))
 ENABLE_SCREEN = True
 # Vision model image prep (8GB VRAM friendly)
 VISION_MAX_EDGE = int(os.getenv("SEVEN_VISION_MAX_EDGE", "1280"))
 VISION_JPEG_QUALITY = int(os.getenv("SEVEN_VISION_JPEG_QUALITY", "75"))
 VISION_KEEP_ALIVE = os.getenv("SEVEN_VISION_KEEP_ALIVE", "2m")  # free VRAM after analysis
+# Reuse a vision answer for the same prompt when the image's 256-bit dHash is
+# within this many bits of one answered in the last VISION_CACHE_SECONDS (0 s = off).
+VISION_CACHE_DISTANCE = int(os.getenv("SEVEN_VISION_CACHE_DISTANCE", "4"))
+VISION_CACHE_SECONDS = float(os.getenv("SEVEN_VISION_CACHE_SECONDS", "120"))
 
 # ── Background / continuous ────────────────────────────────────────────
 # No spam greetings. Background only for real scheduled work or sensor events.
@@ -125,6 +173,15 @@ AUTONOMY_MIN_INTERVAL = float(os.getenv("SEVEN_AUTONOMY_MIN_INTERVAL", "60"))
 WORK_SESSION_MINUTES = float(os.getenv("SEVEN_WORK_MINUTES", "15"))
 # Daemon: how often to refresh world/self (seconds)
 DAEMON_SENSE_SECONDS = float(os.getenv("SEVEN_DAEMON_SENSE", "60"))
+# Sensor hub: per-probe TTLs (seconds) and ring-buffer depth for the background sampler
+SENSE_RESOURCES_TTL = float(os.getenv("SEVEN_SENSE_RESOURCES_TTL", "10"))
+SENSE_OLLAMA_TTL = float(os.getenv("SEVEN_SENSE_OLLAMA_TTL", "30"))
+SENSE_WORK_TTL = float(os.getenv("SEVEN_SENSE_WORK_TTL", "15"))
+SENSE_HISTORY = int(os.getenv("SEVEN_SENSE_HISTORY", "120"))
+# Living state: append-only journal + compact snapshot every N seconds; bounded retention
+LIVING_SNAPSHOT_INTERVAL = float(os.getenv("SEVEN_LIVING_SNAPSHOT_INTERVAL", "120"))
+LIVING_JOURNAL_RETENTION_DAYS = float(os.getenv("SEVEN_LIVING_RETENTION_DAYS", "14"))
+LIVING_JOURNAL_MAX_ENTRIES = int(os.getenv("SEVEN_LIVING_JOURNAL_MAX", "50000"))
 
 # ── Embodiment (robot-ready bus; no hardware required) ─────────────────
 ENABLE_ROBOTICS = os.getenv("SEVEN_ROBOTICS", "0") == "1"
@@ -145,6 +202,28 @@ API_MAX_CONCURRENT_REQUESTS = int(os.getenv("SEVEN_API_CONCURRENCY", "8"))
 API_SOCKET_TIMEOUT = float(os.getenv("SEVEN_API_SOCKET_TIMEOUT", "30"))
 API_MAX_BODY_BYTES = int(os.getenv("SEVEN_API_MAX_BODY_BYTES", str(1024 * 1024)))
 API_MAX_MESSAGE_CHARS = int(os.getenv("SEVEN_API_MAX_MESSAGE_CHARS", "100000"))
+# Comment frames on idle /chat/stream connections (tool runs, model load).
+API_SSE_HEARTBEAT_SECONDS = float(os.getenv("SEVEN_API_SSE_HEARTBEAT", "15"))
+# Max age of the cached /status and /tools snapshots (and their SQLite counts).
+STATUS_SNAPSHOT_TTL = float(os.getenv("SEVEN_STATUS_TTL", "5"))
+# /memory/* keyset pages: default and maximum rows per page (per kind for search).
+API_PAGE_DEFAULT = int(os.getenv("SEVEN_API_PAGE_DEFAULT", "50"))
+API_PAGE_MAX = int(os.getenv("SEVEN_API_PAGE_MAX", "1000"))
+# POST /chat/batch: max prompts per request, and isolated turns run at once per server.
+API_BATCH_MAX_ITEMS = int(os.getenv("SEVEN_API_BATCH_MAX_ITEMS", "256"))
+API_BATCH_WORKERS = int(os.getenv("SEVEN_API_BATCH_WORKERS", "4"))
+# "threading" (one thread per connection, HTTP/1.0) or "asyncio" (keep-alive,
+# pipelining, cheap idle connections; agent work on API_ASYNC_WORKERS threads).
+API_BACKEND = os.getenv("SEVEN_API_BACKEND", "threading").strip().lower()
+API_ASYNC_WORKERS = int(os.getenv("SEVEN_API_WORKERS", "4"))
+API_MAX_CONNECTIONS = int(os.getenv("SEVEN_API_MAX_CONNECTIONS", "4096"))
+API_MAX_STREAMS = int(os.getenv("SEVEN_API_MAX_STREAMS", "1024"))
+# MCP: parallel calls per tool concurrency class; "desktop" and "device" are always 1.
+MCP_READ_CONCURRENCY = int(os.getenv("SEVEN_MCP_READ_CONCURRENCY", "16"))
+MCP_DEFAULT_CONCURRENCY = int(os.getenv("SEVEN_MCP_CONCURRENCY", "4"))
+MCP_HEAVY_CONCURRENCY = int(os.getenv("SEVEN_MCP_HEAVY_CONCURRENCY", "2"))
+# Minimum seconds between progress reports from one long-running tool call.
+PROGRESS_INTERVAL_SECONDS = float(os.getenv("SEVEN_PROGRESS_INTERVAL", "0.5"))
 
 # ── Logging ────────────────────────────────────────────────────────────
 LOG_LEVEL = os.getenv("SEVEN_LOG_LEVEL", "INFO")
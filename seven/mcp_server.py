@@ -6,28 +6,93 @@ Seven deliberately does not sandbox or downgrade tool calls made through it.
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
 import sys
+import threading
 from typing import Any
 
-from seven import __version__
+from seven import __version__, config
 from seven.memory.store import Memory
+from seven.runtime.process import cancel_scope
+from seven.runtime.progress import ProgressSink, progress_scope
 from seven.tools.registry import ToolRegistry, build_default_registry
 
 
+def concurrency_limits() -> dict[str, int]:
+    return {
+        "read": max(1, config.MCP_READ_CONCURRENCY),
+        "default": max(1, config.MCP_DEFAULT_CONCURRENCY),
+        "heavy": max(1, config.MCP_HEAVY_CONCURRENCY),
+        "desktop": 1,
+        "device": 1,
+    }
+
+
 class SevenMCP:
     """Protocol-independent adapter, kept directly testable without stdio."""
 
     def __init__(self, memory: Memory | None = None, registry: ToolRegistry | None = None):
         self.memory = memory or Memory()
         self.registry = registry or build_default_registry(self.memory, tier="full")
+        self.limits = concurrency_limits()
+        self._slots: dict[str, asyncio.Semaphore] = {}
+        self._specs: tuple[tuple[int, str], list[dict[str, Any]]] | None = None
 
     def tool_specs(self) -> list[dict[str, Any]]:
-        return [schema["function"] for schema in self.registry.schemas()]
-
-    def call(self, name: str, arguments: dict[str, Any] | None = None) -> str:
-        return self.registry.execute(name, arguments or {})
+        """Rebuilt only when the registry revision or tier changes."""
+        key = (self.registry.revision, self.registry.tier)
+        if self._specs is None or self._specs[0] != key:
+            self._specs = (key, [schema["function"] for schema in self.registry.schemas()])
+        return self._specs[1]
+
+    def call(
+        self,
+        name: str,
+        arguments: dict[str, Any] | None = None,
+        cancel: threading.Event | None = None,
+        on_progress: ProgressSink | None = None,
+    ) -> str:
+        with cancel_scope(cancel or threading.Event()), progress_scope(on_progress):
+            return self.registry.execute(name, arguments or {})
+
+    def _slot(self, name: str) -> asyncio.Semaphore:
+        kind = self.registry.concurrency_class(name)
+        if kind not in self.limits:
+            kind = "default"
+        if kind not in self._slots:
+            self._slots[kind] = asyncio.Semaphore(self.limits[kind])
+        return self._slots[kind]
+
+    async def call_async(
+        self,
+        name: str,
+        arguments: dict[str, Any] | None = None,
+        on_progress: ProgressSink | None = None,
+    ) -> str:
+        """
+        Run a call on a worker thread inside its concurrency class. Cancelling
+        the awaiting task stops run_tracked process trees; the class slot is
+        held until the thread really finishes, so serialized tools never overlap.
+        on_progress receives the tool's progress reports on that worker thread.
+        """
+        slot = self._slot(name)
+        await slot.acquire()
+        cancel = threading.Event()
+        try:
+            future = asyncio.get_running_loop().run_in_executor(
+                None, functools.partial(self.call, name, arguments, cancel, on_progress)
+            )
+        except BaseException:
+            slot.release()
+            raise
+        future.add_done_callback(lambda _: slot.release())
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            cancel.set()
+            raise
 
 
 def create_server(adapter: SevenMCP | None = None):
@@ -44,26 +109,51 @@ def create_server(adapter: SevenMCP | None = None):
         "The MCP client is responsible for user consent and process access."
     ))
 
+    listed: dict[str, Any] = {}
+
     @server.list_tools()
     async def list_tools():
-        return [
-            types.Tool(
-                name=spec["name"],
-                description=spec.get("description", ""),
-                inputSchema=spec.get("parameters") or {"type": "object", "properties": {}},
-            )
-            for spec in seven.tool_specs()
-        ]
+        specs = seven.tool_specs()
+        if listed.get("specs") is not specs:
+            listed["tools"] = [
+                types.Tool(
+                    name=spec["name"],
+                    description=spec.get("description", ""),
+                    inputSchema=spec.get("parameters") or {"type": "object", "properties": {}},
+                )
+                for spec in specs
+            ]
+            listed["specs"] = specs
+        return listed["tools"]
 
     @server.call_tool(validate_input=True)
     async def call_tool(name: str, arguments: dict[str, Any] | None):
-        result = await asyncio.to_thread(seven.call, name, arguments)
+        result = await seven.call_async(name, arguments, _progress_notifier(server.request_context))
         return [types.TextContent(type="text", text=result)]
 
     server.seven_adapter = seven
     return server
 
 
+def _progress_notifier(context) -> ProgressSink | None:
+    """Forward tool progress as notifications/progress when the client sent a progressToken."""
+    token = getattr(context.meta, "progressToken", None) if context.meta else None
+    if token is None:
+        return None
+    loop = asyncio.get_running_loop()
+
+    def notify(update: dict[str, Any]) -> None:
+        asyncio.run_coroutine_threadsafe(
+            context.session.send_progress_notification(
+                token, update["progress"], update.get("total"), update.get("message"),
+                related_request_id=context.request_id,
+            ),
+            loop,
+        )
+
+    return notify
+
+
 async def run_stdio() -> None:
     try:
         from mcp.server.stdio import stdio_server
@@ -0,0 +1,242 @@
+"""
+Extracted document text for read_document, cached per unit.
+
+One SQLite file (DOCUMENT_CACHE_PATH) holds, per document path, the size,
+mtime and SHA-256 the text was extracted from, and the text of each unit
+read so far: a PDF page, a PPTX slide, the whole of a DOCX, or an XLSX sheet
+in blocks of ROW_BLOCK rows. Units are stored as they are extracted, so
+reading a window of a large document caches that window. A changed size or
+mtime re-hashes the file; an unchanged hash keeps the cached text. Least
+recently used documents are dropped once the stored text passes
+DOCUMENT_CACHE_MB. It is a cache: deleting the file costs re-extraction.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from seven import config
+
+ROW_BLOCK = 1000
+HASH_CHUNK = 1024 * 1024
+
+
+class CachedDocument(NamedTuple):
+    id: int
+    sha256: str
+    units: Optional[int]  # pages, slides or sheets; None until counted
+    meta: Dict[str, Any]
+
+
+class UnitState(NamedTuple):
+    complete: bool
+    rows: int  # sheet rows; 0 for other units
+    chars: int
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DocumentCache:
+    def __init__(self, db_path: Optional[Path] = None, max_mb: Optional[float] = None):
+        self.db_path = Path(db_path or config.DOCUMENT_CACHE_PATH)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = (config.DOCUMENT_CACHE_MB if max_mb is None else max_mb) * 1024 * 1024
+        self._lock = threading.Lock()
+        self._init_db()
+
+    @contextmanager
+    def _conn(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys=ON")
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def _init_db(self) -> None:
+        with self._conn() as c:
+            c.execute("PRAGMA journal_mode=WAL")
+            c.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS documents (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    path TEXT NOT NULL UNIQUE,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    sha256 TEXT NOT NULL,
+                    units INTEGER,
+                    meta TEXT NOT NULL DEFAULT '{}',
+                    chars INTEGER NOT NULL DEFAULT 0,
+                    used_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS units (
+                    doc INTEGER NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+                    unit INTEGER NOT NULL,
+                    complete INTEGER NOT NULL DEFAULT 0,
+                    rows INTEGER NOT NULL DEFAULT 0,
+                    chars INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (doc, unit)
+                );
+                CREATE TABLE IF NOT EXISTS parts (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    doc INTEGER NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+                    unit INTEGER NOT NULL,
+                    block INTEGER NOT NULL,
+                    rows INTEGER NOT NULL DEFAULT 0,
+                    text TEXT NOT NULL,
+                    UNIQUE (doc, unit, block)
+                );
+                CREATE INDEX IF NOT EXISTS idx_documents_used ON documents(used_at);
+                """
+            )
+
+    def open(self, path: Path, st: Optional[os.stat_result] = None) -> Tuple[CachedDocument, str]:
+        """The entry for path, reset when its content changed; (entry, "cached"|"rehashed"|"new")."""
+        key = str(path)
+        st = st or os.stat(path)
+        with self._lock, self._conn() as c:
+            row = c.execute("SELECT * FROM documents WHERE path=?", (key,)).fetchone()
+            state = "cached"
+            if row is None or (row["size"], row["mtime_ns"]) != (st.st_size, st.st_mtime_ns):
+                sha = file_sha256(path)
+                if row is not None and row["sha256"] == sha:
+                    state = "rehashed"
+                    c.execute("UPDATE documents SET size=?, mtime_ns=? WHERE id=?", (st.st_size, st.st_mtime_ns, row["id"]))
+                else:
+                    state = "new"
+                    if row is not None:
+                        c.execute("DELETE FROM documents WHERE id=?", (row["id"],))
+                    c.execute(
+                        "INSERT INTO documents(path, size, mtime_ns, sha256, used_at) VALUES (?,?,?,?,?)",
+                        (key, st.st_size, st.st_mtime_ns, sha, time.time()),
+                    )
+                row = c.execute("SELECT * FROM documents WHERE path=?", (key,)).fetchone()
+            c.execute("UPDATE documents SET used_at=? WHERE id=?", (time.time(), row["id"]))
+            return CachedDocument(row["id"], row["sha256"], row["units"], json.loads(row["meta"])), state
+
+    def describe(self, doc: int, units: Optional[int] = None, **meta: Any) -> None:
+        """Record the unit count and merge meta into the document's metadata."""
+        with self._lock, self._conn() as c:
+            row = c.execute("SELECT meta FROM documents WHERE id=?", (doc,)).fetchone()
+            if row is None:
+                return
+            merged = {**json.loads(row["meta"]), **meta}
+            c.execute(
+                "UPDATE documents SET units=COALESCE(?, units), meta=? WHERE id=?",
+                (units, json.dumps(merged, ensure_ascii=False), doc),
+            )
+
+    def states(self, doc: int) -> Dict[int, UnitState]:
+        with self._conn() as c:
+            return {
+                r["unit"]: UnitState(bool(r["complete"]), r["rows"], r["chars"])
+                for r in c.execute("SELECT unit, complete, rows, chars FROM units WHERE doc=?", (doc,))
+            }
+
+    def texts(self, doc: int, units: Iterable[int]) -> Dict[int, str]:
+        """Text of the complete single-block units among units."""
+        wanted = list(units)
+        found: Dict[int, str] = {}
+        with self._conn() as c:
+            for start in range(0, len(wanted), 500):
+                batch = wanted[start:start + 500]
+                marks = ",".join("?" * len(batch))
+                for r in c.execute(
+                    f"SELECT p.unit, p.text FROM parts p JOIN units u ON u.doc=p.doc AND u.unit=p.unit "
+                    f"WHERE p.doc=? AND u.complete=1 AND p.block=0 AND p.unit IN ({marks})",
+                    (doc, *batch),
+                ):
+                    found[r["unit"]] = r["text"]
+        return found
+
+    def blocks(self, doc: int, unit: int, first: int, last: int) -> Dict[int, Tuple[int, str]]:
+        """block -> (rows, text) for the stored blocks first..last of unit."""
+        with self._conn() as c:
+            return {
+                r["block"]: (r["rows"], r["text"])
+                for r in c.execute(
+                    "SELECT block, rows, text FROM parts WHERE doc=? AND unit=? AND block BETWEEN ? AND ?",
+                    (doc, unit, first, last),
+                )
+            }
+
+    def put(self, doc: int, parts: List[Tuple[int, int, int, str]], complete: bool = False) -> None:
+        """Store (unit, block, rows, text) parts; complete marks single-block units as fully stored."""
+        if not parts:
+            return
+        with self._lock, self._conn() as c:
+            if c.execute("SELECT 1 FROM documents WHERE id=?", (doc,)).fetchone() is None:
+                return  # pruned meanwhile
+            added = 0
+            for unit, block, rows, text in parts:
+                old = c.execute("SELECT length(text) FROM parts WHERE doc=? AND unit=? AND block=?", (doc, unit, block)).fetchone()
+                c.execute(
+                    "INSERT OR REPLACE INTO parts(doc, unit, block, rows, text) VALUES (?,?,?,?,?)",
+                    (doc, unit, block, rows, text),
+                )
+                delta = len(text) - (old[0] if old else 0)
+                c.execute(
+                    "INSERT INTO units(doc, unit, complete, rows, chars) VALUES (?,?,?,?,?) "
+                    "ON CONFLICT(doc, unit) DO UPDATE SET chars=chars+excluded.chars, "
+                    "complete=max(complete, excluded.complete), rows=CASE WHEN excluded.complete THEN excluded.rows ELSE rows END",
+                    (doc, unit, int(complete), rows, delta),
+                )
+                added += delta
+            c.execute("UPDATE documents SET chars=chars+? WHERE id=?", (added, doc))
+
+    def finish(self, doc: int, unit: int, rows: int) -> None:
+        """Mark a multi-block unit (a sheet) fully stored with its total rows."""
+        with self._lock, self._conn() as c:
+            c.execute(
+                "INSERT INTO units(doc, unit, complete, rows) SELECT ?, ?, 1, ? WHERE EXISTS (SELECT 1 FROM documents WHERE id=?) "
+                "ON CONFLICT(doc, unit) DO UPDATE SET complete=1, rows=excluded.rows",
+                (doc, unit, rows, doc),
+            )
+
+    def prune(self) -> int:
+        """Drop least recently used documents until the stored text fits; the number dropped."""
+        with self._lock, self._conn() as c:
+            total = c.execute("SELECT COALESCE(SUM(chars), 0) FROM documents").fetchone()[0]
+            dropped = 0
+            for r in c.execute("SELECT id, chars FROM documents ORDER BY used_at").fetchall():
+                if total <= self.max_bytes:
+                    break
+                c.execute("DELETE FROM documents WHERE id=?", (r["id"],))
+                total -= r["chars"]
+                dropped += 1
+            return dropped
+
+    def stats(self) -> Dict[str, Any]:
+        with self._conn() as c:
+            docs, chars = c.execute("SELECT COUNT(*), COALESCE(SUM(chars), 0) FROM documents").fetchone()
+        return {"path": str(self.db_path), "documents": docs, "chars": chars, "max_mb": self.max_bytes / (1024 * 1024)}
+
+
+_CACHE: Optional[DocumentCache] = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_document_cache() -> DocumentCache:
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None or _CACHE.db_path != Path(config.DOCUMENT_CACHE_PATH):
+            _CACHE = DocumentCache()
+        return _CACHE
@@ -0,0 +1,174 @@
+"""
+Local documents ingested into semantic memory, for search_documents.
+
+ingest() walks a folder the way search_files does (.gitignore rules, no VCS
+directories), extracts every supported file through read_document's
+extractor and cache, splits each page, slide or sheet into overlapping
+CHUNK_CHARS windows that keep their character offsets, embeds them with the
+hashing embedding of vector.py and writes them to the memory database in
+transactions of WRITE_BATCH chunks. Files whose size and mtime match what was
+ingested are skipped; a new mtime with the same SHA-256 is only re-stamped.
+Files that left the folder are dropped from the index.
+
+search() takes FTS5 (bm25) candidates and ranks them by embedding cosine.
+"""
+from __future__ import annotations
+
+import logging
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from seven.memory.document_cache import file_sha256
+from seven.memory.store import Memory
+from seven.memory.vector import cosine, embed_text, pack, unpack
+from seven.runtime.progress import report_progress
+from seven.tools.documents import PAGED, READ_ERRORS, SUPPORTED, document_units
+from seven.tools.file_search import walk
+
+logger = logging.getLogger("seven.document_index")
+
+CHUNK_CHARS = 1200
+CHUNK_OVERLAP = 200
+WRITE_BATCH = 2000
+MAX_FILES = 20_000
+CANDIDATES = 200
+UNIT_NAMES = {**{ext.lstrip("."): label[:-1] for ext, label in PAGED.items()}, "xlsx": "sheet"}
+_BREAKS = ("\n\n", "\n", ". ", " ")
+_WORD = re.compile(r"\w+")
+
+
+def chunk_text(text: str, size: int = CHUNK_CHARS, overlap: int = CHUNK_OVERLAP) -> List[Tuple[int, int, str]]:
+    """(start, end, text) windows of about size chars, overlapping by about overlap.
+
+    Windows end at a paragraph, line, sentence or word break in their second
+    half when there is one, and start on a word; offsets index into text.
+    """
+    chunks: List[Tuple[int, int, str]] = []
+    start, length = 0, len(text)
+    while start < length:
+        end = min(length, start + size)
+        if end < length:
+            floor = start + size // 2
+            for mark in _BREAKS:
+                cut = text.rfind(mark, floor, end)
+                if cut >= 0:
+                    end = cut + len(mark)
+                    break
+        piece = text[start:end]
+        lead = len(piece) - len(piece.lstrip())
+        if piece.strip():
+            chunks.append((start + lead, start + len(piece.rstrip()), piece.strip()))
+        if end >= length:
+            break
+        nxt = max(end - overlap, start + 1)
+        space = text.find(" ", nxt, end)
+        start = space + 1 if space >= 0 else nxt
+    return chunks
+
+
+def fts_any(text: str) -> str:
+    """Words -> an FTS5 query matching any of them as prefixes."""
+    return " OR ".join(f'"{word}"*' for word in dict.fromkeys(w.lower() for w in _WORD.findall(text)))
+
+
+class DocumentIndex:
+    def __init__(self, memory: Memory):
+        self.memory = memory
+
+    def _chunks(self, path: Path) -> List[Tuple[Optional[int], int, int, str, bytes]]:
+        return [
+            (unit, start, end, text, pack(embed_text(text)))
+            for unit, body in document_units(path)
+            for start, end, text in chunk_text(body)
+        ]
+
+    def ingest(self, root: Path, force: bool = False, max_files: int = MAX_FILES) -> Dict[str, Any]:
+        """Bring the index of root (a folder or one file) up to date; counts, failures and timing."""
+        started = time.perf_counter()
+        root = Path(root).expanduser().resolve()
+        if root.is_file():
+            paths, complete = [root], True
+        else:
+            paths, complete = [], True
+            for entry in walk(root):
+                if not entry.is_dir and Path(entry.path).suffix.lower() in SUPPORTED:
+                    if len(paths) >= max_files:
+                        complete = False
+                        break
+                    paths.append(Path(entry.path))
+        known = self.memory.document_sources(str(root))
+        report: Dict[str, Any] = {
+            "root": str(root), "files": len(paths), "new": 0, "changed": 0, "unchanged": 0,
+            "removed": 0, "chunks": 0, "failed": [], "complete": complete,
+        }
+        pending: List[Dict[str, Any]] = []
+        stamps: List[Tuple[str, int, int]] = []
+        waiting = 0
+        extract_seconds = 0.0
+        for done, path in enumerate(paths, 1):
+            key = str(path)
+            try:
+                st = path.stat()
+                old = known.get(key)
+                if old is not None and not force and (old["size"], old["mtime_ns"]) == (st.st_size, st.st_mtime_ns):
+                    report["unchanged"] += 1
+                    continue
+                sha = file_sha256(path)
+                if old is not None and not force and old["sha256"] == sha:
+                    stamps.append((key, st.st_size, st.st_mtime_ns))
+                    report["unchanged"] += 1
+                    continue
+                began = time.perf_counter()
+                chunks = self._chunks(path)
+                extract_seconds += time.perf_counter() - began
+            except READ_ERRORS as exc:
+                report["failed"].append(f"{key}: {exc}")
+                continue
+            except Exception as exc:
+                # Extractors can fail in ways READ_ERRORS does not list; one file must not stop the folder.
+                logger.warning("ingest of %s failed", key, exc_info=True)
+                report["failed"].append(f"{key}: {type(exc).__name__}: {exc}")
+                continue
+            report["changed" if old is not None else "new"] += 1
+            pending.append({
+                "path": key, "kind": path.suffix.lower().lstrip("."), "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns, "sha256": sha, "chunks": chunks,
+            })
+            waiting += len(chunks)
+            if waiting >= WRITE_BATCH:
+                report["chunks"] += self.memory.store_documents(pending)
+                pending, waiting = [], 0
+            report_progress(done, len(paths), f"ingest: {done}/{len(paths)} files", unit="files")
+        report["chunks"] += self.memory.store_documents(pending)
+        if stamps:
+            self.memory.restamp_documents(stamps)
+        if complete:
+            seen = {str(path) for path in paths}
+            gone = [path for path in known if path not in seen]
+            report["removed"] = self.memory.remove_documents(gone) if gone else 0
+        report["seconds"] = round(time.perf_counter() - started, 3)
+        report["extract_embed_seconds"] = round(extract_seconds, 3)
+        report["chunks_per_second"] = round(report["chunks"] / report["seconds"], 1) if report["seconds"] else 0.0
+        logger.info("ingested %s: %s chunks from %s files", root, report["chunks"], report["new"] + report["changed"])
+        return report
+
+    def search(self, query: str, limit: int = 8, root: str = "") -> List[Tuple[float, Dict[str, Any]]]:
+        match = fts_any(query)
+        if not match:
+            return []
+        qv = embed_text(query)
+        scored = [
+            (cosine(qv, unpack(row.pop("vector"))), row)
+            for row in self.memory.document_chunk_candidates(match, CANDIDATES, root)
+        ]
+        scored.sort(key=lambda hit: hit[0], reverse=True)
+        return scored[:limit]
+
+
+def location(row: Dict[str, Any]) -> str:
+    """'page 3, chars 120-1320' for a search hit."""
+    unit = UNIT_NAMES.get(row["kind"])
+    place = f"{unit} {row['unit']}, " if unit and row["unit"] is not None else ""
+    return f"{place}chars {row['char_start']}-{row['char_end']}"
@@ -0,0 +1,441 @@
+"""
+Persistent catalogue of the files under a root (normally WORKSPACE_DIR).
+
+One SQLite file per root under FILE_INDEX_DIR holds each file's size, mtime,
+SHA-256 and the first HEAD_BYTES of text, with FTS5 over path and text. It is
+a cache: deleting it only costs one rebuild.
+
+refresh() diffs a stat() walk against the stored size/mtime and reads only
+files that changed; a changed mtime with an unchanged hash is not a change.
+Additions, modifications and deletions go to a change log. On Linux an
+inotify watcher (SEVEN_INDEX_WATCH) marks single paths dirty so refreshes skip
+the walk; directory moves, .gitignore edits and queue overflows fall back to
+a full walk. The walk skips what search_files skips (VCS dirs, .gitignore).
+"""
+from __future__ import annotations
+
+import atexit
+import ctypes
+import ctypes.util
+import hashlib
+import logging
+import os
+import re
+import select
+import sqlite3
+import struct
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from seven import config
+from seven.tools.file_search import BINARY_SNIFF_BYTES, VCS_DIRS, is_ignored, rules_for, walk
+
+logger = logging.getLogger("seven.file_index")
+
+HEAD_BYTES = 4096
+# Larger files are catalogued without a hash rather than read end to end.
+HASH_MAX_BYTES = 256 * 1024 * 1024
+HASH_CHUNK = 1024 * 1024
+CHANGE_LOG_ROWS = 50_000
+WRITE_BATCH = 500
+
+
+def iso(seconds: Optional[float]) -> Optional[str]:
+    return datetime.fromtimestamp(seconds, timezone.utc).isoformat() if seconds else None
+
+
+def _fingerprint(path: str, size: int) -> Tuple[Optional[str], str]:
+    """(sha256 or None when too large, decoded text head or "" for binary)."""
+    digest = hashlib.sha256() if size <= HASH_MAX_BYTES else None
+    with open(path, "rb") as handle:
+        first = handle.read(max(HEAD_BYTES, BINARY_SNIFF_BYTES))
+        if digest is not None:
+            digest.update(first)
+            for chunk in iter(lambda: handle.read(HASH_CHUNK), b""):
+                digest.update(chunk)
+    binary = b"\0" in first[:BINARY_SNIFF_BYTES]
+    head = "" if binary else first[:HEAD_BYTES].decode("utf-8", errors="ignore")
+    return (digest.hexdigest() if digest else None), head
+
+
+def fts_query(text: str) -> str:
+    """Words -> an FTS5 query matching all of them as prefixes."""
+    words = re.findall(r"\w+", text)
+    return " ".join(f'"{word}"*' for word in words)
+
+
+class _Inotify:
+    """Linux inotify through libc: records which paths changed, nothing else."""
+
+    MODIFY, ATTRIB, CLOSE_WRITE = 0x2, 0x4, 0x8
+    MOVED_FROM, MOVED_TO, CREATE, DELETE = 0x40, 0x80, 0x100, 0x200
+    DELETE_SELF, MOVE_SELF, Q_OVERFLOW, IGNORED, ISDIR = 0x400, 0x800, 0x4000, 0x8000, 0x40000000
+    MASK = MODIFY | ATTRIB | CLOSE_WRITE | MOVED_FROM | MOVED_TO | CREATE | DELETE | DELETE_SELF | MOVE_SELF
+    EVENT = struct.Struct("iIII")
+
+    def __init__(self):
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify needs Linux")
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_CLOEXEC | os.O_NONBLOCK)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.dirs: Dict[int, str] = {}
+        self.dirty: Set[str] = set()
+        self.rescan = False
+        self.closed = False
+        self.lock = threading.Lock()
+        threading.Thread(target=self._read, name="seven-file-index-watch", daemon=True).start()
+
+    def watch(self, path: str, rel: str) -> None:
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), self.MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {path}")
+        with self.lock:
+            self.dirs[wd] = rel
+
+    def take(self) -> Tuple[Set[str], bool]:
+        """Paths changed since the last call, and whether a full walk is needed."""
+        with self.lock:
+            dirty, rescan = self.dirty, self.rescan
+            self.dirty, self.rescan = set(), False
+        return dirty, rescan
+
+    def _read(self) -> None:
+        while not self.closed:
+            try:
+                ready, _, _ = select.select([self.fd], [], [], 1.0)
+                if not ready:
+                    continue
+                data = os.read(self.fd, 64 * 1024)
+            except (OSError, ValueError):
+                break
+            offset = 0
+            with self.lock:
+                while offset + self.EVENT.size <= len(data):
+                    wd, mask, _, length = self.EVENT.unpack_from(data, offset)
+                    raw = data[offset + self.EVENT.size: offset + self.EVENT.size + length]
+                    offset += self.EVENT.size + length
+                    self._event(wd, mask, os.fsdecode(raw.rstrip(b"\0")))
+
+    def _event(self, wd: int, mask: int, name: str) -> None:
+        if mask & self.Q_OVERFLOW:
+            self.rescan = True
+            return
+        if mask & self.IGNORED:
+            self.dirs.pop(wd, None)
+            return
+        parent = self.dirs.get(wd)
+        if parent is None:
+            return
+        if mask & (self.DELETE_SELF | self.MOVE_SELF):
+            self.rescan = True
+        elif mask & self.ISDIR:
+            # New or moved directories need watches and a walk of their contents.
+            if mask & (self.CREATE | self.MOVED_FROM | self.MOVED_TO | self.DELETE):
+                self.rescan = True
+        elif name == ".gitignore":
+            self.rescan = True
+        elif name:
+            self.dirty.add(f"{parent}/{name}" if parent else name)
+
+    def close(self) -> None:
+        self.closed = True
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+
+
+class FileIndex:
+    def __init__(self, root: Path, db_path: Optional[Path] = None, watch: Optional[bool] = None):
+        self.root = Path(root).expanduser().resolve()
+        if db_path is None:
+            key = hashlib.sha256(str(self.root).encode("utf-8")).hexdigest()[:16]
+            db_path = Path(config.FILE_INDEX_DIR) / f"{key}.db"
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.watch = config.FILE_INDEX_WATCH if watch is None else watch
+        self.watcher: Optional[_Inotify] = None
+        self._rules: Dict[str, tuple] = {}
+        self._lock = threading.RLock()
+        self._init_db()
+
+    @contextmanager
+    def _conn(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def _init_db(self) -> None:
+        with self._conn() as c:
+            c.execute("PRAGMA journal_mode=WAL")
+            c.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS files (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    path TEXT NOT NULL UNIQUE,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    sha256 TEXT,
+                    head TEXT NOT NULL DEFAULT '',
+                    changed_at REAL NOT NULL
+                );
+                CREATE VIRTUAL TABLE IF NOT EXISTS files_fts USING fts5(
+                    path, head, content='files', content_rowid='id', prefix='2 3'
+                );
+                CREATE TRIGGER IF NOT EXISTS files_ai AFTER INSERT ON files BEGIN
+                    INSERT INTO files_fts(rowid, path, head) VALUES (new.id, new.path, new.head);
+                END;
+                CREATE TRIGGER IF NOT EXISTS files_ad AFTER DELETE ON files BEGIN
+                    INSERT INTO files_fts(files_fts, rowid, path, head) VALUES ('delete', old.id, old.path, old.head);
+                END;
+                CREATE TRIGGER IF NOT EXISTS files_au AFTER UPDATE OF path, head ON files BEGIN
+                    INSERT INTO files_fts(files_fts, rowid, path, head) VALUES ('delete', old.id, old.path, old.head);
+                    INSERT INTO files_fts(rowid, path, head) VALUES (new.id, new.path, new.head);
+                END;
+                CREATE TABLE IF NOT EXISTS changes (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    path TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_changes_at ON changes(at);
+                CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+                """
+            )
+
+    def _meta(self, c: sqlite3.Connection, key: str) -> Optional[str]:
+        row = c.execute("SELECT value FROM meta WHERE key=?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, c: sqlite3.Connection, **values: Any) -> None:
+        c.executemany("INSERT OR REPLACE INTO meta(key, value) VALUES (?,?)", [(k, str(v)) for k, v in values.items()])
+
+    # ── refresh ────────────────────────────────────────────────────────
+
+    def refresh(self, max_age: Optional[float] = None) -> Dict[str, Any]:
+        """Bring the catalogue up to date; a full walk only when the last one is older than max_age."""
+        max_age = config.FILE_INDEX_MAX_AGE if max_age is None else max_age
+        started = time.perf_counter()
+        with self._lock:
+            with self._conn() as c:
+                scanned_at = float(self._meta(c, "scanned_at") or 0)
+            mode = "cached"
+            stats = {"added": 0, "modified": 0, "deleted": 0}
+            if self.watcher is not None:
+                dirty, rescan = self.watcher.take()
+                if rescan:
+                    mode, stats = "walk", self._walk()
+                elif dirty:
+                    mode, stats = "watch", self._update_paths(dirty)
+            elif time.time() - scanned_at >= max_age:
+                mode, stats = "walk", self._walk()
+        return {"mode": mode, **stats, "ms": round((time.perf_counter() - started) * 1000, 1)}
+
+    def _start_watcher(self) -> None:
+        if not self.watch or self.watcher is not None:
+            return
+        try:
+            self.watcher = _Inotify()
+        except OSError as exc:
+            logger.info("file index watcher unavailable, using mtime walks: %s", exc)
+            self.watch = False
+
+    def _walk(self) -> Dict[str, int]:
+        self._start_watcher()
+        self._rules.clear()
+        with self._conn() as c:
+            c.row_factory = None  # plain tuples: this loads every row
+            known = {path: rest for path, *rest in c.execute("SELECT path, size, mtime_ns, sha256 FROM files")}
+            first = self._meta(c, "scanned_at") is None
+        if self.watcher is not None:
+            self._watch_dir(str(self.root), "")
+        seen: Set[str] = set()
+        pending: List[Tuple[str, os.stat_result]] = []
+        stats = {"added": 0, "modified": 0, "deleted": 0}
+        for entry in walk(str(self.root)):
+            if entry.is_dir:
+                if self.watcher is not None:
+                    # Watched before its listing, so nothing created meanwhile is missed.
+                    self._watch_dir(entry.path, entry.rel)
+                continue
+            try:
+                st = os.stat(entry.path)
+            except OSError:
+                continue
+            seen.add(entry.rel)
+            old = known.get(entry.rel)
+            if old is None or old[0] != st.st_size or old[1] != st.st_mtime_ns:
+                pending.append((entry.rel, st))
+                if len(pending) >= WRITE_BATCH:
+                    self._store(pending, known, stats, log=not first)
+                    pending = []
+        self._store(pending, known, stats, log=not first)
+        gone = [path for path in known if path not in seen]
+        self._delete(gone, stats, log=not first)
+        with self._conn() as c:
+            now = time.time()
+            if first:
+                self._set_meta(c, created_at=now)
+            self._set_meta(c, scanned_at=now)
+        return stats
+
+    def _watch_dir(self, path: str, rel: str) -> None:
+        try:
+            self.watcher.watch(path, rel)
+        except OSError as exc:
+            # Usually fs.inotify.max_user_watches; a partial watch would miss changes.
+            logger.info("file index watcher disabled: %s", exc)
+            self.watcher.close()
+            self.watcher = None
+            self.watch = False
+
+    def _update_paths(self, paths: Set[str]) -> Dict[str, int]:
+        stats = {"added": 0, "modified": 0, "deleted": 0}
+        with self._conn() as c:
+            known = {}
+            for path in paths:
+                row = c.execute("SELECT size, mtime_ns, sha256 FROM files WHERE path=?", (path,)).fetchone()
+                if row:
+                    known[path] = (row["size"], row["mtime_ns"], row["sha256"])
+        pending, gone = [], []
+        for rel in paths:
+            parent = rel.rpartition("/")[0]
+            if parent not in self._rules:
+                self._rules[parent] = rules_for(str(self.root), parent)
+            try:
+                st = os.stat(self.root / rel)
+            except OSError:
+                st = None
+            if st is None or is_ignored(self._rules[parent], rel, False) or rel.split("/", 1)[0] in VCS_DIRS:
+                if rel in known:
+                    gone.append(rel)
+                continue
+            old = known.get(rel)
+            if old is None or old[0] != st.st_size or old[1] != st.st_mtime_ns:
+                pending.append((rel, st))
+        self._store(pending, known, stats, log=True)
+        self._delete(gone, stats, log=True)
+        return stats
+
+    def _store(self, pending: List[Tuple[str, os.stat_result]], known: Dict[str, tuple], stats: Dict[str, int], log: bool) -> None:
+        if not pending:
+            return
+        now = time.time()
+        rows, changes = [], []
+        for rel, st in pending:
+            try:
+                sha, head = _fingerprint(str(self.root / rel), st.st_size)
+            except OSError:
+                continue
+            old = known.get(rel)
+            kind = "added" if old is None else ("modified" if sha is None or sha != old[2] else None)
+            rows.append((rel, st.st_size, st.st_mtime_ns, sha, head, now if kind or old is None else None))
+            if kind:
+                stats[kind] += 1
+                changes.append((rel, kind, now))
+        with self._conn() as c:
+            c.executemany(
+                """INSERT INTO files(path, size, mtime_ns, sha256, head, changed_at) VALUES (?,?,?,?,?,COALESCE(?, 0))
+                   ON CONFLICT(path) DO UPDATE SET size=excluded.size, mtime_ns=excluded.mtime_ns,
+                   sha256=excluded.sha256, head=excluded.head,
+                   changed_at=CASE WHEN ?6 IS NULL THEN changed_at ELSE excluded.changed_at END""",
+                rows,
+            )
+            if log and changes:
+                self._log(c, changes)
+
+    def _delete(self, paths: List[str], stats: Dict[str, int], log: bool) -> None:
+        if not paths:
+            return
+        now = time.time()
+        with self._conn() as c:
+            c.executemany("DELETE FROM files WHERE path=?", [(path,) for path in paths])
+            if log:
+                self._log(c, [(path, "deleted", now) for path in paths])
+        stats["deleted"] += len(paths)
+
+    def _log(self, c: sqlite3.Connection, changes: List[Tuple[str, str, float]]) -> None:
+        c.executemany("INSERT INTO changes(path, kind, at) VALUES (?,?,?)", changes)
+        c.execute("DELETE FROM changes WHERE seq <= (SELECT MAX(seq) FROM changes) - ?", (CHANGE_LOG_ROWS,))
+
+    # ── queries ────────────────────────────────────────────────────────
+
+    def summary(self) -> Dict[str, Any]:
+        with self._conn() as c:
+            row = c.execute("SELECT COUNT(*) AS files, COALESCE(SUM(size), 0) AS bytes FROM files").fetchone()
+            return {
+                "root": str(self.root),
+                "files": row["files"],
+                "bytes": row["bytes"],
+                "created_at": iso(float(self._meta(c, "created_at") or 0)),
+                "scanned_at": iso(float(self._meta(c, "scanned_at") or 0)),
+                "watching": self.watcher is not None,
+            }
+
+    def find(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """Files whose path or text head contains every word of query as a prefix, best first."""
+        match = fts_query(query)
+        if not match:
+            return []
+        with self._conn() as c:
+            rows = c.execute(
+                """SELECT f.path, f.size, f.mtime_ns, f.sha256,
+                          snippet(files_fts, 1, '[', ']', '...', 12) AS snippet
+                   FROM files_fts JOIN files f ON f.id = files_fts.rowid
+                   WHERE files_fts MATCH ? ORDER BY bm25(files_fts, 4.0, 1.0) LIMIT ?""",
+                (match, int(limit)),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def recent(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Indexed files by modification time, newest first."""
+        with self._conn() as c:
+            rows = c.execute(
+                "SELECT path, size, mtime_ns FROM files ORDER BY mtime_ns DESC, path LIMIT ?", (int(limit),)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def changes_since(self, since: float, limit: int = 50) -> List[Dict[str, Any]]:
+        """Latest change per path after since (unix seconds), newest first."""
+        with self._conn() as c:
+            rows = c.execute(
+                """SELECT path, kind, MAX(at) AS at FROM (
+                       SELECT path, kind, at, seq FROM changes WHERE at > ? ORDER BY seq
+                   ) GROUP BY path ORDER BY at DESC LIMIT ?""",
+                (float(since), int(limit)),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def close(self) -> None:
+        if self.watcher is not None:
+            self.watcher.close()
+            self.watcher = None
+
+
+_INDEXES: Dict[str, FileIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_index(root: Optional[str] = None) -> FileIndex:
+    """The process-wide index of root (WORKSPACE_DIR by default)."""
+    resolved = str(Path(root or config.WORKSPACE_DIR).expanduser().resolve())
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(resolved)
+        if index is None:
+            index = _INDEXES[resolved] = FileIndex(Path(resolved))
+            atexit.register(index.close)
+        return index
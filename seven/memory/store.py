@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import json
 import hashlib
+import os
 import re
 import sqlite3
 import threading
@@ -13,9 +14,14 @@ import time
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 from seven import config
+from seven import metrics
+
+SQLITE_SECONDS = metrics.histogram(
+    "seven_sqlite_seconds", "SQLite operation time (lock wait through commit) by Memory method.", ("op",)
+)
 
 
 def _utcnow() -> str:
@@ -33,6 +39,80 @@ _SENSITIVE_TEXT = [
 ]
 
 
+# Paged read views: table, selected columns, equality filters, text columns for q.
+PAGE_KINDS: Dict[str, Dict[str, Any]] = {
+    "facts": {
+        "columns": "id, key, value, source, confidence, created_at, updated_at",
+        "filters": ("key", "source"),
+        "text": ("value", "key"),
+    },
+    "goals": {
+        "columns": "id, title, detail, status, progress, last_action, created_at, updated_at",
+        "filters": ("status",),
+        "text": ("title", "detail"),
+    },
+    "audit": {
+        "columns": "id, tool, arguments, result_preview, ok, created_at",
+        "filters": ("tool", "ok"),
+        "text": ("tool", "arguments", "result_preview"),
+    },
+    "messages": {
+        "columns": "id, role, content, meta, created_at",
+        "filters": ("role",),
+        "text": ("content",),
+    },
+    "notes": {
+        "columns": "id, title, body, created_at",
+        "filters": (),
+        "text": ("title", "body"),
+    },
+}
+PAGE_CHUNK = 200
+
+# A background job is queued, then running, then one of these.
+JOB_FINAL_STATUSES = ("succeeded", "failed", "cancelled", "interrupted")
+
+
+def _iso_bound(value: Union[str, float, int, None]) -> Optional[str]:
+    """Unix seconds or ISO-8601 -> the UTC isoformat created_at columns use."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)) or re.fullmatch(r"\d+(?:\.\d+)?", str(value)):
+        return datetime.fromtimestamp(float(value), timezone.utc).isoformat()
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        raise ValueError(f"invalid time: {value!r}")
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).isoformat()
+
+
+def _decode_row(kind: str, row: Dict[str, Any]) -> Dict[str, Any]:
+    if kind == "audit":
+        row["ok"] = bool(row["ok"])
+        column = "arguments"
+    elif kind == "messages":
+        column = "meta"
+    else:
+        return row
+    try:
+        row[column] = json.loads(row[column]) if row[column] else None
+    except (TypeError, ValueError):
+        pass
+    return row
+
+
+def _decode_job(row: sqlite3.Row) -> Dict[str, Any]:
+    job = dict(row)
+    for key in ("arguments", "progress"):
+        try:
+            job[key] = json.loads(job[key]) if job[key] else None
+        except ValueError:
+            pass
+    return job
+
+
 def _redact_audit(value: Any, key: str = "") -> Any:
     if key and _SENSITIVE_KEYS.search(key):
         return "[REDACTED]"
@@ -59,7 +139,9 @@ class Memory:
         self._init_db()
 
     @contextmanager
-    def _conn(self):
+    def _conn(self, op: str):
+        """A committed-or-rolled-back connection; op labels seven_sqlite_seconds."""
+        started = time.perf_counter()
         with self._lock:
             conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
             conn.row_factory = sqlite3.Row
@@ -72,9 +154,10 @@ class Memory:
                 raise
             finally:
                 conn.close()
+                SQLITE_SECONDS.labels(op).observe(time.perf_counter() - started)
 
     def _init_db(self):
-        with self._conn() as c:
+        with self._conn("_init_db") as c:
             c.executescript(
                 """
                 CREATE TABLE IF NOT EXISTS messages (
@@ -174,6 +257,35 @@ class Memory:
                     vector_json TEXT NOT NULL,
                     created_at TEXT NOT NULL
                 );
+                CREATE TABLE IF NOT EXISTS document_sources (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    path TEXT NOT NULL UNIQUE,
+                    kind TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    sha256 TEXT NOT NULL,
+                    chunks INTEGER NOT NULL DEFAULT 0,
+                    ingested_at TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS document_chunks (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    source_id INTEGER NOT NULL REFERENCES document_sources(id) ON DELETE CASCADE,
+                    unit INTEGER,
+                    char_start INTEGER NOT NULL,
+                    char_end INTEGER NOT NULL,
+                    text TEXT NOT NULL,
+                    vector BLOB NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_document_chunks_source ON document_chunks(source_id);
+                CREATE VIRTUAL TABLE IF NOT EXISTS document_chunks_fts USING fts5(
+                    text, content='document_chunks', content_rowid='id'
+                );
+                CREATE TRIGGER IF NOT EXISTS document_chunks_ai AFTER INSERT ON document_chunks BEGIN
+                    INSERT INTO document_chunks_fts(rowid, text) VALUES (new.id, new.text);
+                END;
+                CREATE TRIGGER IF NOT EXISTS document_chunks_ad AFTER DELETE ON document_chunks BEGIN
+                    INSERT INTO document_chunks_fts(document_chunks_fts, rowid, text) VALUES ('delete', old.id, old.text);
+                END;
                 CREATE TABLE IF NOT EXISTS digests (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     period TEXT NOT NULL,
@@ -218,6 +330,8 @@ class Memory:
                     FOREIGN KEY(task_id) REFERENCES tasks(id) ON DELETE SET NULL
                 );
                 CREATE INDEX IF NOT EXISTS idx_action_items_status ON action_items(status, id);
+                CREATE INDEX IF NOT EXISTS idx_audit_tool_created ON audit(tool, created_at);
+                CREATE INDEX IF NOT EXISTS idx_messages_created ON messages(created_at);
                 CREATE TABLE IF NOT EXISTS legacy_imports (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     source_sha256 TEXT NOT NULL UNIQUE,
@@ -225,6 +339,21 @@ class Memory:
                     imported_at TEXT NOT NULL,
                     report_json TEXT NOT NULL
                 );
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    tool TEXT NOT NULL,
+                    arguments TEXT,
+                    status TEXT NOT NULL DEFAULT 'queued',
+                    pid INTEGER,
+                    progress TEXT,
+                    result_preview TEXT,
+                    ok INTEGER,
+                    announced INTEGER NOT NULL DEFAULT 0,
+                    created_at TEXT NOT NULL,
+                    started_at TEXT,
+                    finished_at TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status, id);
                 """
             )
             task_columns = {row["name"] for row in c.execute("PRAGMA table_info(tasks)").fetchall()}
@@ -249,13 +378,13 @@ class Memory:
             c.execute("PRAGMA user_version=4")
 
     def schema_version(self) -> int:
-        with self._conn() as c:
+        with self._conn("schema_version") as c:
             return int(c.execute("PRAGMA user_version").fetchone()[0])
 
     # ── conversation ───────────────────────────────────────────────────
 
     def add_message(self, role: str, content: str, meta: Optional[dict] = None) -> int:
-        with self._conn() as c:
+        with self._conn("add_message") as c:
             cur = c.execute(
                 "INSERT INTO messages(role, content, meta, created_at) VALUES (?,?,?,?)",
                 (role, content, json.dumps(meta or {}), _utcnow()),
@@ -263,7 +392,7 @@ class Memory:
             return int(cur.lastrowid)
 
     def recent_messages(self, limit: int = 40) -> List[Dict[str, Any]]:
-        with self._conn() as c:
+        with self._conn("recent_messages") as c:
             rows = c.execute(
                 "SELECT role, content, meta, created_at FROM messages ORDER BY id DESC LIMIT ?",
                 (limit,),
@@ -280,11 +409,11 @@ class Memory:
 
     def clear_session_messages(self):
         """Clear chat history but keep facts/goals/tasks."""
-        with self._conn() as c:
+        with self._conn("clear_session_messages") as c:
             c.execute("DELETE FROM messages")
 
     def message_count(self) -> int:
-        with self._conn() as c:
+        with self._conn("message_count") as c:
             row = c.execute("SELECT COUNT(*) AS n FROM messages").fetchone()
             return int(row["n"] if row else 0)
 
@@ -294,7 +423,7 @@ class Memory:
         Keeps the latest `keep_recent` messages intact.
         Returns summary text if compaction ran, else None.
         """
-        with self._conn() as c:
+        with self._conn("compact_history") as c:
             rows = c.execute(
                 "SELECT id, role, content FROM messages ORDER BY id ASC"
             ).fetchall()
@@ -327,7 +456,7 @@ class Memory:
 
     def remember(self, value: str, key: Optional[str] = None, source: str = "chat", confidence: float = 1.0):
         now = _utcnow()
-        with self._conn() as c:
+        with self._conn("remember") as c:
             c.execute(
                 "INSERT INTO facts(key, value, source, confidence, created_at, updated_at) VALUES (?,?,?,?,?,?)",
                 (key, value, source, confidence, now, now),
@@ -340,7 +469,7 @@ class Memory:
 
     def search_facts(self, query: str, limit: int = 8) -> List[Dict[str, Any]]:
         q = f"%{query}%"
-        with self._conn() as c:
+        with self._conn("search_facts") as c:
             rows = c.execute(
                 """
                 SELECT id, key, value, source, confidence, created_at
@@ -353,7 +482,7 @@ class Memory:
         return [dict(r) for r in rows]
 
     def all_facts(self, limit: int = 50) -> List[Dict[str, Any]]:
-        with self._conn() as c:
+        with self._conn("all_facts") as c:
             rows = c.execute(
                 "SELECT id, key, value, source, confidence FROM facts ORDER BY id DESC LIMIT ?",
                 (limit,),
@@ -364,7 +493,7 @@ class Memory:
 
     def add_goal(self, title: str, detail: str = "") -> int:
         now = _utcnow()
-        with self._conn() as c:
+        with self._conn("add_goal") as c:
             cur = c.execute(
                 "INSERT INTO goals(title, detail, status, progress, created_at, updated_at) VALUES (?,?,?,?,?,?)",
                 (title, detail, "active", 0.0, now, now),
@@ -372,7 +501,7 @@ class Memory:
             return int(cur.lastrowid)
 
     def update_goal(self, goal_id: int, progress: Optional[float] = None, status: Optional[str] = None, last_action: Optional[str] = None):
-        with self._conn() as c:
+        with self._conn("update_goal") as c:
             row = c.execute("SELECT * FROM goals WHERE id=?", (goal_id,)).fetchone()
             if not row:
                 return
@@ -385,20 +514,20 @@ class Memory:
             )
 
     def active_goals(self) -> List[Dict[str, Any]]:
-        with self._conn() as c:
+        with self._conn("active_goals") as c:
             rows = c.execute(
                 "SELECT * FROM goals WHERE status='active' ORDER BY id DESC"
             ).fetchall()
         return [dict(r) for r in rows]
 
     def get_goal(self, goal_id: int) -> Optional[Dict[str, Any]]:
-        with self._conn() as c:
+        with self._conn("get_goal") as c:
             row = c.execute("SELECT * FROM goals WHERE id=?", (int(goal_id),)).fetchone()
         return dict(row) if row else None
 
     def add_task(self, title: str, due_at: Optional[str] = None) -> int:
         now = _utcnow()
-        with self._conn() as c:
+        with self._conn("add_task") as c:
             cur = c.execute(
                 "INSERT INTO tasks(title, due_at, status, created_at, updated_at) VALUES (?,?,?,?,?)",
                 (title, due_at, "open", now, now),
@@ -406,14 +535,14 @@ class Memory:
             return int(cur.lastrowid)
 
     def open_tasks(self) -> List[Dict[str, Any]]:
-        with self._conn() as c:
+        with self._conn("open_tasks") as c:
             rows = c.execute(
                 "SELECT * FROM tasks WHERE status='open' ORDER BY id DESC"
             ).fetchall()
         return [dict(r) for r in rows]
 
     def complete_task(self, task_id: int):
-        with self._conn() as c:
+        with self._conn("complete_task") as c:
             c.execute(
                 "UPDATE tasks SET status='done', updated_at=? WHERE id=?",
                 (_utcnow(), task_id),
@@ -431,7 +560,7 @@ class Memory:
         if not text:
             return None
         now = _utcnow()
-        with self._conn() as c:
+        with self._conn("add_action_item") as c:
             cur = c.execute(
                 "INSERT OR IGNORE INTO action_items(fingerprint,text,source_message_id,status,created_at,updated_at) VALUES (?,?,?,?,?,?)",
                 (self.action_fingerprint(text), text, source_message_id, "pending", now, now),
@@ -439,7 +568,7 @@ class Memory:
             return int(cur.lastrowid) if cur.rowcount else None
 
     def list_action_items(self, status: str = "pending", limit: int = 30) -> List[Dict[str, Any]]:
-        with self._conn() as c:
+        with self._conn("list_action_items") as c:
             rows = c.execute(
                 "SELECT * FROM action_items WHERE status=? ORDER BY id DESC LIMIT ?",
                 (status, max(1, min(int(limit), 200))),
@@ -447,7 +576,7 @@ class Memory:
         return [dict(row) for row in rows]
 
     def resolve_action_item(self, item_id: int, accept: bool) -> Optional[Dict[str, Any]]:
-        with self._conn() as c:
+        with self._conn("resolve_action_item") as c:
             row = c.execute("SELECT * FROM action_items WHERE id=?", (int(item_id),)).fetchone()
             if not row or row["status"] != "pending":
                 return None
@@ -473,7 +602,7 @@ class Memory:
         """Open, undelivered tasks with ISO due times at or before `now`."""
         now = now or datetime.now(timezone.utc)
         due: List[Dict[str, Any]] = []
-        with self._conn() as c:
+        with self._conn("due_tasks") as c:
             rows = c.execute(
                 "SELECT * FROM tasks WHERE status='open' AND due_at IS NOT NULL AND reminded_at IS NULL ORDER BY id ASC"
             ).fetchall()
@@ -492,14 +621,14 @@ class Memory:
         return due
 
     def mark_task_reminded(self, task_id: int):
-        with self._conn() as c:
+        with self._conn("mark_task_reminded") as c:
             c.execute(
                 "UPDATE tasks SET reminded_at=?, reminder_attempts=IFNULL(reminder_attempts,0)+1, updated_at=? WHERE id=?",
                 (_utcnow(), _utcnow(), int(task_id)),
             )
 
     def record_reminder_attempt(self, task_id: int):
-        with self._conn() as c:
+        with self._conn("record_reminder_attempt") as c:
             c.execute(
                 "UPDATE tasks SET reminder_attempts=IFNULL(reminder_attempts,0)+1, updated_at=? WHERE id=?",
                 (_utcnow(), int(task_id)),
@@ -508,7 +637,7 @@ class Memory:
     # ── notes / audit ──────────────────────────────────────────────────
 
     def add_note(self, body: str, title: str = "") -> int:
-        with self._conn() as c:
+        with self._conn("add_note") as c:
             cur = c.execute(
                 "INSERT INTO notes(title, body, created_at) VALUES (?,?,?)",
                 (title, body, _utcnow()),
@@ -516,7 +645,7 @@ class Memory:
             return int(cur.lastrowid)
 
     def list_notes(self, limit: int = 20) -> List[Dict[str, Any]]:
-        with self._conn() as c:
+        with self._conn("list_notes") as c:
             rows = c.execute(
                 "SELECT * FROM notes ORDER BY id DESC LIMIT ?", (limit,)
             ).fetchall()
@@ -525,14 +654,14 @@ class Memory:
     def audit(self, tool: str, arguments: dict, result: str, ok: bool):
         safe_arguments = _redact_audit(arguments or {})
         preview = str(_redact_audit((result or "")[:2000]))
-        with self._conn() as c:
+        with self._conn("audit") as c:
             c.execute(
                 "INSERT INTO audit(tool, arguments, result_preview, ok, created_at) VALUES (?,?,?,?,?)",
                 (tool, json.dumps(safe_arguments), preview, 1 if ok else 0, _utcnow()),
             )
 
     def recent_audit(self, limit: int = 20) -> List[Dict[str, Any]]:
-        with self._conn() as c:
+        with self._conn("recent_audit") as c:
             rows = c.execute(
                 "SELECT * FROM audit ORDER BY id DESC LIMIT ?", (limit,)
             ).fetchall()
@@ -540,20 +669,147 @@ class Memory:
 
     def audits_since(self, after_id: int) -> List[Dict[str, Any]]:
         """Audit rows with id > after_id, oldest first."""
-        with self._conn() as c:
+        with self._conn("audits_since") as c:
             rows = c.execute(
                 "SELECT * FROM audit WHERE id > ? ORDER BY id ASC",
                 (int(after_id),),
             ).fetchall()
         return [dict(r) for r in rows]
 
+    # ── background jobs ────────────────────────────────────────────────
+
+    def add_job(self, tool: str, arguments: dict, pid: int) -> int:
+        with self._conn("add_job") as c:
+            cur = c.execute(
+                "INSERT INTO jobs(tool, arguments, status, pid, created_at) VALUES (?,?,'queued',?,?)",
+                (tool, json.dumps(_redact_audit(arguments or {})), int(pid), _utcnow()),
+            )
+            return int(cur.lastrowid)
+
+    def start_job(self, job_id: int) -> bool:
+        """queued -> running; False when the job was cancelled meanwhile."""
+        with self._conn("start_job") as c:
+            cur = c.execute(
+                "UPDATE jobs SET status='running', started_at=? WHERE id=? AND status='queued'",
+                (_utcnow(), int(job_id)),
+            )
+            return cur.rowcount == 1
+
+    def set_job_progress(self, job_id: int, progress: dict):
+        with self._conn("set_job_progress") as c:
+            c.execute("UPDATE jobs SET progress=? WHERE id=?", (json.dumps(progress), int(job_id)))
+
+    def finish_job(self, job_id: int, status: str, result: str = "") -> bool:
+        """Record the end of a job that has not ended yet; False if it already had."""
+        if status not in JOB_FINAL_STATUSES:
+            raise ValueError(f"not a final job status: {status}")
+        with self._conn("finish_job") as c:
+            cur = c.execute(
+                "UPDATE jobs SET status=?, ok=?, result_preview=?, finished_at=? WHERE id=? AND status IN ('queued','running')",
+                (status, 1 if status == "succeeded" else 0, str(_redact_audit((result or "")[:2000])), _utcnow(), int(job_id)),
+            )
+            return cur.rowcount == 1
+
+    def get_job(self, job_id: int) -> Optional[Dict[str, Any]]:
+        with self._conn("get_job") as c:
+            row = c.execute("SELECT * FROM jobs WHERE id=?", (int(job_id),)).fetchone()
+        return _decode_job(row) if row else None
+
+    def list_jobs(self, status: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """Newest first; status "active" means queued or running."""
+        where, params = "", []
+        if status == "active":
+            where = "WHERE status IN ('queued','running')"
+        elif status:
+            where, params = "WHERE status=?", [status]
+        with self._conn("list_jobs") as c:
+            rows = c.execute(f"SELECT * FROM jobs {where} ORDER BY id DESC LIMIT ?", (*params, int(limit))).fetchall()
+        return [_decode_job(row) for row in rows]
+
+    def unannounced_jobs(self, limit: int = 5) -> List[Dict[str, Any]]:
+        with self._conn("unannounced_jobs") as c:
+            rows = c.execute(
+                "SELECT * FROM jobs WHERE announced=0 AND finished_at IS NOT NULL ORDER BY id ASC LIMIT ?",
+                (int(limit),),
+            ).fetchall()
+        return [_decode_job(row) for row in rows]
+
+    def claim_job_announcement(self, job_id: int) -> bool:
+        """True for exactly one caller, so a finished job is announced once."""
+        with self._conn("claim_job_announcement") as c:
+            cur = c.execute("UPDATE jobs SET announced=1 WHERE id=? AND announced=0", (int(job_id),))
+            return cur.rowcount == 1
+
+    # ── paged reads ────────────────────────────────────────────────────
+
+    def page(
+        self,
+        kind: str,
+        limit: int = 50,
+        before: Optional[int] = None,
+        after: Optional[int] = None,
+        since: Union[str, float, None] = None,
+        until: Union[str, float, None] = None,
+        q: Optional[str] = None,
+        **filters: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Keyset page over one PAGE_KINDS table: newest first below `before`, or
+        oldest first above `after`. Rows are fetched PAGE_CHUNK at a time, each
+        chunk its own short connection, so a slow consumer never holds the lock.
+        """
+        spec = PAGE_KINDS.get(kind)
+        if spec is None:
+            raise ValueError(f"unknown memory kind: {kind}")
+        unknown = set(filters) - set(spec["filters"])
+        if unknown:
+            raise ValueError(f"unsupported filter for {kind}: {', '.join(sorted(unknown))}")
+        if before is not None and after is not None:
+            raise ValueError("use before or after, not both")
+        where: List[str] = []
+        params: List[Any] = []
+        for name in spec["filters"]:
+            value = filters.get(name)
+            if value is None:
+                continue
+            if name == "ok":
+                value = 1 if value else 0
+            where.append(f"{name} = ?")
+            params.append(value)
+        for op, bound in ((">=", _iso_bound(since)), ("<=", _iso_bound(until))):
+            if bound is not None:
+                where.append(f"created_at {op} ?")
+                params.append(bound)
+        if q:
+            like = f"%{q}%"
+            where.append("(" + " OR ".join(f"IFNULL({col},'') LIKE ?" for col in spec["text"]) + ")")
+            params.extend([like] * len(spec["text"]))
+        ascending = after is not None
+        cursor = int(after if ascending else (before if before is not None else 2 ** 62))
+        remaining = max(0, int(limit))
+        while remaining:
+            chunk = min(remaining, PAGE_CHUNK)
+            clause = " AND ".join(where + ["id > ?" if ascending else "id < ?"])
+            with self._conn("page") as c:
+                rows = c.execute(
+                    f"SELECT {spec['columns']} FROM {kind} WHERE {clause} "
+                    f"ORDER BY id {'ASC' if ascending else 'DESC'} LIMIT ?",
+                    (*params, cursor, chunk),
+                ).fetchall()
+            for row in rows:
+                yield _decode_row(kind, dict(row))
+            if len(rows) < chunk:
+                return
+            remaining -= len(rows)
+            cursor = int(rows[-1]["id"])
+
     # ── beliefs ────────────────────────────────────────────────────────
 
     def set_belief(self, topic: str, stance: str, confidence: float = 0.5,
                    evidence: str = "", source: str = "self") -> int:
         now = _utcnow()
         conf = max(0.0, min(1.0, float(confidence)))
-        with self._conn() as c:
+        with self._conn("set_belief") as c:
             row = c.execute(
                 "SELECT id FROM beliefs WHERE topic=? ORDER BY id DESC LIMIT 1",
                 (topic,),
@@ -571,7 +827,7 @@ class Memory:
             return int(cur.lastrowid)
 
     def list_beliefs(self, limit: int = 20) -> List[Dict[str, Any]]:
-        with self._conn() as c:
+        with self._conn("list_beliefs") as c:
             rows = c.execute(
                 "SELECT * FROM beliefs ORDER BY updated_at DESC LIMIT ?", (limit,)
             ).fetchall()
@@ -579,7 +835,7 @@ class Memory:
 
     def search_beliefs(self, query: str, limit: int = 8) -> List[Dict[str, Any]]:
         q = f"%{query}%"
-        with self._conn() as c:
+        with self._conn("search_beliefs") as c:
             rows = c.execute(
                 "SELECT * FROM beliefs WHERE topic LIKE ? OR stance LIKE ? OR IFNULL(evidence,'') LIKE ? ORDER BY id DESC LIMIT ?",
                 (q, q, q, limit),
@@ -589,7 +845,7 @@ class Memory:
     # ── working memory ─────────────────────────────────────────────────
 
     def wm_add(self, content: str, kind: str = "item", priority: float = 0.5) -> int:
-        with self._conn() as c:
+        with self._conn("wm_add") as c:
             cur = c.execute(
                 "INSERT INTO working_memory(content, kind, priority, created_at) VALUES (?,?,?,?)",
                 (content, kind, float(priority), _utcnow()),
@@ -603,14 +859,14 @@ class Memory:
             return int(cur.lastrowid)
 
     def wm_list(self) -> List[Dict[str, Any]]:
-        with self._conn() as c:
+        with self._conn("wm_list") as c:
             rows = c.execute(
                 "SELECT * FROM working_memory ORDER BY priority DESC, id DESC LIMIT 9"
             ).fetchall()
         return [dict(r) for r in rows]
 
     def wm_clear(self):
-        with self._conn() as c:
+        with self._conn("wm_clear") as c:
             c.execute("DELETE FROM working_memory")
 
     # ── skills ─────────────────────────────────────────────────────────
@@ -652,7 +908,7 @@ class Memory:
         now = _utcnow()
         steps = self.validate_skill_steps(steps)
         payload = json.dumps(steps, ensure_ascii=False)
-        with self._conn() as c:
+        with self._conn("save_skill") as c:
             row = c.execute("SELECT * FROM skills WHERE name=?", (name,)).fetchone()
             if row:
                 if (row["description"] or "") == description and row["steps_json"] == payload:
@@ -679,7 +935,7 @@ class Memory:
             return {"id": skill_id, "version": 1, "changed": True}
 
     def get_skill(self, name: str) -> Optional[Dict[str, Any]]:
-        with self._conn() as c:
+        with self._conn("get_skill") as c:
             row = c.execute("SELECT * FROM skills WHERE name=?", (name,)).fetchone()
         if not row:
             return None
@@ -691,7 +947,7 @@ class Memory:
         return d
 
     def list_skills(self, limit: int = 30) -> List[Dict[str, Any]]:
-        with self._conn() as c:
+        with self._conn("list_skills") as c:
             rows = c.execute(
                 "SELECT id, name, description, current_version, success_count, failure_count, updated_at FROM skills ORDER BY success_count DESC, id DESC LIMIT ?",
                 (limit,),
@@ -699,14 +955,14 @@ class Memory:
         return [dict(r) for r in rows]
 
     def skill_success(self, name: str):
-        with self._conn() as c:
+        with self._conn("skill_success") as c:
             c.execute(
                 "UPDATE skills SET success_count=success_count+1, updated_at=? WHERE name=?",
                 (_utcnow(), name),
             )
 
     def skill_history(self, name: str, limit: int = 30) -> List[Dict[str, Any]]:
-        with self._conn() as c:
+        with self._conn("skill_history") as c:
             rows = c.execute(
                 """SELECT r.version,r.description,r.source,r.created_at
                    FROM skill_revisions r JOIN skills s ON s.id=r.skill_id
@@ -716,7 +972,7 @@ class Memory:
         return [dict(row) for row in rows]
 
     def get_skill_revision(self, name: str, version: int) -> Optional[Dict[str, Any]]:
-        with self._conn() as c:
+        with self._conn("get_skill_revision") as c:
             row = c.execute(
                 """SELECT r.version,r.description,r.steps_json,r.source,r.created_at
                    FROM skill_revisions r JOIN skills s ON s.id=r.skill_id
@@ -736,7 +992,7 @@ class Memory:
         return self.save_skill(name, row["description"] or "", row["steps"], source=f"rollback:{int(version)}")
 
     def record_skill_run(self, name: str, version: int, ok: bool, step_status: list[dict]):
-        with self._conn() as c:
+        with self._conn("record_skill_run") as c:
             row = c.execute("SELECT id FROM skills WHERE name=?", (name,)).fetchone()
             if not row:
                 return
@@ -751,7 +1007,7 @@ class Memory:
 
     def create_plan(self, title: str, steps: list, goal_id: Optional[int] = None) -> int:
         now = _utcnow()
-        with self._conn() as c:
+        with self._conn("create_plan") as c:
             cur = c.execute(
                 "INSERT INTO plans(title, goal_id, steps_json, current_step, status, created_at, updated_at) VALUES (?,?,?,?,?,?,?)",
                 (title, goal_id, json.dumps(steps, ensure_ascii=False), 0, "active", now, now),
@@ -759,7 +1015,7 @@ class Memory:
             return int(cur.lastrowid)
 
     def get_plan(self, plan_id: int) -> Optional[Dict[str, Any]]:
-        with self._conn() as c:
+        with self._conn("get_plan") as c:
             row = c.execute("SELECT * FROM plans WHERE id=?", (int(plan_id),)).fetchone()
         if not row:
             return None
@@ -771,7 +1027,7 @@ class Memory:
         return d
 
     def active_plans(self) -> List[Dict[str, Any]]:
-        with self._conn() as c:
+        with self._conn("active_plans") as c:
             rows = c.execute(
                 "SELECT * FROM plans WHERE status='active' ORDER BY id DESC"
             ).fetchall()
@@ -796,7 +1052,7 @@ class Memory:
             steps[cur]["result"] = (note or "")[:500]
         cur += 1
         status = "done" if cur >= len(steps) else "active"
-        with self._conn() as c:
+        with self._conn("advance_plan") as c:
             c.execute(
                 "UPDATE plans SET steps_json=?, current_step=?, status=?, updated_at=? WHERE id=?",
                 (json.dumps(steps, ensure_ascii=False), cur, status, _utcnow(), int(plan_id)),
@@ -806,7 +1062,7 @@ class Memory:
     # ── embeddings / digests / prefs ───────────────────────────────────
 
     def add_embedding(self, ref_type: str, ref_id: Optional[int], text: str, vector: list) -> int:
-        with self._conn() as c:
+        with self._conn("add_embedding") as c:
             cur = c.execute(
                 "INSERT INTO embeddings(ref_type, ref_id, text, vector_json, created_at) VALUES (?,?,?,?,?)",
                 (ref_type, ref_id, text, json.dumps(vector), _utcnow()),
@@ -814,7 +1070,7 @@ class Memory:
             return int(cur.lastrowid)
 
     def all_embeddings(self, limit: int = 500) -> List[Dict[str, Any]]:
-        with self._conn() as c:
+        with self._conn("all_embeddings") as c:
             rows = c.execute(
                 "SELECT * FROM embeddings ORDER BY id DESC LIMIT ?", (limit,)
             ).fetchall()
@@ -828,8 +1084,85 @@ class Memory:
             out.append(d)
         return out
 
+    # ── ingested documents ─────────────────────────────────────────────
+
+    @staticmethod
+    def _under(root: str) -> tuple:
+        """SQL condition and parameters for document paths equal to or below root."""
+        if not root:
+            return "1", ()
+        prefix = os.path.join(root, "")
+        return "(s.path = ? OR substr(s.path, 1, ?) = ?)", (root, len(prefix), prefix)
+
+    def document_sources(self, root: str = "") -> Dict[str, Dict[str, Any]]:
+        """path -> id, kind, size, mtime_ns, sha256, chunks of the ingested files under root."""
+        where, args = self._under(root)
+        with self._conn("document_sources") as c:
+            rows = c.execute(
+                f"SELECT s.id, s.path, s.kind, s.size, s.mtime_ns, s.sha256, s.chunks, s.ingested_at "
+                f"FROM document_sources s WHERE {where}",
+                args,
+            ).fetchall()
+        return {r["path"]: dict(r) for r in rows}
+
+    def store_documents(self, documents: List[Dict[str, Any]]) -> int:
+        """Replace the chunks of each document in one transaction; the number of chunks written.
+
+        Each document has path, kind, size, mtime_ns, sha256 and chunks, a list of
+        (unit, char_start, char_end, text, vector bytes).
+        """
+        written = 0
+        now = _utcnow()
+        with self._conn("store_documents") as c:
+            for doc in documents:
+                c.execute(
+                    "INSERT INTO document_sources(path, kind, size, mtime_ns, sha256, chunks, ingested_at) "
+                    "VALUES (?,?,?,?,?,?,?) ON CONFLICT(path) DO UPDATE SET kind=excluded.kind, size=excluded.size, "
+                    "mtime_ns=excluded.mtime_ns, sha256=excluded.sha256, chunks=excluded.chunks, ingested_at=excluded.ingested_at",
+                    (doc["path"], doc["kind"], doc["size"], doc["mtime_ns"], doc["sha256"], len(doc["chunks"]), now),
+                )
+                source = c.execute("SELECT id FROM document_sources WHERE path=?", (doc["path"],)).fetchone()[0]
+                c.execute("DELETE FROM document_chunks WHERE source_id=?", (source,))
+                c.executemany(
+                    "INSERT INTO document_chunks(source_id, unit, char_start, char_end, text, vector) VALUES (?,?,?,?,?,?)",
+                    ((source, *chunk) for chunk in doc["chunks"]),
+                )
+                written += len(doc["chunks"])
+        return written
+
+    def restamp_documents(self, stamps: List[tuple]) -> None:
+        """(path, size, mtime_ns) of ingested files whose content did not change."""
+        with self._conn("restamp_documents") as c:
+            c.executemany("UPDATE document_sources SET size=?, mtime_ns=? WHERE path=?", [(size, mtime, path) for path, size, mtime in stamps])
+
+    def remove_documents(self, paths: List[str]) -> int:
+        with self._conn("remove_documents") as c:
+            return sum(c.execute("DELETE FROM document_sources WHERE path=?", (path,)).rowcount for path in paths)
+
+    def document_chunk_candidates(self, match: str, limit: int = 200, root: str = "") -> List[Dict[str, Any]]:
+        """Chunks matching an FTS5 query, best bm25 first, with their file, offsets, snippet and vector."""
+        where, args = self._under(root)
+        with self._conn("document_chunk_candidates") as c:
+            rows = c.execute(
+                f"""SELECT ch.id, ch.unit, ch.char_start, ch.char_end, ch.vector, s.path, s.kind,
+                           snippet(document_chunks_fts, 0, '', '', ' … ', 32) AS snippet,
+                           bm25(document_chunks_fts) AS rank
+                    FROM document_chunks_fts
+                    JOIN document_chunks ch ON ch.id = document_chunks_fts.rowid
+                    JOIN document_sources s ON s.id = ch.source_id
+                    WHERE document_chunks_fts MATCH ? AND {where}
+                    ORDER BY rank LIMIT ?""",
+                (match, *args, int(limit)),
+            ).fetchall()
+        return [dict(r) for r in rows]
+
+    def document_stats(self) -> Dict[str, int]:
+        with self._conn("document_stats") as c:
+            files, chunks = c.execute("SELECT COUNT(*), COALESCE(SUM(chunks), 0) FROM document_sources").fetchone()
+        return {"files": files, "chunks": chunks}
+
     def add_digest(self, period: str, body: str) -> int:
-        with self._conn() as c:
+        with self._conn("add_digest") as c:
             cur = c.execute(
                 "INSERT INTO digests(period, body, created_at) VALUES (?,?,?)",
                 (period, body, _utcnow()),
@@ -837,14 +1170,14 @@ class Memory:
             return int(cur.lastrowid)
 
     def recent_digests(self, limit: int = 5) -> List[Dict[str, Any]]:
-        with self._conn() as c:
+        with self._conn("recent_digests") as c:
             rows = c.execute(
                 "SELECT * FROM digests ORDER BY id DESC LIMIT ?", (limit,)
             ).fetchall()
         return [dict(r) for r in rows]
 
     def set_preference(self, key: str, value: str):
-        with self._conn() as c:
+        with self._conn("set_preference") as c:
             c.execute(
                 "INSERT INTO preferences(key, value, updated_at) VALUES (?,?,?) "
                 "ON CONFLICT(key) DO UPDATE SET value=excluded.value, updated_at=excluded.updated_at",
@@ -852,12 +1185,12 @@ class Memory:
             )
 
     def get_preference(self, key: str, default: str = "") -> str:
-        with self._conn() as c:
+        with self._conn("get_preference") as c:
             row = c.execute("SELECT value FROM preferences WHERE key=?", (key,)).fetchone()
         return row["value"] if row else default
 
     def all_preferences(self) -> Dict[str, str]:
-        with self._conn() as c:
+        with self._conn("all_preferences") as c:
             rows = c.execute("SELECT key, value FROM preferences").fetchall()
         return {r["key"]: r["value"] for r in rows}
 
@@ -7,6 +7,8 @@ from __future__ import annotations
 import hashlib
 import math
 import re
+from array import array
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
 from seven.memory.store import Memory
@@ -15,6 +17,13 @@ _DIM = 256
 _TOKEN = re.compile(r"[a-z0-9_]{2,}", re.I)
 
 
+@lru_cache(maxsize=200_000)
+def _slot(token: str, dim: int) -> Tuple[int, float]:
+    """(index, sign) of a token; cached because documents repeat most of their words."""
+    h = int(hashlib.md5(token.encode("utf-8")).hexdigest(), 16)
+    return h % dim, 1.0 if (h >> 8) & 1 else -1.0
+
+
 def embed_text(text: str, dim: int = _DIM) -> List[float]:
     """Deterministic feature hashing embedding."""
     vec = [0.0] * dim
@@ -22,15 +31,24 @@ def embed_text(text: str, dim: int = _DIM) -> List[float]:
     if not tokens:
         return vec
     for t in tokens:
-        h = int(hashlib.md5(t.encode("utf-8")).hexdigest(), 16)
-        idx = h % dim
-        sign = 1.0 if (h >> 8) & 1 else -1.0
+        idx, sign = _slot(t, dim)
         vec[idx] += sign
     # L2 normalize
     norm = math.sqrt(sum(v * v for v in vec)) or 1.0
     return [v / norm for v in vec]
 
 
+def pack(vec: List[float]) -> bytes:
+    """float32 bytes of a vector, for BLOB columns (a quarter of the JSON size)."""
+    return array("f", vec).tobytes()
+
+
+def unpack(blob: bytes) -> array:
+    vec = array("f")
+    vec.frombytes(blob)
+    return vec
+
+
 def cosine(a: List[float], b: List[float]) -> float:
     n = min(len(a), len(b))
     if n == 0:
@@ -0,0 +1,236 @@
+"""
+In-process metrics in the Prometheus text exposition format.
+
+Counters, gauges and histograms keyed by label values. An update takes one
+uncontended per-series lock and a bisect; nothing is formatted until /metrics
+is scraped, and callback gauges are only evaluated then.
+"""
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+# Seconds: sub-millisecond SQLite through multi-minute cold LLM loads.
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0,
+)
+
+LabelValues = Tuple[str, ...]
+GaugeSource = Callable[[], Union[float, Dict[LabelValues, float]]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Value:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0):
+        self.inc(-amount)
+
+    def set(self, value: float):
+        self.value = float(value)
+
+
+class _HistogramValue:
+    __slots__ = ("_lock", "_bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self._lock = threading.Lock()
+        self._bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self._bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+
+class Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labels)
+        self._series: Dict[LabelValues, object] = {}
+        self._lock = threading.Lock()
+
+    def _new(self):
+        return _Value()
+
+    def labels(self, *values) -> object:
+        key = tuple(str(v) for v in values)
+        series = self._series.get(key)
+        if series is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {key}")
+            with self._lock:
+                series = self._series.setdefault(key, self._new())
+        return series
+
+    def _items(self) -> List[Tuple[LabelValues, object]]:
+        with self._lock:
+            return sorted(self._series.items())
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for key, series in self._items():
+            lines.append(f"{self.name}{_labels(self.labelnames, key)} {_number(series.value)}")
+        return lines
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0):
+        self.labels().inc(amount)
+
+
+class Gauge(Metric):
+    """Set/inc gauge, or a callback evaluated at scrape time when source is given."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = (), source: Optional[GaugeSource] = None):
+        super().__init__(name, help, labels)
+        self.source = source
+
+    def set(self, value: float):
+        self.labels().set(value)
+
+    def _items(self):
+        if self.source is None:
+            return super()._items()
+        try:
+            value = self.source()
+        except Exception:
+            return []
+        if not isinstance(value, dict):
+            value = {(): value}
+        out = []
+        for key, number in sorted(value.items()):
+            holder = _Value()
+            holder.value = float(number)
+            out.append((tuple(str(v) for v in key), holder))
+        return out
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(float(b) for b in buckets))
+
+    def _new(self):
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value: float):
+        self.labels().observe(value)
+
+    def time(self):
+        return self.labels().time()
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for key, series in self._items():
+            with series._lock:
+                counts, total, count = list(series.counts), series.sum, series.count
+            running = 0
+            for bound, n in zip(self.buckets + (math.inf,), counts):
+                running += n
+                le = 'le="' + _number(bound) + '"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {running}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {count}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: Metric) -> Metric:
+        """Idempotent by name so module reloads reuse the live series."""
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if isinstance(metric, Gauge) and metric.source is not None:
+                    existing.source = metric.source
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def get(self, name: str) -> Optional[Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def counter(name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+    return REGISTRY.register(Counter(name, help, labels))
+
+
+def gauge(name: str, help: str, labels: Sequence[str] = (), source: Optional[GaugeSource] = None) -> Gauge:
+    return REGISTRY.register(Gauge(name, help, labels, source))
+
+
+def histogram(name: str, help: str, labels: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+    return REGISTRY.register(Histogram(name, help, labels, buckets))
+
+
+def render() -> str:
+    return REGISTRY.render()
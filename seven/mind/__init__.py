@@ -1,5 +1,6 @@
+from .sensors import SensorHub
 from .state import LivingState
 from .world import sense_world
 from .self_model import sense_self
 
-__all__ = ["LivingState", "sense_world", "sense_self"]
+__all__ = ["LivingState", "SensorHub", "sense_world", "sense_self"]
@@ -46,7 +46,8 @@ class FreeWill:
             return Decision("wait", "freewill off")
 
         try:
-            self.agent.refresh_living_state()
+            # The heartbeat tick has usually just sensed; reuse that snapshot.
+            self.agent.refresh_living_state(max_age=30)
         except Exception:
             pass
 
@@ -175,7 +176,7 @@ class FreeWill:
         except Exception as e:
             logger.warning("invent_goal LLM failed: %s", e)
             title = "Keep my workspace tidy and documented"
-            detail = "Inspect workspace, write a short STATUS.md of what I find."
+            detail = "Inspect workspace (workspace_changes_since, find_indexed), write a short STATUS.md of what I find."
             say = "I'm giving myself a goal: tidy and document the workspace."
             gid = self.agent.memory.add_goal(title, detail)
             self.agent.memory.remember(f"Self-chosen goal #{gid}: {title}", key="freewill.last_goal", source="freewill")
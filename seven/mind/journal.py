@@ -0,0 +1,211 @@
+"""
+Append-only living-state journal.
+
+One compact JSON line per event (boot, tick, state change, action) under
+SEVEN_DATA_DIR. Appends are O(entry), never a whole-file rewrite; compaction
+drops entries older than the retention window and is the only rewrite. The
+owner snapshots its state before compacting so replay never loses events.
+
+The daemon and the CLI append to the same file. Appends, compaction and the
+owner's snapshot hold an exclusive lock on a sidecar "<journal>.lock" file
+(flock / msvcrt), and every append takes its seq from the file's last entry
+under that lock, so seq is strictly increasing across processes.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import statistics
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+from seven import config
+
+logger = logging.getLogger("seven.mind")
+
+# Bytes read from the end of the journal to find its last seq.
+TAIL_BYTES = 64 * 1024
+
+
+def _lock_file(stream) -> None:
+    if os.name == "nt":
+        import msvcrt
+
+        stream.seek(0)
+        while True:
+            try:
+                msvcrt.locking(stream.fileno(), msvcrt.LK_LOCK, 1)  # retries for ~10 s, then raises
+                return
+            except OSError:
+                continue
+    import fcntl
+
+    fcntl.flock(stream.fileno(), fcntl.LOCK_EX)
+
+
+def _unlock_file(stream) -> None:
+    if os.name == "nt":
+        import msvcrt
+
+        stream.seek(0)
+        msvcrt.locking(stream.fileno(), msvcrt.LK_UNLCK, 1)
+        return
+    import fcntl
+
+    fcntl.flock(stream.fileno(), fcntl.LOCK_UN)
+
+
+class LivingJournal:
+    def __init__(
+        self,
+        path: Path,
+        retention_days: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.retention_seconds = float(
+            config.LIVING_JOURNAL_RETENTION_DAYS if retention_days is None else retention_days
+        ) * 86400.0
+        self.max_entries = int(config.LIVING_JOURNAL_MAX_ENTRIES if max_entries is None else max_entries)
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+        self._lock = threading.RLock()
+        self._lock_depth = 0
+        self._own: Set[int] = set()  # seqs this instance appended, until forgotten by foreign()
+        self.seq = 0
+        self.lines = 0
+        for entry in self.entries():
+            self.seq = max(self.seq, int(entry.get("seq") or 0))
+            self.lines += 1
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """Exclusive across threads and processes; re-entrant within a thread."""
+        with self._lock:
+            if self._lock_depth:
+                self._lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._lock_depth -= 1
+                return
+            with self.lock_path.open("a+b") as stream:
+                _lock_file(stream)
+                self._lock_depth = 1
+                try:
+                    yield
+                finally:
+                    self._lock_depth = 0
+                    _unlock_file(stream)
+
+    def last_seq(self) -> int:
+        """seq of the file's last complete entry (0 when there is none)."""
+        try:
+            with self.path.open("rb") as stream:
+                size = stream.seek(0, os.SEEK_END)
+                stream.seek(max(0, size - TAIL_BYTES))
+                tail = stream.read()
+        except FileNotFoundError:
+            return 0
+        for line in reversed(tail.splitlines()):
+            try:
+                return int(json.loads(line).get("seq") or 0)
+            except (ValueError, AttributeError):
+                continue  # torn or cut-off line
+        return 0
+
+    def append(self, kind: str, **data: Any) -> Dict[str, Any]:
+        with self.locked():
+            # Another process may have appended since our last write.
+            self.seq = max(self.seq, self.last_seq()) + 1
+            entry = {"seq": self.seq, "unix": round(time.time(), 3), "kind": kind, **data}
+            line = json.dumps(entry, separators=(",", ":"), default=str) + "\n"
+            with self.path.open("a", encoding="utf-8") as stream:
+                stream.write(line)
+            self._own.add(self.seq)
+            self.lines += 1
+            return entry
+
+    def foreign(self, after_seq: int) -> Iterator[Dict[str, Any]]:
+        """Entries after after_seq that another journal instance (process) appended."""
+        own = self._own
+        self._own = {seq for seq in own if seq > after_seq}
+        for entry in self.entries(after_seq=after_seq):
+            if int(entry.get("seq") or 0) not in own:
+                yield entry
+
+    def needs_compaction(self) -> bool:
+        return self.lines > self.max_entries
+
+    def entries(
+        self,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        kinds: Optional[Iterable[str]] = None,
+        after_seq: int = 0,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream entries in order, filtered by unix time window, kind and sequence."""
+        if not self.path.exists():
+            return
+        wanted = set(kinds) if kinds else None
+        with self.path.open("r", encoding="utf-8") as stream:
+            for line in stream:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # a torn final line from a crash mid-append is skipped, not fatal
+                    continue
+                if int(entry.get("seq") or 0) <= after_seq:
+                    continue
+                unix = float(entry.get("unix") or 0)
+                if since is not None and unix < since:
+                    continue
+                if until is not None and unix > until:
+                    continue
+                if wanted and entry.get("kind") not in wanted:
+                    continue
+                yield entry
+
+    def compact(self, now: Optional[float] = None) -> int:
+        """Drop entries outside retention/max_entries. Returns entries kept."""
+        with self.locked():
+            cutoff = (now or time.time()) - self.retention_seconds
+            kept = [e for e in self.entries() if float(e.get("unix") or 0) >= cutoff]
+            kept = kept[-max(1, self.max_entries // 2):]
+            tmp = self.path.with_suffix(".tmp")
+            with tmp.open("w", encoding="utf-8") as stream:
+                for entry in kept:
+                    stream.write(json.dumps(entry, separators=(",", ":"), default=str) + "\n")
+            os.replace(tmp, self.path)
+            self.lines = len(kept)
+            logger.info("living journal compacted to %s entries", self.lines)
+            return self.lines
+
+    def cadence(self, since: Optional[float] = None, until: Optional[float] = None) -> Dict[str, Any]:
+        """Tick cadence and uptime over a time window."""
+        ticks = [float(e["unix"]) for e in self.entries(since, until, kinds=("tick",))]
+        boots = sum(1 for _ in self.entries(since, until, kinds=("boot",)))
+        gaps = [b - a for a, b in zip(ticks, ticks[1:])]
+        out: Dict[str, Any] = {"ticks": len(ticks), "boots": boots}
+        if gaps:
+            # A gap much longer than normal cadence means the process was down.
+            typical = statistics.median(gaps)
+            limit = max(typical * 3, float(config.DAEMON_SENSE_SECONDS) * 2)
+            out.update(
+                first=ticks[0],
+                last=ticks[-1],
+                interval_mean_s=round(statistics.fmean(gaps), 2),
+                interval_median_s=round(typical, 2),
+                interval_max_s=round(max(gaps), 2),
+                uptime_s=round(sum(g for g in gaps if g <= limit), 1),
+                downtime_gaps=sum(1 for g in gaps if g > limit),
+            )
+        return out
+
+    def tail(self, n: int, kinds: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        return list(deque(self.entries(kinds=kinds), maxlen=max(0, int(n))))
@@ -109,11 +109,14 @@ class Planner:
         if not real:
             forced = []
             try:
+                # The workspace index answers without re-walking the tree every step: changes since
+                # the plan began, or (when there are none) its summary and most recent files.
                 forced.append(
-                    "list_dir: "
-                    + self.agent.tools.execute("list_dir", {"path": str(
-                        __import__("seven.config", fromlist=["WORKSPACE_DIR"]).WORKSPACE_DIR
-                    )})[:400]
+                    "workspace_changes_since: "
+                    + self.agent.tools.execute(
+                        "workspace_changes_since",
+                        {"since": plan.get("created_at") or "", "limit": 20},
+                    )[:800]
                 )
                 forced.append(
                     "get_system_info: "
@@ -0,0 +1,186 @@
+"""
+Sensor hub — TTL-cached world probes with an optional background sampler.
+
+Each probe (resources, ollama, work) is sampled at most once per TTL and keeps
+a small ring buffer of recent samples. Readers get the cached value; only a
+stale probe with no running sampler is re-sensed inline.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from seven import config
+
+logger = logging.getLogger("seven.mind")
+
+
+@dataclass
+class Probe:
+    name: str
+    sample: Callable[[], Dict[str, Any]]
+    ttl: float
+    value: Dict[str, Any] = field(default_factory=dict)
+    sampled_at: float = 0.0
+    duration: float = 0.0
+    history: Deque[Tuple[float, Dict[str, Any]]] = field(default_factory=deque)
+
+    def stale(self, now: Optional[float] = None) -> bool:
+        if not self.sampled_at:
+            return True
+        return ((now or time.time()) - self.sampled_at) >= self.ttl
+
+
+class SensorHub:
+    """Owns world probes so one heartbeat never senses the same thing twice."""
+
+    def __init__(
+        self,
+        memory=None,
+        brain=None,
+        ttls: Optional[Dict[str, float]] = None,
+        history: Optional[int] = None,
+    ):
+        from seven.mind import world
+
+        self.memory = memory
+        self.brain = brain
+        ttls = ttls or {}
+        depth = max(1, int(history or config.SENSE_HISTORY))
+        self._locks: Dict[str, threading.Lock] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._probes: Dict[str, Probe] = {}
+        self._add(Probe(
+            "resources",
+            lambda: world._resources(cpu_interval=self._cpu_interval()),
+            float(ttls.get("resources", config.SENSE_RESOURCES_TTL)),
+            history=deque(maxlen=depth),
+        ))
+        self._add(Probe(
+            "ollama",
+            lambda: world._ollama(self.brain),
+            float(ttls.get("ollama", config.SENSE_OLLAMA_TTL)),
+            history=deque(maxlen=depth),
+        ))
+        self._add(Probe(
+            "work",
+            lambda: world._work(self.memory),
+            float(ttls.get("work", config.SENSE_WORK_TTL)),
+            history=deque(maxlen=depth),
+        ))
+
+    def _add(self, probe: Probe):
+        self._probes[probe.name] = probe
+        self._locks[probe.name] = threading.Lock()
+
+    def _cpu_interval(self) -> Optional[float]:
+        # psutil measures since the previous call when interval=None; the
+        # sampler primes it on start, so only unprimed inline reads block.
+        return None if self.running() else 0.15
+
+    # ── reads ──────────────────────────────────────────────────────────
+
+    def names(self) -> List[str]:
+        return list(self._probes)
+
+    def read(self, name: str, max_age: Optional[float] = None) -> Dict[str, Any]:
+        """Cached probe value; re-senses inline only if no sampler keeps it fresh."""
+        probe = self._probes[name]
+        limit = probe.ttl if max_age is None else float(max_age)
+        fresh = probe.sampled_at and (time.time() - probe.sampled_at) < limit
+        if fresh or (self.running() and probe.sampled_at and max_age is None):
+            return dict(probe.value)
+        return self.sample(name)
+
+    def cached(self, name: str) -> Tuple[Dict[str, Any], float]:
+        """Last value and its sample time (0 = never) without ever sensing."""
+        probe = self._probes[name]
+        return dict(probe.value), probe.sampled_at
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {name: self.read(name) for name in self._probes}
+
+    def freshness(self) -> Dict[str, Optional[float]]:
+        """Age in seconds of each probe's cached value (None = never sensed)."""
+        now = time.time()
+        return {
+            name: (round(now - p.sampled_at, 2) if p.sampled_at else None)
+            for name, p in self._probes.items()
+        }
+
+    def history(self, name: str, limit: Optional[int] = None) -> List[Tuple[float, Dict[str, Any]]]:
+        items = list(self._probes[name].history)
+        return items[-limit:] if limit else items
+
+    # ── writes ─────────────────────────────────────────────────────────
+
+    def sample(self, name: str) -> Dict[str, Any]:
+        probe = self._probes[name]
+        # Per-probe lock: a slow Ollama ping never blocks a work/resources read.
+        with self._locks[name]:
+            started = time.perf_counter()
+            try:
+                value = probe.sample() or {}
+            except Exception as e:
+                logger.debug("probe %s failed", name, exc_info=True)
+                value = {"error": str(e)}
+            now = time.time()
+            probe.value = value
+            probe.sampled_at = now
+            probe.duration = time.perf_counter() - started
+            probe.history.append((now, value))
+            return dict(value)
+
+    def seed(self, name: str, value: Dict[str, Any]):
+        """Store an externally obtained reading (e.g. the boot-time Ollama ping)."""
+        probe = self._probes[name]
+        with self._locks[name]:
+            now = time.time()
+            probe.value = dict(value or {})
+            probe.sampled_at = now
+            probe.history.append((now, probe.value))
+
+    def invalidate(self, name: Optional[str] = None):
+        """Mark one probe (or all) stale so the next read re-senses it."""
+        for probe in ([self._probes[name]] if name else self._probes.values()):
+            probe.sampled_at = 0.0
+
+    # ── background sampler ─────────────────────────────────────────────
+
+    def running(self) -> bool:
+        return bool(self._thread and self._thread.is_alive())
+
+    def start(self):
+        if self.running():
+            return
+        try:
+            import psutil
+            psutil.cpu_percent(interval=None)
+        except Exception:
+            pass
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="seven-sensors", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        thread = self._thread
+        if thread and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout=2.0)
+        self._thread = None
+
+    def _loop(self):
+        while not self._stop.is_set():
+            now = time.time()
+            for name, probe in self._probes.items():
+                if self._stop.is_set():
+                    return
+                if probe.stale(now):
+                    self.sample(name)
+            wait = min(p.ttl for p in self._probes.values()) if self._probes else 5.0
+            self._stop.wait(max(0.5, min(wait, 5.0)))
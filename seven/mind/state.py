@@ -1,6 +1,11 @@
 """
 Persistent living state: last world/self snapshots + tick history.
-JSON file under SEVEN_DATA_DIR so daemon and CLI share state.
+Events append to an append-only journal (living_journal.jsonl); a compact
+snapshot (living_state.json) is written periodically and on shutdown. Load =
+snapshot + replay of newer journal entries. Daemon and CLI share both files:
+before each snapshot the entries the other process journaled since the last
+one are applied too, under the journal's lock, so the snapshot's seq never
+covers events this process has not seen.
 """
 from __future__ import annotations
 
@@ -12,6 +17,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from seven import config
+from seven.mind.journal import LivingJournal
 from seven.mind.self_model import sense_self, self_summary
 from seven.mind.world import sense_world, world_summary
 
@@ -19,7 +25,7 @@ logger = logging.getLogger("seven.mind")
 
 
 class LivingState:
-    def __init__(self, path: Optional[Path] = None):
+    def __init__(self, path: Optional[Path] = None, journal_path: Optional[Path] = None):
         self.path = Path(path or (config.DATA_DIR / "living_state.json"))
         self.path.parent.mkdir(parents=True, exist_ok=True)
         self._lock = threading.RLock()
@@ -31,26 +37,67 @@ class LivingState:
         self.last_reflection: Optional[str] = None
         self.boot_ts: float = time.time()
         self.history: List[Dict[str, Any]] = []  # last N tick summaries
+        self.journal = LivingJournal(journal_path or self.path.with_name("living_journal.jsonl"))
+        self._state_fingerprint: Optional[str] = None
+        self._snapshot_ts: float = 0.0
+        self._synced_seq = 0  # every journal entry up to this seq is reflected in memory
         self._load()
+        self.journal.append("boot", boot_ts=self.boot_ts)
 
     def _load(self):
-        if not self.path.exists():
-            return
+        snapshot_seq = 0
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                self.world = data.get("world") or {}
+                self.self_state = data.get("self") or {}
+                self.tick_count = int(data.get("tick_count") or 0)
+                self.last_tick_ts = float(data.get("last_tick_ts") or 0)
+                self.last_action = data.get("last_action")
+                self.last_reflection = data.get("last_reflection")
+                self.history = list(data.get("history") or [])[-50:]
+                snapshot_seq = int(data.get("seq") or 0)
+            except Exception as e:
+                logger.warning("living state load failed: %s", e)
+        replayed = 0
         try:
-            data = json.loads(self.path.read_text(encoding="utf-8"))
-            self.world = data.get("world") or {}
-            self.self_state = data.get("self") or {}
-            self.tick_count = int(data.get("tick_count") or 0)
-            self.last_tick_ts = float(data.get("last_tick_ts") or 0)
-            self.last_action = data.get("last_action")
-            self.last_reflection = data.get("last_reflection")
-            self.history = list(data.get("history") or [])[-50:]
-        except Exception as e:
-            logger.warning("living state load failed: %s", e)
+            with self.journal.locked():
+                for entry in self.journal.entries(after_seq=snapshot_seq):
+                    self._apply(entry)
+                    replayed += 1
+                self._synced_seq = max(snapshot_seq, self.journal.last_seq())
+        except OSError as e:
+            logger.warning("living journal replay failed: %s", e)
+        self.history = self.history[-50:]
+        # A deleted/rotated journal must not restart numbering below the snapshot.
+        self.journal.seq = max(self.journal.seq, snapshot_seq)
+        self._state_fingerprint = self._fingerprint()
+        if replayed:
+            logger.debug("living state replayed %s journal entries", replayed)
+
+    def _apply(self, entry: Dict[str, Any]):
+        kind = entry.get("kind")
+        if kind == "tick":
+            self.tick_count = int(entry.get("tick") or self.tick_count)
+            self.last_tick_ts = float(entry.get("unix") or self.last_tick_ts)
+            self.history.append({k: entry.get(k) for k in ("tick", "ts", "mode", "intent", "action")})
+        elif kind == "state":
+            self.world = entry.get("world") or self.world
+            self.self_state = entry.get("self_state") or self.self_state
+        elif kind == "action":
+            self.last_action = entry.get("action")
+            if entry.get("reflection"):
+                self.last_reflection = entry.get("reflection")
 
     def save(self):
-        with self._lock:
+        """Write the compact snapshot (journal entries up to `seq` are folded in)."""
+        with self._lock, self.journal.locked():
+            for entry in self.journal.foreign(self._synced_seq):
+                self._apply(entry)
+            self.history = self.history[-50:]
+            self._synced_seq = max(self._synced_seq, self.journal.seq, self.journal.last_seq())
             payload = {
+                "seq": self._synced_seq,
                 "world": self.world,
                 "self": self.self_state,
                 "tick_count": self.tick_count,
@@ -61,8 +108,34 @@ class LivingState:
                 "history": self.history[-50:],
             }
             tmp = self.path.with_suffix(".tmp")
-            tmp.write_text(json.dumps(payload, indent=2, default=str), encoding="utf-8")
+            tmp.write_text(json.dumps(payload, separators=(",", ":"), default=str), encoding="utf-8")
             tmp.replace(self.path)
+            self._snapshot_ts = time.time()
+
+    def _maybe_snapshot(self):
+        if self.journal.needs_compaction():
+            with self.journal.locked():
+                self.save()
+                self.journal.compact()
+        elif (time.time() - self._snapshot_ts) >= config.LIVING_SNAPSHOT_INTERVAL:
+            self.save()
+
+    def _fingerprint(self) -> str:
+        """Material state only — timestamps and CPU jitter do not journal a new state."""
+        st = self.self_state.get("state") or {}
+        oll = self.world.get("ollama") or {}
+        work = self.world.get("work") or {}
+        material = {
+            "mode": st.get("mode"),
+            "energy": st.get("energy"),
+            "work_session": st.get("work_session"),
+            "intent": self.self_state.get("intent"),
+            "ollama": [oll.get("ok"), oll.get("model"), oll.get("loaded")],
+            "goals": [(g.get("id"), g.get("progress")) for g in work.get("active_goals") or []],
+            "tasks": [t.get("id") for t in work.get("open_tasks") or []],
+            "failures": [f.get("at") for f in work.get("recent_failures") or []],
+        }
+        return json.dumps(material, sort_keys=True, default=str)
 
     def refresh(
         self,
@@ -72,10 +145,13 @@ class LivingState:
         tools_active: Optional[List[str]] = None,
         tools_total: Optional[int] = None,
         work_session: Optional[str] = None,
+        sensors=None,
     ) -> Dict[str, Any]:
-        """Sense world + self, persist, return combined snapshot."""
+        """Sense world + self (via cached sensors when given), journal the tick, return snapshot."""
         with self._lock:
-            self.world = sense_world(memory=memory, brain=brain, last_user_ts=last_user_ts)
+            self.world = sense_world(
+                memory=memory, brain=brain, last_user_ts=last_user_ts, sensors=sensors,
+            )
             self.self_state = sense_self(
                 world=self.world,
                 tools_active=tools_active,
@@ -94,7 +170,12 @@ class LivingState:
             }
             self.history.append(entry)
             self.history = self.history[-50:]
-            self.save()
+            self.journal.append("tick", **entry)
+            fingerprint = self._fingerprint()
+            if fingerprint != self._state_fingerprint:
+                self.journal.append("state", world=self.world, self_state=self.self_state)
+                self._state_fingerprint = fingerprint
+            self._maybe_snapshot()
             return {"world": self.world, "self": self.self_state, "tick": self.tick_count}
 
     def record_action(self, action: str, reflection: Optional[str] = None):
@@ -102,7 +183,15 @@ class LivingState:
             self.last_action = (action or "")[:500]
             if reflection:
                 self.last_reflection = reflection[:800]
-            self.save()
+            self.journal.append("action", action=self.last_action, reflection=reflection and self.last_reflection)
+            self._maybe_snapshot()
+
+    def ticks_between(self, since: Optional[float] = None, until: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Journaled tick summaries within a unix-time window."""
+        return list(self.journal.entries(since, until, kinds=("tick",)))
+
+    def cadence(self, since: Optional[float] = None, until: Optional[float] = None) -> Dict[str, Any]:
+        return self.journal.cadence(since, until)
 
     def context_for_prompt(self) -> str:
         """Compact block for system / autonomy prompts."""
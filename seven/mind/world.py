@@ -1,6 +1,7 @@
 """
 World sensing — structured snapshot of machine + time + open work.
-No LLM required. Cheap enough for every heartbeat.
+No LLM required. Cheap enough for every heartbeat; pass a SensorHub to reuse
+TTL-cached probe readings instead of re-sensing.
 """
 from __future__ import annotations
 
@@ -16,6 +17,7 @@ def sense_world(
     memory=None,
     brain=None,
     last_user_ts: Optional[float] = None,
+    sensors=None,
 ) -> Dict[str, Any]:
     now = time.time()
     idle_min = None
@@ -35,9 +37,9 @@ def sense_world(
             "idle_minutes": idle_min,
             "last_user_ts": last_user_ts,
         },
-        "resources": _resources(),
-        "ollama": _ollama(brain),
-        "work": _work(memory),
+        "resources": sensors.read("resources") if sensors else _resources(),
+        "ollama": sensors.read("ollama") if sensors else _ollama(brain),
+        "work": sensors.read("work") if sensors else _work(memory),
         "time": {
             "local": datetime.now().strftime("%Y-%m-%d %H:%M:%S %A"),
             "hour": datetime.now().hour,
@@ -47,14 +49,14 @@ def sense_world(
     return snap
 
 
-def _resources() -> Dict[str, Any]:
+def _resources(cpu_interval: Optional[float] = 0.15) -> Dict[str, Any]:
     out: Dict[str, Any] = {}
     try:
         import psutil
         vm = psutil.virtual_memory()
         out["ram_total_gb"] = round(vm.total / 1e9, 1)
         out["ram_used_pct"] = vm.percent
-        out["cpu_pct"] = psutil.cpu_percent(interval=0.15)
+        out["cpu_pct"] = psutil.cpu_percent(interval=cpu_interval)
         out["cpu_count"] = psutil.cpu_count()
         disk = psutil.disk_usage(os.path.expanduser("~"))
         out["disk_free_gb"] = round(disk.free / 1e9, 1)
@@ -68,19 +70,25 @@ def _ollama(brain) -> Dict[str, Any]:
     if brain is None:
         return {"ok": None}
     try:
-        p = brain.ping()
-        return {
-            "ok": p.get("ok"),
-            "model": p.get("model"),
-            "loaded": p.get("loaded"),
-            "has_vision": p.get("has_vision"),
-            "hint": p.get("hint"),
-            "error": p.get("error"),
-        }
+        return ollama_from_ping(brain.ping())
     except Exception as e:
         return {"ok": False, "error": str(e)}
 
 
+def ollama_from_ping(p: Dict[str, Any]) -> Dict[str, Any]:
+    """World-model subset of Brain.ping(); also used to seed the sensor hub."""
+    return {
+        "ok": p.get("ok"),
+        "model": p.get("model"),
+        "loaded": p.get("loaded"),
+        "has_vision": p.get("has_vision"),
+        "hint": p.get("hint"),
+        "error": p.get("error"),
+        "provider": p.get("provider"),
+        "has_primary": p.get("has_primary"),
+    }
+
+
 def _work(memory) -> Dict[str, Any]:
     if memory is None:
         return {}
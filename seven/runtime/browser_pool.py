@@ -0,0 +1,277 @@
+"""
+Warm Chromium for browser_get and browser_screenshot.
+
+One Playwright instance and browser live on a dedicated thread running an
+asyncio loop; tool calls hand that loop a job and wait for its result. Up to
+SEVEN_BROWSER_CONTEXTS isolated browser contexts (separate cookies and
+storage) serve pages at the same time. A context is replaced after
+SEVEN_BROWSER_PAGES_PER_CONTEXT pages, after a page that failed, or when the
+browser's processes pass SEVEN_BROWSER_MAX_RSS_MB. After
+SEVEN_BROWSER_IDLE_SECONDS without a call the browser and its thread shut
+down, and the next call launches them again (0 turns either check off).
+Text-only jobs abort image, media and font requests.
+"""
+from __future__ import annotations
+
+import asyncio
+import atexit
+import concurrent.futures
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+import psutil
+
+from seven import config
+
+logger = logging.getLogger("seven.browser_pool")
+
+BLOCKED_RESOURCES = frozenset({"image", "media", "font"})
+VIEWPORT = {"width": 1280, "height": 800}
+IDLE_CHECK_SECONDS = 5.0
+SHUTDOWN_TIMEOUT = 30.0
+
+# async job(page) -> result, run on a fresh page of a pooled context.
+PageJob = Callable[[Any], Awaitable[Any]]
+# async launch() -> (browser, async stop()).
+Launcher = Callable[[], Awaitable[Tuple[Any, Callable[[], Awaitable[None]]]]]
+
+
+async def launch_chromium() -> Tuple[Any, Callable[[], Awaitable[None]]]:
+    """Headless Chromium; raises ImportError when Playwright is not installed."""
+    from playwright.async_api import async_playwright
+
+    playwright = await async_playwright().start()
+    try:
+        browser = await playwright.chromium.launch(headless=True)
+    except BaseException:
+        await playwright.stop()
+        raise
+
+    async def stop() -> None:
+        try:
+            await browser.close()
+        finally:
+            await playwright.stop()
+
+    return browser, stop
+
+
+async def block_heavy(route) -> None:
+    if route.request.resource_type in BLOCKED_RESOURCES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def chromium_rss_mb() -> float:
+    """Resident memory of the Chromium processes started under this one."""
+    total = 0
+    for child in psutil.Process().children(recursive=True):
+        try:
+            if "chrom" in child.name().lower():
+                total += child.memory_info().rss
+        except psutil.Error:
+            continue
+    return total / (1024 * 1024)
+
+
+class _Context:
+    def __init__(self, context):
+        self.context = context
+        self.pages = 0
+
+
+class _Session:
+    """One browser on its own thread and event loop; replaced after an idle shutdown."""
+
+    def __init__(self, pool: "BrowserPool"):
+        self.pool = pool
+        self.loop = asyncio.new_event_loop()
+        self.browser = None
+        self.stop: Optional[Callable[[], Awaitable[None]]] = None
+        self.idle: List[_Context] = []  # contexts not serving a page
+        self.slots = asyncio.Semaphore(pool.size)
+        self.launching = asyncio.Lock()
+        self.thread = threading.Thread(target=self._serve, name="seven-browser", daemon=True)
+        self.thread.start()
+
+    def _serve(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
+
+    async def _ensure_browser(self) -> None:
+        async with self.launching:
+            if self.browser is not None and self.browser.is_connected():
+                return
+            if self.browser is not None:
+                logger.warning("browser disconnected; relaunching")
+                self.idle.clear()
+                await self._stop_browser()
+            self.browser, self.stop = await self.pool.launch()
+            self.pool.launches += 1
+
+    async def _stop_browser(self) -> None:
+        stop, self.browser, self.stop = self.stop, None, None
+        if stop is not None:
+            try:
+                await stop()
+            except Exception as exc:
+                logger.debug("browser stop failed: %s", exc)
+
+    async def _close_context(self, ctx: _Context) -> None:
+        try:
+            await ctx.context.close()
+        except Exception as exc:
+            logger.debug("browser context close failed: %s", exc)
+
+    async def page(self, job: PageJob, block: bool) -> Any:
+        async with self.slots:
+            await self._ensure_browser()
+            if self.idle:
+                ctx = self.idle.pop()
+            else:
+                ctx = _Context(await self.browser.new_context(viewport=VIEWPORT))
+                self.pool.contexts_opened += 1
+            page, ok = None, False
+            try:
+                page = await ctx.context.new_page()
+                if block:
+                    await page.route("**/*", block_heavy)
+                result = await job(page)
+                ok = True
+                return result
+            finally:
+                ctx.pages += 1
+                if page is not None:
+                    try:
+                        await page.close()
+                    except Exception:
+                        ok = False
+                # A failed page may leave the context half-navigated or crashed.
+                if ok and ctx.pages < self.pool.pages_per_context and not self.pool.over_memory():
+                    self.idle.append(ctx)
+                else:
+                    await self._close_context(ctx)
+
+    async def close(self) -> None:
+        idle, self.idle = self.idle, []
+        for ctx in idle:
+            await self._close_context(ctx)
+        await self._stop_browser()
+
+    async def close_and_stop(self) -> None:
+        try:
+            await self.close()
+        finally:
+            self.loop.stop()
+
+    def shutdown(self) -> None:
+        """Close the browser and end the thread; called from any other thread."""
+        try:
+            asyncio.run_coroutine_threadsafe(self.close(), self.loop).result(SHUTDOWN_TIMEOUT)
+        except Exception as exc:
+            logger.warning("browser shutdown failed: %r", exc)
+        try:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        except RuntimeError:
+            pass  # the loop already stopped and closed
+        self.thread.join(SHUTDOWN_TIMEOUT)
+
+
+class BrowserPool:
+    def __init__(
+        self,
+        size: int,
+        pages_per_context: int,
+        idle_seconds: float,
+        max_rss_mb: float,
+        launch: Launcher = launch_chromium,
+    ):
+        self.size = max(1, size)
+        self.pages_per_context = max(1, pages_per_context)
+        self.idle_seconds = max(0.0, idle_seconds)
+        self.max_rss_mb = max_rss_mb
+        self.launch = launch
+        self.rss_mb = chromium_rss_mb
+        self.launches = 0
+        self.contexts_opened = 0
+        self.closed = False
+        self._session: Optional[_Session] = None
+        self._pending = 0
+        self._last_used = time.monotonic()
+        self._lock = threading.Lock()
+
+    def run(self, job: PageJob, block_heavy: bool = True, timeout: float = 60.0) -> Any:
+        """job(page)'s result on a pooled page; raises what the job or the launch raised."""
+        with self._lock:
+            if self.closed:
+                raise RuntimeError("browser pool is closed")
+            if self._session is None:
+                self._session = _Session(self)
+                if self.idle_seconds > 0:
+                    self._session.loop.call_soon_threadsafe(self._check_idle, self._session)
+            session = self._session
+            self._pending += 1
+        try:
+            future = asyncio.run_coroutine_threadsafe(session.page(job, block_heavy), session.loop)
+            try:
+                return future.result(timeout)
+            except concurrent.futures.TimeoutError:
+                future.cancel()
+                raise TimeoutError(f"browser page timed out after {timeout:.0f}s") from None
+        finally:
+            with self._lock:
+                self._pending -= 1
+                self._last_used = time.monotonic()
+
+    def _check_idle(self, session: _Session) -> None:
+        """Runs on the session's loop: shut it down once no call arrived for idle_seconds."""
+        with self._lock:
+            if self._session is not session:
+                return
+            idle = self._pending == 0 and time.monotonic() - self._last_used >= self.idle_seconds
+            if idle:
+                self._session = None
+        if idle:
+            logger.info("browser idle for %.0fs; shutting down", self.idle_seconds)
+            session.loop.create_task(session.close_and_stop())
+        else:
+            session.loop.call_later(min(IDLE_CHECK_SECONDS, self.idle_seconds), self._check_idle, session)
+
+    def over_memory(self) -> bool:
+        return self.max_rss_mb > 0 and self.rss_mb() > self.max_rss_mb
+
+    def running(self) -> bool:
+        with self._lock:
+            return self._session is not None
+
+    def close(self) -> None:
+        with self._lock:
+            self.closed = True
+            session, self._session = self._session, None
+        if session is not None:
+            session.shutdown()
+
+
+_POOL: Optional[BrowserPool] = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """The process-wide pool; nothing launches until the first page."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = BrowserPool(
+                config.BROWSER_CONTEXTS,
+                config.BROWSER_PAGES_PER_CONTEXT,
+                config.BROWSER_IDLE_SECONDS,
+                config.BROWSER_MAX_RSS_MB,
+            )
+            atexit.register(_POOL.close)
+        return _POOL
@@ -17,7 +17,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 from seven import config, __version__
-from seven.agent.loop import Seven
+from seven.agent.loop import TICK_SECONDS, Seven
 from seven.runtime.process import terminate_process_tree
 import psutil
 
@@ -183,9 +183,10 @@ def run_daemon(enable_api: bool = False, tick_seconds: float | None = None):
             now = time.time()
             if now - last_sense >= sense_every:
                 try:
-                    agent.refresh_living_state()
-                    # Light autonomous tick outside heartbeat thread too (belt+suspenders)
-                    # Prefer heartbeat thread; here only re-sense + save
+                    # Probes come from the background sensor hub; this only folds
+                    # the cached readings into living state and saves on change.
+                    with TICK_SECONDS.labels("daemon_sense").time():
+                        agent.refresh_living_state(max_age=sense_every / 2)
                     last_sense = now
                 except Exception:
                     logger.exception("daemon sense failed")
@@ -254,6 +255,7 @@ def daemon_status() -> str:
             lines.append(f"mode={st.get('mode')} energy={st.get('energy')} ticks={data.get('tick_count')}")
             lines.append(f"intent={self_st.get('intent')}")
             lines.append(f"last_action={data.get('last_action')}")
+            lines.append(f"snapshot_seq={data.get('seq')} journal={state_path.with_name('living_journal.jsonl')}")
         except Exception as e:
             lines.append(f"state_read_error={e}")
     return "\n".join(lines)
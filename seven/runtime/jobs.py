@@ -0,0 +1,208 @@
+"""
+Background jobs: any registered tool run on a worker thread while the caller
+gets a job id back at once.
+
+Job records live in the memory database, so their status outlives the process
+that ran them. Lines from streamed subprocesses (run_tracked stream=True) and
+progress reports go to DATA_DIR/jobs/<id>.log, the full result to <id>.result.
+At most SEVEN_JOB_WORKERS jobs run at once; later ones wait queued. Every
+finished job is passed to the manager's listeners, and Seven announces it
+once, the way it delivers due reminders.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import psutil
+
+from seven import config
+from seven.memory.store import JOB_FINAL_STATUSES, Memory
+from seven.runtime.process import cancel_scope, output_scope
+from seven.runtime.progress import progress_scope
+
+logger = logging.getLogger("seven.jobs")
+
+# Tools that manage jobs never run as one.
+JOB_TOOLS = frozenset({"start_job", "job_status", "job_output", "job_cancel", "list_jobs"})
+
+JobListener = Callable[[Dict[str, Any]], None]
+
+
+class JobManager:
+    def __init__(self, registry, memory: Memory, workers: Optional[int] = None, directory: Optional[Path] = None):
+        self.registry = registry
+        self.memory = memory
+        self.directory = Path(directory or Path(config.DATA_DIR) / "jobs")
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.workers = max(1, config.JOB_WORKERS if workers is None else workers)
+        self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="seven-job")
+        self._running: Dict[int, tuple[threading.Event, Future]] = {}
+        self._lock = threading.Lock()
+        # name -> listener(job); keyed so re-binding a module replaces its listener.
+        self.listeners: Dict[str, JobListener] = {}
+        self.interrupt_orphans()
+
+    def log_path(self, job_id: int) -> Path:
+        return self.directory / f"{int(job_id)}.log"
+
+    def result_path(self, job_id: int) -> Path:
+        return self.directory / f"{int(job_id)}.result"
+
+    def interrupt_orphans(self) -> int:
+        """Mark jobs whose owning process is gone as interrupted."""
+        count = 0
+        for job in self.memory.list_jobs(status="active", limit=1000):
+            pid = job.get("pid")
+            if pid == os.getpid() and int(job["id"]) in self._running:
+                continue
+            if pid != os.getpid() and pid and psutil.pid_exists(int(pid)):
+                continue
+            if self.memory.finish_job(int(job["id"]), "interrupted", "owning process exited before the job finished"):
+                count += 1
+        return count
+
+    def start(self, tool: str, arguments: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        if tool in JOB_TOOLS:
+            raise ValueError(f"{tool} cannot run as a background job")
+        if tool not in self.registry.all_names():
+            raise ValueError(f"unknown tool '{tool}'")
+        arguments = arguments if isinstance(arguments, dict) else {}
+        job_id = self.memory.add_job(tool, arguments, os.getpid())
+        cancel = threading.Event()
+        with self._lock:
+            future = self._executor.submit(self._run, job_id, tool, arguments, cancel)
+            self._running[job_id] = (cancel, future)
+        return self.memory.get_job(job_id)
+
+    def _run(self, job_id: int, tool: str, arguments: Dict[str, Any], cancel: threading.Event) -> None:
+        try:
+            if cancel.is_set():
+                self._finish(job_id, "cancelled", "cancelled before it started")
+                return
+            if not self.memory.start_job(job_id):
+                return
+            log_lock = threading.Lock()
+            with open(self.log_path(job_id), "a", encoding="utf-8", errors="replace") as log:
+
+                def write(line: str) -> None:
+                    with log_lock:
+                        log.write(line + "\n")
+                        log.flush()
+
+                def on_line(stream: str, line: str) -> None:
+                    write(f"[{stream}] {line}")
+
+                def on_progress(update: Dict[str, Any]) -> None:
+                    self.memory.set_job_progress(job_id, update)
+                    write(f"[progress] {json.dumps(update)}")
+
+                with ExitStack() as stack:
+                    stack.enter_context(cancel_scope(cancel))
+                    stack.enter_context(progress_scope(on_progress))
+                    stack.enter_context(output_scope(on_line))
+                    result = self.registry.execute(tool, arguments)
+            self.result_path(job_id).write_text(result, encoding="utf-8")
+            if cancel.is_set():
+                status = "cancelled"
+            else:
+                status = "failed" if result.startswith("ERROR") else "succeeded"
+            self._finish(job_id, status, result)
+        except Exception as exc:
+            logger.exception("job %s failed", job_id)
+            self._finish(job_id, "failed", f"ERROR: job crashed: {exc}")
+        finally:
+            with self._lock:
+                self._running.pop(job_id, None)
+
+    def _finish(self, job_id: int, status: str, result: str) -> None:
+        if not self.memory.finish_job(job_id, status, result):
+            return
+        job = self.memory.get_job(job_id)
+        for name, listener in list(self.listeners.items()):
+            try:
+                listener(job)
+            except Exception:
+                logger.exception("job listener %s failed", name)
+
+    def status(self, job_id: int) -> Optional[Dict[str, Any]]:
+        return self.memory.get_job(job_id)
+
+    def output(self, job_id: int, max_chars: int = 4000) -> Optional[Dict[str, Any]]:
+        """The last max_chars of the job log, and of its result once finished."""
+        job = self.memory.get_job(job_id)
+        if job is None:
+            return None
+        job["log"] = _tail(self.log_path(job_id), max_chars)
+        if job["status"] in JOB_FINAL_STATUSES:
+            job["result"] = _tail(self.result_path(job_id), max_chars) or job.get("result_preview") or ""
+        return job
+
+    def cancel(self, job_id: int) -> Dict[str, Any]:
+        job = self.memory.get_job(job_id)
+        if job is None:
+            raise KeyError(job_id)
+        if job["status"] in JOB_FINAL_STATUSES:
+            return job
+        with self._lock:
+            running = self._running.get(int(job_id))
+        if running is not None:
+            cancel, future = running
+            cancel.set()
+            if future.cancel():
+                # Still queued: it will never start, so record the end here.
+                with self._lock:
+                    self._running.pop(int(job_id), None)
+                self._finish(int(job_id), "cancelled", "cancelled before it started")
+            return self.memory.get_job(job_id)
+        pid = job.get("pid")
+        if pid and pid != os.getpid() and psutil.pid_exists(int(pid)):
+            raise PermissionError(f"job #{job_id} belongs to process {pid}; cancel it there")
+        self.memory.finish_job(int(job_id), "interrupted", "owning process exited before the job finished")
+        return self.memory.get_job(job_id)
+
+    def close(self) -> None:
+        with self._lock:
+            running = dict(self._running)
+        for job_id, (cancel, future) in running.items():
+            cancel.set()
+            if future.cancel():
+                self._finish(job_id, "cancelled", "cancelled before it started")
+        self._executor.shutdown(wait=False)
+
+
+def _tail(path: Path, max_chars: int) -> str:
+    try:
+        with open(path, "rb") as stream:
+            size = os.fstat(stream.fileno()).st_size
+            # UTF-8 is at most 4 bytes a character; decode a little more than needed.
+            stream.seek(max(0, size - max(0, max_chars) * 4))
+            text = stream.read().decode("utf-8", errors="replace")
+    except OSError:
+        return ""
+    return text[-max_chars:] if max_chars > 0 else ""
+
+
+def elapsed_seconds(job: Dict[str, Any]) -> Optional[float]:
+    """Run time so far, or in total once finished."""
+    if not job.get("started_at"):
+        return None
+    started = datetime.fromisoformat(job["started_at"])
+    ended = datetime.fromisoformat(job["finished_at"]) if job.get("finished_at") else datetime.now(timezone.utc)
+    return round((ended - started).total_seconds(), 1)
+
+
+def get_manager(registry, memory: Memory) -> JobManager:
+    """The registry's job manager, created on first use."""
+    with registry._load_lock:
+        manager = getattr(registry, "jobs", None)
+        if manager is None:
+            manager = registry.jobs = JobManager(registry, memory)
+        return manager
@@ -1,13 +1,29 @@
 """Subprocess execution that owns and cleans up the complete process tree."""
 from __future__ import annotations
 
+import logging
 import os
 import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Mapping, Sequence
+from typing import Callable, Iterator, Mapping, Optional, Sequence
 
 import psutil
 
+from seven import config
+from seven.runtime.progress import report_progress, reporting
+
+logger = logging.getLogger("seven.process")
+
+# on_line(stream_name, line) for run_tracked(stream=True); called on reader threads.
+LineCallback = Callable[[str, str], None]
+PIPE_CHUNK_BYTES = 64 * 1024
+# A "line" with no newline is delivered in pieces of at most this size.
+MAX_LINE_BYTES = 64 * 1024
+
 
 @dataclass
 class ProcessResult:
@@ -17,6 +33,59 @@ class ProcessResult:
     stderr: str
     timed_out: bool = False
     terminated_pids: tuple[int, ...] = ()
+    cancelled: bool = False
+    # Filled in streaming mode: bytes the process wrote, and whether any were dropped.
+    stdout_bytes: int | None = None
+    stderr_bytes: int | None = None
+    truncated: bool = False
+
+
+# Set by cancel_scope(); run_tracked polls it and tears down the process tree.
+_CANCEL: ContextVar[Optional[threading.Event]] = ContextVar("seven_process_cancel", default=None)
+CANCEL_POLL_SECONDS = 0.1
+
+
+@contextmanager
+def cancel_scope(event: threading.Event) -> Iterator[threading.Event]:
+    """run_tracked calls made inside stop their whole process tree once event is set."""
+    token = _CANCEL.set(event)
+    try:
+        yield event
+    finally:
+        _CANCEL.reset(token)
+
+
+# Set by output_scope(); streamed run_tracked calls also hand every line to it.
+_OUTPUT: ContextVar[Optional[LineCallback]] = ContextVar("seven_process_output", default=None)
+
+
+@contextmanager
+def output_scope(on_line: LineCallback) -> Iterator[None]:
+    """Tee the lines of streamed run_tracked calls made inside to on_line(stream_name, line)."""
+    token = _OUTPUT.set(on_line)
+    try:
+        yield
+    finally:
+        _OUTPUT.reset(token)
+
+
+def current_cancel() -> Optional[threading.Event]:
+    """The cancel event of the enclosing cancel_scope, for runners other than run_tracked."""
+    return _CANCEL.get()
+
+
+def read_bounded(path: str, name: str, head_bytes: int, tail_bytes: int, encoding: str = "utf-8") -> tuple[str, int, bool]:
+    """Read an output file with the same head/tail caps as streamed pipes: (text, bytes, truncated)."""
+    capture = _Capture(name, head_bytes, tail_bytes, None, encoding)
+    with open(path, "rb") as stream:
+        capture.feed(stream.read(capture.head_cap))
+        size = os.fstat(stream.fileno()).st_size
+        start = max(capture.total, size - capture.tail_cap)
+        # The middle is never read, only counted.
+        capture.total += start - capture.total
+        stream.seek(start)
+        capture.feed(stream.read(size - start))
+    return capture.text(), capture.total, capture.omitted > 0
 
 
 def terminate_process_tree(pid: int, grace_seconds: float = 2.0) -> tuple[int, ...]:
@@ -52,13 +121,31 @@ def run_tracked(
     timeout: float = 60,
     shell: bool = False,
     encoding: str = "utf-8",
+    stream: bool = False,
+    head_bytes: int | None = None,
+    tail_bytes: int | None = None,
+    on_line: LineCallback | None = None,
 ) -> ProcessResult:
+    """
+    Run args to completion, timeout or cancellation, then kill its whole tree.
+
+    By default output is collected whole by communicate(). stream=True reads
+    each pipe on a reader thread instead, keeping only the first head_bytes
+    and last tail_bytes of it (PROCESS_OUTPUT_HEAD/TAIL_BYTES by default) and
+    passing every line to on_line(stream_name, line) and to the enclosing
+    output_scope as it arrives.
+    """
+    cancel = _CANCEL.get()
+    if cancel is not None and cancel.is_set():
+        return ProcessResult(args, None, "", "", cancelled=True)
     creationflags = 0
     start_new_session = False
     if os.name == "nt":
         creationflags = getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0)
     else:
         start_new_session = True
+    # Streaming decodes per buffer itself, so its pipes stay binary.
+    text = {} if stream else {"text": True, "encoding": encoding, "errors": "replace"}
     process = subprocess.Popen(
         args,
         shell=shell,
@@ -66,23 +153,216 @@ def run_tracked(
         env=dict(env) if env is not None else None,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
-        encoding=encoding,
-        errors="replace",
         creationflags=creationflags,
         start_new_session=start_new_session,
+        **text,
     )
-    try:
-        stdout, stderr = process.communicate(timeout=timeout)
-        return ProcessResult(args, process.returncode, stdout or "", stderr or "")
-    except subprocess.TimeoutExpired:
-        terminated = terminate_process_tree(process.pid)
+    if stream:
+        watcher = _OUTPUT.get()
+        if watcher is not None:
+            on_line = watcher if on_line is None else _tee(on_line, watcher)
+        output: _Communicated | _Streamed = _Streamed(
+            process,
+            config.PROCESS_OUTPUT_HEAD_BYTES if head_bytes is None else head_bytes,
+            config.PROCESS_OUTPUT_TAIL_BYTES if tail_bytes is None else tail_bytes,
+            on_line, encoding,
+        )
+    else:
+        output = _Communicated(process)
+    started = time.monotonic()
+    deadline = started + timeout
+    # Poll only when someone can cancel or is watching progress.
+    poll = cancel is not None or reporting()
+    label, reported = _label(args), 0
+    while True:
+        remaining = max(0.0, deadline - time.monotonic())
+        if output.wait(min(CANCEL_POLL_SECONDS, remaining) if poll else remaining):
+            return output.result(args)
+        if cancel is not None and cancel.is_set():
+            return _stop(output, args, cancelled=True)
+        if time.monotonic() >= deadline:
+            return _stop(output, args, timed_out=True)
+        elapsed = int(time.monotonic() - started)
+        if elapsed > reported:
+            reported = elapsed
+            lines = output.lines()
+            message = f"{label} running {elapsed}s" + (f", {lines} lines of output" if lines is not None else "")
+            report_progress(elapsed, message=message, unit="seconds")
+
+
+def _tee(first: LineCallback, second: LineCallback) -> LineCallback:
+    def both(name: str, line: str) -> None:
+        first(name, line)
+        second(name, line)
+    return both
+
+
+def _label(args: str | Sequence[str]) -> str:
+    first = (args.split() or [""])[0] if isinstance(args, str) else (str(args[0]) if args else "")
+    return os.path.basename(first) or "process"
+
+
+def _stop(output: "_Communicated | _Streamed", args: str | Sequence[str], **reason: bool) -> ProcessResult:
+    terminated = terminate_process_tree(output.process.pid)
+    output.finish()
+    return output.result(args, terminated_pids=terminated, **reason)
+
+
+class _Communicated:
+    """Whole-output collection through communicate()."""
+
+    def __init__(self, process: subprocess.Popen):
+        self.process = process
+        self.out: tuple[str | None, str | None] = ("", "")
+
+    def wait(self, timeout: float) -> bool:
         try:
-            stdout, stderr = process.communicate(timeout=5)
+            # communicate() may be retried after TimeoutExpired without losing output.
+            self.out = self.process.communicate(timeout=timeout)
+            return True
         except subprocess.TimeoutExpired:
-            process.kill()
-            stdout, stderr = process.communicate()
+            return False
+
+    def finish(self) -> None:
+        try:
+            self.out = self.process.communicate(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.out = self.process.communicate()
+
+    def lines(self) -> int | None:
+        return None
+
+    def result(self, args: str | Sequence[str], **extra) -> ProcessResult:
+        stdout, stderr = self.out
+        return ProcessResult(args, self.process.returncode, stdout or "", stderr or "", **extra)
+
+
+class _Capture:
+    """First head and last tail bytes of one pipe, plus running byte and line counts."""
+
+    def __init__(self, name: str, head: int, tail: int, on_line: LineCallback | None, encoding: str):
+        self.name = name
+        self.head_cap, self.tail_cap = max(0, head), max(0, tail)
+        self.head, self.tail, self.partial = bytearray(), bytearray(), bytearray()
+        self.total = 0
+        self.newlines = 0
+        self.on_line = on_line
+        self.encoding = encoding
+
+    def feed(self, chunk: bytes) -> None:
+        self.total += len(chunk)
+        self.newlines += chunk.count(b"\n")
+        if self.on_line is not None:
+            self._split(chunk)
+        room = self.head_cap - len(self.head)
+        if room > 0:
+            self.head += chunk[:room]
+            chunk = chunk[room:]
+        if chunk and self.tail_cap:
+            self.tail += chunk
+            if len(self.tail) > self.tail_cap:
+                # bytearray drops a prefix in place, so this stays a ring buffer in cost.
+                del self.tail[: len(self.tail) - self.tail_cap]
+
+    def _split(self, chunk: bytes) -> None:
+        self.partial += chunk
+        *lines, rest = self.partial.split(b"\n")
+        if len(rest) > MAX_LINE_BYTES:
+            lines.append(rest)
+            rest = b""
+        self.partial = bytearray(rest)
+        for line in lines:
+            self._emit(line)
+
+    def _emit(self, line: bytes) -> None:
+        try:
+            self.on_line(self.name, line.decode(self.encoding, errors="replace").rstrip("\r"))
+        except Exception:
+            # A broken callback must not stop the pipe being drained.
+            logger.debug("run_tracked line callback failed; disabled", exc_info=True)
+            self.on_line = None
+
+    def close(self) -> None:
+        if self.on_line is not None and self.partial:
+            self._emit(bytes(self.partial))
+        self.partial.clear()
+
+    @property
+    def omitted(self) -> int:
+        return self.total - len(self.head) - len(self.tail)
+
+    def text(self) -> str:
+        if self.omitted <= 0:
+            return self._decode(bytes(self.head + self.tail))
+        marker = f"\n... [{self.omitted} bytes of {self.name} omitted] ...\n"
+        return self._decode(bytes(self.head)) + marker + self._decode(bytes(self.tail))
+
+    def _decode(self, data: bytes) -> str:
+        # Same newline translation text-mode pipes apply.
+        return data.decode(self.encoding, errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+
+
+class _Streamed:
+    """Both pipes drained incrementally on reader threads into bounded captures."""
+
+    def __init__(self, process: subprocess.Popen, head: int, tail: int, on_line: LineCallback | None, encoding: str):
+        self.process = process
+        self.captures = (
+            _Capture("stdout", head, tail, on_line, encoding),
+            _Capture("stderr", head, tail, on_line, encoding),
+        )
+        self.readers = [
+            threading.Thread(target=_pump, args=(pipe, capture), name=f"seven-{capture.name}-{process.pid}", daemon=True)
+            for pipe, capture in zip((process.stdout, process.stderr), self.captures)
+        ]
+        for reader in self.readers:
+            reader.start()
+
+    def wait(self, timeout: float) -> bool:
+        """True once both pipes hit EOF and the process exited, like communicate()."""
+        end = time.monotonic() + timeout
+        for reader in self.readers:
+            reader.join(max(0.0, end - time.monotonic()))
+        if any(reader.is_alive() for reader in self.readers):
+            return False
+        try:
+            self.process.wait(max(0.0, end - time.monotonic()))
+            return True
+        except subprocess.TimeoutExpired:
+            return False
+
+    def finish(self) -> None:
+        if not self.wait(5):
+            self.process.kill()
+            # A pipe still held by an escaped process must not hang us; keep what arrived.
+            self.wait(1)
+            self.process.wait()
+
+    def lines(self) -> int | None:
+        return sum(capture.newlines for capture in self.captures)
+
+    def result(self, args: str | Sequence[str], **extra) -> ProcessResult:
+        out, err = self.captures
         return ProcessResult(
-            args, process.returncode, stdout or "", stderr or "",
-            timed_out=True, terminated_pids=terminated,
+            args, self.process.returncode, out.text(), err.text(),
+            stdout_bytes=out.total, stderr_bytes=err.total,
+            truncated=out.omitted > 0 or err.omitted > 0, **extra,
         )
+
+
+def _pump(pipe, capture: _Capture) -> None:
+    try:
+        while True:
+            chunk = pipe.read1(PIPE_CHUNK_BYTES)
+            if not chunk:
+                break
+            capture.feed(chunk)
+    except (OSError, ValueError):
+        pass
+    finally:
+        capture.close()
+        try:
+            pipe.close()
+        except OSError:
+            pass
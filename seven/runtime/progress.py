@@ -0,0 +1,82 @@
+"""Progress reports from long-running tools to whoever is waiting on them.
+
+A front end opens progress_scope(sink) around a tool call; code running inside
+it calls report_progress() with whatever unit it counts (bytes pulled, pages
+parsed, seconds running). Reports outside a scope cost one ContextVar lookup.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from seven import config
+
+logger = logging.getLogger("seven.progress")
+
+# sink(update) receives {"progress", "total"?, "message"?, "unit"?}.
+ProgressSink = Callable[[Dict[str, Any]], None]
+
+
+class _Scope:
+    def __init__(self, sink: ProgressSink, interval: float):
+        self.sink = sink
+        self.interval = interval
+        self.last = float("-inf")
+        self.lock = threading.Lock()
+
+    def send(self, update: Dict[str, Any], final: bool) -> None:
+        now = time.monotonic()
+        with self.lock:
+            if not final and now - self.last < self.interval:
+                return
+            self.last = now
+        try:
+            self.sink(update)
+        except Exception:
+            # A slow or broken observer must never fail the tool it watches.
+            logger.debug("progress sink failed", exc_info=True)
+
+
+_SCOPE: ContextVar[Optional[_Scope]] = ContextVar("seven_progress", default=None)
+
+
+@contextmanager
+def progress_scope(sink: Optional[ProgressSink], interval: Optional[float] = None) -> Iterator[None]:
+    """Route report_progress() calls made inside to sink, at most one per interval
+    seconds except the final report. sink=None silences reports."""
+    scope = None if sink is None else _Scope(
+        sink, config.PROGRESS_INTERVAL_SECONDS if interval is None else max(0.0, interval)
+    )
+    token = _SCOPE.set(scope)
+    try:
+        yield
+    finally:
+        _SCOPE.reset(token)
+
+
+def reporting() -> bool:
+    return _SCOPE.get() is not None
+
+
+def report_progress(
+    progress: float,
+    total: Optional[float] = None,
+    message: str = "",
+    unit: str = "",
+) -> None:
+    """Report monotonically increasing progress; total when it is known."""
+    scope = _SCOPE.get()
+    if scope is None:
+        return
+    update: Dict[str, Any] = {"progress": progress}
+    if total is not None:
+        update["total"] = total
+    if message:
+        update["message"] = message
+    if unit:
+        update["unit"] = unit
+    scope.send(update, final=total is not None and progress >= total)
@@ -0,0 +1,286 @@
+"""
+Warm Python interpreters for run_python.
+
+Each worker (python_worker.py) preloads SEVEN_PYTHON_PRELOAD once and then
+runs scripts in a fresh namespace, forked from itself where the OS has fork.
+Workers are recycled after SEVEN_PYTHON_WORKER_MAX_RUNS runs or when their
+RSS passes SEVEN_PYTHON_WORKER_MAX_RSS_MB, and replaced in the background.
+When every worker is busy or still warming up, run() returns None and the
+caller falls back to a fresh interpreter, so a call never queues behind another.
+"""
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import queue
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import psutil
+
+from seven import config
+from seven.runtime.process import (
+    CANCEL_POLL_SECONDS,
+    ProcessResult,
+    current_cancel,
+    read_bounded,
+    terminate_process_tree,
+)
+from seven.runtime.progress import report_progress, reporting
+
+logger = logging.getLogger("seven.python_pool")
+
+WORKER_SCRIPT = Path(__file__).with_name("python_worker.py")
+READY_TIMEOUT = 120.0
+HANDSHAKE_TIMEOUT = 10.0
+
+
+class WorkerError(RuntimeError):
+    """The worker broke before the job started; it is discarded and the caller falls back."""
+
+
+class PythonWorker:
+    def __init__(self, preload: Sequence[str], cwd: str):
+        creationflags = getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0) if os.name == "nt" else 0
+        self.process = subprocess.Popen(
+            [sys.executable, str(WORKER_SCRIPT), "--preload", ",".join(preload)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            cwd=cwd,
+            creationflags=creationflags,
+            start_new_session=os.name != "nt",
+        )
+        self.messages: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        threading.Thread(target=self._read, name=f"seven-python-worker-{self.process.pid}", daemon=True).start()
+        self.runs = 0
+        try:
+            hello = self.messages.get(timeout=READY_TIMEOUT)
+        except queue.Empty:
+            hello = None
+        if not hello or "ready" not in hello:
+            self.close()
+            raise WorkerError("python worker failed to start")
+        self.preloaded: List[str] = hello["preloaded"]
+        self.forking: bool = hello["fork"]
+        if hello["failed"]:
+            logger.info("python worker could not preload: %s", ", ".join(hello["failed"]))
+
+    def _read(self) -> None:
+        try:
+            for line in self.process.stdout:
+                try:
+                    self.messages.put(json.loads(line))
+                except ValueError:
+                    continue
+        except (OSError, ValueError):
+            pass
+        finally:
+            self.messages.put(None)
+
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def rss_mb(self) -> float:
+        try:
+            return psutil.Process(self.process.pid).memory_info().rss / (1024 * 1024)
+        except psutil.Error:
+            return float("inf")
+
+    def close(self) -> None:
+        if self.alive():
+            terminate_process_tree(self.process.pid, grace_seconds=1.0)
+        for pipe in (self.process.stdin, self.process.stdout):
+            try:
+                pipe.close()
+            except (OSError, ValueError):
+                pass
+
+    def run(self, script: str, cwd: str, timeout: float) -> ProcessResult:
+        """Run script with run_tracked's timeout, cancel and progress semantics."""
+        self.runs += 1
+        paths = []
+        for suffix in (".out", ".err"):
+            handle, path = tempfile.mkstemp(prefix="seven-python-", suffix=suffix)
+            os.close(handle)
+            paths.append(path)
+        try:
+            job = {"script": script, "cwd": cwd, "out": paths[0], "err": paths[1]}
+            try:
+                self.process.stdin.write(json.dumps(job) + "\n")
+                self.process.stdin.flush()
+                started = self.messages.get(timeout=HANDSHAKE_TIMEOUT)
+            except (OSError, ValueError, queue.Empty) as exc:
+                raise WorkerError(f"python worker did not take the job: {exc}") from exc
+            if not started or "started" not in started:
+                raise WorkerError("python worker exited before the job started")
+            returncode, reason, terminated = self._wait(started["started"], timeout)
+            stdout, stdout_bytes, cut_out = read_bounded(
+                paths[0], "stdout", config.PROCESS_OUTPUT_HEAD_BYTES, config.PROCESS_OUTPUT_TAIL_BYTES
+            )
+            stderr, stderr_bytes, cut_err = read_bounded(
+                paths[1], "stderr", config.PROCESS_OUTPUT_HEAD_BYTES, config.PROCESS_OUTPUT_TAIL_BYTES
+            )
+            return ProcessResult(
+                [sys.executable, script], returncode, stdout, stderr,
+                terminated_pids=terminated, stdout_bytes=stdout_bytes, stderr_bytes=stderr_bytes,
+                truncated=cut_out or cut_err, **reason,
+            )
+        finally:
+            for path in paths:
+                Path(path).unlink(missing_ok=True)
+
+    def _wait(self, child: int, timeout: float) -> tuple[Optional[int], Dict[str, bool], tuple[int, ...]]:
+        cancel = current_cancel()
+        poll = cancel is not None or reporting()
+        started = time.monotonic()
+        deadline = started + timeout
+        reported = 0
+        while True:
+            remaining = max(0.0, deadline - time.monotonic())
+            try:
+                message = self.messages.get(timeout=min(CANCEL_POLL_SECONDS, remaining) if poll else remaining)
+            except queue.Empty:
+                if cancel is not None and cancel.is_set():
+                    reason = {"cancelled": True}
+                elif time.monotonic() >= deadline:
+                    reason = {"timed_out": True}
+                else:
+                    elapsed = int(time.monotonic() - started)
+                    if elapsed > reported:
+                        reported = elapsed
+                        report_progress(elapsed, message=f"python running {elapsed}s", unit="seconds")
+                    continue
+                # The child on a forking worker; the worker itself when it runs jobs in process.
+                terminated = terminate_process_tree(child)
+                try:
+                    message = self.messages.get(timeout=5.0)
+                except queue.Empty:
+                    self.close()
+                    return None, reason, terminated
+                return self._exit_code(message), reason, terminated
+            return self._exit_code(message), {}, ()
+
+    def _exit_code(self, message: Optional[Dict[str, Any]]) -> Optional[int]:
+        if message is not None:
+            return message.get("exit")
+        # The worker itself ended: os._exit in process, or killed along with its job.
+        try:
+            return self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.close()
+            return None
+
+
+class PythonPool:
+    def __init__(self, size: int, preload: Sequence[str], max_runs: int, max_rss_mb: float, cwd: str):
+        self.size = max(1, size)
+        self.preload = list(preload)
+        self.max_runs = max(1, max_runs)
+        self.max_rss_mb = max_rss_mb
+        self.cwd = cwd
+        self.idle: List[PythonWorker] = []
+        self.workers = 0  # idle + busy + warming
+        self.closed = False
+        self._lock = threading.Lock()
+
+    def warm(self) -> None:
+        with self._lock:
+            self._fill()
+
+    def _fill(self) -> None:
+        while not self.closed and self.workers < self.size:
+            self.workers += 1
+            threading.Thread(target=self._spawn, name="seven-python-warmup", daemon=True).start()
+
+    def _spawn(self) -> None:
+        try:
+            worker = PythonWorker(self.preload, self.cwd)
+        except (OSError, WorkerError) as exc:
+            logger.warning("python worker start failed: %s", exc)
+            with self._lock:
+                self.workers -= 1
+            return
+        with self._lock:
+            if not self.closed:
+                self.idle.append(worker)
+                return
+        worker.close()
+
+    def _acquire(self) -> Optional[PythonWorker]:
+        with self._lock:
+            while self.idle:
+                worker = self.idle.pop()
+                if worker.alive():
+                    return worker
+                self.workers -= 1
+            self._fill()
+        return None
+
+    def _release(self, worker: PythonWorker) -> None:
+        retire = (
+            not worker.alive()
+            or worker.runs >= self.max_runs
+            or worker.rss_mb() > self.max_rss_mb
+        )
+        with self._lock:
+            if not retire and not self.closed:
+                self.idle.append(worker)
+                return
+            self.workers -= 1
+            self._fill()
+        worker.close()
+
+    def run(self, script: str, cwd: str, timeout: float) -> Optional[ProcessResult]:
+        """Result from a warm worker, or None when none is ready."""
+        worker = self._acquire()
+        if worker is None:
+            return None
+        try:
+            return worker.run(script, cwd, timeout)
+        except WorkerError as exc:
+            logger.warning("python worker discarded: %s", exc)
+            worker.close()
+            return None
+        finally:
+            self._release(worker)
+
+    def close(self) -> None:
+        with self._lock:
+            self.closed = True
+            idle, self.idle = self.idle, []
+        for worker in idle:
+            worker.close()
+
+
+_POOL: Optional[PythonPool] = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_pool() -> Optional[PythonPool]:
+    """The process-wide pool, started on first use; None when SEVEN_PYTHON_WORKERS=0."""
+    global _POOL
+    if config.PYTHON_WORKERS <= 0:
+        return None
+    with _POOL_LOCK:
+        if _POOL is None:
+            config.WORKSPACE_DIR.mkdir(parents=True, exist_ok=True)
+            _POOL = PythonPool(
+                config.PYTHON_WORKERS,
+                [name.strip() for name in config.PYTHON_PRELOAD.split(",") if name.strip()],
+                config.PYTHON_WORKER_MAX_RUNS,
+                config.PYTHON_WORKER_MAX_RSS_MB,
+                str(config.WORKSPACE_DIR),
+            )
+            _POOL.warm()
+            atexit.register(_POOL.close)
+        return _POOL
@@ -0,0 +1,133 @@
+"""Private warm interpreter for run_python, controlled by JSON lines on stdin/stdout.
+
+Started by file path, not ``-m``, so it never imports the seven package. It
+preloads modules once, then runs each job in a fresh ``__main__`` namespace:
+in a forked child where fork exists (the worker stays a clean zygote), in
+process elsewhere. Exits when its controller closes stdin.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import os
+import sys
+import traceback
+
+CONTROL = None  # stream to the controller; fd 1 itself belongs to job output
+
+
+def _send(message: dict) -> None:
+    CONTROL.write(json.dumps(message) + "\n")
+    CONTROL.flush()
+
+
+def _redirect(job: dict) -> None:
+    for fd, path in ((1, job["out"]), (2, job["err"])):
+        target = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.dup2(target, fd)
+        os.close(target)
+    sys.stdout = open(1, "w", encoding="utf-8", errors="replace", closefd=False)
+    sys.stderr = open(2, "w", encoding="utf-8", errors="replace", closefd=False, buffering=1)
+
+
+def _execute(job: dict) -> int:
+    """Run the script like ``python script`` would; returns its exit code."""
+    script = job["script"]
+    os.chdir(job["cwd"])
+    sys.argv = [script]
+    sys.path[0] = os.path.dirname(script)
+    namespace = {"__name__": "__main__", "__file__": script, "__builtins__": __builtins__}
+    code = 0
+    try:
+        with open(script, encoding="utf-8") as source:
+            compiled = compile(source.read(), script, "exec")
+        exec(compiled, namespace)
+    except SystemExit as exc:
+        if exc.code is None:
+            code = 0
+        elif isinstance(exc.code, int):
+            code = exc.code
+        else:
+            print(exc.code, file=sys.stderr)
+            code = 1
+    except BaseException as exc:
+        # Drop this frame so the traceback starts in the user's script.
+        traceback.print_exception(type(exc), exc, exc.__traceback__.tb_next)
+        code = 1
+    finally:
+        for stream in (sys.stdout, sys.stderr):
+            try:
+                stream.flush()
+            except (OSError, ValueError):
+                pass
+    return code
+
+
+def _run_forked(job: dict) -> int:
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            os.setsid()
+            devnull = os.open(os.devnull, os.O_RDONLY)
+            os.dup2(devnull, 0)
+            os.close(devnull)
+            sys.stdin = open(0, closefd=False)
+            _redirect(job)
+            code = _execute(job)
+        finally:
+            os._exit(code & 0xFF)
+    _send({"started": pid})
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status)
+
+
+def _run_inline(job: dict) -> int:
+    _send({"started": os.getpid()})
+    saved = [os.dup(1), os.dup(2)]
+    streams, cwd, argv, path0 = (sys.stdout, sys.stderr), os.getcwd(), sys.argv, sys.path[0]
+    try:
+        _redirect(job)
+        return _execute(job)
+    finally:
+        sys.stdout.close()
+        sys.stderr.close()
+        for fd, copy in zip((1, 2), saved):
+            os.dup2(copy, fd)
+            os.close(copy)
+        sys.stdout, sys.stderr = streams
+        os.chdir(cwd)
+        sys.argv, sys.path[0] = argv, path0
+
+
+def main(argv=None) -> int:
+    global CONTROL
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--preload", default="")
+    args = parser.parse_args(argv)
+    # Started by path, sys.path[0] is seven/runtime; its modules must not shadow user imports.
+    sys.path[0] = os.getcwd()
+    # Keep the control channel on a private fd; preload chatter goes nowhere.
+    CONTROL = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.close(devnull)
+    loaded, failed = [], []
+    for name in filter(None, (part.strip() for part in args.preload.split(","))):
+        try:
+            importlib.import_module(name)
+            loaded.append(name)
+        except Exception:
+            failed.append(name)
+    forking = hasattr(os, "fork")
+    _send({"ready": os.getpid(), "preloaded": loaded, "failed": failed, "fork": forking})
+    for line in sys.stdin:
+        job = json.loads(line)
+        code = _run_forked(job) if forking else _run_inline(job)
+        _send({"exit": code})
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
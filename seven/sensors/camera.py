@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Tuple
 
@@ -11,25 +12,38 @@ logger = logging.getLogger("seven.camera")
 
 
 def list_cameras(max_index: int = 6) -> List[dict]:
-    """Probe camera indices 0..max_index-1."""
+    """Probe camera indices 0..max_index-1 in parallel (a camera session's index is reported, not reopened)."""
     try:
         import cv2
     except ImportError:
         return [{"error": "opencv-python not installed"}]
 
+    from seven.sensors.camera_session import active_session
+
+    session = active_session()
+    indices = [i for i in range(max_index) if session is None or i != session.index]
     found = []
-    for i in range(max_index):
-        cap = cv2.VideoCapture(i, cv2.CAP_DSHOW) if _is_windows() else cv2.VideoCapture(i)
+    if indices:
+        with ThreadPoolExecutor(max_workers=len(indices), thread_name_prefix="seven-camera-probe") as pool:
+            found = [cam for cam in pool.map(lambda i: _probe(cv2, i), indices) if cam is not None]
+    if session is not None:
+        status = session.status()
+        found.append({"index": session.index, "ok": True, "width": status["width"], "height": status["height"], "session": True})
+    return sorted(found, key=lambda cam: cam["index"])
+
+
+def _probe(cv2, i: int) -> Optional[dict]:
+    cap = cv2.VideoCapture(i, cv2.CAP_DSHOW) if _is_windows() else cv2.VideoCapture(i)
+    try:
         if not cap.isOpened():
-            cap.release()
-            continue
+            return None
         ok, frame = cap.read()
         w = h = 0
         if ok and frame is not None:
             h, w = frame.shape[:2]
+        return {"index": i, "ok": bool(ok), "width": w, "height": h}
+    finally:
         cap.release()
-        found.append({"index": i, "ok": bool(ok), "width": w, "height": h})
-    return found
 
 
 def _is_windows() -> bool:
@@ -46,7 +60,8 @@ def capture_frame(
 ) -> Tuple[bool, str]:
     """
     Capture one frame. Returns (ok, message_or_path).
-    Warms up a few frames so exposure settles.
+    Warms up a few frames so exposure settles. While a camera session holds
+    the index (and no size is requested) its latest frame is used instead.
     """
     try:
         import cv2
@@ -58,6 +73,18 @@ def capture_frame(
     out = out.expanduser()
     out.parent.mkdir(parents=True, exist_ok=True)
 
+    from seven.sensors.camera_session import active_session
+
+    session = None if width or height else active_session(idx)
+    if session is not None:
+        latest = session.latest()
+        if latest is not None:
+            frame, age = latest
+            cv2.imwrite(str(out), frame, [int(cv2.IMWRITE_JPEG_QUALITY), 85])
+            h, w = frame.shape[:2]
+            return True, f"OK webcam index={idx} size={w}x{h} path={out.resolve()} (session frame {age * 1000:.0f} ms old)"
+        logger.warning("camera session returned no frame (%s); opening the device", session.error or "timed out")
+
     # CAP_DSHOW avoids long hangs on some Windows webcams
     if _is_windows():
         cap = cv2.VideoCapture(idx, cv2.CAP_DSHOW)
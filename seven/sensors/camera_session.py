@@ -0,0 +1,212 @@
+"""
+Webcam held open between captures, only while the user asks for it.
+
+capture_frame opens the device, reads warm-up frames and releases it on every
+call, which costs from a few hundred milliseconds to seconds per capture
+depending on the driver. The user's /camera on command opens the device once
+and a background thread keeps reading frames into a one-slot buffer that
+holds only the latest frame, so capture_webcam, see_webcam and check_presence
+get a current frame without the open. The session ends on /camera off (or the
+camera_session_stop tool) or after its TTL (SEVEN_CAMERA_SESSION_SECONDS, at
+most SEVEN_CAMERA_SESSION_MAX_SECONDS); the device is then released and
+capture goes back to opening it per call. No tool starts a session, so the
+model, autonomy and the planner cannot turn the camera on, and frames are
+only written to disk when a tool asks for one.
+"""
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from seven import config
+
+logger = logging.getLogger("seven.camera_session")
+
+# Frames read before the first one is served, so exposure settles.
+WARMUP_FRAMES = 5
+# Consecutive failed reads after which the session gives up the device.
+MAX_READ_FAILURES = 50
+READ_RETRY_SECONDS = 0.02
+FIRST_FRAME_TIMEOUT = 5.0
+CLOSE_TIMEOUT = 5.0
+
+# open(index, width, height) -> an opened cv2.VideoCapture-like device (read, release).
+Opener = Callable[[int, Optional[int], Optional[int]], Any]
+
+
+def open_camera(index: int, width: Optional[int] = None, height: Optional[int] = None):
+    """cv2.VideoCapture for index; raises RuntimeError when it cannot be opened."""
+    import cv2
+
+    from seven.sensors.camera import _is_windows
+
+    # CAP_DSHOW avoids long hangs on some Windows webcams
+    cap = cv2.VideoCapture(index, cv2.CAP_DSHOW) if _is_windows() else cv2.VideoCapture(index)
+    if not cap.isOpened():
+        cap.release()
+        raise RuntimeError(f"cannot open camera index {index}. Try list_cameras / SEVEN_CAMERA_INDEX.")
+    if width:
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, int(width))
+    if height:
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, int(height))
+    return cap
+
+
+class CameraSession:
+    """One open camera and the thread reading it; start() once, then latest() until closed."""
+
+    def __init__(
+        self,
+        index: int,
+        ttl: float,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        opener: Opener = open_camera,
+    ):
+        self.index = index
+        self.ttl = ttl
+        self.width = width
+        self.height = height
+        self.opener = opener
+        self.frames = 0
+        self.error = ""
+        self.started_at = 0.0
+        self.deadline = 0.0
+        self._frame = None
+        self._frame_at = 0.0
+        self._cap = None
+        self._ready = threading.Condition()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "CameraSession":
+        """Open the device in the caller's thread (so errors surface) and start grabbing."""
+        self._cap = self.opener(self.index, self.width, self.height)
+        self.started_at = time.monotonic()
+        self.deadline = self.started_at + self.ttl
+        self._thread = threading.Thread(target=self._grab, name=f"seven-camera-{self.index}", daemon=True)
+        self._thread.start()
+        logger.info("camera %s session started for %.0fs", self.index, self.ttl)
+        return self
+
+    def _grab(self) -> None:
+        failures = 0
+        reason = "closed"
+        try:
+            while not self._stop.is_set():
+                if time.monotonic() >= self.deadline:
+                    reason = "expired"
+                    break
+                ok, frame = self._cap.read()
+                if not ok or frame is None:
+                    failures += 1
+                    if failures >= MAX_READ_FAILURES:
+                        self.error = f"camera {self.index} stopped returning frames"
+                        reason = "failed"
+                        break
+                    self._stop.wait(READ_RETRY_SECONDS)
+                    continue
+                failures = 0
+                with self._ready:
+                    self._frame, self._frame_at = frame, time.monotonic()
+                    self.frames += 1
+                    self._ready.notify_all()
+        except Exception as exc:
+            self.error = f"camera {self.index} read failed: {exc}"
+            reason = "failed"
+        finally:
+            self._stop.set()
+            try:
+                self._cap.release()
+            except Exception as exc:
+                logger.debug("camera release failed: %s", exc)
+            with self._ready:
+                self._ready.notify_all()
+            logger.info("camera %s session %s after %d frames", self.index, reason, self.frames)
+
+    def alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive() and not self._stop.is_set()
+
+    def latest(self, timeout: float = FIRST_FRAME_TIMEOUT):
+        """(frame, age seconds) of the newest frame past warm-up, or None if the session ended first."""
+        end = time.monotonic() + timeout
+        with self._ready:
+            while self.frames < WARMUP_FRAMES and not self._stop.is_set():
+                left = end - time.monotonic()
+                if left <= 0:
+                    return None
+                self._ready.wait(left)
+            if self._frame is None or self.frames < WARMUP_FRAMES:
+                return None
+            return self._frame, time.monotonic() - self._frame_at
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(CLOSE_TIMEOUT)
+
+    def status(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._ready:
+            frame = self._frame
+        height, width = frame.shape[:2] if frame is not None else (0, 0)
+        return {
+            "index": self.index,
+            "active": self.alive(),
+            "frames": self.frames,
+            "width": int(width),
+            "height": int(height),
+            "seconds_left": round(max(0.0, self.deadline - now), 1) if self.alive() else 0.0,
+            "error": self.error,
+        }
+
+
+_SESSION: Optional[CameraSession] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def start_session(
+    camera_index: Optional[int] = None,
+    seconds: Optional[float] = None,
+    width: Optional[int] = None,
+    height: Optional[int] = None,
+    opener: Optional[Opener] = None,
+) -> CameraSession:
+    """Start (or restart with a new TTL) the process-wide session; raises when the device fails to open."""
+    global _SESSION
+    idx = config.CAMERA_INDEX if camera_index is None else int(camera_index)
+    ttl = config.CAMERA_SESSION_SECONDS if seconds is None else float(seconds)
+    ttl = min(max(1.0, ttl), config.CAMERA_SESSION_MAX_SECONDS)
+    with _SESSION_LOCK:
+        old, _SESSION = _SESSION, None
+        if old is not None:
+            old.close()  # release the device before it is opened again
+        _SESSION = CameraSession(idx, ttl, width, height, opener or open_camera).start()
+        return _SESSION
+
+
+def stop_session() -> Optional[CameraSession]:
+    """Close the session if there is one; returns it for its final status."""
+    global _SESSION
+    with _SESSION_LOCK:
+        session, _SESSION = _SESSION, None
+    if session is not None:
+        session.close()
+    return session
+
+
+def active_session(camera_index: Optional[int] = None) -> Optional[CameraSession]:
+    """The running session, if any (and if it holds camera_index when one is given)."""
+    with _SESSION_LOCK:
+        session = _SESSION
+    if session is None or not session.alive():
+        return None
+    if camera_index is not None and int(camera_index) != session.index:
+        return None
+    return session
+
+
+atexit.register(stop_session)
@@ -1,31 +1,37 @@
 """
-Browser automation — Playwright if installed, else HTTP fetch.
+Browser automation — a warm Playwright browser (runtime/browser_pool.py) if
+installed, else HTTP fetch.
 L4: no confirmations.
 """
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Optional
 
+from seven import config
+from seven.runtime.browser_pool import get_browser_pool
+
+
+def _url(url: str) -> str:
+    return url if url.startswith(("http://", "https://")) else "https://" + url
+
 
 def browser_get(url: str, max_chars: int = 12000) -> str:
-    """Fetch page text; try playwright, else requests/html strip via web_fetch."""
+    """Fetch page text; try the warm Playwright browser, else requests/html strip via web_fetch."""
     if not url:
         return "ERROR: url required"
-    if not url.startswith(("http://", "https://")):
-        url = "https://" + url
+    url = _url(url)
+
+    async def read(page):
+        await page.goto(url, timeout=30000, wait_until="domcontentloaded")
+        return await page.title(), await page.inner_text("body")
+
     err = ""
     try:
-        from playwright.sync_api import sync_playwright
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(url, timeout=30000, wait_until="domcontentloaded")
-            text = page.inner_text("body")
-            title = page.title()
-            browser.close()
-            if len(text) > max_chars:
-                text = text[:max_chars] + "\n...[truncated]"
-            return f"title={title}\nurl={url}\n\n{text}"
+        title, text = get_browser_pool().run(read, block_heavy=True)
+        if len(text) > max_chars:
+            text = text[:max_chars] + "\n...[truncated]"
+        return f"title={title}\nurl={url}\n\n{text}"
     except ImportError:
         err = "playwright not installed"
     except Exception as e:
@@ -39,21 +45,16 @@ def browser_get(url: str, max_chars: int = 12000) -> str:
 
 
 def browser_screenshot(url: str, path: Optional[str] = None) -> str:
+    out = (Path(path) if path else (config.DATA_DIR / "browser_shot.png")).expanduser()
+    url = _url(url)
+
+    async def shoot(page):
+        await page.goto(url, timeout=30000, wait_until="domcontentloaded")
+        await page.screenshot(path=str(out), full_page=False)
+
     try:
-        from playwright.sync_api import sync_playwright
-        from seven import config
-        from pathlib import Path
-        out = Path(path) if path else (config.DATA_DIR / "browser_shot.png")
-        out = out.expanduser()
         out.parent.mkdir(parents=True, exist_ok=True)
-        if not url.startswith(("http://", "https://")):
-            url = "https://" + url
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page(viewport={"width": 1280, "height": 800})
-            page.goto(url, timeout=30000, wait_until="domcontentloaded")
-            page.screenshot(path=str(out), full_page=False)
-            browser.close()
+        get_browser_pool().run(shoot, block_heavy=False)
         return f"OK browser screenshot {out}"
     except ImportError:
         return "ERROR: playwright not installed. pip install playwright && playwright install chromium"
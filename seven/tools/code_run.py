@@ -1,4 +1,4 @@
-"""Run Python code in a subprocess."""
+"""Run Python code in a subprocess: a warm worker when the pool has one ready, else a fresh interpreter."""
 from __future__ import annotations
 
 import os
@@ -8,6 +8,7 @@ from pathlib import Path
 
 from seven import config
 from seven.runtime.process import run_tracked
+from seven.runtime.python_pool import get_pool
 
 
 def run_python(code: str, timeout: int = 60) -> str:
@@ -19,13 +20,25 @@ def run_python(code: str, timeout: int = 60) -> str:
         f.write(code)
         path = f.name
     try:
-        completed = run_tracked(
-            [sys.executable, path],
-            timeout=timeout,
-            cwd=str(work),
-            env=os.environ.copy(),
-        )
+        pool = get_pool()
+        completed = pool.run(path, str(work), timeout) if pool is not None else None
+        warm = completed is not None
+        if completed is None:
+            completed = run_tracked(
+                [sys.executable, path],
+                timeout=timeout,
+                cwd=str(work),
+                env=os.environ.copy(),
+                stream=True,
+            )
         parts = [f"exit_code={completed.returncode}", f"script={path}"]
+        if warm:
+            parts.append("runner=warm_worker")
+        if completed.truncated:
+            parts.append(
+                f"output_truncated=true stdout_bytes={completed.stdout_bytes} "
+                f"stderr_bytes={completed.stderr_bytes}"
+            )
         if completed.stdout:
             parts.append("STDOUT:\n" + completed.stdout)
         if completed.stderr:
@@ -37,6 +50,8 @@ def run_python(code: str, timeout: int = 60) -> str:
                 f"ERROR: python timed out after {timeout}s; "
                 f"terminated_processes={list(completed.terminated_pids)}"
             )
+        if completed.cancelled:
+            parts.append(f"ERROR: python cancelled; terminated_processes={list(completed.terminated_pids)}")
         return "\n".join(parts)
     except Exception as e:
         return f"ERROR: {e}"
@@ -34,11 +34,15 @@ def _format(result: ProcessResult, command: Sequence[str]) -> str:
         "command": list(command),
         "exit_code": result.returncode,
         "timed_out": result.timed_out,
+        "cancelled": result.cancelled,
         "terminated_processes": list(result.terminated_pids),
-        "stdout": result.stdout[-40000:],
-        "stderr": result.stderr[-10000:],
+        "stdout": result.stdout,
+        "stderr": result.stderr,
+        "output_truncated": result.truncated,
+        "stdout_bytes": result.stdout_bytes,
+        "stderr_bytes": result.stderr_bytes,
     }
-    prefix = "ERROR: " if result.timed_out or result.returncode not in (0, None) else ""
+    prefix = "ERROR: " if result.timed_out or result.cancelled or result.returncode not in (0, None) else ""
     return prefix + json.dumps(payload, ensure_ascii=False, indent=2)
 
 
@@ -53,6 +57,8 @@ def _run(name: str, args: Sequence[str], cwd: Optional[str]) -> str:
         result = run_tracked(
             command, cwd=work, env=os.environ.copy(),
             timeout=config.OPENCODE_TIMEOUT,
+            # Agents narrate as they go; the conclusion sits at the end.
+            stream=True, head_bytes=8_000, tail_bytes=32_000,
         )
         return _format(result, command)
     except Exception as exc:
@@ -126,7 +132,7 @@ def register(reg):
         properties = {"prompt": {"type": "string"}, "cwd": {"type": "string"}, **extra}
         reg.register(Tool(
             name=name,
-            description=description,
+            description=description + " Long tasks can run in the background through start_job.",
             parameters={"type": "object", "properties": properties, "required": ["prompt"]},
             handler=handler,
         ))
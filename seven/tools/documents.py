@@ -1,18 +1,48 @@
-"""Bounded local extraction for text, data, PDF, and Office documents."""
+"""
+Bounded local extraction for text, data, PDF, and Office documents.
+
+PDF pages, PPTX slides, DOCX text and XLSX sheets (in row blocks) are cached
+per unit in memory/document_cache.py, so repeated reads and windows (pages=,
+sheets=, rows=) only extract what has not been read before. Large PDF jobs
+run on a process pool; DOCX and XLSX XML is parsed incrementally, so
+memory follows the requested window rather than the file.
+"""
 from __future__ import annotations
 
 import csv
 import importlib.util
 import io
 import json
+import math
+import multiprocessing
+import re
 import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from xml.etree import ElementTree as ET
 
+from seven import config
+from seven.memory.document_cache import ROW_BLOCK, CachedDocument, DocumentCache, get_document_cache
+from seven.runtime.progress import report_progress
+
 TEXT_EXTENSIONS = {".txt", ".md", ".log", ".xml", ".html", ".htm", ".py", ".cs", ".js", ".ts", ".css", ".yaml", ".yml", ".ini", ".cfg", ".conf", ".bat", ".ps1", ".sh"}
 SUPPORTED = TEXT_EXTENSIONS | {".csv", ".json", ".pdf", ".docx", ".xlsx", ".pptx"}
-MAX_FILE_BYTES = 50 * 1024 * 1024
-MAX_ARCHIVE_UNCOMPRESSED = 200 * 1024 * 1024
+# PDF, PPTX and XLSX are extracted a page, slide or row block at a time, so they may be larger.
+MAX_FILE_BYTES = 200 * 1024 * 1024
+MAX_ARCHIVE_UNCOMPRESSED = 1024 * 1024 * 1024
+# Text, CSV, JSON and DOCX are held whole in memory while they are read.
+LOADED = TEXT_EXTENSIONS | {".csv", ".json", ".docx"}
+MAX_LOADED_FILE_BYTES = 50 * 1024 * 1024
+MAX_LOADED_ARCHIVE_UNCOMPRESSED = 200 * 1024 * 1024
+# Fewer missing pages than this are extracted in-process; a pool costs a few hundred ms to start.
+PDF_PARALLEL_MIN_PAGES = 32
+CACHE_WRITE_BATCH = 50
+XML_CHUNK = 64 * 1024
+PAGED = {".pdf": "pages", ".pptx": "slides"}
+# What a malformed or unreadable document raises while being extracted.
+READ_ERRORS = (OSError, ValueError, KeyError, ET.ParseError, zipfile.BadZipFile, json.JSONDecodeError)
 
 
 def document_status() -> str:
@@ -22,6 +52,11 @@ def document_status() -> str:
         "office_backend": "stdlib OOXML",
         "max_file_bytes": MAX_FILE_BYTES,
         "max_archive_uncompressed_bytes": MAX_ARCHIVE_UNCOMPRESSED,
+        "loaded_whole": sorted(LOADED),
+        "max_loaded_file_bytes": MAX_LOADED_FILE_BYTES,
+        "max_loaded_archive_uncompressed_bytes": MAX_LOADED_ARCHIVE_UNCOMPRESSED,
+        "pdf_workers": config.DOCUMENT_WORKERS,
+        "cache": get_document_cache().stats(),
     }, indent=2)
 
 
@@ -31,122 +66,590 @@ def _bounded(text: str, max_chars: int) -> tuple[str, bool]:
     return text[:max_chars] + "\n...[truncated]", True
 
 
-def _safe_archive(path: Path) -> zipfile.ZipFile:
+def _bounded_join(pieces: Iterable[str], sep: str, max_chars: int) -> Tuple[str, int, bool]:
+    """sep.join(pieces) cut like _bounded, holding at most max_chars of it; (text, total chars, truncated)."""
+    kept, size, total = [], 0, 0
+    for index, piece in enumerate(pieces):
+        if index:
+            piece = sep + piece
+        total += len(piece)
+        if size <= max_chars:
+            kept.append(piece)
+            size += len(piece)
+    text, truncated = _bounded("".join(kept), max_chars)
+    return text, total, truncated
+
+
+def parse_ranges(spec: str, total: int, what: str) -> List[int]:
+    """'1-3,7,10-' -> the sorted 1-based numbers it names, up to total."""
+    numbers = set()
+    for part in spec.replace(" ", "").split(","):
+        if not part:
+            continue
+        match = re.fullmatch(r"(\d+)(?:-(\d*))?", part)
+        if match is None:
+            raise ValueError(f"bad {what} range '{part}' (use e.g. 1-3,7,10-)")
+        first = int(match.group(1))
+        last = first if match.group(2) is None else int(match.group(2) or total)
+        if first < 1 or last < first:
+            raise ValueError(f"bad {what} range '{part}'")
+        numbers.update(range(first, min(last, total) + 1))
+    if not numbers:
+        raise ValueError(f"{what} '{spec}' out of range: the document has {total}")
+    return sorted(numbers)
+
+
+def parse_span(spec: str) -> Tuple[int, Optional[int]]:
+    """'100-200' / '100-' / '100' -> (first, last or None)."""
+    match = re.fullmatch(r"(\d+)(?:-(\d*))?", spec.replace(" ", ""))
+    if match is None or int(match.group(1)) < 1:
+        raise ValueError(f"bad rows range '{spec}' (use e.g. 1-1000 or 5000-)")
+    first = int(match.group(1))
+    last = first if match.group(2) is None else (int(match.group(2)) if match.group(2) else None)
+    if last is not None and last < first:
+        raise ValueError(f"bad rows range '{spec}'")
+    return first, last
+
+
+def _size_limit(ext: str) -> int:
+    return MAX_LOADED_FILE_BYTES if ext in LOADED else MAX_FILE_BYTES
+
+
+def _safe_archive(path: Path, limit: int = MAX_ARCHIVE_UNCOMPRESSED) -> zipfile.ZipFile:
     archive = zipfile.ZipFile(path)
     total = sum(info.file_size for info in archive.infolist())
-    if total > MAX_ARCHIVE_UNCOMPRESSED:
+    if total > limit:
         archive.close()
-        raise ValueError(f"expanded archive exceeds {MAX_ARCHIVE_UNCOMPRESSED} bytes")
+        raise ValueError(f"expanded archive exceeds {limit} bytes")
     if any(info.filename.startswith(("/", "\\")) or ".." in Path(info.filename).parts for info in archive.infolist()):
         archive.close()
         raise ValueError("unsafe path in Office archive")
     return archive
 
 
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _texts(node) -> List[str]:
+    return [(child.text or "") for child in node.iter() if _local(child.tag) == "t"]
+
+
 def _xml_text(blob: bytes) -> str:
     root = ET.fromstring(blob)
-    return " ".join((node.text or "").strip() for node in root.iter() if node.tag.rsplit("}", 1)[-1] == "t" and (node.text or "").strip())
+    return " ".join((node.text or "").strip() for node in root.iter() if _local(node.tag) == "t" and (node.text or "").strip())
 
 
-def _read_docx(path: Path) -> tuple[str, dict]:
-    with _safe_archive(path) as archive:
+def _numbered(names: Iterable[str], prefix: str) -> List[str]:
+    """Members prefix<N>.xml in numeric order (slide2 before slide10)."""
+    found = [name for name in names if name.startswith(prefix) and name.endswith(".xml")]
+    return sorted(found, key=lambda name: (int(re.sub(r"\D", "", name[len(prefix):]) or 0), name))
+
+
+class _Read:
+    """What one read_document call took from the cache and what it extracted."""
+
+    def __init__(self, cache: DocumentCache, entry: CachedDocument):
+        self.cache = cache
+        self.entry = entry
+        self.cached = 0
+        self.extracted = 0
+
+    @property
+    def state(self) -> str:
+        if not self.extracted:
+            return "hit"
+        return "partial" if self.cached else "miss"
+
+
+def _units(read: _Read, numbers: List[int], extract, label: str, name: str) -> Dict[int, str]:
+    """Text of each numbered unit, from the cache or extract(missing) -> (number, text) pairs."""
+    texts = read.cache.texts(read.entry.id, numbers)
+    read.cached += len(texts)
+    missing = [n for n in numbers if n not in texts]
+    batch: List[Tuple[int, int, int, str]] = []
+    done = len(texts)
+    for number, text in extract(missing):
+        texts[number] = text
+        batch.append((number, 0, 0, text))
+        read.extracted += 1
+        done += 1
+        report_progress(done, len(numbers), f"{name}: {label} {done}/{len(numbers)}", unit=label + "s")
+        if len(batch) >= CACHE_WRITE_BATCH:
+            read.cache.put(read.entry.id, batch, complete=True)
+            batch = []
+    read.cache.put(read.entry.id, batch, complete=True)
+    return texts
+
+
+# ── PDF ────────────────────────────────────────────────────────────────
+
+@contextmanager
+def _pdf_errors() -> Iterator[None]:
+    """pypdf's own errors (PdfReadError, PdfStreamError, ...) as ValueError, so READ_ERRORS covers them."""
+    from pypdf.errors import PyPdfError
+
+    try:
+        yield
+    except PyPdfError as exc:
+        raise ValueError(f"malformed PDF: {exc}") from exc
+
+
+def _pdf_pages(path: str, numbers: List[int]) -> List[Tuple[int, str]]:
+    """Text of the given 1-based pages; module level so pool workers can run it."""
+    from pypdf import PdfReader
+
+    with _pdf_errors():
+        reader = PdfReader(path)
+        return [(n, reader.pages[n - 1].extract_text() or "") for n in numbers]
+
+
+def _extract_pdf(path: Path, numbers: List[int]) -> Iterator[Tuple[int, str]]:
+    workers = min(config.DOCUMENT_WORKERS, math.ceil(len(numbers) / 8))
+    if len(numbers) < PDF_PARALLEL_MIN_PAGES or workers <= 1:
+        from pypdf import PdfReader
+
+        with _pdf_errors():
+            reader = PdfReader(str(path))
+            for n in numbers:
+                yield n, reader.pages[n - 1].extract_text() or ""
+        return
+    # Several contiguous chunks per worker: each opens the file once, and results stream back.
+    size = max(8, math.ceil(len(numbers) / (workers * 4)))
+    chunks = [numbers[i:i + size] for i in range(0, len(numbers), size)]
+    # spawn, not fork: the agent process runs many threads.
+    with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        for future in as_completed([pool.submit(_pdf_pages, str(path), chunk) for chunk in chunks]):
+            yield from future.result()
+
+
+def _pdf_total(path: Path, read: _Read) -> int:
+    total = read.entry.units
+    if total is None:
+        from pypdf import PdfReader
+
+        with _pdf_errors():
+            total = len(PdfReader(str(path)).pages)
+        read.cache.describe(read.entry.id, units=total)
+    return total
+
+
+def _read_pdf(path: Path, read: _Read, pages: str, max_chars: int) -> Tuple[str, int, bool, dict]:
+    total = _pdf_total(path, read)
+    wanted = parse_ranges(pages, total, "pages") if pages else list(range(1, total + 1))
+    texts = _units(read, wanted, lambda missing: _extract_pdf(path, missing), "page", path.name)
+    text, chars, truncated = _bounded_join((f"--- Page {n} ---\n{texts[n]}" for n in wanted), "\n\n", max_chars)
+    return text, chars, truncated, {"pages": total}
+
+
+# ── Office ─────────────────────────────────────────────────────────────
+
+def _docx_text(path: Path, read: _Read) -> str:
+    cached = read.cache.texts(read.entry.id, [0])
+    if 0 in cached:
+        read.cached += 1
+        return cached[0]
+    with _safe_archive(path, MAX_LOADED_ARCHIVE_UNCOMPRESSED) as archive:
         if "word/document.xml" not in archive.namelist():
             raise ValueError("invalid DOCX: word/document.xml missing")
-        root = ET.fromstring(archive.read("word/document.xml"))
         blocks = []
-        for node in root.iter():
-            if node.tag.rsplit("}", 1)[-1] == "p":
-                text = " ".join((child.text or "").strip() for child in node.iter() if child.tag.rsplit("}", 1)[-1] == "t" and (child.text or "").strip())
-                if text:
-                    blocks.append(text)
-        return "\n".join(blocks), {"blocks": len(blocks)}
+        with archive.open("word/document.xml") as stream:
+            for _, node in ET.iterparse(stream, events=("end",)):
+                if _local(node.tag) == "p":
+                    paragraph = " ".join(t.strip() for t in _texts(node) if t.strip())
+                    if paragraph:
+                        blocks.append(paragraph)
+                    node.clear()
+    text = "\n".join(blocks)
+    read.cache.describe(read.entry.id, blocks=len(blocks))
+    read.cache.put(read.entry.id, [(0, 0, 0, text)], complete=True)
+    read.entry.meta["blocks"] = len(blocks)
+    read.extracted += 1
+    return text
+
+
+def _read_docx(path: Path, read: _Read, max_chars: int) -> Tuple[str, int, bool, dict]:
+    text = _docx_text(path, read)
+    total = len(text)
+    text, truncated = _bounded(text, max_chars)
+    return text, total, truncated, {"blocks": read.entry.meta.get("blocks", 0)}
+
+
+def _slides(archive: zipfile.ZipFile) -> List[str]:
+    names = _numbered(archive.namelist(), "ppt/slides/slide")
+    if not names:
+        raise ValueError("invalid PPTX: no slides found")
+    return names
+
+
+def _slide_texts(read: _Read, archive: zipfile.ZipFile, names: List[str], wanted: List[int], label: str) -> Dict[int, str]:
+    def extract(missing):
+        for n in missing:
+            yield n, _xml_text(archive.read(names[n - 1]))
 
+    return _units(read, wanted, extract, "slide", label)
 
-def _read_pptx(path: Path) -> tuple[str, dict]:
+
+def _read_pptx(path: Path, read: _Read, slides: str, max_chars: int) -> Tuple[str, int, bool, dict]:
     with _safe_archive(path) as archive:
-        slides = sorted(n for n in archive.namelist() if n.startswith("ppt/slides/slide") and n.endswith(".xml"))
-        if not slides:
-            raise ValueError("invalid PPTX: no slides found")
-        parts = [f"--- Slide {index} ---\n{_xml_text(archive.read(name))}" for index, name in enumerate(slides, 1)]
-        return "\n\n".join(parts), {"slides": len(slides)}
+        names = _slides(archive)
+        wanted = parse_ranges(slides, len(names), "slides") if slides else list(range(1, len(names) + 1))
+        texts = _slide_texts(read, archive, names, wanted, path.name)
+    text, chars, truncated = _bounded_join((f"--- Slide {n} ---\n{texts[n]}" for n in wanted), "\n\n", max_chars)
+    return text, chars, truncated, {"slides": len(names)}
+
+
+def _shared_strings(archive: zipfile.ZipFile) -> List[str]:
+    if "xl/sharedStrings.xml" not in archive.namelist():
+        return []
+    shared = []
+    with archive.open("xl/sharedStrings.xml") as stream:
+        for _, node in ET.iterparse(stream, events=("end",)):
+            if _local(node.tag) == "si":
+                shared.append(" ".join(_texts(node)))
+                node.clear()
+    return shared
+
+
+class _SheetTarget:
+    """Expat target turning worksheet XML into 'a | b | c' rows without building a tree."""
+
+    def __init__(self, shared: List[str]):
+        self.shared = shared
+        self.rows: List[str] = []
+        self.names: Dict[str, str] = {}
+        self.cells: Optional[List[str]] = None
+        self.kind: Optional[str] = None
+        self.value: Optional[str] = None
+        self.inline: Optional[List[str]] = None  # <is> text runs of the current cell
+        self.text: Optional[List[str]] = None  # character data being collected
+
+    def _name(self, tag: str) -> str:
+        name = self.names.get(tag)
+        if name is None:
+            name = self.names[tag] = _local(tag)
+        return name
+
+    def start(self, tag, attrib) -> None:
+        name = self._name(tag)
+        if name == "row":
+            self.cells = []
+        elif name == "c":
+            self.kind, self.value = attrib.get("t"), None
+        elif self.value is None and self.cells is not None:
+            if name == "v" and self.inline is None:
+                self.text = []
+            elif name == "is":
+                self.inline = []
+            elif name == "t" and self.inline is not None:
+                self.text = []
+
+    def data(self, text: str) -> None:
+        if self.text is not None:
+            self.text.append(text)
+
+    def end(self, tag) -> None:
+        name = self._name(tag)
+        if name == "v" and self.text is not None and self.inline is None:
+            self.value, self.text = "".join(self.text), None
+        elif name == "t" and self.text is not None:
+            run = "".join(self.text).strip()
+            if run:
+                self.inline.append(run)
+            self.text = None
+        elif name == "is" and self.inline is not None:
+            self.value, self.inline = " ".join(self.inline), None
+        elif name == "c" and self.cells is not None:
+            raw = self.value or ""
+            if self.kind == "s" and raw.isdigit() and int(raw) < len(self.shared):
+                raw = self.shared[int(raw)]
+            self.cells.append(raw)
+        elif name == "row" and self.cells is not None:
+            self.rows.append(" | ".join(self.cells))
+            self.cells = None
+
+    def close(self) -> None:
+        return None
+
+
+def _sheet_rows(archive: zipfile.ZipFile, name: str, shared: List[str]) -> Iterator[str]:
+    """Each row of a worksheet as 'a | b | c', parsed incrementally."""
+    target = _SheetTarget(shared)
+    parser = ET.XMLParser(target=target)
+    with archive.open(name) as stream:
+        for chunk in iter(lambda: stream.read(XML_CHUNK), b""):
+            parser.feed(chunk)
+            rows, target.rows = target.rows, []
+            yield from rows
+    parser.close()
+    yield from target.rows
+
+
+class _Sheet:
+    def __init__(self, read: _Read, archive: zipfile.ZipFile, number: int, name: str, shared):
+        self.read = read
+        self.archive = archive
+        self.number = number
+        self.name = name
+        self.shared = shared  # callable: the shared strings, loaded on first need
+        self.rows_out = 0
+        self.total_rows: Optional[int] = None
+
+    def lines(self, first: int, last: Optional[int]) -> Iterator[str]:
+        """Rows first..last (1-based positions in the sheet), from cached blocks or a streamed parse."""
+        cache, doc = self.read.cache, self.read.entry.id
+        state = cache.states(doc).get(self.number)
+        if state is not None and state.complete:
+            self.total_rows = state.rows
+        low = (first - 1) // ROW_BLOCK
+        if self.total_rows is not None:
+            high = (min(last or self.total_rows, self.total_rows) - 1) // ROW_BLOCK
+            served = self._from_cache(low, high, first, last)
+        elif last is not None:
+            high = (last - 1) // ROW_BLOCK
+            stored = cache.blocks(doc, self.number, low, high)
+            full = len(stored) == high - low + 1 and all(rows == ROW_BLOCK for rows, _ in stored.values())
+            served = self._from_cache(low, high, first, last) if full else None
+        else:
+            served = None
+        if served is not None:
+            self.read.cached += 1
+            yield from served
+            return
+        self.read.extracted += 1
+        yield from self._stream(first, last)
+
+    def _from_cache(self, low: int, high: int, first: int, last: Optional[int]) -> Iterator[str]:
+        for start in range(low, high + 1, 50):
+            stored = self.read.cache.blocks(self.read.entry.id, self.number, start, min(start + 49, high))
+            for block in sorted(stored):
+                row = block * ROW_BLOCK
+                for line in stored[block][1].split("\n") if stored[block][0] else ():
+                    row += 1
+                    if row >= first and (last is None or row <= last):
+                        self.rows_out += 1
+                        yield line
+
+    def _stream(self, first: int, last: Optional[int]) -> Iterator[str]:
+        cache, doc = self.read.cache, self.read.entry.id
+        buffer: List[str] = []
+        pending: List[Tuple[int, int, int, str]] = []
+        block = row = 0
+        for line in _sheet_rows(self.archive, self.name, self.shared()):
+            row += 1
+            buffer.append(line)
+            if row >= first and (last is None or row <= last):
+                self.rows_out += 1
+                yield line
+            if len(buffer) == ROW_BLOCK:
+                pending.append((self.number, block, ROW_BLOCK, "\n".join(buffer)))
+                buffer, block = [], block + 1
+                if len(pending) >= CACHE_WRITE_BATCH:
+                    cache.put(doc, pending)
+                    pending = []
+                if row % (ROW_BLOCK * 10) == 0:
+                    report_progress(row, None, f"{self.archive.filename}: sheet {self.number} row {row}", unit="rows")
+                # Stop at a block boundary past the window: that block is cached whole.
+                if last is not None and row >= last:
+                    cache.put(doc, pending)
+                    return
+        if buffer:
+            pending.append((self.number, block, len(buffer), "\n".join(buffer)))
+        cache.put(doc, pending)
+        cache.finish(doc, self.number, row)
+        self.total_rows = row
+
+
+def _worksheets(read: _Read, archive: zipfile.ZipFile) -> List[_Sheet]:
+    names = _numbered(archive.namelist(), "xl/worksheets/sheet")
+    if not names:
+        raise ValueError("invalid XLSX: no worksheets found")
+    shared: List[List[str]] = []
+
+    def strings() -> List[str]:
+        if not shared:
+            shared.append(_shared_strings(archive))
+        return shared[0]
+
+    return [_Sheet(read, archive, n, name, strings) for n, name in enumerate(names, 1)]
 
 
-def _read_xlsx(path: Path) -> tuple[str, dict]:
+def _read_xlsx(path: Path, read: _Read, sheets: str, rows: str, max_chars: int) -> Tuple[str, int, bool, dict]:
+    first, last = parse_span(rows) if rows else (1, None)
     with _safe_archive(path) as archive:
-        names = archive.namelist()
-        sheets = sorted(n for n in names if n.startswith("xl/worksheets/sheet") and n.endswith(".xml"))
-        if not sheets:
-            raise ValueError("invalid XLSX: no worksheets found")
-        shared = []
-        if "xl/sharedStrings.xml" in names:
-            root = ET.fromstring(archive.read("xl/sharedStrings.xml"))
-            for item in root:
-                shared.append(" ".join((n.text or "") for n in item.iter() if n.tag.rsplit("}", 1)[-1] == "t"))
-        output, row_count = [], 0
-        for sheet_index, name in enumerate(sheets, 1):
-            output.append(f"--- Sheet {sheet_index} ---")
-            root = ET.fromstring(archive.read(name))
-            for row in (n for n in root.iter() if n.tag.rsplit("}", 1)[-1] == "row"):
-                values = []
-                for cell in (n for n in row if n.tag.rsplit("}", 1)[-1] == "c"):
-                    kind = cell.attrib.get("t")
-                    value_node = next((n for n in cell if n.tag.rsplit("}", 1)[-1] in {"v", "is"}), None)
-                    raw = "" if value_node is None else (value_node.text or _xml_text(ET.tostring(value_node)))
-                    if kind == "s" and raw.isdigit() and int(raw) < len(shared):
-                        raw = shared[int(raw)]
-                    values.append(raw)
-                output.append(" | ".join(values))
-                row_count += 1
-        return "\n".join(output), {"sheets": len(sheets), "rows": row_count}
-
-
-def read_document(path: str, max_chars: int = 50_000) -> str:
+        every = _worksheets(read, archive)
+        wanted = parse_ranges(sheets, len(every), "sheets") if sheets else list(range(1, len(every) + 1))
+        parts = [every[n - 1] for n in wanted]
+
+        def pieces() -> Iterator[str]:
+            for sheet in parts:
+                yield f"--- Sheet {sheet.number} ---"
+                yield from sheet.lines(first, last)
+
+        text, chars, truncated = _bounded_join(pieces(), "\n", max_chars)
+    meta = {
+        "sheets": len(every),
+        "rows": sum(sheet.rows_out for sheet in parts),
+        "sheet_rows": {str(sheet.number): sheet.total_rows for sheet in parts},
+    }
+    return text, chars, truncated, meta
+
+
+def _plain_text(path: Path, ext: str) -> Tuple[str, dict]:
+    if ext in TEXT_EXTENSIONS:
+        return path.read_text(encoding="utf-8", errors="replace"), {}
+    if ext == ".json":
+        return json.dumps(json.loads(path.read_text(encoding="utf-8")), ensure_ascii=False, indent=2), {}
+    table = list(csv.reader(io.StringIO(path.read_text(encoding="utf-8-sig", errors="replace"))))
+    return "\n".join(" | ".join(row) for row in table), {"rows": len(table)}
+
+
+def document_units(path: Path) -> Iterator[Tuple[Optional[int], str]]:
+    """(page, slide or sheet number, whole text) for each part of a document, through the cache.
+
+    Text, CSV, JSON and DOCX files are one part numbered None. Raises one of
+    READ_ERRORS for unsupported, oversized or malformed files.
+    """
+    st = path.stat()
+    ext = path.suffix.lower()
+    if st.st_size > _size_limit(ext):
+        raise ValueError(f"file is {st.st_size} bytes; limit is {_size_limit(ext)}")
+    if ext not in SUPPORTED:
+        raise ValueError(f"unsupported document type '{ext or '(none)'}'")
+    if ext in TEXT_EXTENSIONS | {".json", ".csv"}:
+        yield None, _plain_text(path, ext)[0]
+        return
+    if ext == ".pdf" and importlib.util.find_spec("pypdf") is None:
+        raise ValueError("PDF support requires: pip install 'seven-ai[documents]'")
+    cache = get_document_cache()
+    read = _Read(cache, cache.open(path, st)[0])
+    try:
+        if ext == ".pdf":
+            numbers = list(range(1, _pdf_total(path, read) + 1))
+            texts = _units(read, numbers, lambda missing: _extract_pdf(path, missing), "page", path.name)
+            for n in numbers:
+                yield n, texts[n]
+        elif ext == ".docx":
+            yield None, _docx_text(path, read)
+        else:
+            with _safe_archive(path) as archive:
+                if ext == ".pptx":
+                    names = _slides(archive)
+                    numbers = list(range(1, len(names) + 1))
+                    texts = _slide_texts(read, archive, names, numbers, path.name)
+                    for n in numbers:
+                        yield n, texts[n]
+                else:
+                    for sheet in _worksheets(read, archive):
+                        yield sheet.number, "\n".join(sheet.lines(1, None))
+    finally:
+        if read.extracted:
+            cache.prune()
+
+
+def read_document(path: str, max_chars: int = 50_000, pages: str = "", sheets: str = "", rows: str = "") -> str:
     p = Path(path).expanduser().resolve()
     max_chars = max(100, min(int(max_chars), 200_000))
     if not p.exists() or not p.is_file():
         return f"ERROR: file not found: {p}"
-    size = p.stat().st_size
-    if size > MAX_FILE_BYTES:
-        return f"ERROR: file is {size} bytes; limit is {MAX_FILE_BYTES}"
+    st = p.stat()
+    size = st.st_size
     ext = p.suffix.lower()
+    if size > _size_limit(ext):
+        return f"ERROR: file is {size} bytes; limit is {_size_limit(ext)}"
     if ext not in SUPPORTED:
         return f"ERROR: unsupported document type '{ext or '(none)'}'"
+    pages, sheets, rows = str(pages or "").strip(), str(sheets or "").strip(), str(rows or "").strip()
+    if pages and ext not in PAGED:
+        return "ERROR: pages= applies to PDF pages and PPTX slides"
+    if (sheets or rows) and ext != ".xlsx":
+        return "ERROR: sheets= and rows= apply to XLSX workbooks"
     try:
-        meta = {}
-        if ext in TEXT_EXTENSIONS:
-            text = p.read_text(encoding="utf-8", errors="replace")
-        elif ext == ".json":
-            text = json.dumps(json.loads(p.read_text(encoding="utf-8")), ensure_ascii=False, indent=2)
-        elif ext == ".csv":
-            rows = list(csv.reader(io.StringIO(p.read_text(encoding="utf-8-sig", errors="replace"))))
-            text, meta = "\n".join(" | ".join(row) for row in rows), {"rows": len(rows)}
-        elif ext == ".docx":
-            text, meta = _read_docx(p)
-        elif ext == ".pptx":
-            text, meta = _read_pptx(p)
-        elif ext == ".xlsx":
-            text, meta = _read_xlsx(p)
+        if ext in TEXT_EXTENSIONS | {".json", ".csv"}:
+            text, meta = _plain_text(p, ext)
+            total_chars = len(text)
+            text, truncated = _bounded(text, max_chars)
         else:
-            try:
-                from pypdf import PdfReader
-            except ImportError:
+            if ext == ".pdf" and importlib.util.find_spec("pypdf") is None:
                 return "ERROR: PDF support requires: pip install 'seven-ai[documents]'"
-            reader = PdfReader(str(p))
-            parts = [f"--- Page {i} ---\n{page.extract_text() or ''}" for i, page in enumerate(reader.pages, 1)]
-            text, meta = "\n\n".join(parts), {"pages": len(reader.pages)}
-        total_chars = len(text)
-        text, truncated = _bounded(text, max_chars)
+            cache = get_document_cache()
+            entry, _ = cache.open(p, st)
+            read = _Read(cache, entry)
+            if ext == ".pdf":
+                text, total_chars, truncated, meta = _read_pdf(p, read, pages, max_chars)
+            elif ext == ".docx":
+                text, total_chars, truncated, meta = _read_docx(p, read, max_chars)
+            elif ext == ".pptx":
+                text, total_chars, truncated, meta = _read_pptx(p, read, pages, max_chars)
+            else:
+                text, total_chars, truncated, meta = _read_xlsx(p, read, sheets, rows, max_chars)
+            meta["cache"] = read.state
+            if read.extracted:
+                cache.prune()
+        window = {name: value for name, value in (("pages", pages), ("sheets", sheets), ("rows", rows)) if value}
         header = {"path": str(p), "type": ext.lstrip("."), "bytes": size, "total_chars": total_chars, "truncated": truncated, **meta}
+        if window:
+            header["window"] = window
         return json.dumps(header, ensure_ascii=False) + "\n\n" + text
-    except (OSError, ValueError, KeyError, ET.ParseError, zipfile.BadZipFile, json.JSONDecodeError) as exc:
+    except READ_ERRORS as exc:
         return f"ERROR reading {p}: {exc}"
 
 
-def register(reg):
+def register(reg, memory=None):
     from seven.tools.registry import Tool
-    reg.register(Tool("document_status", "Report supported local document formats and optional PDF backend.", {"type": "object", "properties": {}}, document_status))
-    reg.register(Tool("read_document", "Extract bounded local text from PDF, DOCX, XLSX, PPTX, CSV, JSON, and text documents.", {
+
+    def ingest_documents(path: str, force: bool = False) -> str:
+        if memory is None:
+            return "ERROR: memory not ready"
+        from seven.memory.document_index import DocumentIndex
+
+        root = Path(path).expanduser().resolve()
+        if not root.exists():
+            return f"ERROR: not found: {root}"
+        r = DocumentIndex(memory).ingest(root, force=bool(force))
+        lines = [
+            f"Ingested {r['root']}: {r['files']} files ({r['new']} new, {r['changed']} changed, "
+            f"{r['unchanged']} unchanged, {r['removed']} removed, {len(r['failed'])} failed)",
+            f"{r['chunks']} chunks in {r['seconds']:.2f}s ({r['chunks_per_second']:.0f} chunks/s)",
+        ]
+        if not r["complete"]:
+            lines.append(f"Stopped after {r['files']} files; run again on a subfolder for the rest.")
+        lines += [f"  failed: {failure}" for failure in r["failed"][:20]]
+        return "\n".join(lines)
+
+    def search_documents(query: str, limit: int = 8, path: str = "") -> str:
+        if memory is None:
+            return "ERROR: memory not ready"
+        from seven.memory.document_index import DocumentIndex, location
+
+        root = str(Path(path).expanduser().resolve()) if path else ""
+        hits = DocumentIndex(memory).search(query, limit=max(1, min(int(limit), 50)), root=root)
+        if not hits:
+            stats = memory.document_stats()
+            return f"No document hits for: {query} ({stats['files']} files, {stats['chunks']} chunks ingested)"
+        lines = [f"Document hits for: {query}"]
+        for n, (score, row) in enumerate(hits, 1):
+            lines.append(f"{n}. {row['path']} ({location(row)}) score {score:.2f}")
+            lines.append(f"   {' '.join(row['snippet'].split())}")
+        return "\n".join(lines)
+
+    reg.register(Tool("document_status", "Report supported local document formats, optional PDF backend and the extraction cache.", {"type": "object", "properties": {}}, document_status))
+    reg.register(Tool("read_document", "Extract bounded local text from PDF, DOCX, XLSX, PPTX, CSV, JSON, and text documents. Large PDFs/decks and workbooks can be read in windows: pages (PDF pages or PPTX slides), sheets, rows.", {
         "type": "object", "properties": {
             "path": {"type": "string"},
             "max_chars": {"type": "integer", "minimum": 100, "maximum": 200000},
+            "pages": {"type": "string", "description": "PDF pages or PPTX slides, e.g. '1-5,9' or '40-'"},
+            "sheets": {"type": "string", "description": "XLSX sheets, e.g. '2' or '1-3'"},
+            "rows": {"type": "string", "description": "XLSX rows within each sheet, e.g. '1-1000' or '5000-'"},
         }, "required": ["path"]}, read_document))
+    reg.register(Tool("ingest_documents", "Chunk, embed and index the documents in a folder (or one file) into memory for search_documents; only new or changed files are re-read.", {
+        "type": "object", "properties": {
+            "path": {"type": "string"},
+            "force": {"type": "boolean", "description": "re-ingest unchanged files too"},
+        }, "required": ["path"]}, ingest_documents))
+    reg.register(Tool("search_documents", "Search ingested documents; returns file, page/slide/sheet, character offsets and a snippet per hit.", {
+        "type": "object", "properties": {
+            "query": {"type": "string"},
+            "limit": {"type": "integer", "minimum": 1, "maximum": 50},
+            "path": {"type": "string", "description": "only documents under this folder"},
+        }, "required": ["query"]}, search_documents))
@@ -0,0 +1,394 @@
+"""
+Line-based patching for edit_file: search/replace hunks or a unified diff.
+
+Both forms become Hunks (old lines, new lines, optional line hint). The file is
+streamed twice and never held in memory:
+
+1. every place each hunk's old lines occur, with its byte offsets, is found
+   by bytes.find on the lines joined by LF or CRLF over 1 MiB buffers (or,
+   for insertions and mixed line endings, one pass over the lines);
+2. the unchanged byte ranges are copied in 1 MiB chunks to a temp file in the
+   same directory with the new lines in between, which is fsynced and
+   os.replace()d over the original.
+
+A search/replace hunk must match exactly once. A diff hunk must match its
+context somewhere, and the occurrence nearest its @@ line wins (like patch's
+offset). Hunks may not overlap. Line endings and a missing final newline are
+preserved. Lines are compared without their line ending.
+"""
+from __future__ import annotations
+
+import os
+import re
+import shutil
+import tempfile
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+SUMMARY_MAX_LINES = 60
+COPY_CHUNK = 1024 * 1024
+HUNK_HEADER = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+
+class PatchError(ValueError):
+    pass
+
+
+class Hunk(NamedTuple):
+    old: Tuple[str, ...]
+    new: Tuple[str, ...]
+    hint: Optional[int] = None  # 0-based line where a diff hunk expects old to start
+
+
+class Applied(NamedTuple):
+    hunk: int
+    start: int  # 0-based line of the match
+    old: Tuple[str, ...]
+    new: Tuple[str, ...]
+    start_byte: int
+    end_byte: int
+    eol: bytes  # ending of the last replaced line
+
+
+def _lines(text: str) -> Tuple[str, ...]:
+    return tuple(text.splitlines())
+
+
+def hunks_from_edits(edits: Sequence[dict]) -> List[Hunk]:
+    hunks = []
+    for number, edit in enumerate(edits, 1):
+        if not isinstance(edit, dict) or not isinstance(edit.get("search"), str):
+            raise PatchError(f"edit {number} needs a 'search' string")
+        old = _lines(edit["search"])
+        if not old:
+            raise PatchError(f"edit {number} has an empty search")
+        hunks.append(Hunk(old, _lines(str(edit.get("replace") or ""))))
+    return hunks
+
+
+def hunks_from_diff(diff: str) -> List[Hunk]:
+    """Hunks of a single-file unified diff; ---/+++ headers are optional."""
+    hunks: List[Hunk] = []
+    old: List[str] = []
+    new: List[str] = []
+    hint: Optional[int] = None
+    files = 0
+
+    def close():
+        if hint is not None:
+            hunks.append(Hunk(tuple(old), tuple(new), hint))
+
+    lines = diff.splitlines()
+    for number, line in enumerate(lines):
+        header = HUNK_HEADER.match(line)
+        if header:
+            close()
+            start, count = int(header.group(1)), header.group(2)
+            # "-N,0" inserts after line N; otherwise old starts at line N.
+            hint = start if count == "0" else max(start - 1, 0)
+            old, new = [], []
+        elif line.startswith("--- ") and number + 1 < len(lines) and lines[number + 1].startswith("+++ "):
+            files += 1
+            if files > 1:
+                raise PatchError("the diff touches more than one file; send one edit_file call per file")
+            close()
+            hint = None
+        elif hint is None or (line.startswith("+++ ") and number and lines[number - 1].startswith("--- ")):
+            continue
+        elif line.startswith("\\"):
+            continue  # "\ No newline at end of file": endings are kept as they are
+        elif line.startswith("-"):
+            old.append(line[1:])
+        elif line.startswith("+"):
+            new.append(line[1:])
+        elif line.startswith(" ") or line == "":
+            old.append(line[1:])
+            new.append(line[1:])
+        else:
+            raise PatchError(f"unexpected diff line: {line[:80]!r}")
+    close()
+    if not hunks:
+        raise PatchError("no @@ hunks found in diff")
+    return hunks
+
+
+def _encode(lines: Sequence[str]) -> Tuple[bytes, ...]:
+    return tuple(line.encode("utf-8", errors="surrogateescape") for line in lines)
+
+
+def _body(raw: bytes) -> bytes:
+    """raw without its line ending."""
+    if raw.endswith(b"\r\n"):
+        return raw[:-2]
+    return raw[:-1] if raw.endswith(b"\n") else raw
+
+
+class _Scan(NamedTuple):
+    found: Dict[int, List[Tuple[int, int, int, bytes]]]  # hunk -> (line, start byte, end byte, last eol)
+    line_offsets: Dict[int, int]  # byte offset of each line an insertion needs
+    lines: int
+    size: int
+    eol: bytes  # the first line's ending, used for new lines
+    final_newline: bool
+
+
+def _scan(path: str, hunks: Sequence[Tuple[bytes, ...]], insert_at: Sequence[int]) -> _Scan:
+    """One pass over the file: where each hunk's old lines occur, in bytes as well as lines."""
+    found: Dict[int, List[Tuple[int, int, int, bytes]]] = {index: [] for index in range(len(hunks))}
+    by_first: Dict[bytes, List[int]] = {}
+    for index, old in enumerate(hunks):
+        if old:
+            by_first.setdefault(old[0], []).append(index)
+    wanted = set(insert_at)
+    line_offsets: Dict[int, int] = {}
+    active: List[Tuple[int, int, int, int]] = []  # (hunk, start line, start byte, lines matched)
+    offset = number = 0
+    eol, raw = b"\n", b""
+    with open(path, "rb") as handle:
+        for number, raw in enumerate(handle):
+            if number in wanted:
+                line_offsets[number] = offset
+            body = _body(raw)
+            if number == 0 and len(body) < len(raw):
+                eol = raw[len(body):]
+            end = offset + len(raw)
+            if active:
+                still = []
+                for index, start, start_byte, matched in active:
+                    if hunks[index][matched] == body:
+                        if matched + 1 == len(hunks[index]):
+                            found[index].append((start, start_byte, end, raw[len(body):]))
+                        else:
+                            still.append((index, start, start_byte, matched + 1))
+                active = still
+            for index in by_first.get(body, ()):
+                if len(hunks[index]) == 1:
+                    found[index].append((number, offset, end, raw[len(body):]))
+                else:
+                    active.append((index, number, offset, 1))
+            offset = end
+        lines = number + 1 if raw else 0
+    for position in wanted:
+        if position >= lines:
+            line_offsets[position] = offset
+    return _Scan(found, line_offsets, lines, offset, eol, raw.endswith(b"\n") or not raw)
+
+
+def _scan_chunked(path: str, hunks: Sequence[Tuple[bytes, ...]], insert_at: Sequence[int]) -> Optional[_Scan]:
+    """_scan for the common case at C speed: each hunk's lines joined by LF or CRLF, found with bytes.find.
+
+    The file is read in COPY_CHUNK buffers that overlap by the longest needle,
+    so memory stays flat. None when this cannot answer: an empty file, a hunk
+    of only empty lines, or a hunk with no match (it may still match across
+    mixed line endings).
+    """
+    if any(old and not any(old) for old in hunks):
+        return None
+    needles = [
+        (index, joiner.join(old))
+        for index, old in enumerate(hunks) if old
+        for joiner in ((b"\n",) if len(old) == 1 else (b"\n", b"\r\n"))
+    ]
+    # A match needs the byte before it and up to two after it in the same buffer.
+    keep = max([len(needle) for _, needle in needles] or [0]) + 3
+    found: Dict[int, List[Tuple[int, int, int, bytes]]] = {index: [] for index in range(len(hunks))}
+    wanted = sorted(set(insert_at))
+    line_offsets: Dict[int, int] = {}
+    eol, line, last = None, 0, b""
+    with open(path, "rb") as handle:
+        buf, base, done = b"", 0, 0  # buf starts at byte base; matches before done were taken
+
+        def count(start: int, end: int) -> None:
+            """Add the newlines in buf[start:end] to line, noting where wanted lines start."""
+            nonlocal line
+            newlines = buf.count(b"\n", start, end)
+            while wanted and wanted[0] <= line + newlines:
+                target = wanted.pop(0)
+                position = start
+                for _ in range(target - line):
+                    position = buf.find(b"\n", position, end) + 1
+                line_offsets[target] = base + position
+                line, start, newlines = target, position, newlines - (target - line)
+            line += newlines
+
+        while True:
+            chunk = handle.read(COPY_CHUNK)
+            eof = not chunk
+            buf += chunk
+            if not buf:
+                return None
+            if eol is None and (b"\n" in buf or eof):
+                first = buf.find(b"\n")
+                eol = b"\r\n" if first > 0 and buf[first - 1:first] == b"\r" else b"\n"
+            limit = len(buf) if eof else max(len(buf) - keep, 0)
+            hits = []
+            for index, needle in needles:
+                position = buf.find(needle, max(done - base, 0))
+                while 0 <= position < limit:
+                    end = position + len(needle)
+                    if position + base == 0 or buf[position - 1] == 10:
+                        ending = b"" if eof and end == len(buf) else buf[end:end + 2]
+                        ending = ending if ending in (b"", b"\r\n") else ending[:1]
+                        if ending in (b"", b"\n", b"\r\n"):
+                            hits.append((position, index, end + len(ending), ending))
+                    position = buf.find(needle, position + 1)
+            counted = max(done - base, 0)
+            for position, index, end, ending in sorted(hits):
+                count(counted, position)
+                counted = position
+                found[index].append((line, base + position, base + end, ending))
+            if eof:
+                count(counted, len(buf))
+                last = buf[-1:]
+                break
+            count(counted, limit)
+            done = base + limit
+            cut = max(limit - 1, 0)  # keep the byte before the next candidate
+            base, buf = base + cut, buf[cut:]
+    size = base + len(buf)
+    if not all(found[index] for index, old in enumerate(hunks) if old):
+        return None
+    final_newline = last == b"\n"
+    lines = line + (0 if final_newline else 1)
+    for target in wanted:  # past the last newline: the end of the file
+        line_offsets[target] = size
+    return _Scan(found, line_offsets, lines, size, eol or b"\n", final_newline)
+
+
+def _near_misses(path: str, hunk: Hunk, limit: int = 3) -> List[str]:
+    """Where the hunk's first old line occurs, exactly or apart from whitespace, to help fix the hunk."""
+    exact = hunk.old[0].encode("utf-8", errors="surrogateescape")
+    want = b" ".join(exact.split())
+    out = []
+    with open(path, "rb") as handle:
+        for number, raw in enumerate(handle, 1):
+            body = _body(raw)
+            if body == exact:
+                out.append(f"line {number} (later lines differ)")
+            elif want and b" ".join(body.split()) == want:
+                out.append(f"line {number} (whitespace differs)")
+            if len(out) >= limit:
+                break
+    return out
+
+
+class Plan(NamedTuple):
+    edits: List[Applied]
+    eol: bytes
+    final_newline: bool
+    size: int
+
+
+def plan(path: str, hunks: Sequence[Hunk]) -> Plan:
+    """Where each hunk applies, in file order; raises PatchError when any does not fit."""
+    encoded = [_encode(hunk.old) for hunk in hunks]
+    insert_at = [hunk.hint for hunk in hunks if not hunk.old]
+    scan = _scan_chunked(path, encoded, insert_at) or _scan(path, encoded, insert_at)
+    chosen: List[Applied] = []
+    for index, hunk in enumerate(hunks):
+        if not hunk.old:
+            if hunk.hint is None or hunk.hint > scan.lines:
+                raise PatchError(f"hunk {index + 1} inserts at line {hunk.hint}, past the end ({scan.lines} lines)")
+            at = scan.line_offsets[hunk.hint]
+            chosen.append(Applied(index, hunk.hint, hunk.old, hunk.new, at, at, scan.eol))
+            continue
+        matches = scan.found[index]
+        if not matches:
+            hints = _near_misses(path, hunk)
+            detail = ("; first line found at " + ", ".join(hints)) if hints else ""
+            raise PatchError(f"hunk {index + 1} does not match the file (it starts {hunk.old[0].strip()[:80]!r}){detail}")
+        if hunk.hint is None:
+            if len(matches) > 1:
+                lines = ", ".join(str(match[0] + 1) for match in matches[:5])
+                raise PatchError(f"hunk {index + 1} matches {len(matches)} times (lines {lines}); add more context lines")
+            match = matches[0]
+        else:
+            match = min(matches, key=lambda candidate: abs(candidate[0] - hunk.hint))
+        chosen.append(Applied(index, match[0], hunk.old, hunk.new, match[1], match[2], match[3]))
+    chosen.sort(key=lambda item: (item.start, len(item.old), item.hunk))
+    for before, after in zip(chosen, chosen[1:]):
+        if after.start < before.start + len(before.old):
+            raise PatchError(f"hunks {before.hunk + 1} and {after.hunk + 1} overlap")
+    return Plan(chosen, scan.eol, scan.final_newline, scan.size)
+
+
+def _copy(src, out, start: int, end: int) -> None:
+    src.seek(start)
+    remaining = end - start
+    while remaining > 0:
+        chunk = src.read(min(COPY_CHUNK, remaining))
+        if not chunk:
+            break
+        out.write(chunk)
+        remaining -= len(chunk)
+
+
+def _drop_line_ending(out) -> None:
+    """Cut the line ending that closes what out holds so far (out is at its end)."""
+    end = out.tell()
+    out.seek(max(0, end - 2))
+    tail = out.read()
+    out.truncate(end - (2 if tail.endswith(b"\r\n") else 1 if tail.endswith((b"\n", b"\r")) else 0))
+
+
+def write(path: str, planned: Plan, stat: os.stat_result) -> int:
+    """Copy path to a temp file with the edits swapped in, then atomically replace it. Returns the new size."""
+    directory = os.path.dirname(os.path.abspath(path))
+    handle, temp = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory)
+    try:
+        with open(path, "rb") as src, os.fdopen(handle, "w+b") as out:
+            position, open_line = 0, False
+            for edit in planned.edits:
+                if edit.start_byte > position:
+                    _copy(src, out, position, edit.start_byte)
+                    open_line = edit.start_byte == planned.size and not planned.final_newline
+                position = edit.end_byte
+                if not edit.new:
+                    continue
+                if open_line:
+                    out.write(planned.eol)  # the old last line had no newline
+                # The last new line keeps the replaced block's ending, "" at EOF included.
+                final = edit.eol if edit.old else (b"" if open_line else planned.eol)
+                out.write(planned.eol.join(_encode(edit.new)) + final)
+                open_line = not final
+            _copy(src, out, position, planned.size)
+            last = planned.edits[-1] if planned.edits else None
+            if last and last.old and not last.new and last.end_byte == planned.size and not planned.final_newline:
+                _drop_line_ending(out)  # the deleted last line had no newline, so the new last line has none
+            out.flush()
+            os.fsync(out.fileno())
+        current = os.stat(path)
+        if (current.st_size, current.st_mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+            raise PatchError("the file changed while it was being edited; read it again and retry")
+        shutil.copymode(path, temp)
+        os.replace(temp, path)
+        return os.stat(path).st_size
+    except BaseException:
+        try:
+            os.unlink(temp)
+        except OSError:
+            pass
+        raise
+
+
+def summary(edits: Sequence[Applied]) -> Tuple[List[str], int, int]:
+    """Compact diff of the changed lines only (shared leading/trailing context dropped), +count, -count."""
+    lines: List[str] = []
+    added = removed = shift = 0
+    for edit in edits:
+        old, new = list(edit.old), list(edit.new)
+        head = 0
+        while head < min(len(old), len(new)) and old[head] == new[head]:
+            head += 1
+        tail = 0
+        while tail < min(len(old), len(new)) - head and old[len(old) - 1 - tail] == new[len(new) - 1 - tail]:
+            tail += 1
+        gone, came = old[head:len(old) - tail], new[head:len(new) - tail]
+        first = edit.start + head + 1
+        lines.append(f"@@ -{first},{len(gone)} +{first + shift},{len(came)} @@")
+        lines.extend("-" + text for text in gone)
+        lines.extend("+" + text for text in came)
+        added, removed = added + len(came), removed + len(gone)
+        shift += len(came) - len(gone)
+    if len(lines) > SUMMARY_MAX_LINES:
+        lines = lines[:SUMMARY_MAX_LINES] + [f"... {len(lines) - SUMMARY_MAX_LINES} more diff lines"]
+    return lines, added, removed
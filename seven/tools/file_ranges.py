@@ -0,0 +1,145 @@
+"""
+Bounded reads of large files for read_file: byte ranges, the last N lines and
+line windows. Nothing here holds more than the requested window plus one
+read buffer, so memory stays flat however large the file is.
+
+Line windows use a sparse line index: the cumulative newline count at the end
+of every LINE_INDEX_BLOCK bytes. Finding a line is a bisect plus a scan of at
+most one block of the file's mmap. Indexes are cached per (path, size, mtime),
+so paging through the same log pays for the index once.
+"""
+from __future__ import annotations
+
+import mmap
+import os
+import threading
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import NamedTuple, Tuple
+
+LINE_INDEX_BLOCK = 64 * 1024
+LINE_INDEX_CACHE = 16
+TAIL_CHUNK = 64 * 1024
+
+
+class LineIndex(NamedTuple):
+    size: int
+    mtime_ns: int
+    newlines: array  # newlines in bytes [0, (i + 1) * LINE_INDEX_BLOCK)
+    total_lines: int
+
+
+class LineWindow(NamedTuple):
+    data: bytes
+    first: int
+    last: int  # 0 when the window is empty
+    total_lines: int
+    truncated: bool
+
+
+_INDEXES: "OrderedDict[str, LineIndex]" = OrderedDict()
+_INDEXES_LOCK = threading.Lock()
+
+
+def read_range(path: str, offset: int, length: int) -> bytes:
+    with open(path, "rb") as handle:
+        handle.seek(offset)
+        return handle.read(length)
+
+
+def read_tail(path: str, lines: int, max_bytes: int) -> Tuple[bytes, bool]:
+    """The last lines lines of path, read backwards; (data, truncated to max_bytes)."""
+    with open(path, "rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if size == 0 or lines <= 0:
+            return b"", False
+        data, pos = b"", size
+        while pos > 0:
+            step = min(TAIL_CHUNK, pos)
+            pos -= step
+            handle.seek(pos)
+            data = handle.read(step) + data
+            # A final newline ends the last line; it does not start another.
+            body = len(data) - 1 if data.endswith(b"\n") else len(data)
+            if data.count(b"\n", 0, body) >= lines or len(data) > max_bytes + TAIL_CHUNK:
+                break
+    body = len(data) - 1 if data.endswith(b"\n") else len(data)
+    start = body
+    for _ in range(lines):
+        start = data.rfind(b"\n", 0, start)
+        if start < 0:
+            break
+    start = start + 1 if start >= 0 else 0
+    if len(data) - start > max_bytes:
+        return data[-max_bytes:], True
+    return data[start:], False
+
+
+def _build_index(handle, size: int, mtime_ns: int) -> LineIndex:
+    # Plain reads, not the mmap: mapped pages would all count as resident memory.
+    newlines, total, last = array("Q"), 0, b""
+    handle.seek(0)
+    while True:
+        chunk = handle.read(LINE_INDEX_BLOCK * 16)
+        if not chunk:
+            break
+        for start in range(0, len(chunk), LINE_INDEX_BLOCK):
+            total += chunk.count(b"\n", start, start + LINE_INDEX_BLOCK)
+            newlines.append(total)
+        last = chunk[-1:]
+    return LineIndex(size, mtime_ns, newlines, total + (1 if last not in (b"", b"\n") else 0))
+
+
+def line_index(path: str) -> LineIndex:
+    """The cached index of path, rebuilt when its size or mtime changed."""
+    key = os.path.realpath(path)
+    with open(key, "rb") as handle:
+        st = os.fstat(handle.fileno())
+        with _INDEXES_LOCK:
+            index = _INDEXES.get(key)
+            if index is not None and (index.size, index.mtime_ns) == (st.st_size, st.st_mtime_ns):
+                _INDEXES.move_to_end(key)
+                return index
+        index = _build_index(handle, st.st_size, st.st_mtime_ns)
+    with _INDEXES_LOCK:
+        _INDEXES[key] = index
+        _INDEXES.move_to_end(key)
+        while len(_INDEXES) > LINE_INDEX_CACHE:
+            _INDEXES.popitem(last=False)
+    return index
+
+
+def _line_start(data, index: LineIndex, line: int) -> int:
+    """Byte offset where 1-based line starts; the file size past the last line."""
+    need = line - 1
+    if need <= 0:
+        return 0
+    if need > (index.newlines[-1] if index.newlines else 0):
+        return index.size
+    block = bisect_left(index.newlines, need)
+    pos = block * LINE_INDEX_BLOCK
+    for _ in range(need - (index.newlines[block - 1] if block else 0)):
+        pos = data.find(b"\n", pos) + 1
+    return pos
+
+
+def read_lines(path: str, first: int, last: int, max_bytes: int) -> LineWindow:
+    """Lines first..last (1-based, inclusive; last=0 means to the end), at most max_bytes."""
+    first = max(1, first)
+    with open(path, "rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if size == 0:
+            return LineWindow(b"", first, 0, 0, False)
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            index = line_index(path)
+            if first > index.total_lines:
+                return LineWindow(b"", first, 0, index.total_lines, False)
+            last = index.total_lines if last <= 0 else min(last, index.total_lines)
+            start = _line_start(data, index, first)
+            end = _line_start(data, index, last + 1)
+            truncated = end - start > max_bytes
+            if truncated:
+                end = start + max_bytes
+                last = first + data[start:end].count(b"\n")
+            return LineWindow(data[start:end], first, last, index.total_lines, truncated)
@@ -0,0 +1,277 @@
+"""
+Bounded filesystem walking and content search for the file tools.
+
+Directories are listed with os.scandir breadth first, sorted by name, and the
+walk is a generator: callers stop it as soon as they have enough hits. VCS
+directories and paths matched by .gitignore files inside the root are skipped
+unless ignore=False. With workers > 1 the directories of each level are listed
+on a thread pool; the output order is the same either way.
+"""
+from __future__ import annotations
+
+import fnmatch
+import mmap
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, NamedTuple, Sequence, Tuple
+
+VCS_DIRS = frozenset({".git", ".hg", ".svn", ".bzr", "_darcs", ".jj"})
+# Like git: a NUL byte in the first 8 KiB means binary.
+BINARY_SNIFF_BYTES = 8192
+MAX_LINE_CHARS = 300
+# Smaller files are read whole in one call; mapping them costs more than it saves.
+MMAP_MIN_BYTES = 1024 * 1024
+
+
+class IgnoreRule(NamedTuple):
+    base: str  # directory of the .gitignore, relative to the walk root ("" = root)
+    regex: re.Pattern
+    negate: bool
+    dir_only: bool
+    anchored: bool  # matched against the path below base, not just the name
+
+
+class Entry(NamedTuple):
+    path: str
+    rel: str  # POSIX path relative to the walk root
+    is_dir: bool
+
+
+class GrepHit(NamedTuple):
+    path: str
+    line_no: int
+    line: str
+
+
+def _translate(pattern: str) -> str:
+    """gitignore glob -> regex over a POSIX relative path."""
+    out, i = [], 0
+    while i < len(pattern):
+        char = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+            continue
+        if char == "*":
+            out.append("[^/]*")
+        elif char == "?":
+            out.append("[^/]")
+        elif char == "[" and pattern.find("]", i + 2) > 0:
+            # The first character of a class may be a literal "]".
+            end = pattern.find("]", i + 2)
+            body = pattern[i + 1:end]
+            out.append("[" + ("^" + body[1:] if body.startswith("!") else body) + "]")
+            i = end + 1
+            continue
+        elif char == "\\" and i + 1 < len(pattern):
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+            continue
+        else:
+            out.append(re.escape(char))
+        i += 1
+    return "".join(out) + r"\Z"
+
+
+def parse_gitignore(text: str, base: str = "") -> Tuple[IgnoreRule, ...]:
+    rules = []
+    for raw in text.splitlines():
+        line = raw.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        negate = line.startswith("!")
+        if negate:
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        anchored = "/" in line
+        line = line.lstrip("/")
+        if not line:
+            continue
+        try:
+            regex = re.compile(_translate(line))
+        except (re.error, ValueError):
+            continue
+        rules.append(IgnoreRule(base, regex, negate, dir_only, anchored))
+    return tuple(rules)
+
+
+def is_ignored(rules: Sequence[IgnoreRule], rel: str, is_dir: bool) -> bool:
+    """Last matching rule wins; deeper .gitignore files come later in rules."""
+    ignored = False
+    name = rel.rsplit("/", 1)[-1]
+    for rule in rules:
+        if rule.dir_only and not is_dir:
+            continue
+        if rule.base:
+            if not rel.startswith(rule.base + "/"):
+                continue
+            below = rel[len(rule.base) + 1:]
+        else:
+            below = rel
+        if rule.regex.match(below if rule.anchored else name):
+            ignored = not rule.negate
+    return ignored
+
+
+def _read_rules(directory: str, rel: str) -> Tuple[IgnoreRule, ...]:
+    try:
+        with open(os.path.join(directory, ".gitignore"), encoding="utf-8", errors="replace") as handle:
+            return parse_gitignore(handle.read(), rel)
+    except OSError:
+        return ()
+
+
+def rules_for(root: str, rel_dir: str) -> Tuple[IgnoreRule, ...]:
+    """The rules walk() applies inside rel_dir: every .gitignore from root down to it."""
+    rules = _read_rules(root, "")
+    parts = [part for part in rel_dir.split("/") if part]
+    for depth in range(1, len(parts) + 1):
+        rel = "/".join(parts[:depth])
+        rules = rules + _read_rules(os.path.join(root, *parts[:depth]), rel)
+    return rules
+
+
+def _scan(path: str, rel: str, rules: Tuple[IgnoreRule, ...], ignore: bool) -> Tuple[List[Entry], Tuple[IgnoreRule, ...]]:
+    try:
+        with os.scandir(path) as listing:
+            entries = sorted(listing, key=lambda entry: entry.name)
+    except OSError:
+        return [], rules
+    if ignore and any(entry.name == ".gitignore" for entry in entries):
+        rules = rules + _read_rules(path, rel)
+    out = []
+    for entry in entries:
+        try:
+            # Symlinked directories are reported, never followed: no cycles.
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            continue
+        child = f"{rel}/{entry.name}" if rel else entry.name
+        if ignore and ((is_dir and entry.name in VCS_DIRS) or (rules and is_ignored(rules, child, is_dir))):
+            continue
+        out.append(Entry(entry.path, child, is_dir))
+    return out, rules
+
+
+def walk(root: str, ignore: bool = True, workers: int = 1) -> Iterator[Entry]:
+    """Every file and directory below root, breadth first, sorted by name per directory."""
+    frontier: List[Tuple[str, str, Tuple[IgnoreRule, ...]]] = [(os.fspath(root), "", ())]
+    pool = ThreadPoolExecutor(workers, thread_name_prefix="seven-walk") if workers > 1 else None
+    try:
+        while frontier:
+            jobs = [(path, rel, rules, ignore) for path, rel, rules in frontier]
+            listings = pool.map(lambda job: _scan(*job), jobs) if pool else (_scan(*job) for job in jobs)
+            frontier = []
+            for entries, rules in listings:
+                for entry in entries:
+                    yield entry
+                    if entry.is_dir:
+                        frontier.append((entry.path, entry.rel, rules))
+    finally:
+        if pool is not None:
+            # A caller that stopped early must not wait for the rest of a level.
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+def name_matcher(pattern: str):
+    """rglob-style test: a pattern with "/" matches the end of the relative path, otherwise the name.
+
+    As with rglob, "**/" stands for zero or more directories, so "**/*.py"
+    also matches files directly in the root.
+    """
+    flags = re.IGNORECASE if os.name == "nt" else 0
+    if "/" in pattern:
+        match = re.compile("(?:.*/)?" + _translate(pattern.lstrip("/")), flags).match
+        return lambda entry: match(entry.rel) is not None
+    # Compiled once; fnmatch.fnmatch would normcase and look up its cache per call.
+    match = re.compile(fnmatch.translate(pattern), flags).match
+    return lambda entry: match(entry.rel, entry.rel.rfind("/") + 1) is not None
+
+
+def _newlines(data, start: int, end: int) -> int:
+    if isinstance(data, bytes):
+        return data.count(b"\n", start, end)
+    # mmap has no count(); copy at most 1 MiB at a time.
+    return sum(data[offset:min(end, offset + MMAP_MIN_BYTES)].count(b"\n") for offset in range(start, end, MMAP_MIN_BYTES))
+
+
+def _grep_buffer(path: str, data, size: int, regex: re.Pattern, limit: int) -> List[GrepHit]:
+    hits: List[GrepHit] = []
+    line_no, counted, pos = 1, 0, 0
+    while pos <= size and len(hits) < limit:
+        match = regex.search(data, pos)
+        if match is None:
+            break
+        start = data.rfind(b"\n", 0, match.start()) + 1
+        line_no += _newlines(data, counted, start)
+        counted = start
+        end = data.find(b"\n", match.start())
+        end = size if end < 0 else end
+        # Minified files can hold megabytes on one line; copy only what is shown.
+        line = data[start:min(end, start + MAX_LINE_CHARS * 4)]
+        text = line.decode("utf-8", errors="replace").rstrip("\r")
+        hits.append(GrepHit(path, line_no, text[:MAX_LINE_CHARS]))
+        pos = end + 1  # one hit per line
+    return hits
+
+
+def grep_file(path: str, regex: re.Pattern, limit: int) -> List[GrepHit]:
+    """Up to limit matching lines of one text file; [] for binary files.
+
+    Files from MMAP_MIN_BYTES up are searched through mmap, so memory stays
+    bounded by the page cache rather than the file size.
+    """
+    if limit <= 0:
+        return []
+    try:
+        with open(path, "rb") as handle:
+            size = os.fstat(handle.fileno()).st_size
+            if size == 0:
+                return []
+            if size < MMAP_MIN_BYTES:
+                data = handle.read()
+                if b"\0" in data[:BINARY_SNIFF_BYTES]:
+                    return []
+                return _grep_buffer(path, data, len(data), regex, limit)
+            if b"\0" in handle.read(BINARY_SNIFF_BYTES):
+                return []
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return _grep_buffer(path, data, size, regex, limit)
+    except (OSError, ValueError):
+        return []
+
+
+def compile_query(query: str, regex: bool = False, ignore_case: bool = False) -> re.Pattern:
+    """bytes pattern for grep_file; ignore_case folds ASCII letters only.
+
+    Regexes are compiled with re.MULTILINE so ^ and $ anchor at each line, as in grep.
+    """
+    source = query.encode("utf-8")
+    flags = re.IGNORECASE if ignore_case else 0
+    return re.compile(source, flags | re.MULTILINE) if regex else re.compile(re.escape(source), flags)
+
+
+def grep(
+    root: str,
+    query: re.Pattern,
+    glob: str = "",
+    max_hits: int = 100,
+    ignore: bool = True,
+    workers: int = 1,
+) -> Iterator[Tuple[Entry, GrepHit]]:
+    matches = name_matcher(glob) if glob else None
+    remaining = max_hits
+    for entry in walk(root, ignore=ignore, workers=workers):
+        if entry.is_dir or (matches is not None and not matches(entry)):
+            continue
+        for hit in grep_file(entry.path, query, remaining):
+            yield entry, hit
+            remaining -= 1
+        if remaining <= 0:
+            return
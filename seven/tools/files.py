@@ -1,28 +1,61 @@
 """Filesystem tools — read/write/list/search."""
 from __future__ import annotations
 
+import json
 import os
+import re
 import shutil
 from pathlib import Path
 from typing import Optional
 
+from seven import config
+from seven.tools.file_edit import PatchError, hunks_from_diff, hunks_from_edits, plan, summary, write
+from seven.tools.file_ranges import read_lines, read_range, read_tail
+from seven.tools.file_search import compile_query, grep, name_matcher, walk
 
-def read_file(path: str, max_bytes: int = 200_000) -> str:
+
+def read_file(
+    path: str,
+    max_bytes: int = 200_000,
+    offset: int = 0,
+    length: int = 0,
+    tail_lines: int = 0,
+    start_line: int = 0,
+    end_line: int = 0,
+) -> str:
+    """Read at most max_bytes: from the start, from a byte offset, the last lines, or a line window."""
     p = Path(path).expanduser()
     if not p.exists():
         return f"ERROR: not found: {p}"
     if p.is_dir():
         return f"ERROR: is a directory: {p}"
-    data = p.read_bytes()
-    truncated = False
-    if len(data) > max_bytes:
-        data = data[:max_bytes]
-        truncated = True
-    try:
-        text = data.decode("utf-8")
-    except UnicodeDecodeError:
-        text = data.decode("utf-8", errors="replace")
-    out = f"path={p.resolve()}\nsize={p.stat().st_size}\n\n{text}"
+    modes = sum(1 for used in (offset or length, tail_lines, start_line or end_line) if used)
+    if modes > 1:
+        return "ERROR: use only one of offset/length, tail_lines or start_line/end_line"
+    if min(offset, length, tail_lines, start_line, end_line) < 0:
+        return "ERROR: offsets, lengths and line numbers must not be negative"
+    max_bytes = max(1, int(max_bytes))
+    size = p.stat().st_size
+    span = ""
+    if tail_lines:
+        data, truncated = read_tail(str(p), tail_lines, max_bytes)
+        span = f"range=last {tail_lines} lines\n"
+    elif start_line or end_line:
+        if end_line and end_line < max(start_line, 1):
+            return "ERROR: end_line is before start_line"
+        window = read_lines(str(p), start_line, end_line, max_bytes)
+        data, truncated = window.data, window.truncated
+        shown = f"{window.first}-{window.last}" if window.last else "none"
+        span = f"range=lines {shown} of {window.total_lines}\n"
+    else:
+        want = min(length, max_bytes) if length else max_bytes
+        data = read_range(str(p), offset, want)
+        end = offset + len(data)
+        truncated = end < (min(size, offset + length) if length else size)
+        if offset or length:
+            span = f"range=bytes {offset}-{end}\n"
+    text = data.decode("utf-8", errors="replace")
+    out = f"path={p.resolve()}\nsize={size}\n{span}\n{text}"
     if truncated:
         out += "\n...[truncated]"
     return out
@@ -39,6 +72,33 @@ def write_file(path: str, content: str, mode: str = "overwrite") -> str:
     return f"OK wrote {len(content)} chars to {p.resolve()}"
 
 
+def edit_file(path: str, edits=None, diff: str = "", dry_run: bool = False) -> str:
+    """Apply search/replace edits or a unified diff in place and report only the changed lines."""
+    p = Path(path).expanduser()
+    if not p.is_file():
+        return f"ERROR: not a file: {p}"
+    if bool(edits) == bool(diff):
+        return "ERROR: give either edits (search/replace pairs) or diff (unified diff)"
+    if isinstance(edits, str):
+        try:
+            edits = json.loads(edits)
+        except ValueError:
+            return "ERROR: edits must be a list of {search, replace} objects"
+    if isinstance(edits, dict):
+        edits = [edits]
+    try:
+        hunks = hunks_from_edits(edits) if edits else hunks_from_diff(diff)
+        before = p.stat()
+        planned = plan(str(p), hunks)
+        lines, added, removed = summary(planned.edits)
+        size = before.st_size if dry_run else write(str(p), planned, before)
+    except PatchError as e:
+        return f"ERROR: {e}; nothing was changed"
+    verb = "would edit" if dry_run else "edited"
+    head = f"OK {verb} {p.resolve()}: {len(planned.edits)} hunk(s), +{added} -{removed} lines, {before.st_size} -> {size} bytes"
+    return "\n".join([head] + lines)
+
+
 def list_dir(path: str = ".", max_entries: int = 200) -> str:
     p = Path(path).expanduser()
     if not p.exists():
@@ -59,15 +119,57 @@ def list_dir(path: str = ".", max_entries: int = 200) -> str:
     return "\n".join(lines)
 
 
-def search_files(root: str, pattern: str, max_hits: int = 50) -> str:
-    """Glob search under root."""
+def search_files(root: str, pattern: str, max_hits: int = 50, include_ignored: bool = False) -> str:
+    """Glob search under root; stops walking at max_hits."""
     root_p = Path(root).expanduser()
     if not root_p.exists():
         return f"ERROR: not found: {root_p}"
-    hits = list(root_p.rglob(pattern))[:max_hits]
+    matches = name_matcher(pattern)
+    hits = []
+    for entry in walk(str(root_p), ignore=not include_ignored, workers=config.FILE_SEARCH_WORKERS):
+        if matches(entry):
+            if len(hits) >= max_hits:
+                hits.append(f"... stopped at max_hits={max_hits}")
+                break
+            hits.append(entry.path)
     if not hits:
         return f"No matches for '{pattern}' under {root_p}"
-    return "\n".join(str(h) for h in hits)
+    return "\n".join(hits)
+
+
+def grep_files(
+    root: str,
+    query: str,
+    glob: str = "",
+    regex: bool = False,
+    ignore_case: bool = False,
+    max_hits: int = 100,
+    include_ignored: bool = False,
+) -> str:
+    """Line-numbered matches of query in text files under root."""
+    root_p = Path(root).expanduser()
+    if not root_p.exists():
+        return f"ERROR: not found: {root_p}"
+    if root_p.is_file():
+        return f"ERROR: not a directory: {root_p} (use read_file)"
+    try:
+        compiled = compile_query(query, regex=regex, ignore_case=ignore_case)
+    except re.error as e:
+        return f"ERROR: bad regex: {e}"
+    lines = [f"root={root_p.resolve()}"]
+    found = 0
+    for entry, hit in grep(
+        str(root_p), compiled, glob=glob, max_hits=max_hits + 1,
+        ignore=not include_ignored, workers=config.FILE_SEARCH_WORKERS,
+    ):
+        if found >= max_hits:
+            lines.append(f"... stopped at max_hits={max_hits}")
+            break
+        lines.append(f"{entry.rel}:{hit.line_no}: {hit.line}")
+        found += 1
+    if not found:
+        return f"No matches for '{query}' under {root_p}"
+    return "\n".join(lines)
 
 
 def delete_path(path: str, recursive: bool = False) -> str:
@@ -99,12 +201,18 @@ def register(reg):
 
     reg.register(Tool(
         name="read_file",
-        description="Read a text file from disk.",
+        description="Read a text file from disk: the start by default, or a byte range (offset/length), "
+                    "the last tail_lines lines, or lines start_line..end_line (1-based). Large files are never read whole.",
         parameters={
             "type": "object",
             "properties": {
                 "path": {"type": "string"},
                 "max_bytes": {"type": "integer"},
+                "offset": {"type": "integer", "minimum": 0},
+                "length": {"type": "integer", "minimum": 0},
+                "tail_lines": {"type": "integer", "minimum": 0},
+                "start_line": {"type": "integer", "minimum": 0},
+                "end_line": {"type": "integer", "minimum": 0},
             },
             "required": ["path"],
         },
@@ -124,6 +232,30 @@ def register(reg):
         },
         handler=write_file,
     ))
+    reg.register(Tool(
+        name="edit_file",
+        description="Change part of a text file without rewriting it: edits=[{search, replace}] (each search must "
+                    "match whole lines exactly once) or diff=<unified diff>. Hunk context is verified, the write is "
+                    "atomic, and only the changed lines are returned. Prefer this over write_file for existing files.",
+        parameters={
+            "type": "object",
+            "properties": {
+                "path": {"type": "string"},
+                "edits": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {"search": {"type": "string"}, "replace": {"type": "string"}},
+                        "required": ["search", "replace"],
+                    },
+                },
+                "diff": {"type": "string"},
+                "dry_run": {"type": "boolean"},
+            },
+            "required": ["path"],
+        },
+        handler=edit_file,
+    ))
     reg.register(Tool(
         name="list_dir",
         description="List directory contents.",
@@ -138,18 +270,38 @@ def register(reg):
     ))
     reg.register(Tool(
         name="search_files",
-        description="Glob search for files under a root path (e.g. pattern='*.py').",
+        description="Glob search for files under a root path (e.g. pattern='*.py'). Skips .git and .gitignore'd paths unless include_ignored.",
         parameters={
             "type": "object",
             "properties": {
                 "root": {"type": "string"},
                 "pattern": {"type": "string"},
                 "max_hits": {"type": "integer"},
+                "include_ignored": {"type": "boolean"},
             },
             "required": ["root", "pattern"],
         },
         handler=search_files,
     ))
+    reg.register(Tool(
+        name="grep_files",
+        description="Search file contents under a root path; returns path:line: text for matching lines. "
+                    "Literal text unless regex=true; glob limits file names (e.g. '*.py'). Skips binary, .git and .gitignore'd files.",
+        parameters={
+            "type": "object",
+            "properties": {
+                "root": {"type": "string"},
+                "query": {"type": "string"},
+                "glob": {"type": "string"},
+                "regex": {"type": "boolean"},
+                "ignore_case": {"type": "boolean"},
+                "max_hits": {"type": "integer"},
+                "include_ignored": {"type": "boolean"},
+            },
+            "required": ["root", "query"],
+        },
+        handler=grep_files,
+    ))
     reg.register(Tool(
         name="delete_path",
         description="Delete a file or directory.",
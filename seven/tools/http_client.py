@@ -0,0 +1,374 @@
+"""
+Shared HTTP client for the web tools: one pooled requests.Session, bodies
+streamed up to a byte cap, and an on-disk HTTP cache.
+
+The cache follows the private-cache rules of RFC 9111, simplified:
+
+- responses with Cache-Control: no-store, Vary: * or a status other than 200
+  are not stored;
+- a stored response is fresh for max-age, else Expires - Date, else 10% of its
+  age at Last-Modified time (at most a day). no-cache means always revalidate;
+- a stale response with an ETag or Last-Modified is revalidated with
+  If-None-Match / If-Modified-Since, and a 304 refreshes it without a body.
+
+Bodies are stored once per SHA-256 under HTTP_CACHE_DIR/bodies, and each URL's
+entry under HTTP_CACHE_DIR/entries points at one. A body cut at the byte cap is
+kept as partial and serves later requests whose cap it covers.
+"""
+from __future__ import annotations
+
+import calendar
+import codecs
+import email.utils
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import Counter
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from seven import config
+
+logger = logging.getLogger("seven.http")
+
+USER_AGENT = "SevenAI/4.0 (+local-agent)"
+READ_CHUNK = 64 * 1024
+# Slices fed to the HTML parser; small enough that hitting max_chars stops it early.
+PARSE_CHUNK = 8 * 1024
+# Longest heuristic freshness for responses with only Last-Modified.
+HEURISTIC_MAX_SECONDS = 24 * 3600
+PRUNE_EVERY = 50
+KEPT_HEADERS = ("content-type", "etag", "last-modified", "cache-control", "expires", "date", "age", "vary")
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def session() -> requests.Session:
+    """The process-wide session; its connection pool keeps sockets to each host alive."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            pooled = requests.Session()
+            adapter = HTTPAdapter(pool_connections=config.HTTP_POOL_SIZE, pool_maxsize=config.HTTP_POOL_SIZE)
+            pooled.mount("http://", adapter)
+            pooled.mount("https://", adapter)
+            pooled.headers["User-Agent"] = USER_AGENT
+            _SESSION = pooled
+        return _SESSION
+
+
+class Fetched(NamedTuple):
+    url: str
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    truncated: bool  # body stopped at the byte cap
+    cache: str  # miss | hit | revalidated | off
+
+
+def _cache_control(headers: Dict[str, str]) -> Dict[str, str]:
+    out = {}
+    for part in headers.get("cache-control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            out[name.lower()] = value.strip().strip('"')
+    return out
+
+
+def _http_date(value: str) -> Optional[float]:
+    try:
+        parsed = email.utils.parsedate_tz(value)
+    except (TypeError, ValueError):
+        return None
+    return float(calendar.timegm(parsed[:9]) - (parsed[9] or 0)) if parsed else None
+
+
+def freshness_lifetime(headers: Dict[str, str]) -> float:
+    """Seconds a stored response may be served without revalidation."""
+    directives = _cache_control(headers)
+    if "no-cache" in directives:
+        return 0.0
+    if "max-age" in directives:
+        try:
+            return max(float(directives["max-age"]), 0.0)
+        except ValueError:
+            return 0.0
+    date = _http_date(headers.get("date", ""))
+    expires = _http_date(headers.get("expires", ""))
+    if "expires" in headers:
+        return max((expires or 0) - (date or time.time()), 0.0) if expires else 0.0
+    modified = _http_date(headers.get("last-modified", ""))
+    if modified and date and date > modified:
+        return min((date - modified) * 0.1, HEURISTIC_MAX_SECONDS)
+    return 0.0
+
+
+def storable(status: int, headers: Dict[str, str]) -> bool:
+    directives = _cache_control(headers)
+    if status != 200 or "no-store" in directives or headers.get("vary", "").strip() == "*":
+        return False
+    return freshness_lifetime(headers) > 0 or "etag" in headers or "last-modified" in headers
+
+
+class HttpCache:
+    def __init__(self, directory: Path, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._stores = 0
+        self._lock = threading.Lock()
+
+    def _entry_path(self, url: str) -> Path:
+        return self.directory / "entries" / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+    def _body_path(self, digest: str) -> Path:
+        return self.directory / "bodies" / digest[:2] / digest
+
+    def get(self, url: str) -> Optional[dict]:
+        try:
+            entry = json.loads(self._entry_path(url).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if entry.get("url") != url or not self._body_path(entry["sha256"]).exists():
+            return None
+        return entry
+
+    def body(self, entry: dict, max_bytes: int) -> bytes:
+        with open(self._body_path(entry["sha256"]), "rb") as handle:
+            return handle.read(max_bytes)
+
+    def is_fresh(self, entry: dict) -> bool:
+        age = time.time() - entry["stored_at"] + float(entry.get("age") or 0)
+        return age < freshness_lifetime(entry["headers"])
+
+    def _write(self, path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        temp.write_bytes(data)
+        os.replace(temp, path)
+
+    def put(self, url: str, status: int, headers: Dict[str, str], body: bytes, complete: bool) -> dict:
+        digest = hashlib.sha256(body).hexdigest()
+        body_path = self._body_path(digest)
+        if not body_path.exists():
+            self._write(body_path, body)
+        try:
+            age = float(headers.get("age") or 0)
+        except ValueError:
+            age = 0.0
+        entry = {
+            "url": url, "status": status, "headers": headers, "sha256": digest, "size": len(body),
+            "complete": complete, "stored_at": time.time(), "age": age,
+        }
+        self.touch(url, entry)
+        with self._lock:
+            self._stores += 1
+            due = self._stores % PRUNE_EVERY == 1
+        if due:
+            self.prune()
+        return entry
+
+    def touch(self, url: str, entry: dict) -> None:
+        self._write(self._entry_path(url), json.dumps(entry).encode("utf-8"))
+
+    def prune(self) -> None:
+        """Drop the entries stored longest ago until the bodies fit in max_bytes, then unreferenced bodies."""
+        entries: List[Tuple[float, Path, str]] = []
+        for path in (self.directory / "entries").glob("*.json"):
+            try:
+                entry = json.loads(path.read_text(encoding="utf-8"))
+                entries.append((float(entry["stored_at"]), path, entry["sha256"]))
+            except (OSError, ValueError, KeyError):
+                path.unlink(missing_ok=True)
+        bodies = {path.name: path for path in (self.directory / "bodies").glob("*/*") if not path.name.endswith(".tmp")}
+        sizes = {name: path.stat().st_size for name, path in bodies.items()}
+        entries.sort()
+        references = Counter(digest for _, _, digest in entries)
+        total = sum(size for name, size in sizes.items() if name in references)
+        for _, path, digest in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            references[digest] -= 1
+            if not references[digest]:
+                del references[digest]
+                total -= sizes.get(digest, 0)
+        for name, path in bodies.items():
+            if name not in references:
+                path.unlink(missing_ok=True)
+
+
+_CACHE: Optional[HttpCache] = None
+
+
+def cache() -> Optional[HttpCache]:
+    global _CACHE
+    if config.HTTP_CACHE_MB <= 0:
+        return None
+    with _SESSION_LOCK:
+        if _CACHE is None or _CACHE.directory != Path(config.HTTP_CACHE_DIR):
+            _CACHE = HttpCache(Path(config.HTTP_CACHE_DIR), int(config.HTTP_CACHE_MB * 1024 * 1024))
+        return _CACHE
+
+
+def _read_capped(response: requests.Response, max_bytes: int) -> Tuple[bytes, bool]:
+    parts, size = [], 0
+    for chunk in response.iter_content(READ_CHUNK):
+        parts.append(chunk)
+        size += len(chunk)
+        if size > max_bytes:
+            return b"".join(parts)[:max_bytes], True
+    return b"".join(parts), False
+
+
+def fetch(url: str, max_bytes: Optional[int] = None, timeout: float = 30, use_cache: bool = True) -> Fetched:
+    """GET url through the pooled session and the cache; raises requests.HTTPError for error statuses."""
+    max_bytes = config.WEB_MAX_BYTES if max_bytes is None else max_bytes
+    store = cache() if use_cache else None
+    entry = store.get(url) if store else None
+    if entry is not None and not entry["complete"] and entry["size"] < max_bytes:
+        entry = None  # cut shorter than this caller wants
+    if entry is not None and store.is_fresh(entry):
+        return Fetched(url, entry["status"], entry["headers"], store.body(entry, max_bytes), not entry["complete"] or entry["size"] > max_bytes, "hit")
+    conditional = {}
+    if entry is not None:
+        if entry["headers"].get("etag"):
+            conditional["If-None-Match"] = entry["headers"]["etag"]
+        if entry["headers"].get("last-modified"):
+            conditional["If-Modified-Since"] = entry["headers"]["last-modified"]
+    with session().get(url, headers=conditional, timeout=timeout, stream=True) as response:
+        headers = {name: response.headers[name] for name in KEPT_HEADERS if name in response.headers}
+        if response.status_code == 304 and entry is not None and conditional:
+            response.content  # drain the empty body so the connection goes back to the pool
+            entry["headers"] = {**entry["headers"], **headers}
+            entry["stored_at"], entry["age"] = time.time(), float(headers.get("age") or 0)
+            store.touch(url, entry)
+            body = store.body(entry, max_bytes)
+            return Fetched(url, entry["status"], entry["headers"], body, not entry["complete"] or entry["size"] > max_bytes, "revalidated")
+        response.raise_for_status()
+        body, truncated = _read_capped(response, max_bytes)
+    if store is not None and storable(response.status_code, headers):
+        store.put(url, response.status_code, headers, body, complete=not truncated)
+    return Fetched(url, response.status_code, headers, body, truncated, "miss" if store else "off")
+
+
+# ── text extraction ────────────────────────────────────────────────────
+
+_CHARSET = re.compile(rb"""<meta[^>]+charset=["']?([\w-]+)""", re.I)
+
+
+def charset(headers: Dict[str, str], head: bytes) -> str:
+    """Declared encoding: Content-Type charset, else an HTML <meta> in the first KiB, else UTF-8."""
+    match = re.search(r"charset=[\"']?([\w-]+)", headers.get("content-type", ""), re.I)
+    if match is None and "html" in headers.get("content-type", "html").lower():
+        meta = _CHARSET.search(head[:1024])
+        name = meta.group(1).decode("ascii") if meta else "utf-8"
+    else:
+        name = match.group(1) if match else "utf-8"
+    try:
+        return codecs.lookup(name).name
+    except LookupError:
+        return "utf-8"
+
+
+class _TextExtractor(HTMLParser):
+    SKIP = frozenset({"script", "style", "noscript", "template", "svg", "iframe", "object"})
+    BLOCKS = frozenset({
+        "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt", "figcaption", "footer",
+        "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main", "nav", "ol", "p", "pre",
+        "section", "table", "title", "tr", "ul",
+    })
+
+    def __init__(self, max_chars: int):
+        super().__init__(convert_charrefs=True)
+        self.max_chars = max_chars
+        self.parts: List[str] = []
+        self.chars = 0
+        self.skipping = 0
+        self.pending_space = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP:
+            self.skipping += 1
+        elif tag in self.BLOCKS:
+            self._newline()
+
+    def handle_startendtag(self, tag, attrs):
+        if tag in self.BLOCKS:
+            self._newline()
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP:
+            self.skipping = max(self.skipping - 1, 0)
+        elif tag in self.BLOCKS:
+            self._newline()
+
+    def _newline(self):
+        if self.parts and self.parts[-1] != "\n":
+            self.parts.append("\n")
+            self.chars += 1
+        self.pending_space = False
+
+    def handle_data(self, data):
+        if self.skipping or self.full:
+            return
+        words = data.split()
+        if not words:
+            self.pending_space = self.pending_space or bool(data)
+            return
+        text = " ".join(words)
+        if (self.pending_space or data[:1].isspace()) and self.parts and self.parts[-1] != "\n":
+            text = " " + text
+        self.pending_space = data[-1:].isspace()
+        self.parts.append(text)
+        self.chars += len(text)
+
+    @property
+    def full(self) -> bool:
+        return self.chars >= self.max_chars
+
+    def text(self) -> str:
+        return "".join(self.parts).strip()
+
+
+def _pieces(body: bytes) -> Iterator[bytes]:
+    for start in range(0, len(body), PARSE_CHUNK):
+        yield body[start:start + PARSE_CHUNK]
+
+
+def extract_text(chunks: Iterable[bytes], encoding: str, max_chars: int, html: bool) -> Tuple[str, bool]:
+    """Readable text of a body in one pass, stopping once max_chars are produced; (text, cut short)."""
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    if not html:
+        parts, size = [], 0
+        for chunk in chunks:
+            piece = decoder.decode(chunk)
+            parts.append(piece)
+            size += len(piece)
+            if size > max_chars:
+                return "".join(parts)[:max_chars], True
+        text = "".join(parts) + decoder.decode(b"", final=True)
+        return text[:max_chars], len(text) > max_chars
+    parser = _TextExtractor(max_chars)
+    for chunk in chunks:
+        parser.feed(decoder.decode(chunk))
+        if parser.full:
+            break
+    else:
+        parser.feed(decoder.decode(b"", final=True))
+        parser.close()
+    text = parser.text()
+    return text[:max_chars], parser.full
+
+
+def html_to_text(body: bytes, headers: Dict[str, str], max_chars: int) -> Tuple[str, bool]:
+    html = "html" in headers.get("content-type", "").lower()
+    return extract_text(_pieces(body), charset(headers, body[:1024]), max_chars, html)
@@ -0,0 +1,105 @@
+"""Background jobs: run any tool without waiting, then poll, read or cancel it."""
+from __future__ import annotations
+
+import json
+
+from seven.runtime.jobs import elapsed_seconds, get_manager
+from seven.tools.registry import Tool
+
+
+def _summary(job: dict) -> dict:
+    out = {key: job.get(key) for key in ("id", "tool", "status", "progress", "created_at", "started_at", "finished_at")}
+    out["elapsed_seconds"] = elapsed_seconds(job)
+    return out
+
+
+def register(reg, memory=None, agent=None):
+    def jobs():
+        # Created on first use, so building the registry starts no threads.
+        if memory is None:
+            return None
+        manager = get_manager(reg, memory)
+        if agent is not None and hasattr(agent, "on_job_finished"):
+            manager.listeners["agent"] = agent.on_job_finished
+        return manager
+
+    def start_job(tool: str, arguments=None) -> str:
+        manager = jobs()
+        if manager is None:
+            return "ERROR: background jobs need a memory database"
+        if isinstance(arguments, str):
+            try:
+                arguments = json.loads(arguments or "{}")
+            except ValueError:
+                return "ERROR: arguments must be a JSON object"
+        if arguments is not None and not isinstance(arguments, dict):
+            return "ERROR: arguments must be a JSON object"
+        try:
+            job = manager.start(tool, arguments)
+        except ValueError as exc:
+            return f"ERROR: {exc}"
+        return f"OK started job #{job['id']} ({tool}); check it with job_status or job_output."
+
+    def job_status(job_id: int) -> str:
+        manager = jobs()
+        job = manager.status(job_id) if manager else None
+        if job is None:
+            return f"ERROR: job #{job_id} not found"
+        payload = _summary(job)
+        payload["result_preview"] = (job.get("result_preview") or "")[:500]
+        return json.dumps(payload, ensure_ascii=False, indent=2)
+
+    def job_output(job_id: int, max_chars: int = 4000) -> str:
+        manager = jobs()
+        job = manager.output(job_id, max(0, min(int(max_chars), 40000))) if manager else None
+        if job is None:
+            return f"ERROR: job #{job_id} not found"
+        parts = [f"job #{job['id']} {job['tool']} {job['status']}"]
+        if job["log"]:
+            parts.append("LOG (tail):\n" + job["log"])
+        if "result" in job:
+            parts.append("RESULT:\n" + job["result"])
+        return "\n".join(parts)
+
+    def job_cancel(job_id: int) -> str:
+        manager = jobs()
+        if manager is None:
+            return "ERROR: background jobs need a memory database"
+        try:
+            job = manager.cancel(job_id)
+        except KeyError:
+            return f"ERROR: job #{job_id} not found"
+        except PermissionError as exc:
+            return f"ERROR: {exc}"
+        if job["status"] == "running":
+            return f"OK cancel requested for job #{job_id}; its processes are being stopped."
+        return f"OK job #{job_id} is {job['status']}."
+
+    def list_jobs(status: str = "", limit: int = 20) -> str:
+        if jobs() is None:
+            return "ERROR: background jobs need a memory database"
+        rows = memory.list_jobs(status or None, limit)
+        if not rows:
+            return "No background jobs."
+        return "\n".join(f"[{job['id']}] {job['tool']} {job['status']} created {job['created_at']}" for job in rows)
+
+    reg.register(Tool("start_job", "Run a tool as a background job and return its job id at once. "
+                      "Use for long tools (coding agents, shell builds, model pulls, SSH).", {
+        "type": "object", "properties": {
+            "tool": {"type": "string", "description": "Name of the tool to run."},
+            "arguments": {"type": "object", "description": "Arguments for that tool."},
+        }, "required": ["tool"]}, start_job))
+    reg.register(Tool("job_status", "Status, progress and result preview of a background job.", {
+        "type": "object", "properties": {"job_id": {"type": "integer"}}, "required": ["job_id"]}, job_status))
+    reg.register(Tool("job_output", "Tail of a background job's streamed output, and its result once finished.", {
+        "type": "object", "properties": {
+            "job_id": {"type": "integer"},
+            "max_chars": {"type": "integer", "minimum": 0, "maximum": 40000},
+        }, "required": ["job_id"]}, job_output))
+    reg.register(Tool("job_cancel", "Cancel a queued or running background job and stop its processes.", {
+        "type": "object", "properties": {"job_id": {"type": "integer"}}, "required": ["job_id"]}, job_cancel))
+    reg.register(Tool("list_jobs", "List recent background jobs, newest first.", {
+        "type": "object", "properties": {
+            "status": {"type": "string", "enum": ["active", "queued", "running", "succeeded", "failed", "cancelled", "interrupted"]},
+            "limit": {"type": "integer", "minimum": 1, "maximum": 200},
+        }}, list_jobs))
@@ -7,6 +7,7 @@ from typing import Any
 import requests
 
 from seven import config
+from seven.runtime.progress import report_progress
 
 
 def _url(path: str) -> str:
@@ -82,6 +83,9 @@ def ollama_pull(model: str) -> str:
         )
         last: dict[str, Any] = {}
         updates = 0
+        # Per-layer byte counts; their sums keep reported progress monotonic across layers.
+        completed: dict[str, int] = {}
+        totals: dict[str, int] = {}
         for line in response.iter_lines(decode_unicode=True):
             if not line:
                 continue
@@ -89,6 +93,14 @@ def ollama_pull(model: str) -> str:
             updates += 1
             if last.get("error"):
                 return f"ERROR: {last['error']}"
+            digest = last.get("digest")
+            if digest and last.get("total"):
+                totals[digest] = int(last["total"])
+                completed[digest] = max(completed.get(digest, 0), int(last.get("completed") or 0))
+                report_progress(
+                    sum(completed.values()), sum(totals.values()),
+                    f"{model.strip()}: {last.get('status', 'pulling')}", unit="bytes",
+                )
         return json.dumps({"ok": True, "model": model.strip(), "updates": updates, "final": last}, indent=2)
     except (RuntimeError, ValueError, json.JSONDecodeError) as exc:
         return f"ERROR: {exc}"
@@ -2,29 +2,47 @@
 Tool registry — OpenAI/Ollama function-calling schemas + executors.
 L4: tools run for real. Every call is audited via Memory.
 Supports tiers: core (small models) vs full (all tools).
+Built-in schemas come from a cached manifest; a tool module is imported and
+its handlers bound on the first execution of one of its tools.
 """
 from __future__ import annotations
 
+import hashlib
+import importlib
+import json
 import logging
+import os
+import threading
+import time
 import traceback
-from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Set
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from seven.memory.store import Memory
+from seven import metrics
 from seven.tools.sanitize import sanitize_arguments
 
 logger = logging.getLogger("seven.tools")
 
+TOOL_SECONDS = metrics.histogram("seven_tool_seconds", "Tool execution latency by tool.", ("tool",))
+TOOL_ERRORS = metrics.counter("seven_tool_errors_total", "Tool calls that returned or raised an error.", ("tool",))
+
 # Tools always exposed in "core" tier — enough for desktop co-pilot on small LLMs
 CORE_TOOL_NAMES: Set[str] = {
     "run_shell",
     "read_file",
     "write_file",
+    "edit_file",
     "list_dir",
     "search_files",
+    "grep_files",
+    "find_indexed",
+    "workspace_changes_since",
     "run_python",
     "get_system_info",
     "web_search",
+    "web_search_many",
     "web_fetch",
     "browser_get",
     "open_url",
@@ -64,12 +82,72 @@ CORE_TOOL_NAMES: Set[str] = {
     "set_clipboard",
     "list_cameras",
     "capture_webcam",
+    "camera_session_stop",
     "analyze_image",
     "see_screen",
     "see_webcam",
     "check_presence",
 }
 
+# Concurrency classes for callers that run tools in parallel (MCP). Desktop
+# input shares one screen/keyboard and devices one serial link: both run one
+# call at a time. Heavy tools (subprocess agents, model pulls, browsers, vision)
+# are capped; read-only tools run in parallel. Anything unlisted is "default".
+# Extension tools may declare a class with a "concurrency:<class>" tag.
+TOOL_CONCURRENCY: Dict[str, Set[str]] = {
+    "read": {
+        "read_file", "list_dir", "search_files", "grep_files", "web_search", "web_search_many", "web_fetch",
+        "get_system_info", "search_memory", "list_tasks", "list_goals", "list_notes", "list_beliefs", "wm_show",
+        "list_skills", "skill_history", "semantic_search", "list_action_items", "screen_size",
+        "list_windows", "active_window", "list_cameras", "read_document", "document_status", "search_documents",
+        "ollama_status", "ollama_list", "ollama_show", "notification_status", "music_status",
+        "coding_agent_status", "robot_status", "robot_list_ports", "ssh_status", "extension_status",
+        "github_status", "github_repo", "github_contents", "github_commits", "github_issues",
+        "job_status", "job_output", "list_jobs", "find_indexed", "workspace_changes_since",
+    },
+    "heavy": {
+        "run_opencode", "run_claude_cli", "run_codex_cli", "run_aider", "run_python",
+        "ollama_pull", "ollama_load", "ollama_copy", "ollama_delete",
+        "browser_get", "browser_screenshot", "capture_webcam", "see_webcam", "see_screen",
+        "analyze_image", "check_presence", "ssh_run", "ssh_copy_to", "ssh_copy_from", "index_memory", "ingest_documents",
+    },
+    "desktop": {
+        "mouse_click", "mouse_move", "type_text", "hotkey", "screenshot", "focus_window", "open_url",
+        "get_clipboard", "set_clipboard", "notify_desktop",
+        "play_local_audio", "pause_local_audio", "resume_local_audio", "stop_local_audio",
+    },
+    "device": {"robot_connect", "robot_disconnect", "robot_action"},
+}
+_CONCURRENCY_OF = {name: cls for cls, names in TOOL_CONCURRENCY.items() for name in names}
+
+# Built-in tool modules (seven.tools.<name>) and the registry context keys
+# each module's register() accepts. Order is registration order.
+BUILTIN_TOOL_MODULES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("shell", ()),
+    ("files", ()),
+    ("screen", ()),
+    ("web", ()),
+    ("vision", ("brain",)),
+    ("code_run", ()),
+    ("system_info", ()),
+    ("notes_tasks", ("memory",)),
+    ("clipboard", ()),
+    ("coding_agent", ()),
+    ("robotics_bus", ()),
+    ("desktop_windows", ()),
+    ("browser", ()),
+    ("mind_tools", ("memory", "agent")),
+    ("ollama_manager", ()),
+    ("notifications", ()),
+    ("action_items", ("memory",)),
+    ("documents", ("memory",)),
+    ("music", ()),
+    ("ssh", ()),
+    ("github_reader", ()),
+    ("jobs", ("memory", "agent")),
+    ("workspace", ()),
+)
+
 # Extended sets (still in full tier)
 FULL_ONLY_HINT = (
     "delete_path", "move_path", "mouse_click", "mouse_move", "type_text", "hotkey",
@@ -85,10 +163,11 @@ class Tool:
     name: str
     description: str
     parameters: Dict[str, Any]
-    handler: Callable[..., str]
+    handler: Optional[Callable[..., str]]  # None = bound lazily from `module`
     enabled: bool = True
     tier: str = "full"  # "core" | "full" — core tools also set tier=core at register time
     tags: List[str] = field(default_factory=list)
+    module: str = ""  # built-in seven.tools module that owns the handler
 
 
 class ToolRegistry:
@@ -96,20 +175,78 @@ class ToolRegistry:
         self.memory = memory
         self.tier = (tier or "full").lower()
         self._tools: Dict[str, Tool] = {}
+        # memory / brain / agent handed to built-in register() calls
+        self.context: Dict[str, Any] = {"memory": memory}
+        self._loaded_modules: Set[str] = set()
+        self._binding: Optional[str] = None
+        self._load_lock = threading.RLock()
+        # Bumped whenever the exposed schema set can change; keys caller caches.
+        self.revision = 0
 
     def set_tier(self, tier: str):
         self.tier = (tier or "full").lower()
+        self.revision += 1
 
     def register(self, tool: Tool):
+        if self._binding:
+            tool.module = tool.module or self._binding
+            existing = self._tools.get(tool.name)
+            if existing is not None and existing.module == self._binding:
+                # Binding a manifest entry (or re-binding context): swap the handler in place.
+                existing.handler = tool.handler
+                return
         if tool.name in self._tools:
             raise ValueError(f"tool already registered: {tool.name}")
         # Auto-tag core membership
         if tool.name in CORE_TOOL_NAMES:
             tool.tier = "core"
         self._tools[tool.name] = tool
+        self.revision += 1
+
+    def load_module(self, module: str, force: bool = False):
+        """Import a built-in tool module and bind its handlers with the current context."""
+        with self._load_lock:
+            if module in self._loaded_modules and not force:
+                return
+            keys = dict(BUILTIN_TOOL_MODULES).get(module)
+            if keys is None:
+                raise KeyError(f"not a built-in tool module: {module}")
+            mod = importlib.import_module(f"seven.tools.{module}")
+            kwargs = {key: self.context.get(key) for key in keys}
+            self._binding = module
+            try:
+                mod.register(self, **kwargs)
+            finally:
+                self._binding = None
+            self._loaded_modules.add(module)
+
+    def bind_context(self, **context: Any):
+        """Late-bind agent context; modules already loaded are re-bound in place."""
+        with self._load_lock:
+            self.context.update(context)
+            for module, keys in BUILTIN_TOOL_MODULES:
+                if module in self._loaded_modules and set(keys) & set(context):
+                    self.load_module(module, force=True)
+
+    def _resolve(self, tool: Tool) -> Callable[..., str]:
+        if tool.handler is None and tool.module:
+            self.load_module(tool.module)
+        if tool.handler is None:
+            raise RuntimeError(f"tool '{tool.name}' has no handler")
+        return tool.handler
 
     def unregister(self, name: str) -> bool:
-        return self._tools.pop(name, None) is not None
+        removed = self._tools.pop(name, None) is not None
+        if removed:
+            self.revision += 1
+        return removed
+
+    def concurrency_class(self, name: str) -> str:
+        tool = self._tools.get(name)
+        for tag in tool.tags if tool else ():
+            if tag.startswith("concurrency:"):
+                return tag.split(":", 1)[1]
+        return _CONCURRENCY_OF.get(name, "default")
 
     def _is_active(self, tool: Tool) -> bool:
         if not tool.enabled:
@@ -147,6 +284,16 @@ class ToolRegistry:
         Tiers control schema exposure, not authority. A deliberately disabled tool,
         however, must never execute through the registry.
         """
+        started = time.perf_counter()
+        result = self._execute(name, arguments)
+        # Unknown names come from the model; fold them so labels stay bounded.
+        label = name if name in self._tools else "unknown"
+        TOOL_SECONDS.labels(label).observe(time.perf_counter() - started)
+        if result.startswith("ERROR"):
+            TOOL_ERRORS.labels(label).inc()
+        return result
+
+    def _execute(self, name: str, arguments: Optional[Dict[str, Any]]) -> str:
         arguments = arguments if isinstance(arguments, dict) else {}
         tool = self._tools.get(name)
         if not tool:
@@ -166,7 +313,8 @@ class ToolRegistry:
         kwargs = sanitize_arguments(arguments, properties=props, required=required)
 
         try:
-            result = tool.handler(**kwargs)
+            handler = self._resolve(tool)
+            result = handler(**kwargs)
             if result is None:
                 result = ""
             result = str(result)
@@ -180,7 +328,7 @@ class ToolRegistry:
             try:
                 loose = {k: v for k, v in arguments.items() if not _is_blank_loose(v)}
                 loose = sanitize_arguments(loose, properties=props, required=required)
-                result = str(tool.handler(**loose))
+                result = str(self._resolve(tool)(**loose))
                 if self.memory:
                     self.memory.audit(name, loose, result, ok=not str(result).startswith("ERROR"))
                 return result
@@ -205,44 +353,83 @@ def _is_blank_loose(value: Any) -> bool:
     return False
 
 
+def _manifest_fingerprint() -> str:
+    from seven import __version__
+    package = Path(__file__).resolve().parent
+    parts = [__version__]
+    for module, _ in BUILTIN_TOOL_MODULES:
+        try:
+            st = (package / f"{module}.py").stat()
+            parts.append(f"{module}:{st.st_size}:{st.st_mtime_ns}")
+        except OSError:
+            parts.append(f"{module}:missing")
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def _manifest_path() -> Path:
+    from seven import config
+    return Path(config.DATA_DIR) / "tool_manifest.json"
+
+
+def load_tool_manifest() -> Optional[Dict[str, List[Dict[str, Any]]]]:
+    """Cached built-in tool metadata, or None when missing/stale."""
+    try:
+        data = json.loads(_manifest_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if data.get("fingerprint") != _manifest_fingerprint():
+        return None
+    modules = data.get("modules") or {}
+    if set(modules) != {name for name, _ in BUILTIN_TOOL_MODULES}:
+        return None
+    return modules
+
+
+def write_tool_manifest(reg: ToolRegistry):
+    modules: Dict[str, List[Dict[str, Any]]] = {name: [] for name, _ in BUILTIN_TOOL_MODULES}
+    for tool in reg._tools.values():
+        if tool.module in modules:
+            spec = asdict(tool)
+            spec.pop("handler")
+            modules[tool.module].append(spec)
+    path = _manifest_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"fingerprint": _manifest_fingerprint(), "modules": modules}), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        logger.debug("tool manifest write failed", exc_info=True)
+
+
 def build_default_registry(
     memory: Memory,
     brain=None,
     tier: Optional[str] = None,
     agent=None,
 ) -> ToolRegistry:
-    """Wire all real tools; expose schemas per tier."""
+    """
+    Wire all real tools; expose schemas per tier.
+    With SEVEN_LAZY_TOOLS (default on) built-in schemas come from the cached
+    manifest and each tool module is imported on first use. `agent` may be
+    bound later with reg.bind_context(agent=...).
+    """
     from seven import config
-    from seven.tools import (
-        shell, files, screen, web, vision, code_run,
-        system_info, notes_tasks, clipboard, coding_agent, robotics_bus,
-        desktop_windows, browser, mind_tools, ollama_manager, notifications, action_items, documents, music, ssh, github_reader,
-    )
 
     use_tier = (tier or getattr(config, "TOOL_TIER", "full") or "full").lower()
     reg = ToolRegistry(memory=memory, tier=use_tier)
+    reg.context.update(brain=brain, agent=agent)
 
-    shell.register(reg)
-    files.register(reg)
-    screen.register(reg)
-    web.register(reg)
-    vision.register(reg, brain=brain)
-    code_run.register(reg)
-    system_info.register(reg)
-    notes_tasks.register(reg, memory=memory)
-    clipboard.register(reg)
-    coding_agent.register(reg)
-    robotics_bus.register(reg)
-    desktop_windows.register(reg)
-    browser.register(reg)
-    mind_tools.register(reg, memory=memory, agent=agent)
-    ollama_manager.register(reg)
-    notifications.register(reg)
-    action_items.register(reg, memory=memory)
-    documents.register(reg)
-    music.register(reg)
-    ssh.register(reg)
-    github_reader.register(reg)
+    manifest = load_tool_manifest() if getattr(config, "LAZY_TOOLS", True) else None
+    if manifest is not None:
+        for module, _ in BUILTIN_TOOL_MODULES:
+            for spec in manifest[module]:
+                reg.register(Tool(**{**spec, "handler": None}))
+    else:
+        for module, _ in BUILTIN_TOOL_MODULES:
+            reg.load_module(module)
+        if getattr(config, "LAZY_TOOLS", True):
+            write_tool_manifest(reg)
 
     if getattr(config, "ENABLE_EXTENSIONS", True):
         from seven.extensions.manager import ExtensionManager
@@ -55,6 +55,7 @@ def run_shell(command: str, cwd: Optional[str] = None, timeout: Optional[int] =
             timeout=timeout,
             env=env,
             encoding="utf-8",
+            stream=True,
         )
         out = completed.stdout or ""
         err = completed.stderr or ""
@@ -63,6 +64,11 @@ def run_shell(command: str, cwd: Optional[str] = None, timeout: Optional[int] =
             f"cwd={cwd}",
             f"shell={env.get('COMSPEC') or env.get('SHELL') or 'default'}",
         ]
+        if completed.truncated:
+            parts.append(
+                f"output_truncated=true stdout_bytes={completed.stdout_bytes} "
+                f"stderr_bytes={completed.stderr_bytes}"
+            )
         if out:
             parts.append("STDOUT:\n" + out)
         if err:
@@ -74,6 +80,8 @@ def run_shell(command: str, cwd: Optional[str] = None, timeout: Optional[int] =
                 f"ERROR: command timed out after {timeout}s; "
                 f"terminated_processes={list(completed.terminated_pids)}"
             )
+        if completed.cancelled:
+            parts.append(f"ERROR: command cancelled; terminated_processes={list(completed.terminated_pids)}")
         if completed.returncode != 0 and platform.system() == "Windows":
             if any(tok in command for tok in ("Get-", "Write-Host", "$", " | ")):
                 parts.append(
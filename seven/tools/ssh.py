@@ -9,6 +9,8 @@ from pathlib import Path
 from seven.runtime.process import run_tracked
 
 _TARGET = re.compile(r"^[A-Za-z0-9_.-]+$")
+# Output is streamed and bounded per pipe: the start and the (usually more useful) end.
+OUTPUT_CAPS = {"stream": True, "head_bytes": 10_000, "tail_bytes": 40_000}
 
 
 def _validate(name: str, value: str) -> str:
@@ -56,10 +58,13 @@ def _result(completed, timeout: int) -> dict:
         "ok": completed.returncode == 0 and not completed.timed_out,
         "exit_code": completed.returncode,
         "timed_out": completed.timed_out,
+        "cancelled": completed.cancelled,
         "terminated_pids": list(completed.terminated_pids),
-        "stdout": completed.stdout[:50_000],
-        "stderr": completed.stderr[:20_000],
-        "output_truncated": len(completed.stdout) > 50_000 or len(completed.stderr) > 20_000,
+        "stdout": completed.stdout,
+        "stderr": completed.stderr,
+        "output_truncated": completed.truncated,
+        "stdout_bytes": completed.stdout_bytes,
+        "stderr_bytes": completed.stderr_bytes,
         "timeout_seconds": timeout,
     }
 
@@ -74,7 +79,7 @@ def ssh_run(host: str, username: str, command: str, port: int = 22, identity_fil
             raise ValueError("command is required")
         timeout = max(1, min(int(timeout), 600))
         args = [executable, *_options(port, identity_file, known_hosts_file, timeout), f"{username}@{host}", command]
-        completed = run_tracked(args, timeout=timeout)
+        completed = run_tracked(args, timeout=timeout, **OUTPUT_CAPS)
         return json.dumps(_result(completed, timeout), ensure_ascii=False, indent=2)
     except (OSError, ValueError) as exc:
         return json.dumps({"ok": False, "state": "not_started", "error": str(exc)}, indent=2)
@@ -99,7 +104,7 @@ def _copy(direction: str, host: str, username: str, remote_path: str, local_path
         options[options.index("-p")] = "-P"
         remote = f"{username}@{host}:{remote_path}"
         args = [executable, "-s", *options, "--", str(local), remote] if direction == "to" else [executable, "-s", *options, "--", remote, str(local)]
-        completed = run_tracked(args, timeout=timeout)
+        completed = run_tracked(args, timeout=timeout, **OUTPUT_CAPS)
         result = _result(completed, timeout)
         result.update(direction=direction, local_path=str(local), remote_path=remote_path)
         if direction == "from" and result["ok"]:
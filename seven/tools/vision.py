@@ -1,6 +1,7 @@
 """
-Vision tools: webcam, screenshot, image analysis via Ollama vision model.
-VRAM-aware: images are downscaled before send; vision model keep_alive is short.
+Vision tools: webcam (optionally a held-open camera session), screenshot, image analysis via Ollama vision model.
+VRAM-aware: images are downscaled before send; vision model keep_alive is short;
+answers are reused for unchanged images (vision_cache.py) unless fresh=True.
 """
 from __future__ import annotations
 
@@ -9,10 +10,11 @@ import io
 import json
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 from seven import config
 from seven.tools.sanitize import is_blank
+from seven.tools.vision_cache import HASH_BITS, dhash, get_vision_cache
 
 logger = logging.getLogger("seven.vision")
 
@@ -30,6 +32,11 @@ def set_brain(brain):
 
 def _prepare_image_b64(path: str) -> str:
     """Load image, downscale if huge, return JPEG base64."""
+    return _prepare_image(path)[0]
+
+
+def _prepare_image(path: str) -> Tuple[str, Optional[int]]:
+    """JPEG base64 of the downscaled image and its dHash (None when PIL cannot read it)."""
     p = Path(path).expanduser()
     data = p.read_bytes()
     try:
@@ -46,10 +53,10 @@ def _prepare_image_b64(path: str) -> str:
             img = img.resize((max(1, int(w * scale)), max(1, int(h * scale))))
         buf = io.BytesIO()
         img.save(buf, format="JPEG", quality=JPEG_QUALITY, optimize=True)
-        return base64.b64encode(buf.getvalue()).decode("ascii")
+        return base64.b64encode(buf.getvalue()).decode("ascii"), dhash(img)
     except Exception as e:
         logger.warning("PIL resize failed (%s); sending raw bytes", e)
-        return base64.b64encode(data).decode("ascii")
+        return base64.b64encode(data).decode("ascii"), None
 
 
 def capture_webcam(
@@ -70,6 +77,49 @@ def capture_webcam(
     return msg
 
 
+def camera_session_start(camera_index: Optional[int] = None, seconds: Optional[float] = None) -> str:
+    """Backs the /camera on command. Deliberately not a tool: only a user turns the camera on."""
+    from seven.sensors.camera_session import start_session
+    if is_blank(camera_index):
+        camera_index = None
+    if is_blank(seconds):
+        seconds = None
+    try:
+        session = start_session(camera_index=camera_index, seconds=seconds)
+    except ImportError:
+        return "ERROR: opencv-python not installed"
+    except (RuntimeError, TypeError, ValueError) as e:
+        return f"ERROR: {e}"
+    latest = session.latest()
+    status = session.status()
+    if latest is None:
+        return f"ERROR: camera {session.index} opened but returned no frames. {status['error']}".rstrip()
+    return (
+        f"Camera {session.index} session started ({status['width']}x{status['height']}) for "
+        f"{session.ttl:.0f}s; webcam tools now reuse its latest frame. /camera off releases it."
+    )
+
+
+def camera_session_stop() -> str:
+    from seven.sensors.camera_session import stop_session
+    session = stop_session()
+    if session is None:
+        return "No camera session running."
+    return f"Camera {session.index} session stopped after {session.frames} frames; device released."
+
+
+def camera_session_status() -> str:
+    from seven.sensors.camera_session import active_session
+    session = active_session()
+    if session is None:
+        return "No camera session running. /camera on [seconds] [index] starts one."
+    status = session.status()
+    return (
+        f"Camera {status['index']} session: {status['width']}x{status['height']}, "
+        f"{status['frames']} frames, {status['seconds_left']:.0f}s left."
+    )
+
+
 def list_cameras() -> str:
     from seven.sensors.camera import list_cameras as _list
     cams = _list()
@@ -78,7 +128,7 @@ def list_cameras() -> str:
     return json.dumps(cams, indent=2)
 
 
-def analyze_image(path: str, prompt: Optional[str] = None) -> str:
+def analyze_image(path: str, prompt: Optional[str] = None, fresh: bool = False) -> str:
     if _brain is None:
         return "ERROR: vision brain not wired"
     if is_blank(path):
@@ -89,7 +139,20 @@ def analyze_image(path: str, prompt: Optional[str] = None) -> str:
     if is_blank(prompt):
         prompt = "Describe what you see in detail. Note text, UI, people, and anything actionable."
     try:
-        b64 = _prepare_image_b64(str(p))
+        b64, bits = _prepare_image(str(p))
+        cache = get_vision_cache()
+        model = str(getattr(_brain, "vision_model", "") or config.OLLAMA_VISION_MODEL)
+        if bits is not None and not fresh:
+            cached = cache.lookup(bits, str(prompt), model)
+            if cached is not None:
+                logger.info(
+                    "vision cache hit for %s (%d/%d bits, %.0fs old): skipped %s call and its VRAM swap",
+                    p.name, cached.distance, HASH_BITS, cached.age, model,
+                )
+                return (
+                    f"[cached vision answer: image within {cached.distance} bits of one seen "
+                    f"{cached.age:.0f}s ago; fresh=true to re-run]\n{cached.answer}"
+                )
         result = _brain.vision(
             str(prompt),
             b64,
@@ -103,6 +166,8 @@ def analyze_image(path: str, prompt: Optional[str] = None) -> str:
                 "(empty vision response) — is Ollama vision model available? "
                 f"Try: ollama pull {config.OLLAMA_VISION_MODEL}  |  see docs/VISION.md"
             )
+        if bits is not None:
+            cache.store(bits, str(prompt), model, result)
         return result
     except Exception as e:
         return (
@@ -111,7 +176,7 @@ def analyze_image(path: str, prompt: Optional[str] = None) -> str:
         )
 
 
-def see_screen(prompt: Optional[str] = None) -> str:
+def see_screen(prompt: Optional[str] = None, fresh: bool = False) -> str:
     """Screenshot + vision model analysis."""
     if is_blank(prompt):
         prompt = (
@@ -134,10 +199,10 @@ def see_screen(prompt: Optional[str] = None) -> str:
     except Exception as e:
         return f"ERROR capturing screen: {e}"
     header = f"[screenshot saved {path}]\n"
-    return header + analyze_image(str(path), str(prompt))
+    return header + analyze_image(str(path), str(prompt), fresh=bool(fresh))
 
 
-def see_webcam(prompt: Optional[str] = None, camera_index: Optional[int] = None) -> str:
+def see_webcam(prompt: Optional[str] = None, camera_index: Optional[int] = None, fresh: bool = False) -> str:
     """Capture webcam then analyze with vision model."""
     if is_blank(prompt):
         prompt = "Describe the camera view. Is a person present? What is in the scene?"
@@ -145,7 +210,7 @@ def see_webcam(prompt: Optional[str] = None, camera_index: Optional[int] = None)
     cap = capture_webcam(path=path, camera_index=camera_index)
     if cap.startswith("ERROR"):
         return cap
-    return cap + "\n" + analyze_image(path, str(prompt))
+    return cap + "\n" + analyze_image(path, str(prompt), fresh=bool(fresh))
 
 
 def check_presence(camera_index: Optional[int] = None) -> str:
@@ -187,6 +252,14 @@ def register(reg, brain=None):
         handler=capture_webcam,
         tier="core",
     ))
+    reg.register(Tool(
+        name="camera_session_stop",
+        # No start tool: the session begins only from the user's /camera on command.
+        description="Stop the webcam session the user started with /camera on and release the camera.",
+        parameters={"type": "object", "properties": {}},
+        handler=lambda: camera_session_stop(),
+        tier="core",
+    ))
     reg.register(Tool(
         name="analyze_image",
         description=(
@@ -198,6 +271,7 @@ def register(reg, brain=None):
             "properties": {
                 "path": {"type": "string"},
                 "prompt": {"type": "string"},
+                "fresh": {"type": "boolean", "description": "skip the answer cached for a near-identical image"},
             },
             "required": ["path"],
         },
@@ -214,6 +288,7 @@ def register(reg, brain=None):
             "type": "object",
             "properties": {
                 "prompt": {"type": "string"},
+                "fresh": {"type": "boolean", "description": "skip the answer cached for a near-identical image"},
             },
         },
         handler=see_screen,
@@ -227,6 +302,7 @@ def register(reg, brain=None):
             "properties": {
                 "prompt": {"type": "string"},
                 "camera_index": {"type": "integer"},
+                "fresh": {"type": "boolean", "description": "skip the answer cached for a near-identical image"},
             },
         },
         handler=see_webcam,
@@ -0,0 +1,126 @@
+"""
+Vision answers reused for images that have not visibly changed.
+
+Each image sent to the vision model gets a 256-bit difference hash (dHash:
+16x17 grayscale thumbnail, one bit per horizontally adjacent pair). An answer
+is cached under the prompt and vision model; a later image whose hash is
+within SEVEN_VISION_CACHE_DISTANCE bits of a cached one, asked the same
+question within SEVEN_VISION_CACHE_SECONDS, gets the cached answer without a
+model call, which on 8 GB cards also means no swap of the text model out of
+VRAM. dHash ignores small details by design (a changed label or a moved
+cursor is about one bit), so callers that need the exact current pixels pass
+fresh=True. SEVEN_VISION_CACHE_SECONDS=0 turns the cache off.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from seven import config, metrics
+
+logger = logging.getLogger("seven.vision_cache")
+
+HASH_SIZE = 16
+HASH_BITS = HASH_SIZE * HASH_SIZE
+# Cached images per (prompt, model); older ones are dropped first.
+PER_PROMPT = 32
+
+VISION_CACHE = metrics.counter(
+    "seven_vision_cache_total", "Vision calls answered from the cache (hit) or sent to the model (miss).", ("result",)
+)
+
+
+def dhash(image, size: int = HASH_SIZE) -> int:
+    """Difference hash of a PIL image as a size*size-bit integer."""
+    from PIL import Image
+
+    gray = image.convert("L").resize((size + 1, size), Image.BILINEAR)
+    pixels = np.asarray(gray, dtype=np.int16)
+    bits = (pixels[:, 1:] > pixels[:, :-1]).ravel()
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+class _Entry(NamedTuple):
+    bits: int
+    answer: str
+    at: float
+
+
+class CachedAnswer(NamedTuple):
+    answer: str
+    distance: int
+    age: float
+
+
+class VisionCache:
+    def __init__(self, max_distance: int, ttl: float, max_prompts: int = 256):
+        self.max_distance = max_distance
+        self.ttl = ttl
+        self.max_prompts = max_prompts
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, str], List[_Entry]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_distance >= 0
+
+    @staticmethod
+    def _key(prompt: str, model: str) -> Tuple[str, str]:
+        return " ".join(prompt.split()).lower(), model
+
+    def lookup(self, bits: int, prompt: str, model: str) -> Optional[CachedAnswer]:
+        """The answer cached for the nearest image within max_distance, if any."""
+        if not self.enabled:
+            return None
+        key, now = self._key(prompt, model), time.monotonic()
+        with self._lock:
+            entries = [e for e in self._entries.get(key, ()) if now - e.at < self.ttl]
+            best = min(entries, key=lambda e: hamming(bits, e.bits), default=None)
+            if best is not None and hamming(bits, best.bits) <= self.max_distance:
+                self._entries[key] = entries
+                self._entries.move_to_end(key)
+                self.hits += 1
+                VISION_CACHE.labels("hit").inc()
+                return CachedAnswer(best.answer, hamming(bits, best.bits), now - best.at)
+            self.misses += 1
+            VISION_CACHE.labels("miss").inc()
+            return None
+
+    def store(self, bits: int, prompt: str, model: str, answer: str) -> None:
+        if not self.enabled:
+            return
+        key = self._key(prompt, model)
+        with self._lock:
+            entries = [e for e in self._entries.get(key, ()) if hamming(bits, e.bits) > self.max_distance]
+            entries.append(_Entry(bits, answer, time.monotonic()))
+            self._entries[key] = entries[-PER_PROMPT:]
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_prompts:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_CACHE: Optional[VisionCache] = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_vision_cache() -> VisionCache:
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            _CACHE = VisionCache(config.VISION_CACHE_DISTANCE, config.VISION_CACHE_SECONDS)
+        return _CACHE
@@ -1,42 +1,78 @@
-"""Web search and fetch — real HTTP."""
+"""Web search and fetch — real HTTP through the pooled, cached client in http_client."""
 from __future__ import annotations
 
+import html as html_lib
 import re
-from typing import Optional
-from urllib.parse import quote_plus
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Union
+from urllib.parse import parse_qs, quote_plus, urlsplit
 
-import requests
+from seven import config
+from seven.tools.http_client import fetch, html_to_text
+
+SEARCH_URL = "https://html.duckduckgo.com/html/?q={query}"
+MAX_QUERIES = 8
+# Reciprocal rank fusion constant: a result's score is the sum of 1 / (RRF_K + rank) over the queries returning it.
+RRF_K = 60
+TRACKING_PARAMS = re.compile(r"^(utm_\w+|fbclid|gclid|msclkid|mc_cid|mc_eid|ref_src)$", re.I)
+
+_RESULT = re.compile(r'<a\b([^>]*class="result__a"[^>]*)>(.*?)</a>', re.I | re.S)
+_SNIPPET = re.compile(r'class="result__snippet"[^>]*>(.*?)</(?:a|div|td)>', re.I | re.S)
+
+
+class SearchResult(NamedTuple):
+    title: str
+    url: str
+    snippet: str
+
+
+def _clean(fragment: str) -> str:
+    return re.sub(r"\s+", " ", html_lib.unescape(re.sub(r"<.*?>", "", fragment))).strip()
+
+
+def parse_results(html: str) -> List[SearchResult]:
+    """Results of a DuckDuckGo HTML page in page order; redirect links are unwrapped."""
+    anchors = list(_RESULT.finditer(html))
+    results = []
+    for index, match in enumerate(anchors):
+        href = re.search(r'href="([^"]*)"', match.group(1))
+        if href is None:
+            continue
+        url = html_lib.unescape(href.group(1))
+        if "uddg=" in url:
+            url = parse_qs(urlsplit(url).query).get("uddg", [""])[0]
+        end = anchors[index + 1].start() if index + 1 < len(anchors) else len(html)
+        snippet = _SNIPPET.search(html, match.end(), end)
+        results.append(SearchResult(_clean(match.group(2)), url, _clean(snippet.group(1)) if snippet else ""))
+    return results
+
+
+def search(query: str) -> List[SearchResult]:
+    result = fetch(SEARCH_URL.format(query=quote_plus(query)), timeout=20)
+    return parse_results(result.body.decode("utf-8", errors="replace"))
+
+
+def canonical_url(url: str) -> str:
+    """The dedupe key of url: no scheme, www., fragment, tracking parameters or trailing slash."""
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower()
+    host = host[4:] if host.startswith("www.") else host
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+    query = "&".join(
+        pair for pair in parts.query.split("&") if pair and not TRACKING_PARAMS.match(pair.split("=", 1)[0])
+    )
+    # Joined by hand: urlunsplit adds "//" only when there is a host, so slicing it off cut relative paths.
+    return f"{host}{parts.path.rstrip('/') or '/'}" + (f"?{query}" if query else "")
 
 
 def web_search(query: str, max_results: int = 5) -> str:
     """Search via DuckDuckGo HTML (no API key)."""
     max_results = max(1, min(int(max_results), 10))
     try:
-        url = f"https://html.duckduckgo.com/html/?q={quote_plus(query)}"
-        r = requests.get(
-            url,
-            timeout=20,
-            headers={"User-Agent": "SevenAI/4.0 (+local-agent)"},
-        )
-        r.raise_for_status()
-        html = r.text
-        # crude parse of result links
-        links = re.findall(
-            r'uddg=([^&"]+).*?class="result__a"[^>]*>(.*?)</a>',
-            html,
-            flags=re.I | re.S,
-        )
-        if not links:
-            # alternate pattern
-            titles = re.findall(r'class="result__a"[^>]*href="([^"]+)"[^>]*>(.*?)</a>', html, flags=re.I | re.S)
-            links = [(h, t) for h, t in titles]
-        from urllib.parse import unquote
         lines = [f"Search results for: {query}"]
         seen = set()
-        for href, title in links:
-            href = unquote(href)
-            title = re.sub(r"<.*?>", "", title).strip()
-            title = re.sub(r"\s+", " ", title)
+        for title, href, _ in search(query):
             if not href or href in seen:
                 continue
             seen.add(href)
@@ -50,25 +86,79 @@ def web_search(query: str, max_results: int = 5) -> str:
         return f"ERROR web_search: {e}"
 
 
+def web_search_many(
+    queries: Union[List[str], str],
+    max_results: int = 8,
+    per_query: int = 5,
+    prefetch: int = 0,
+    prefetch_chars: int = 400,
+) -> str:
+    """Run several queries at once, merge results by canonical URL and rank them by reciprocal rank fusion."""
+    if isinstance(queries, str):
+        queries = queries.splitlines()
+    queries = list(dict.fromkeys(q.strip() for q in queries if q and q.strip()))[:MAX_QUERIES]
+    if not queries:
+        return "ERROR web_search_many: no queries"
+    max_results = max(1, min(int(max_results), 20))
+    per_query = max(1, min(int(per_query), 10))
+    prefetch = max(0, min(int(prefetch), max_results))
+    with ThreadPoolExecutor(max(1, min(config.WEB_SEARCH_WORKERS, len(queries))), thread_name_prefix="seven-search") as pool:
+        futures = [pool.submit(search, query) for query in queries]
+        merged: Dict[str, dict] = {}
+        failures: List[str] = []
+        for number, (query, future) in enumerate(zip(queries, futures), start=1):
+            try:
+                results = future.result()
+            except Exception as e:
+                failures.append(f"query {number} failed: {e}")
+                continue
+            rank = 0
+            for title, url, snippet in results:
+                key = canonical_url(url) if url else ""
+                if not key or (key in merged and number in merged[key]["queries"]):
+                    continue
+                rank += 1
+                item = merged.setdefault(key, {"title": title, "url": url, "snippet": snippet, "score": 0.0, "queries": []})
+                item["score"] += 1.0 / (RRF_K + rank)
+                item["queries"].append(number)
+                item["snippet"] = item["snippet"] or snippet
+                if rank >= per_query:
+                    break
+        if not merged:
+            detail = "; ".join(failures) or "no parseable results"
+            return f"ERROR web_search_many: {detail}"
+        ranked = sorted(merged.values(), key=lambda item: -item["score"])[:max_results]
+        pages = [pool.submit(_page_text, item["url"], prefetch_chars) for item in ranked[:prefetch]]
+        for item, page in zip(ranked, pages):
+            item["page"] = page.result()
+    lines = [f"Search results for {len(queries)} queries ({len(merged)} unique URLs):"]
+    lines += [f"  q{number}: {query}" for number, query in enumerate(queries, start=1)]
+    lines += [f"  {failure}" for failure in failures]
+    for position, item in enumerate(ranked, start=1):
+        lines.append(f"{position}. {item['title']}\n   {item['url']}\n   [{','.join(f'q{n}' for n in item['queries'])}]")
+        text = item.get("page") or item["snippet"]
+        if text:
+            lines.append(f"   > {text}")
+    return "\n".join(lines)
+
+
+def _page_text(url: str, max_chars: int) -> str:
+    try:
+        result = fetch(url, timeout=20)
+        text, cut = html_to_text(result.body, result.headers, max(1, int(max_chars)))
+    except Exception as e:
+        return f"(prefetch failed: {e})"
+    text = re.sub(r"\s+", " ", text).strip()
+    return text + " ..." if cut or result.truncated else text
+
+
 def web_fetch(url: str, max_chars: int = 12000) -> str:
     try:
-        r = requests.get(
-            url,
-            timeout=30,
-            headers={"User-Agent": "SevenAI/4.0 (+local-agent)"},
-        )
-        r.raise_for_status()
-        ctype = r.headers.get("content-type", "")
-        text = r.text
-        if "html" in ctype.lower():
-            # strip tags roughly
-            text = re.sub(r"(?is)<script.*?>.*?</script>", " ", text)
-            text = re.sub(r"(?is)<style.*?>.*?</style>", " ", text)
-            text = re.sub(r"(?is)<[^>]+>", " ", text)
-            text = re.sub(r"\s+", " ", text).strip()
-        if len(text) > max_chars:
-            text = text[:max_chars] + "\n...[truncated]"
-        return f"url={url}\nstatus={r.status_code}\n\n{text}"
+        result = fetch(url, timeout=30)
+        text, cut = html_to_text(result.body, result.headers, max(1, int(max_chars)))
+        if cut or result.truncated:
+            text += "\n...[truncated]"
+        return f"url={url}\nstatus={result.status}\ncache={result.cache}\n\n{text}"
     except Exception as e:
         return f"ERROR web_fetch: {e}"
 
@@ -89,6 +179,25 @@ def register(reg):
         },
         handler=web_search,
     ))
+    reg.register(Tool(
+        name="web_search_many",
+        description=(
+            "Run several search queries in parallel (e.g. rephrasings of one question) and return one "
+            "deduplicated, ranked list. prefetch=K also fetches the top K pages and quotes their opening text."
+        ),
+        parameters={
+            "type": "object",
+            "properties": {
+                "queries": {"type": "array", "items": {"type": "string"}, "description": f"Up to {MAX_QUERIES} queries"},
+                "max_results": {"type": "integer", "description": "Merged results to return (default 8)"},
+                "per_query": {"type": "integer", "description": "Results taken from each query (default 5)"},
+                "prefetch": {"type": "integer", "description": "Top results to fetch (default 0)"},
+                "prefetch_chars": {"type": "integer", "description": "Text quoted per fetched page (default 400)"},
+            },
+            "required": ["queries"],
+        },
+        handler=web_search_many,
+    ))
     reg.register(Tool(
         name="web_fetch",
         description="Fetch a URL and return text content.",
@@ -0,0 +1,97 @@
+"""Workspace index tools: ranked file lookup and "what changed" without walking the tree."""
+from __future__ import annotations
+
+import time
+from datetime import datetime
+from pathlib import Path
+
+from seven.memory.file_index import get_index, iso
+from seven.tools.registry import Tool
+
+
+def _since_seconds(since: str) -> float:
+    """ISO timestamp or unix seconds -> unix seconds; empty means 24 hours ago."""
+    text = str(since or "").strip()
+    if not text:
+        return time.time() - 24 * 3600
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    moment = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    return moment.timestamp()
+
+
+def _header(index, refreshed: dict) -> str:
+    info = index.summary()
+    return (
+        f"root={info['root']} files={info['files']} scanned_at={info['scanned_at']} "
+        f"refresh={refreshed['mode']} ({refreshed['ms']} ms)"
+    )
+
+
+def _index(root: str):
+    if root and not Path(root).expanduser().is_dir():
+        raise NotADirectoryError(f"not a directory: {root}")
+    index = get_index(root or None)
+    return index, index.refresh()
+
+
+def find_indexed(query: str, limit: int = 20, root: str = "") -> str:
+    """Files whose path or first 4 KiB match every word of query, best first."""
+    try:
+        index, refreshed = _index(root)
+    except OSError as e:
+        return f"ERROR: {e}"
+    hits = index.find(query, max(1, min(int(limit), 200)))
+    if not hits:
+        return f"No indexed files match '{query}' under {index.root}"
+    lines = [_header(index, refreshed)]
+    for hit in hits:
+        snippet = " ".join((hit["snippet"] or "").split())
+        lines.append(f"{hit['path']} ({hit['size']} bytes)" + (f": {snippet}" if snippet else ""))
+    return "\n".join(lines)
+
+
+def workspace_changes_since(since: str = "", limit: int = 50, root: str = "") -> str:
+    """Files added, modified or deleted after since, newest first.
+
+    With no logged changes (a fresh index logs none) the answer is the index
+    summary and its most recently modified files, so callers still see what
+    the workspace holds.
+    """
+    try:
+        cutoff = _since_seconds(since)
+    except ValueError:
+        return f"ERROR: since must be an ISO timestamp or unix seconds, got {since!r}"
+    try:
+        index, refreshed = _index(root)
+    except OSError as e:
+        return f"ERROR: {e}"
+    limit = max(1, min(int(limit), 1000))
+    changes = index.changes_since(cutoff, limit)
+    if not changes:
+        lines = [_header(index, refreshed), f"No changes since {iso(cutoff)}. Most recently modified:"]
+        lines.extend(f"{row['path']} ({row['size']} bytes)  {iso(row['mtime_ns'] / 1e9)}" for row in index.recent(limit))
+        return "\n".join(lines)
+    lines = [_header(index, refreshed)]
+    lines.extend(f"{change['kind']:<8} {change['path']}  {iso(change['at'])}" for change in changes)
+    return "\n".join(lines)
+
+
+def register(reg):
+    root_schema = {"type": "string", "description": "Directory to index (default: the workspace)."}
+    reg.register(Tool("find_indexed", "Find workspace files by words in their path or opening text, ranked. "
+                      "Answers from a persistent index, so it stays fast on large trees.", {
+        "type": "object", "properties": {
+            "query": {"type": "string"},
+            "limit": {"type": "integer", "minimum": 1, "maximum": 200},
+            "root": root_schema,
+        }, "required": ["query"]}, find_indexed))
+    reg.register(Tool("workspace_changes_since", "List workspace files added, modified or deleted since a time "
+                      "(ISO timestamp or unix seconds; default the last 24 hours).", {
+        "type": "object", "properties": {
+            "since": {"type": "string"},
+            "limit": {"type": "integer", "minimum": 1, "maximum": 1000},
+            "root": root_schema,
+        }}, workspace_changes_since))
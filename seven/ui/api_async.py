@@ -0,0 +1,578 @@
+"""
+Asyncio front end for the loopback REST API.
+
+Same routes, token auth and limits as the threading server, but HTTP/1.1:
+connections are kept alive, pipelined requests are answered in order, and an
+idle connection or a waiting event stream costs a coroutine instead of a
+thread. Agent work runs on a small executor, one chat turn at a time.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+import logging
+import socket
+import threading
+import time
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Set
+from urllib.parse import urlparse
+
+from seven import config, metrics, __version__
+from seven.agent.loop import Seven
+from seven.ui.api_server import (
+    API_REJECTED,
+    JSON_TYPE,
+    LIVE_SERVERS,
+    ROUTES,
+    SECURITY_HEADERS,
+    APIRequestError,
+    Prepared,
+    SnapshotCache,
+    Streamed,
+    batch_summary,
+    content_length,
+    memory_body,
+    memory_query,
+    observe_request,
+    parse_batch,
+    parse_chat_message,
+    require_json,
+    snapshot_response,
+    status_body,
+    submit_batch,
+    token_matches,
+    tools_body,
+)
+
+logger = logging.getLogger("seven.api")
+
+MAX_HEAD_BYTES = 64 * 1024
+REASONS = {
+    200: "OK", 304: "Not Modified", 400: "Bad Request", 401: "Unauthorized", 404: "Not Found",
+    405: "Method Not Allowed", 411: "Length Required", 413: "Payload Too Large",
+    415: "Unsupported Media Type", 431: "Request Header Fields Too Large",
+    500: "Internal Server Error", 503: "Service Unavailable", 505: "HTTP Version Not Supported",
+}
+
+
+class Headers(dict):
+    """Lower-cased header map whose .get() is case-insensitive like http.client's."""
+
+    def get(self, name, default=None):
+        return super().get(name.lower(), default)
+
+
+class Request:
+    __slots__ = ("method", "target", "version", "headers", "body", "body_error")
+
+    def __init__(self, method: str, target: str, version: str, headers: Headers):
+        self.method = method
+        self.target = target
+        self.version = version
+        self.headers = headers
+        self.body: Optional[bytes] = None
+        # A rejected Content-Length leaves the body unread: answer, then close.
+        self.body_error: Optional[APIRequestError] = None
+
+    def keep_alive(self) -> bool:
+        connection = (self.headers.get("Connection") or "").lower()
+        if self.version == "HTTP/1.0":
+            return "keep-alive" in connection
+        return "close" not in connection
+
+
+class AsyncAPIServer:
+    """Drop-in for SevenAPIServer: same address/token/agent/shutdown surface."""
+
+    seven_backend = "asyncio"
+
+    def __init__(self, address, token: str, agent: Optional[Seven] = None):
+        self.seven_api_token = token
+        self.seven_agent = agent
+        self.seven_owns_agent = agent is None
+        self.seven_agent_lock = threading.RLock()
+        self.seven_thread: Optional[threading.Thread] = None
+        self.seven_active = 0
+        self.seven_connections = 0
+        self.seven_streams = 0
+        self.seven_shutdown_lock = threading.Lock()
+        self.seven_closed = False
+        # Bound synchronously so a port conflict raises here, as with the stdlib server.
+        # create_server sets SO_REUSEADDR on POSIX only, matching allow_reuse_address.
+        self.socket = socket.create_server(tuple(address), family=socket.AF_INET, backlog=1024)
+        self.server_address = self.socket.getsockname()
+        self.loop = asyncio.new_event_loop()
+        self.executor = ThreadPoolExecutor(
+            max_workers=max(1, config.API_ASYNC_WORKERS), thread_name_prefix="seven-api-worker"
+        )
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._stop = asyncio.Event()
+        self._turn_lock = asyncio.Lock()
+        self._inflight = 0
+        self._waiting = 0
+        self.seven_snapshots = SnapshotCache()
+        self.seven_batch_pool = ThreadPoolExecutor(max(1, config.API_BATCH_WORKERS), thread_name_prefix="seven-batch")
+        self._tasks: Set[asyncio.Task] = set()
+        self._writers: Set[asyncio.StreamWriter] = set()
+        self._finished = threading.Event()
+        LIVE_SERVERS.add(self)
+
+    def queue_depths(self) -> dict:
+        return {
+            "turns_waiting": self._waiting,
+            "streams": self.seven_streams,
+            "connections": self.seven_connections,
+            "executor": self.executor._work_queue.qsize(),
+            "batch": self.seven_batch_pool._work_queue.qsize(),
+        }
+
+    # ── lifecycle ──────────────────────────────────────────────────────
+
+    def get_agent(self) -> Seven:
+        with self.seven_agent_lock:
+            if self.seven_agent is None:
+                self.seven_agent = Seven()
+                self.seven_agent.start_heartbeat()
+            return self.seven_agent
+
+    def serve_forever(self):
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_until_complete(self._serve())
+        finally:
+            self._finish()
+
+    async def _serve(self):
+        self._server = await asyncio.start_server(self._connection, sock=self.socket, limit=MAX_HEAD_BYTES)
+        await self._stop.wait()
+        await self._shutdown()
+
+    async def _shutdown(self):
+        if self._server is not None:
+            self._server.close()
+        else:
+            self.socket.close()
+        deadline = self.loop.time() + 10
+        while self.seven_active and self.loop.time() < deadline:
+            await asyncio.sleep(0.05)
+        # Idle keep-alive readers see EOF and unwind; anything still busy is cancelled.
+        for writer in list(self._writers):
+            writer.close()
+        if self._tasks:
+            await asyncio.wait(set(self._tasks), timeout=2)
+
+    def _finish(self):
+        if self.loop.is_closed():
+            return
+        try:
+            if not self._stop.is_set():
+                self._stop.set()
+                self.loop.run_until_complete(self._shutdown())
+            pending = [t for t in asyncio.all_tasks(self.loop) if not t.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        finally:
+            self.loop.close()
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.seven_batch_pool.shutdown(wait=False, cancel_futures=True)
+            self._finished.set()
+
+    def shutdown_cleanly(self) -> None:
+        with self.seven_shutdown_lock:
+            if self.seven_closed:
+                return
+            self.seven_closed = True
+        LIVE_SERVERS.discard(self)
+        if self.loop.is_running():
+            self.loop.call_soon_threadsafe(self._stop.set)
+            self._finished.wait(15)
+        elif self.seven_thread and self.seven_thread.is_alive():
+            # Started but its loop has not begun running yet.
+            self.loop.call_soon_threadsafe(self._stop.set)
+        else:
+            self._finish()
+        if self.seven_thread and self.seven_thread.is_alive():
+            self.seven_thread.join(timeout=15)
+        active = self.seven_active
+        if self.seven_owns_agent and self.seven_agent is not None and not active:
+            self.seven_agent.shutdown()
+            self.seven_agent = None
+        elif active:
+            logger.error("API closed with %s active request(s); owned agent left intact", active)
+
+    # ── connections ────────────────────────────────────────────────────
+
+    async def _connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        task = asyncio.current_task()
+        self._tasks.add(task)
+        self._writers.add(writer)
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            try:
+                # Small pipelined responses must not wait on Nagle.
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except OSError:
+                pass
+        self.seven_connections += 1
+        try:
+            if self.seven_connections > max(1, config.API_MAX_CONNECTIONS):
+                API_REJECTED.labels("asyncio", "connections").inc()
+                await self._respond(writer, 503, {"error": "connection limit reached"}, keep_alive=False)
+                return
+            while not self._stop.is_set():
+                try:
+                    request = await asyncio.wait_for(
+                        self._read_request(reader), timeout=max(1.0, config.API_SOCKET_TIMEOUT)
+                    )
+                except APIRequestError as exc:
+                    await self._respond(writer, exc.status, {"error": str(exc)}, keep_alive=False)
+                    return
+                if request is None:
+                    return
+                self.seven_active += 1
+                try:
+                    keep_alive = await self._dispatch(request, reader, writer)
+                finally:
+                    self.seven_active -= 1
+                if not keep_alive:
+                    return
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError, OSError):
+            pass
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self.seven_connections -= 1
+            self._writers.discard(writer)
+            self._tasks.discard(task)
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Request]:
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError as exc:
+            if not exc.partial.strip():
+                return None  # clean close between requests
+            raise APIRequestError(400, "incomplete request head")
+        except asyncio.LimitOverrunError:
+            raise APIRequestError(431, "request head too large")
+        lines = head.decode("latin-1").split("\r\n")
+        parts = lines[0].split(" ")
+        if len(parts) != 3:
+            raise APIRequestError(400, "malformed request line")
+        method, target, version = parts
+        if version not in ("HTTP/1.0", "HTTP/1.1"):
+            raise APIRequestError(505, "HTTP version not supported")
+        headers = Headers()
+        for line in lines[1:]:
+            if not line:
+                continue
+            name, sep, value = line.partition(":")
+            if not sep or not name.strip():
+                raise APIRequestError(400, "malformed header")
+            headers[name.strip().lower()] = value.strip()
+        request = Request(method.upper(), target, version, headers)
+        if headers.get("Transfer-Encoding"):
+            request.body_error = APIRequestError(411, "Content-Length required")
+        elif headers.get("Content-Length") is not None:
+            try:
+                length = content_length(headers.get("Content-Length"))
+            except APIRequestError as exc:
+                request.body_error = exc
+            else:
+                try:
+                    request.body = await reader.readexactly(length)
+                except asyncio.IncompleteReadError:
+                    request.body_error = APIRequestError(400, "incomplete request body")
+        return request
+
+    async def _respond(self, writer: asyncio.StreamWriter, code: int, body, keep_alive: bool):
+        """body is a JSON-able dict, an already encoded Prepared, or Streamed."""
+        if isinstance(body, Streamed):
+            await self._respond_streamed(writer, code, body, keep_alive)
+            return
+        if not isinstance(body, Prepared):
+            body = Prepared(json.dumps(body, ensure_ascii=False).encode("utf-8"), JSON_TYPE)
+        data = body.data
+        headers = [("Server", f"SevenRealAPI/{__version__}"), ("Content-Type", body.content_type)]
+        if code != 304:
+            headers.append(("Content-Length", str(len(data))))
+        headers += [
+            *SECURITY_HEADERS,
+            *body.headers,
+            ("Connection", "keep-alive" if keep_alive else "close"),
+        ]
+        if code == 401:
+            headers.append(("WWW-Authenticate", 'Bearer realm="Seven"'))
+        writer.write(self._head(code, headers) + data)
+        await writer.drain()
+
+    async def _respond_streamed(self, writer: asyncio.StreamWriter, code: int, body: Streamed, keep_alive: bool):
+        """Chunked on a kept-alive connection, close-delimited otherwise; chunks are pulled on the executor."""
+        headers = [
+            ("Server", f"SevenRealAPI/{__version__}"),
+            ("Content-Type", body.content_type),
+            *SECURITY_HEADERS,
+            ("Transfer-Encoding", "chunked") if keep_alive else ("Connection", "close"),
+        ]
+        if keep_alive:
+            headers.append(("Connection", "keep-alive"))
+        writer.write(self._head(code, headers))
+        while True:
+            try:
+                chunk = await self._call(next, body.chunks, None)
+            except Exception:
+                logger.exception("API streamed response failed")
+                # Never finish the body: the client must see it truncated, not complete.
+                raise ConnectionResetError("streamed response failed")
+            if chunk is None:
+                break
+            if chunk:
+                writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk) if keep_alive else chunk)
+                await writer.drain()
+        if keep_alive:
+            writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    @staticmethod
+    def _head(code: int, headers) -> bytes:
+        lines = [f"HTTP/1.1 {code} {REASONS.get(code, '')}"]
+        lines.extend(f"{name}: {value}" for name, value in headers)
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+    async def _call(self, fn, *args, **kwargs) -> Any:
+        return await self.loop.run_in_executor(self.executor, functools.partial(fn, *args, **kwargs))
+
+    @asynccontextmanager
+    async def _agent_turn(self):
+        self._waiting += 1
+        try:
+            await self._turn_lock.acquire()
+        finally:
+            self._waiting -= 1
+        try:
+            yield
+        finally:
+            self._turn_lock.release()
+
+    # ── routes ─────────────────────────────────────────────────────────
+
+    async def _dispatch(self, request: Request, reader, writer) -> bool:
+        started = time.perf_counter()
+        keep_alive = request.keep_alive() and request.body_error is None and not self._stop.is_set()
+        path = urlparse(request.target).path
+        if request.method == "POST" and path in ("/chat/stream", "/chat/batch"):
+            # Streams are capped separately: a waiting stream holds no thread.
+            code, keep_alive = await self._post_stream(request, reader, writer, path)
+            observe_request("asyncio", path, code, started)
+            return keep_alive
+        if self._inflight >= max(1, config.API_MAX_CONCURRENT_REQUESTS):
+            API_REJECTED.labels("asyncio", "concurrency").inc()
+            code, body = 503, {"error": "request concurrency limit reached"}
+        else:
+            self._inflight += 1
+            try:
+                if request.method == "GET":
+                    code, body = await self._get(request, path)
+                elif request.method == "POST":
+                    code, body = await self._post(request, path)
+                else:
+                    code, body = 405, {"error": "method not allowed"}
+            finally:
+                self._inflight -= 1
+        if isinstance(body, Streamed) and request.version == "HTTP/1.0":
+            keep_alive = False  # no chunked encoding: the close ends the body
+        try:
+            await self._respond(writer, code, body, keep_alive)
+        finally:
+            observe_request("asyncio", path, code, started)
+        return keep_alive
+
+    async def _get(self, request: Request, path: str):
+        if path in ("/", "/health"):
+            return 200, {"ok": True, "service": "seven-real", "version": __version__}
+        if not token_matches(self.seven_api_token, request.headers):
+            return 401, {"error": "authentication required"}
+        if path == "/metrics":
+            return 200, Prepared(metrics.render().encode("utf-8"), metrics.CONTENT_TYPE)
+        try:
+            agent = await self._call(self.get_agent)
+        except Exception:
+            logger.exception("API agent initialization failed")
+            return 503, {"error": "agent unavailable"}
+        if path.startswith("/memory/"):
+            try:
+                kinds, params = memory_query(path, urlparse(request.target).query)
+                body = await self._call(memory_body, agent.memory, kinds, params, path == "/memory/search")
+            except APIRequestError as exc:
+                return exc.status, {"error": str(exc)}
+            except ValueError as exc:
+                return 400, {"error": str(exc)}
+            except Exception:
+                logger.exception("API memory query failed")
+                return 500, {"error": "memory query failed"}
+            return 200, body
+        if path not in ("/status", "/tools"):
+            return 404, {"error": "not found", "paths": ROUTES}
+        # Served from snapshots, never through handle(): probes don't queue behind chats.
+        build = status_body if path == "/status" else tools_body
+        try:
+            snapshot = await self._call(self.seven_snapshots.get, path, lambda: build(agent))
+        except Exception:
+            logger.exception("API %s failed", path)
+            return 500, {"error": "agent request failed"}
+        return snapshot_response(snapshot, request.headers)
+
+    def _chat_message(self, request: Request) -> str:
+        require_json(request.headers.get("Content-Type"))
+        if request.body_error is not None:
+            raise request.body_error
+        if request.body is None:
+            raise APIRequestError(411, "Content-Length required")
+        return parse_chat_message(request.body)
+
+    async def _post(self, request: Request, path: str):
+        if path != "/chat":
+            return 404, {"error": "not found"}
+        if not token_matches(self.seven_api_token, request.headers):
+            return 401, {"error": "authentication required"}
+        try:
+            message = self._chat_message(request)
+        except APIRequestError as exc:
+            return exc.status, {"error": str(exc)}
+        try:
+            agent = await self._call(self.get_agent)
+            async with self._agent_turn():
+                reply = await self._call(agent.handle, message)
+        except Exception:
+            logger.exception("API chat failed")
+            return 500, {"error": "agent request failed"}
+        return 200, {"reply": reply, "role": "assistant"}
+
+    async def _post_stream(self, request: Request, reader, writer, path: str):
+        """Returns (status, keep_alive); a successful stream always closes."""
+        keep_alive = request.keep_alive() and request.body_error is None
+        if not token_matches(self.seven_api_token, request.headers):
+            await self._respond(writer, 401, {"error": "authentication required"}, keep_alive)
+            return 401, keep_alive
+        try:
+            if path == "/chat/batch":
+                require_json(request.headers.get("Content-Type"))
+                if request.body_error is not None:
+                    raise request.body_error
+                if request.body is None:
+                    raise APIRequestError(411, "Content-Length required")
+                body = parse_batch(request.body)
+            else:
+                body = self._chat_message(request)
+        except APIRequestError as exc:
+            await self._respond(writer, exc.status, {"error": str(exc)}, keep_alive)
+            return exc.status, keep_alive
+        if self.seven_streams >= max(1, config.API_MAX_STREAMS):
+            API_REJECTED.labels("asyncio", "streams").inc()
+            await self._respond(writer, 503, {"error": "stream limit reached"}, keep_alive)
+            return 503, keep_alive
+        self.seven_streams += 1
+        try:
+            try:
+                agent = await self._call(self.get_agent)
+            except Exception:
+                logger.exception("API agent initialization failed")
+                await self._respond(writer, 500, {"error": "agent request failed"}, False)
+                return 500, False
+            if path == "/chat/batch":
+                await self._relay_stream(functools.partial(self._stream_batch, agent, body), "batch", reader, writer)
+            else:
+                await self._relay_stream(functools.partial(self._stream_turn, agent, body), "chat", reader, writer)
+        finally:
+            self.seven_streams -= 1
+        return 200, False
+
+    async def _relay_stream(self, produce, what: str, reader, writer):
+        """
+        produce(put, on_event, cancel) is a coroutine: put enqueues from the
+        loop, on_event from worker threads. Events go out as SSE frames.
+        """
+        headers = [
+            ("Server", f"SevenRealAPI/{__version__}"),
+            ("Content-Type", "text/event-stream; charset=utf-8"),
+            *SECURITY_HEADERS,
+            ("X-Accel-Buffering", "no"),
+            ("Connection", "close"),
+        ]
+        writer.write(self._head(200, headers))
+        events: asyncio.Queue = asyncio.Queue()
+        cancel = threading.Event()
+
+        def on_event(kind: str, data: Dict[str, Any]):
+            self.loop.call_soon_threadsafe(events.put_nowait, (kind, data))
+
+        turn = asyncio.ensure_future(self._produce(produce, what, on_event, cancel, events))
+        # The client sends nothing after the request; EOF means it went away.
+        gone = asyncio.ensure_future(reader.read(1))
+        heartbeat = max(0.05, config.API_SSE_HEARTBEAT_SECONDS)
+        seq = 0
+        try:
+            await writer.drain()
+            while True:
+                getter = asyncio.ensure_future(events.get())
+                done, _ = await asyncio.wait({getter, gone}, timeout=heartbeat, return_when=asyncio.FIRST_COMPLETED)
+                if gone in done and not gone.cancelled() and not gone.result():
+                    getter.cancel()
+                    raise ConnectionResetError("stream client closed")
+                if gone in done:
+                    gone = self.loop.create_future()  # pipelined bytes, not a close
+                if getter not in done:
+                    getter.cancel()
+                    writer.write(b": heartbeat\n\n")
+                    await writer.drain()
+                    continue
+                item = getter.result()
+                if item is None:
+                    break
+                seq += 1
+                kind, data = item
+                payload = json.dumps(data, ensure_ascii=False, default=str)
+                writer.write(f"id: {seq}\nevent: {kind}\ndata: {payload}\n\n".encode("utf-8"))
+                await writer.drain()
+        except (ConnectionError, OSError):
+            logger.info("stream client disconnected; cancelling turn")
+            cancel.set()
+        finally:
+            gone.cancel()
+            # Keep the agent turn lock until the turn reaches its next boundary.
+            await asyncio.shield(turn)
+
+    async def _produce(self, produce, what: str, on_event, cancel: threading.Event, events: asyncio.Queue):
+        try:
+            await produce(lambda kind, data: events.put_nowait((kind, data)), on_event, cancel)
+        except Exception:
+            logger.exception("API %s stream failed", what)
+            events.put_nowait(("error", {"error": "agent request failed"}))
+        finally:
+            events.put_nowait(None)
+
+    async def _stream_turn(self, agent, message: str, put, on_event, cancel: threading.Event):
+        async with self._agent_turn():
+            if cancel.is_set():
+                return
+            reply = await self._call(agent.handle, message, on_event=on_event, cancel=cancel)
+        put("final", {"reply": reply, "role": "assistant", "cancelled": cancel.is_set()})
+
+    async def _stream_batch(self, agent, items, put, on_event, cancel: threading.Event):
+        """Items run on the batch pool, not the API executor; results go out as they finish."""
+        started = time.perf_counter()
+        futures = [asyncio.wrap_future(f) for f in submit_batch(agent, items, self.seven_batch_pool, cancel)]
+        results = []
+        try:
+            for next_done in asyncio.as_completed(futures):
+                results.append(await next_done)
+                put("result", results[-1])
+        finally:
+            for future in futures:
+                future.cancel()
+        put("done", batch_summary(results, len(items), started))
@@ -1,19 +1,28 @@
 """Authenticated, loopback-only stdlib REST API for Seven."""
 from __future__ import annotations
 
+import gzip
+import hashlib
 import hmac
+import itertools
 import json
 import logging
 import os
+import queue
 import secrets
 import threading
 import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
-from typing import Optional
-from urllib.parse import urlparse
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
 
-from seven import config, __version__
+from seven import config, metrics, __version__
 from seven.agent.loop import Seven
+from seven.memory.store import PAGE_KINDS
 
 logger = logging.getLogger("seven.api")
 
@@ -64,8 +73,363 @@ class APIRequestError(ValueError):
         self.status = status
 
 
+# Shared by the threading and asyncio front ends so limits/auth cannot drift.
+SECURITY_HEADERS = (
+    ("Cache-Control", "no-store"),
+    ("X-Content-Type-Options", "nosniff"),
+    ("Referrer-Policy", "no-referrer"),
+)
+MEMORY_PATHS = ["/memory/" + kind for kind in PAGE_KINDS] + ["/memory/search"]
+ROUTES = ["/health", "/status", "/tools", "/metrics", *MEMORY_PATHS, "POST /chat", "POST /chat/stream", "POST /chat/batch"]
+_ROUTE_LABELS = {"/", "/health", "/status", "/tools", "/metrics", "/chat", "/chat/stream", "/chat/batch", *MEMORY_PATHS}
+
+# Every running front end, so scrape-time gauges can read their counters.
+LIVE_SERVERS: "weakref.WeakSet" = weakref.WeakSet()
+
+
+def _inflight():
+    out: dict = {}
+    for server in list(LIVE_SERVERS):
+        key = (server.seven_backend,)
+        out[key] = out.get(key, 0) + server.seven_active
+    return out
+
+
+def _queue_depths():
+    out: dict = {}
+    for server in list(LIVE_SERVERS):
+        for queue_name, depth in server.queue_depths().items():
+            key = (server.seven_backend, queue_name)
+            out[key] = out.get(key, 0) + depth
+    return out
+
+
+API_SECONDS = metrics.histogram("seven_api_request_seconds", "API request latency by backend and route.", ("backend", "route"))
+API_REQUESTS = metrics.counter("seven_api_requests_total", "API responses by backend, route and status.", ("backend", "route", "code"))
+API_REJECTED = metrics.counter("seven_api_rejected_total", "503 rejections by backend and limit hit.", ("backend", "reason"))
+BATCH_ITEMS = metrics.counter("seven_api_batch_items_total", "POST /chat/batch items by final status.", ("status",))
+metrics.gauge("seven_api_inflight", "Admitted API requests in progress.", ("backend",), source=_inflight)
+metrics.gauge(
+    "seven_api_queue_depth",
+    "Waiting API work: turns_waiting for the agent, open streams, connections, executor backlog.",
+    ("backend", "queue"),
+    source=_queue_depths,
+)
+
+
+JSON_TYPE = "application/json; charset=utf-8"
+GZIP_MIN_BYTES = 512
+
+
+@dataclass(frozen=True)
+class Prepared:
+    """An already-encoded response body with its own content headers."""
+
+    data: bytes
+    content_type: str
+    headers: Tuple[Tuple[str, str], ...] = ()
+
+
+@dataclass(frozen=True)
+class Streamed:
+    """A response body produced incrementally; length unknown until the end."""
+
+    chunks: Iterator[bytes]
+    content_type: str = JSON_TYPE
+
+
+class Snapshot:
+    """One serialized read-only response, its weak ETag and a lazily gzipped copy."""
+
+    def __init__(self, body: dict):
+        self.built = time.time()
+        # as_of changes every rebuild; the ETag covers only the content.
+        stable = json.dumps(body, sort_keys=True, ensure_ascii=False, default=str)
+        self.etag = 'W/"' + hashlib.sha256(stable.encode("utf-8")).hexdigest()[:32] + '"'
+        self.data = json.dumps({**body, "as_of": round(self.built, 3)}, ensure_ascii=False, default=str).encode("utf-8")
+        self._gzipped: Optional[bytes] = None
+
+    def gzipped(self) -> bytes:
+        if self._gzipped is None:
+            self._gzipped = gzip.compress(self.data, compresslevel=6)
+        return self._gzipped
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        if not if_none_match:
+            return False
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        mine = self.etag[2:]
+        return any(tag == "*" or (tag[2:] if tag.startswith("W/") else tag) == mine for tag in tags)
+
+
+class SnapshotCache:
+    """Per-route snapshots rebuilt at most every STATUS_SNAPSHOT_TTL seconds, one builder at a time."""
+
+    def __init__(self):
+        self._entries: Dict[str, Snapshot] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _fresh(self, key: str) -> Optional[Snapshot]:
+        entry = self._entries.get(key)
+        if entry is not None and time.time() - entry.built < config.STATUS_SNAPSHOT_TTL:
+            return entry
+        return None
+
+    def get(self, key: str, build: Callable[[], dict]) -> Snapshot:
+        entry = self._fresh(key)
+        if entry is not None:
+            return entry
+        with self._lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            # Concurrent pollers wait for one rebuild instead of each running it.
+            entry = self._fresh(key)
+            if entry is None:
+                entry = Snapshot(build())
+                self._entries[key] = entry
+            return entry
+
+
+def status_body(agent) -> dict:
+    """Read-only status; agents without status_snapshot fall back to handle()."""
+    snapshot = getattr(agent, "status_snapshot", None)
+    if snapshot is None:
+        return {"status": agent.handle("/status")}
+    snap = snapshot()
+    return {"status": agent.status_text(snap), "snapshot": snap}
+
+
+def tools_body(agent) -> dict:
+    listing = getattr(agent, "tools_listing", None)
+    return {"tools": listing() if listing else agent.handle("/tools"), "names": agent.tools.names()}
+
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    for item in (accept_encoding or "").split(","):
+        coding, _, params = item.strip().partition(";")
+        if coding.strip().lower() in ("gzip", "*"):
+            return params.replace(" ", "").lower() not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+def snapshot_response(snapshot: Snapshot, headers) -> Tuple[int, Prepared]:
+    """304 on a matching If-None-Match, otherwise the body, gzipped when accepted."""
+    extra = [("ETag", snapshot.etag), ("Vary", "Accept-Encoding")]
+    if snapshot.matches(headers.get("If-None-Match")):
+        return 304, Prepared(b"", JSON_TYPE, tuple(extra))
+    data = snapshot.data
+    if len(data) >= GZIP_MIN_BYTES and accepts_gzip(headers.get("Accept-Encoding")):
+        data = snapshot.gzipped()
+        extra.append(("Content-Encoding", "gzip"))
+    return 200, Prepared(data, JSON_TYPE, tuple(extra))
+
+
+_BOOLS = {"1": True, "true": True, "yes": True, "0": False, "false": False, "no": False}
+
+
+def memory_query(path: str, query: str) -> Tuple[List[str], Dict[str, Any]]:
+    """Validate a /memory/* request into (kinds, Memory.page kwargs)."""
+    kind = path[len("/memory/"):]
+    raw: Dict[str, str] = {}
+    for name, values in parse_qs(query, keep_blank_values=True).items():
+        if len(values) != 1:
+            raise APIRequestError(400, f"repeated parameter: {name}")
+        raw[name] = values[0].strip()
+    if kind == "search":
+        kinds = [k.strip() for k in raw.pop("kinds", "").split(",") if k.strip()] or list(PAGE_KINDS)
+        unknown = [k for k in kinds if k not in PAGE_KINDS]
+        if unknown:
+            raise APIRequestError(400, f"unknown kinds: {', '.join(unknown)}")
+        if not raw.get("q"):
+            raise APIRequestError(400, "q is required")
+        allowed: Tuple[str, ...] = ()
+    elif kind in PAGE_KINDS:
+        kinds, allowed = [kind], PAGE_KINDS[kind]["filters"]
+    else:
+        raise APIRequestError(404, "not found")
+    params: Dict[str, Any] = {}
+    try:
+        limit = int(raw.pop("limit", "") or config.API_PAGE_DEFAULT)
+        for name in ("before", "after"):
+            if raw.get(name):
+                params[name] = int(raw[name])
+            raw.pop(name, None)
+    except ValueError:
+        raise APIRequestError(400, "limit, before and after must be integers")
+    params["limit"] = max(1, min(limit, config.API_PAGE_MAX))
+    for name in ("since", "until", "q"):
+        if raw.get(name):
+            params[name] = raw[name]
+        raw.pop(name, None)
+    for name, value in raw.items():
+        if name not in allowed:
+            raise APIRequestError(400, f"unknown parameter: {name}")
+        if name == "ok":
+            if value.lower() not in _BOOLS:
+                raise APIRequestError(400, "ok must be true or false")
+            params[name] = _BOOLS[value.lower()]
+        else:
+            params[name] = value
+    return kinds, params
+
+
+def memory_body(memory, kinds: List[str], params: Dict[str, Any], search: bool = False) -> Streamed:
+    """
+    Open every page and read its first row before any byte is sent, so bad
+    filters become a 400 instead of a truncated 200; the rest streams.
+    """
+    pages = []
+    for kind in kinds:
+        rows = memory.page(kind, **params)
+        first = next(rows, None)
+        pages.append((kind, rows if first is None else itertools.chain([first], rows)))
+    return Streamed(_memory_json(pages, params["limit"], params.get("q"), search))
+
+
+def _memory_json(pages, limit: int, q: Optional[str], search: bool) -> Iterator[bytes]:
+    """{"kind", "limit", "items", "next"} per page; search nests pages under "results"."""
+    if search:
+        yield ('{"q": ' + json.dumps(q, ensure_ascii=False) + ', "results": {').encode("utf-8")
+    for n, (kind, rows) in enumerate(pages):
+        opening = (", " if n else "") + (f'"{kind}": {{' if search else "{") + f'"kind": "{kind}", "limit": {limit}, "items": ['
+        parts, count, last = [opening], 0, None
+        for row in rows:
+            parts.append((", " if count else "") + json.dumps(row, ensure_ascii=False, default=str))
+            count += 1
+            last = row["id"]
+            if len(parts) >= 100:
+                yield "".join(parts).encode("utf-8")
+                parts = []
+        # A full page may have more rows: pass next back as before= (or after=).
+        parts.append('], "next": ' + json.dumps(last if count >= limit else None) + "}")
+        yield "".join(parts).encode("utf-8")
+    if search:
+        yield b"}}"
+
+
+def observe_request(backend: str, path: str, status: int, started: float) -> None:
+    route = path if path in _ROUTE_LABELS else "other"
+    API_SECONDS.labels(backend, route).observe(time.perf_counter() - started)
+    API_REQUESTS.labels(backend, route, status).inc()
+
+
+def token_matches(expected: str, headers) -> bool:
+    """Constant-time check of a Bearer or X-Seven-Token header (headers has .get)."""
+    auth = headers.get("Authorization", "") or ""
+    supplied = auth[7:].strip() if auth.lower().startswith("bearer ") else ""
+    supplied = supplied or (headers.get("X-Seven-Token", "") or "").strip()
+    return bool(expected and supplied and hmac.compare_digest(expected, supplied))
+
+
+def content_length(raw_length: Optional[str]) -> int:
+    if raw_length is None:
+        raise APIRequestError(411, "Content-Length required")
+    try:
+        length = int(raw_length)
+    except ValueError:
+        raise APIRequestError(400, "invalid Content-Length")
+    if length <= 0:
+        raise APIRequestError(400, "non-empty JSON body required")
+    if length > max(1, config.API_MAX_BODY_BYTES):
+        raise APIRequestError(413, f"request body exceeds {config.API_MAX_BODY_BYTES} bytes")
+    return length
+
+
+def require_json(content_type: Optional[str]) -> None:
+    if (content_type or "").split(";", 1)[0].strip().lower() != "application/json":
+        raise APIRequestError(415, "Content-Type must be application/json")
+
+
+def _json_object(raw: bytes) -> dict:
+    try:
+        body = json.loads(raw.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        raise APIRequestError(400, "malformed UTF-8 JSON")
+    if not isinstance(body, dict):
+        raise APIRequestError(400, "JSON body must be an object")
+    return body
+
+
+def _checked_text(value, what: str) -> str:
+    if not isinstance(value, str) or not value.strip():
+        raise APIRequestError(400, f"{what} required")
+    value = value.strip()
+    if len(value) > max(1, config.API_MAX_MESSAGE_CHARS):
+        raise APIRequestError(413, f"{what} exceeds {config.API_MAX_MESSAGE_CHARS} characters")
+    return value
+
+
+def parse_chat_message(raw: bytes) -> str:
+    """Decode a complete chat body into its stripped, length-checked message."""
+    body = _json_object(raw)
+    return _checked_text(body.get("message") or body.get("text") or "", "message")
+
+
+def parse_batch(raw: bytes) -> List[Dict[str, Any]]:
+    """
+    {"items": [...], "system"?, "tools"?}; an item is a string or
+    {"message", "id"?, "system"?, "tools"?}. Top-level system/tools are defaults.
+    """
+    body = _json_object(raw)
+    items = body.get("items")
+    if not isinstance(items, list) or not items:
+        raise APIRequestError(400, "items must be a non-empty array")
+    if len(items) > max(1, config.API_BATCH_MAX_ITEMS):
+        raise APIRequestError(413, f"batch exceeds {config.API_BATCH_MAX_ITEMS} items")
+    default_system = body.get("system")
+    default_tools = body.get("tools", True)
+    parsed = []
+    for index, item in enumerate(items):
+        if isinstance(item, str):
+            item = {"message": item}
+        if not isinstance(item, dict):
+            raise APIRequestError(400, f"items[{index}] must be a string or object")
+        system = item.get("system", default_system)
+        tools = item.get("tools", default_tools)
+        if not isinstance(tools, bool):
+            raise APIRequestError(400, f"items[{index}].tools must be true or false")
+        item_id = item.get("id", index)
+        if not isinstance(item_id, (str, int)) or isinstance(item_id, bool):
+            raise APIRequestError(400, f"items[{index}].id must be a string or integer")
+        parsed.append({
+            "id": item_id,
+            "message": _checked_text(item.get("message") or item.get("text") or "", f"items[{index}].message"),
+            "system": _checked_text(system, f"items[{index}].system") if system is not None else None,
+            "tools": tools,
+        })
+    return parsed
+
+
+def batch_item(agent, index: int, item: Dict[str, Any], cancel: threading.Event) -> Dict[str, Any]:
+    """One batch item as an isolated turn; always returns its result event."""
+    if cancel.is_set():
+        result = {"status": "cancelled", "reply": "Cancelled.", "tools": [], "seconds": 0.0}
+    else:
+        try:
+            result = agent.run_ephemeral(item["message"], system=item["system"], use_tools=item["tools"], cancel=cancel)
+        except Exception:
+            logger.exception("API batch item %s failed", index)
+            result = {"status": "error", "reply": "item failed", "tools": [], "seconds": 0.0}
+    BATCH_ITEMS.labels(result["status"]).inc()
+    return {"index": index, "id": item["id"], **result}
+
+
+def submit_batch(agent, items: List[Dict[str, Any]], pool: ThreadPoolExecutor, cancel: threading.Event) -> List[Future]:
+    return [pool.submit(batch_item, agent, index, item, cancel) for index, item in enumerate(items)]
+
+
+def batch_summary(results: List[Dict[str, Any]], total: int, started: float) -> Dict[str, Any]:
+    counts = {"ok": 0, "error": 0, "cancelled": 0}
+    for result in results:
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+    counts["cancelled"] += total - len(results)
+    return {"items": total, **counts, "seconds": round(time.perf_counter() - started, 3)}
+
+
 class SevenAPIServer(ThreadingHTTPServer):
     daemon_threads = True
+    seven_backend = "threading"
     # Permit an immediate clean restart after accepted connections enter
     # TIME_WAIT; an actively listening instance still owns the port.
     allow_reuse_address = os.name != "nt"
@@ -81,7 +445,13 @@ class SevenAPIServer(ThreadingHTTPServer):
         self.seven_thread: threading.Thread | None = None
         self.seven_shutdown_lock = threading.Lock()
         self.seven_closed = False
+        self.seven_waiting = 0
+        self.seven_streams = 0
+        self.seven_snapshots = SnapshotCache()
+        # Threads start on first use; batch items never take the agent turn lock.
+        self.seven_batch_pool = ThreadPoolExecutor(max(1, config.API_BATCH_WORKERS), thread_name_prefix="seven-batch")
         super().__init__(address, handler)
+        LIVE_SERVERS.add(self)
 
     def get_request(self):
         request, address = super().get_request()
@@ -89,6 +459,9 @@ class SevenAPIServer(ThreadingHTTPServer):
         return request, address
 
     def get_agent(self) -> Seven:
+        # Fast path: the agent lock is also the turn lock, and read-only routes must not wait on it.
+        if self.seven_agent is not None:
+            return self.seven_agent
         with self.seven_agent_lock:
             if self.seven_agent is None:
                 self.seven_agent = Seven()
@@ -100,10 +473,12 @@ class SevenAPIServer(ThreadingHTTPServer):
             if self.seven_closed:
                 return
             self.seven_closed = True
+        LIVE_SERVERS.discard(self)
         if self.seven_thread and self.seven_thread.is_alive():
             self.shutdown()
             self.seven_thread.join(timeout=10)
         self.server_close()
+        self.seven_batch_pool.shutdown(wait=False, cancel_futures=True)
         deadline = time.monotonic() + 10
         with self.seven_active_condition:
             while self.seven_active and time.monotonic() < deadline:
@@ -128,6 +503,28 @@ class SevenAPIServer(ThreadingHTTPServer):
             self.seven_active_condition.notify_all()
         self.seven_slots.release()
 
+    @contextmanager
+    def agent_turn(self):
+        """Hold the agent lock for one turn, counting requests queued behind it."""
+        with self.seven_active_condition:
+            self.seven_waiting += 1
+        try:
+            self.seven_agent_lock.acquire()
+        finally:
+            with self.seven_active_condition:
+                self.seven_waiting -= 1
+        try:
+            yield
+        finally:
+            self.seven_agent_lock.release()
+
+    def queue_depths(self) -> dict:
+        return {
+            "turns_waiting": self.seven_waiting,
+            "streams": self.seven_streams,
+            "batch": self.seven_batch_pool._work_queue.qsize(),
+        }
+
 
 class SevenHandler(BaseHTTPRequestHandler):
     server_version = f"SevenRealAPI/{__version__}"
@@ -135,14 +532,21 @@ class SevenHandler(BaseHTTPRequestHandler):
     def log_message(self, fmt, *args):
         logger.info("%s - %s", self.address_string(), fmt % args)
 
+    def send_response(self, code, message=None):
+        self.seven_status = code
+        super().send_response(code, message)
+
     def _send(self, code: int, body: dict):
-        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self._send_prepared(code, Prepared(json.dumps(body, ensure_ascii=False).encode("utf-8"), JSON_TYPE))
+
+    def _send_prepared(self, code: int, body: Prepared):
+        data = body.data
         self.send_response(code)
-        self.send_header("Content-Type", "application/json; charset=utf-8")
-        self.send_header("Content-Length", str(len(data)))
-        self.send_header("Cache-Control", "no-store")
-        self.send_header("X-Content-Type-Options", "nosniff")
-        self.send_header("Referrer-Policy", "no-referrer")
+        self.send_header("Content-Type", body.content_type)
+        if code != 304:
+            self.send_header("Content-Length", str(len(data)))
+        for name, value in SECURITY_HEADERS + body.headers:
+            self.send_header(name, value)
         if code == 401:
             self.send_header("WWW-Authenticate", 'Bearer realm="Seven"')
         self.end_headers()
@@ -151,35 +555,15 @@ class SevenHandler(BaseHTTPRequestHandler):
         except (BrokenPipeError, ConnectionResetError, OSError):
             logger.info("client disconnected before API response completed")
 
-    def _read_json(self) -> dict:
-        raw_length = self.headers.get("Content-Length")
-        if raw_length is None:
-            raise APIRequestError(411, "Content-Length required")
-        try:
-            length = int(raw_length)
-        except ValueError:
-            raise APIRequestError(400, "invalid Content-Length")
-        if length <= 0:
-            raise APIRequestError(400, "non-empty JSON body required")
-        if length > max(1, config.API_MAX_BODY_BYTES):
-            raise APIRequestError(413, f"request body exceeds {config.API_MAX_BODY_BYTES} bytes")
+    def _read_body(self) -> bytes:
+        length = content_length(self.headers.get("Content-Length"))
         raw = self.rfile.read(length)
         if len(raw) != length:
             raise APIRequestError(400, "incomplete request body")
-        try:
-            body = json.loads(raw.decode("utf-8"))
-        except (UnicodeDecodeError, json.JSONDecodeError):
-            raise APIRequestError(400, "malformed UTF-8 JSON")
-        if not isinstance(body, dict):
-            raise APIRequestError(400, "JSON body must be an object")
-        return body
+        return raw
 
     def _authorized(self) -> bool:
-        expected = getattr(self.server, "seven_api_token", "")
-        auth = self.headers.get("Authorization", "")
-        supplied = auth[7:].strip() if auth.lower().startswith("bearer ") else ""
-        supplied = supplied or self.headers.get("X-Seven-Token", "").strip()
-        return bool(expected and supplied and hmac.compare_digest(expected, supplied))
+        return token_matches(getattr(self.server, "seven_api_token", ""), self.headers)
 
     def _require_auth(self) -> bool:
         if self._authorized():
@@ -187,14 +571,23 @@ class SevenHandler(BaseHTTPRequestHandler):
         self._send(401, {"error": "authentication required"})
         return False
 
-    def do_GET(self):
-        if not self.server.admit():
-            self._send(503, {"error": "request concurrency limit reached"})
-            return
+    def _serve_admitted(self, route):
+        started = time.perf_counter()
+        self.seven_status = 0
         try:
-            self._get()
+            if not self.server.admit():
+                API_REJECTED.labels("threading", "concurrency").inc()
+                self._send(503, {"error": "request concurrency limit reached"})
+                return
+            try:
+                route()
+            finally:
+                self.server.release_request()
         finally:
-            self.server.release_request()
+            observe_request("threading", urlparse(self.path).path, self.seven_status, started)
+
+    def do_GET(self):
+        self._serve_admitted(self._get)
 
     def _get(self):
         path = urlparse(self.path).path
@@ -203,62 +596,86 @@ class SevenHandler(BaseHTTPRequestHandler):
             return
         if not self._require_auth():
             return
+        if path == "/metrics":
+            self._send_prepared(200, Prepared(metrics.render().encode("utf-8"), metrics.CONTENT_TYPE))
+            return
         try:
             agent = self.server.get_agent()
         except Exception:
             logger.exception("API agent initialization failed")
             self._send(503, {"error": "agent unavailable"})
             return
-        if path == "/status":
+        if path.startswith("/memory/"):
+            self._send_memory(agent, path)
+        elif path in ("/status", "/tools"):
+            # Served from snapshots, never through handle(): probes don't queue behind chats.
+            build = status_body if path == "/status" else tools_body
             try:
-                self._send(200, {"status": agent.handle("/status")})
+                snapshot = self.server.seven_snapshots.get(path, lambda: build(agent))
             except Exception:
-                logger.exception("API status failed")
-                self._send(500, {"error": "agent request failed"})
-        elif path == "/tools":
-            try:
-                self._send(200, {"tools": agent.handle("/tools"), "names": agent.tools.names()})
-            except Exception:
-                logger.exception("API tools failed")
+                logger.exception("API %s failed", path)
                 self._send(500, {"error": "agent request failed"})
+                return
+            self._send_prepared(*snapshot_response(snapshot, self.headers))
         else:
-            self._send(404, {"error": "not found", "paths": ["/health", "/status", "/tools", "POST /chat"]})
+            self._send(404, {"error": "not found", "paths": ROUTES})
 
-    def do_POST(self):
-        if not self.server.admit():
-            self._send(503, {"error": "request concurrency limit reached"})
+    def _send_memory(self, agent, path: str):
+        try:
+            kinds, params = memory_query(path, urlparse(self.path).query)
+            body = memory_body(agent.memory, kinds, params, search=path == "/memory/search")
+        except APIRequestError as exc:
+            self._send(exc.status, {"error": str(exc)})
             return
+        except ValueError as exc:
+            self._send(400, {"error": str(exc)})
+            return
+        except Exception:
+            logger.exception("API memory query failed")
+            self._send(500, {"error": "memory query failed"})
+            return
+        self._send_streamed(200, body)
+
+    def _send_streamed(self, code: int, body: Streamed):
+        """HTTP/1.0: no Content-Length, the body ends when the connection closes."""
+        self.send_response(code)
+        self.send_header("Content-Type", body.content_type)
+        for name, value in SECURITY_HEADERS:
+            self.send_header(name, value)
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
         try:
-            self._post()
-        finally:
-            self.server.release_request()
+            for chunk in body.chunks:
+                self.wfile.write(chunk)
+        except (BrokenPipeError, ConnectionResetError, OSError):
+            logger.info("client disconnected before API response completed")
+        except Exception:
+            # Headers are gone; closing mid-body leaves the client a truncated document.
+            logger.exception("API streamed response failed")
+
+    def do_POST(self):
+        self._serve_admitted(self._post)
 
     def _post(self):
-        if urlparse(self.path).path != "/chat":
+        path = urlparse(self.path).path
+        if path not in ("/chat", "/chat/stream", "/chat/batch"):
             self._send(404, {"error": "not found"})
             return
         if not self._require_auth():
             return
-        content_type = self.headers.get("Content-Type", "").split(";", 1)[0].strip().lower()
-        if content_type != "application/json":
-            self._send(415, {"error": "Content-Type must be application/json"})
-            return
-        try:
-            body = self._read_json()
-        except APIRequestError as exc:
-            self._send(exc.status, {"error": str(exc)})
+        if path == "/chat/batch":
+            self._stream_batch()
             return
-        message = body.get("message") or body.get("text") or ""
-        if not isinstance(message, str) or not message.strip():
-            self._send(400, {"error": "message required"})
+        message = self._read_message()
+        if message is None:
             return
-        message = message.strip()
-        if len(message) > max(1, config.API_MAX_MESSAGE_CHARS):
-            self._send(413, {"error": f"message exceeds {config.API_MAX_MESSAGE_CHARS} characters"})
+        if path == "/chat/stream":
+            self._stream_chat(message)
             return
         try:
             agent = self.server.get_agent()
-            with self.server.seven_agent_lock:
+            with self.server.agent_turn():
                 reply = agent.handle(message)
         except Exception:
             logger.exception("API chat failed")
@@ -266,14 +683,118 @@ class SevenHandler(BaseHTTPRequestHandler):
             return
         self._send(200, {"reply": reply, "role": "assistant"})
 
-    def _method_not_allowed(self):
-        if not self.server.admit():
-            self._send(503, {"error": "request concurrency limit reached"})
+    def _read_message(self) -> Optional[str]:
+        """Validate a chat body; sends the error response and returns None on failure."""
+        try:
+            require_json(self.headers.get("Content-Type"))
+            return parse_chat_message(self._read_body())
+        except APIRequestError as exc:
+            self._send(exc.status, {"error": str(exc)})
+            return None
+
+    def _stream_chat(self, message: str):
+        """Run one turn on a worker thread and relay its events as Server-Sent Events."""
+        try:
+            agent = self.server.get_agent()
+        except Exception:
+            logger.exception("API agent initialization failed")
+            self._send(500, {"error": "agent request failed"})
+            return
+
+        def turn(emit, cancel: threading.Event):
+            with self.server.agent_turn():
+                reply = agent.handle(message, on_event=emit, cancel=cancel)
+            emit("final", {"reply": reply, "role": "assistant", "cancelled": cancel.is_set()})
+
+        self._stream_events(turn, "chat")
+
+    def _stream_batch(self):
+        """Fan isolated turns out on the batch pool; one result event per item as it finishes."""
+        try:
+            require_json(self.headers.get("Content-Type"))
+            items = parse_batch(self._read_body())
+        except APIRequestError as exc:
+            self._send(exc.status, {"error": str(exc)})
+            return
+        try:
+            agent = self.server.get_agent()
+        except Exception:
+            logger.exception("API agent initialization failed")
+            self._send(500, {"error": "agent request failed"})
             return
+
+        def batch(emit, cancel: threading.Event):
+            started = time.perf_counter()
+            futures = submit_batch(agent, items, self.server.seven_batch_pool, cancel)
+            results = []
+            try:
+                for future in as_completed(futures):
+                    results.append(future.result())
+                    emit("result", results[-1])
+            finally:
+                for future in futures:
+                    future.cancel()
+            emit("done", batch_summary(results, len(items), started))
+
+        self._stream_events(batch, "batch")
+
+    def _stream_events(self, produce, what: str):
+        """produce(emit, cancel) runs on a worker thread; its events go out as SSE frames."""
+        events: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        cancel = threading.Event()
+
+        def turn():
+            try:
+                produce(lambda kind, data: events.put((kind, data)), cancel)
+            except Exception:
+                logger.exception("API %s stream failed", what)
+                events.put(("error", {"error": "agent request failed"}))
+            finally:
+                events.put(None)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+        for name, value in SECURITY_HEADERS:
+            self.send_header(name, value)
+        self.send_header("X-Accel-Buffering", "no")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        worker = threading.Thread(target=turn, name="seven-api-stream", daemon=True)
+        worker.start()
+        heartbeat = max(0.05, config.API_SSE_HEARTBEAT_SECONDS)
+        seq = 0
+        with self.server.seven_active_condition:
+            self.server.seven_streams += 1
         try:
-            self._send(405, {"error": "method not allowed"})
+            while True:
+                try:
+                    item = events.get(timeout=heartbeat)
+                except queue.Empty:
+                    # Comment frame: keeps proxies/sockets alive and detects a gone client.
+                    self._write_event(": heartbeat\n\n")
+                    continue
+                if item is None:
+                    break
+                seq += 1
+                kind, data = item
+                payload = json.dumps(data, ensure_ascii=False, default=str)
+                self._write_event(f"id: {seq}\nevent: {kind}\ndata: {payload}\n\n")
+        except (BrokenPipeError, ConnectionResetError, OSError):
+            logger.info("stream client disconnected; cancelling turn")
+            cancel.set()
         finally:
-            self.server.release_request()
+            with self.server.seven_active_condition:
+                self.server.seven_streams -= 1
+        # The turn stops at its next token/tool boundary; keep the slot until it does.
+        worker.join()
+
+    def _write_event(self, frame: str):
+        self.wfile.write(frame.encode("utf-8"))
+        self.wfile.flush()
+
+    def _method_not_allowed(self):
+        self._serve_admitted(lambda: self._send(405, {"error": "method not allowed"}))
 
     do_PUT = _method_not_allowed
     do_PATCH = _method_not_allowed
@@ -281,14 +802,28 @@ class SevenHandler(BaseHTTPRequestHandler):
     do_OPTIONS = _method_not_allowed
 
 
-def start_api_server(host: Optional[str] = None, port: Optional[int] = None, background: bool = True, agent: Optional[Seven] = None) -> SevenAPIServer:
+def start_api_server(
+    host: Optional[str] = None,
+    port: Optional[int] = None,
+    background: bool = True,
+    agent: Optional[Seven] = None,
+    backend: Optional[str] = None,
+):
+    """Start the threading (default) or asyncio front end; both share one lifecycle surface."""
     host = host or config.API_HOST
     port = config.API_PORT if port is None else int(port)
+    backend = (backend or config.API_BACKEND).strip().lower()
     if host not in {"127.0.0.1", "localhost"}:
         raise ValueError("Seven API supports loopback binding only")
-    httpd = SevenAPIServer((host, port), SevenHandler, get_or_create_api_token(), agent=agent)
+    if backend == "asyncio":
+        from seven.ui.api_async import AsyncAPIServer
+        httpd = AsyncAPIServer((host, port), get_or_create_api_token(), agent=agent)
+    elif backend == "threading":
+        httpd = SevenAPIServer((host, port), SevenHandler, get_or_create_api_token(), agent=agent)
+    else:
+        raise ValueError(f"unknown API backend {backend!r}; use 'threading' or 'asyncio'")
     bound_host, bound_port = httpd.server_address[:2]
-    logger.info("API listening on http://%s:%s", bound_host, bound_port)
+    logger.info("API (%s) listening on http://%s:%s", backend, bound_host, bound_port)
     if background:
         thread = threading.Thread(target=httpd.serve_forever, name="seven-api", daemon=True)
         httpd.seven_thread = thread
@@ -305,6 +840,7 @@ def run_api_blocking() -> int:
     host, port = httpd.server_address[:2]
     print(f"Seven API http://{host}:{port}")
     print('POST /chat  {"message": "..."}')
+    print('POST /chat/stream  {"message": "..."}  (text/event-stream)')
     try:
         httpd.serve_forever()
     except KeyboardInterrupt:
@@ -13,9 +13,22 @@ import time
 
 from seven import config, __version__
 from seven.agent.loop import Seven
+from seven.runtime.progress import progress_scope
 
 logger = logging.getLogger("seven.talk")
 
+# One progress line per this many seconds keeps long pulls/agents readable.
+PROGRESS_PRINT_SECONDS = 2.0
+
+
+def _show_progress(update: dict) -> None:
+    """Print a long-running tool's progress while the turn is still working."""
+    done, total = update["progress"], update.get("total")
+    text = update.get("message") or f"{done:g} {update.get('unit', '')}".strip()
+    if total:
+        text += f" ({min(100.0, 100.0 * done / total):.0f}%)"
+    print(f"[{text}]")
+
 
 def run_talk(
     agent: Seven | None = None,
@@ -164,7 +177,8 @@ def run_talk(
 
             print(f"[{config.BOT_NAME}…]")
             try:
-                reply = agent.handle(user_text)
+                with progress_scope(_show_progress, PROGRESS_PRINT_SECONDS):
+                    reply = agent.handle(user_text)
             except Exception as e:
                 reply = f"I hit a snag: {e}"
                 logger.exception("talk handle failed")
@@ -0,0 +1,217 @@
+import http.client
+import json
+import re
+import socket
+import threading
+import time
+
+import pytest
+import requests
+
+from seven.ui import api_async, api_server
+
+
+class Tools:
+    def names(self): return ["proof_tool"]
+
+
+class FakeAgent:
+    def __init__(self, endless=False):
+        self.tools = Tools()
+        self.endless = endless
+        self.cancelled = threading.Event()
+        self.heartbeat = False
+        self.stopped = False
+        self.calls = 0
+
+    def start_heartbeat(self): self.heartbeat = True
+    def shutdown(self): self.stopped = True
+    def handle(self, message, on_event=None, cancel=None):
+        self.calls += 1
+        if on_event is not None:
+            on_event("round", {"round": 0})
+            while self.endless and not cancel.is_set():
+                on_event("token", {"delta": "x" * 512})
+                time.sleep(0.01)
+            if cancel.is_set():
+                self.cancelled.set()
+                return "Cancelled."
+            on_event("token", {"delta": "reply:" + message})
+        return "reply:" + message
+
+
+def _start(tmp_path, monkeypatch, agent=None):
+    monkeypatch.setattr(api_server.config, "DATA_DIR", tmp_path)
+    monkeypatch.delenv("SEVEN_API_TOKEN", raising=False)
+    server = api_server.start_api_server(port=0, agent=agent, backend="asyncio")
+    assert isinstance(server, api_async.AsyncAPIServer)
+    return server, server.server_address[1], server.seven_api_token
+
+
+def test_keep_alive_reuses_one_connection_for_many_requests(tmp_path, monkeypatch):
+    agent = FakeAgent()
+    server, port, token = _start(tmp_path, monkeypatch, agent)
+    headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+    try:
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=3)
+        conn.request("GET", "/health")
+        first = conn.getresponse()
+        assert first.status == 200 and json.loads(first.read())["ok"] is True
+        assert first.getheader("Connection") == "keep-alive"
+        assert first.getheader("Cache-Control") == "no-store"
+        local = conn.sock.getsockname()
+        for i in range(5):
+            conn.request("POST", "/chat", body=json.dumps({"message": f"m{i}"}), headers=headers)
+            response = conn.getresponse()
+            assert json.loads(response.read()) == {"reply": f"reply:m{i}", "role": "assistant"}
+        conn.request("GET", "/tools", headers=headers)
+        assert json.loads(conn.getresponse().read())["names"] == ["proof_tool"]
+        assert conn.sock.getsockname() == local  # never reconnected
+        conn.close()
+    finally:
+        server.shutdown_cleanly()
+    assert server.seven_thread.is_alive() is False
+    assert agent.stopped is False
+
+
+def test_pipelined_requests_are_answered_in_order(tmp_path, monkeypatch):
+    server, port, token = _start(tmp_path, monkeypatch, FakeAgent())
+    body = json.dumps({"message": "piped"}).encode()
+    raw = (
+        b"GET /health HTTP/1.1\r\nHost: x\r\n\r\n"
+        + b"POST /chat HTTP/1.1\r\nHost: x\r\nAuthorization: Bearer " + token.encode()
+        + b"\r\nContent-Type: application/json\r\nContent-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+        + b"GET /status HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n"
+    )
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=3) as sock:
+            sock.sendall(raw)
+            data = b""
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                data += chunk
+        statuses = re.findall(rb"HTTP/1\.1 (\d{3}) ", data)
+        assert statuses == [b"200", b"200", b"401"]
+        assert data.index(b'"service"') < data.index(b"reply:piped") < data.index(b"authentication required")
+    finally:
+        server.shutdown_cleanly()
+
+
+def test_auth_limits_and_methods_match_threading_server(tmp_path, monkeypatch):
+    monkeypatch.setattr(api_server.config, "API_MAX_BODY_BYTES", 40)
+    monkeypatch.setattr(api_server.config, "API_MAX_MESSAGE_CHARS", 5)
+    server, port, token = _start(tmp_path, monkeypatch, FakeAgent())
+    base = f"http://127.0.0.1:{port}"
+    headers = {"Authorization": f"Bearer {token}"}
+    try:
+        unauthorized = requests.get(base + "/status", timeout=3)
+        assert unauthorized.status_code == 401
+        assert unauthorized.headers["WWW-Authenticate"].startswith("Bearer")
+        assert requests.get(base + "/status", headers={"X-Seven-Token": token}, timeout=3).json()["status"] == "reply:/status"
+        assert requests.post(base + "/chat", headers=headers, data="message=x", timeout=3).status_code == 415
+        malformed = requests.post(base + "/chat", headers={**headers, "Content-Type": "application/json"}, data="{", timeout=3)
+        assert malformed.status_code == 400 and "malformed" in malformed.json()["error"]
+        assert requests.post(base + "/chat", headers=headers, json={"message": "123456"}, timeout=3).status_code == 413
+        oversized = requests.post(base + "/chat", headers=headers, json={"message": "x" * 100}, timeout=3)
+        assert oversized.status_code == 413 and oversized.headers["Connection"] == "close"
+        assert requests.options(base + "/chat", timeout=3).status_code == 405
+        missing = requests.get(base + "/missing", headers=headers, timeout=3)
+        assert missing.status_code == 404 and "POST /chat/stream" in missing.json()["paths"]
+        with pytest.raises(OSError):
+            api_server.start_api_server(port=port, agent=FakeAgent(), backend="asyncio")
+        with pytest.raises(ValueError, match="loopback"):
+            api_server.start_api_server(host="0.0.0.0", port=0, agent=FakeAgent(), backend="asyncio")
+        with pytest.raises(ValueError, match="backend"):
+            api_server.start_api_server(port=0, agent=FakeAgent(), backend="twisted")
+    finally:
+        server.shutdown_cleanly()
+    replacement = api_server.start_api_server(port=port, agent=FakeAgent(), backend="asyncio")
+    try:
+        assert requests.get(f"{base}/health", timeout=3).status_code == 200
+    finally:
+        replacement.shutdown_cleanly()
+
+
+def test_many_idle_connections_do_not_block_service(tmp_path, monkeypatch):
+    server, port, token = _start(tmp_path, monkeypatch, FakeAgent())
+    idle = []
+    try:
+        for _ in range(300):
+            idle.append(socket.create_connection(("127.0.0.1", port), timeout=3))
+        deadline = time.monotonic() + 3
+        while server.seven_connections < 300 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert server.seven_connections >= 300
+        # 300 idle sockets cost coroutines, not threads.
+        assert threading.active_count() < 50
+        response = requests.get(f"http://127.0.0.1:{port}/health", timeout=3)
+        assert response.status_code == 200
+    finally:
+        for sock in idle:
+            sock.close()
+        server.shutdown_cleanly()
+
+
+def test_stream_events_and_disconnect_cancellation(tmp_path, monkeypatch):
+    agent = FakeAgent()
+    server, port, token = _start(tmp_path, monkeypatch, agent)
+    base = f"http://127.0.0.1:{port}"
+    headers = {"Authorization": f"Bearer {token}"}
+    try:
+        with requests.post(base + "/chat/stream", headers=headers, json={"message": "hi"}, stream=True, timeout=5) as response:
+            assert response.headers["Content-Type"].startswith("text/event-stream")
+            kinds = [line[7:] for line in response.iter_lines(decode_unicode=True) if line.startswith("event: ")]
+        assert kinds == ["round", "token", "final"]
+
+        agent.endless = True
+        response = requests.post(base + "/chat/stream", headers=headers, json={"message": "go"}, stream=True, timeout=5)
+        next(response.iter_lines())
+        response.close()
+        assert agent.cancelled.wait(5)
+        deadline = time.monotonic() + 5
+        while server.seven_streams and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert server.seven_streams == 0
+    finally:
+        server.shutdown_cleanly()
+
+
+def test_concurrency_limit_fails_fast(tmp_path, monkeypatch):
+    monkeypatch.setattr(api_server.config, "API_MAX_CONCURRENT_REQUESTS", 1)
+    entered, release = threading.Event(), threading.Event()
+    agent = FakeAgent()
+    def block(message, on_event=None, cancel=None):
+        entered.set()
+        release.wait(5)
+        return "done"
+    agent.handle = block
+    server, port, token = _start(tmp_path, monkeypatch, agent)
+    base = f"http://127.0.0.1:{port}"
+    try:
+        first = threading.Thread(
+            target=requests.post,
+            args=(base + "/chat",),
+            kwargs={"headers": {"Authorization": f"Bearer {token}"}, "json": {"message": "x"}, "timeout": 5},
+        )
+        first.start()
+        assert entered.wait(2)
+        assert requests.get(base + "/health", timeout=2).status_code == 503
+        release.set()
+        first.join(5)
+    finally:
+        release.set()
+        server.shutdown_cleanly()
+
+
+def test_owned_lazy_agent_is_started_and_stopped(tmp_path, monkeypatch):
+    created = FakeAgent()
+    monkeypatch.setattr(api_async, "Seven", lambda: created)
+    server, port, token = _start(tmp_path, monkeypatch, agent=None)
+    try:
+        response = requests.get(f"http://127.0.0.1:{port}/status", headers={"Authorization": f"Bearer {token}"}, timeout=3)
+        assert response.status_code == 200 and created.heartbeat is True
+    finally:
+        server.shutdown_cleanly()
+    assert created.stopped is True
@@ -1,10 +1,12 @@
 import concurrent.futures
+import json
 import threading
 import time
 
 import pytest
 import requests
 
+from seven.memory.store import Memory
 from seven.ui import api_server
 
 
@@ -152,3 +154,284 @@ def test_agent_exception_is_json_500_without_details(tmp_path, monkeypatch):
         assert "private internal detail" not in response.text
     finally:
         server.shutdown_cleanly()
+
+
+class StreamingAgent(FakeAgent):
+    def __init__(self, pause=0.0, endless=False):
+        super().__init__()
+        self.pause = pause
+        self.endless = endless
+        self.cancelled = threading.Event()
+
+    def handle(self, message, on_event=None, cancel=None):
+        on_event("round", {"round": 0})
+        on_event("tool_call", {"round": 0, "id": "1", "name": "proof_tool", "arguments": {}})
+        time.sleep(self.pause)
+        on_event("tool_result", {"round": 0, "id": "1", "name": "proof_tool", "ok": True, "preview": "42"})
+        on_event("round", {"round": 1})
+        while self.endless and not cancel.is_set():
+            on_event("token", {"delta": "x" * 512})
+            time.sleep(0.01)
+        if cancel.is_set():
+            self.cancelled.set()
+            return "Cancelled."
+        for delta in ("reply:", message):
+            on_event("token", {"delta": delta})
+        return "reply:" + message
+
+
+def _sse(response):
+    events, comments, current = [], 0, {}
+    for line in response.iter_lines(decode_unicode=True):
+        if line.startswith(":"):
+            comments += 1
+        elif line.startswith("event: "):
+            current["event"] = line[7:]
+        elif line.startswith("data: "):
+            current["data"] = json.loads(line[6:])
+        elif not line and current:
+            events.append(current)
+            current = {}
+    return events, comments
+
+
+def test_chat_stream_emits_typed_events_and_heartbeats(tmp_path, monkeypatch):
+    monkeypatch.setattr(api_server.config, "API_SSE_HEARTBEAT_SECONDS", 0.05)
+    server, base, token = _start(tmp_path, monkeypatch, StreamingAgent(pause=0.3))
+    headers = {"Authorization": f"Bearer {token}"}
+    try:
+        assert requests.post(base + "/chat/stream", json={"message": "hi"}, timeout=3).status_code == 401
+        bad = requests.post(base + "/chat/stream", headers=headers, data="message=x", timeout=3)
+        assert bad.status_code == 415
+        with requests.post(base + "/chat/stream", headers=headers, json={"message": "hi"}, stream=True, timeout=5) as response:
+            assert response.status_code == 200
+            assert response.headers["Content-Type"].startswith("text/event-stream")
+            assert response.headers["Cache-Control"] == "no-store"
+            events, comments = _sse(response)
+        kinds = [e["event"] for e in events]
+        assert kinds == ["round", "tool_call", "tool_result", "round", "token", "token", "final"]
+        assert events[2]["data"]["preview"] == "42"
+        assert "".join(e["data"]["delta"] for e in events if e["event"] == "token") == "reply:hi"
+        assert events[-1]["data"] == {"reply": "reply:hi", "role": "assistant", "cancelled": False}
+        assert comments >= 1  # heartbeat while the tool "ran"
+    finally:
+        server.shutdown_cleanly()
+
+
+def test_chat_stream_body_limits_match_chat(tmp_path, monkeypatch):
+    monkeypatch.setattr(api_server.config, "API_MAX_MESSAGE_CHARS", 5)
+    server, base, token = _start(tmp_path, monkeypatch, StreamingAgent())
+    try:
+        response = requests.post(base + "/chat/stream", headers={"Authorization": f"Bearer {token}"}, json={"message": "123456"}, timeout=3)
+        assert response.status_code == 413
+    finally:
+        server.shutdown_cleanly()
+
+
+def test_chat_stream_client_disconnect_cancels_turn(tmp_path, monkeypatch):
+    agent = StreamingAgent(endless=True)
+    server, base, token = _start(tmp_path, monkeypatch, agent)
+    try:
+        response = requests.post(base + "/chat/stream", headers={"Authorization": f"Bearer {token}"}, json={"message": "go"}, stream=True, timeout=5)
+        next(response.iter_lines())
+        response.close()
+        assert agent.cancelled.wait(5)
+        with server.seven_active_condition:
+            assert server.seven_active_condition.wait_for(lambda: server.seven_active == 0, timeout=5)
+    finally:
+        server.shutdown_cleanly()
+
+
+class SnapshotAgent(FakeAgent):
+    """Exposes the read-only status path; handle() blocks like a long chat turn."""
+
+    def __init__(self):
+        super().__init__(block=True)
+        self.builds = 0
+
+    def status_snapshot(self):
+        self.builds += 1
+        return {"counts": {"messages": 3}, "padding": "x" * 2048, "freshness": {"counts": 1.0}}
+
+    @staticmethod
+    def status_text(snap):
+        return f"messages: {snap['counts']['messages']}"
+
+    def tools_listing(self):
+        return "proof_tool"
+
+
+@pytest.mark.parametrize("backend", ["threading", "asyncio"])
+def test_status_and_tools_are_cached_snapshots_with_etags(tmp_path, monkeypatch, backend):
+    monkeypatch.setattr(api_server.config, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(api_server.config, "STATUS_SNAPSHOT_TTL", 60)
+    monkeypatch.delenv("SEVEN_API_TOKEN", raising=False)
+    agent = SnapshotAgent()
+    server = api_server.start_api_server(port=0, agent=agent, backend=backend)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    headers = {"Authorization": f"Bearer {server.seven_api_token}"}
+    chat = threading.Thread(
+        target=requests.post, args=(base + "/chat",), kwargs={"headers": headers, "json": {"message": "long"}, "timeout": 5}
+    )
+    try:
+        chat.start()
+        assert agent.entered.wait(2)
+        # A chat holds the agent; status must not queue behind it.
+        first = requests.get(base + "/status", headers=headers, timeout=2)
+        assert first.status_code == 200
+        assert first.json()["status"] == "messages: 3" and first.json()["snapshot"]["freshness"] == {"counts": 1.0}
+        assert first.headers["Content-Encoding"] == "gzip" and first.headers["Vary"] == "Accept-Encoding"
+        etag = first.headers["ETag"]
+        assert etag.startswith('W/"')
+
+        again = requests.get(base + "/status", headers={**headers, "If-None-Match": etag}, timeout=2)
+        assert again.status_code == 304 and again.content == b"" and again.headers["ETag"] == etag
+        plain = requests.get(base + "/status", headers={**headers, "Accept-Encoding": "identity"}, timeout=2)
+        assert "Content-Encoding" not in plain.headers and plain.json()["as_of"] == first.json()["as_of"]
+        assert agent.builds == 1
+
+        tools = requests.get(base + "/tools", headers=headers, timeout=2)
+        assert tools.json() == {"tools": "proof_tool", "names": ["proof_tool"], "as_of": tools.json()["as_of"]}
+        assert tools.headers["ETag"] != etag
+        assert requests.get(base + "/tools", headers={**headers, "If-None-Match": "*"}, timeout=2).status_code == 304
+    finally:
+        agent.release.set()
+        chat.join(5)
+        server.shutdown_cleanly()
+
+
+def test_snapshot_etag_ignores_rebuild_time_and_cache_is_single_flight(monkeypatch):
+    monkeypatch.setattr(api_server.config, "STATUS_SNAPSHOT_TTL", 0)
+    first = api_server.Snapshot({"a": 1})
+    time.sleep(0.01)
+    second = api_server.Snapshot({"a": 1})
+    assert first.etag == second.etag and first.data != second.data
+    assert first.matches('"nope", ' + first.etag[2:]) and not first.matches(None)
+    assert api_server.accepts_gzip("br, gzip;q=0.5") and not api_server.accepts_gzip("gzip;q=0")
+
+    monkeypatch.setattr(api_server.config, "STATUS_SNAPSHOT_TTL", 60)
+    cache = api_server.SnapshotCache()
+    calls = []
+
+    def build():
+        calls.append(1)
+        time.sleep(0.1)
+        return {"n": len(calls)}
+
+    with concurrent.futures.ThreadPoolExecutor(8) as pool:
+        etags = {snap.etag for snap in pool.map(lambda _: cache.get("/status", build), range(8))}
+    assert len(calls) == 1 and len(etags) == 1
+
+
+@pytest.mark.parametrize("backend", ["threading", "asyncio"])
+def test_memory_endpoints_page_filter_and_stream(tmp_path, monkeypatch, backend):
+    monkeypatch.setattr(api_server.config, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(api_server.config, "API_PAGE_MAX", 300)
+    monkeypatch.delenv("SEVEN_API_TOKEN", raising=False)
+    agent = FakeAgent()
+    agent.memory = Memory(tmp_path / "api.db")
+    for i in range(620):
+        agent.memory.audit("run_shell" if i % 2 else "read_file", {"n": i}, f"out {i}", i % 4 != 0)
+    agent.memory.remember("the sky is green", key="sky")
+    agent.memory.add_note("green notes", title="colors")
+    agent.memory.add_message("user", "hello green world")
+    server = api_server.start_api_server(port=0, agent=agent, backend=backend)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    headers = {"Authorization": f"Bearer {server.seven_api_token}"}
+    try:
+        assert requests.get(base + "/memory/audit", timeout=3).status_code == 401
+        # limit is capped at API_PAGE_MAX; the page is larger than one fetch chunk.
+        page = requests.get(base + "/memory/audit?tool=run_shell&limit=5000", headers=headers, timeout=5).json()
+        assert page["kind"] == "audit" and page["limit"] == 300 and len(page["items"]) == 300
+        assert all(item["tool"] == "run_shell" for item in page["items"])
+        rest = requests.get(
+            base + f"/memory/audit?tool=run_shell&limit=300&before={page['next']}", headers=headers, timeout=5
+        ).json()
+        assert len(rest["items"]) == 10 and rest["next"] is None
+        assert {item["id"] for item in page["items"]}.isdisjoint(item["id"] for item in rest["items"])
+        failed = requests.get(base + "/memory/audit?ok=false&after=0&limit=3", headers=headers, timeout=3).json()
+        assert [item["arguments"]["n"] for item in failed["items"]] == [0, 4, 8]
+        assert requests.get(base + "/memory/facts", headers=headers, timeout=3).json()["items"][0]["key"] == "sky"
+        assert requests.get(base + "/memory/messages?role=user", headers=headers, timeout=3).json()["items"][0]["content"] == "hello green world"
+        assert requests.get(base + "/memory/notes?since=2000-01-01", headers=headers, timeout=3).json()["items"][0]["title"] == "colors"
+        search = requests.get(base + "/memory/search?q=green&kinds=facts,notes,messages", headers=headers, timeout=3).json()
+        assert search["q"] == "green" and set(search["results"]) == {"facts", "notes", "messages"}
+        assert all(len(result["items"]) == 1 for result in search["results"].values())
+
+        for query, status in (
+            ("/memory/audit?ok=maybe", 400), ("/memory/audit?limit=x", 400), ("/memory/notes?tool=x", 400),
+            ("/memory/audit?since=yesterday", 400), ("/memory/search", 400), ("/memory/search?q=x&kinds=bogus", 400),
+            ("/memory/audit?before=5&after=1", 400), ("/memory/secrets", 404),
+        ):
+            assert requests.get(base + query, headers=headers, timeout=3).status_code == status, query
+    finally:
+        server.shutdown_cleanly()
+
+
+class BatchAgent(FakeAgent):
+    """run_ephemeral sleeps by prompt so completion order differs from submit order."""
+
+    def __init__(self):
+        super().__init__()
+        self.running = 0
+        self.peak = 0
+        self.seen = []
+        self.guard = threading.Lock()
+
+    def run_ephemeral(self, prompt, system=None, use_tools=True, cancel=None):
+        with self.guard:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            self.seen.append((prompt, system, use_tools))
+        try:
+            if prompt == "boom":
+                raise RuntimeError("model crashed")
+            time.sleep(float(prompt.split(":")[1]) if ":" in prompt else 0)
+            return {"status": "ok", "reply": "did " + prompt, "tools": [], "seconds": 0.0}
+        finally:
+            with self.guard:
+                self.running -= 1
+
+
+@pytest.mark.parametrize("backend", ["threading", "asyncio"])
+def test_chat_batch_fans_out_and_streams_results_as_they_finish(tmp_path, monkeypatch, backend):
+    monkeypatch.setattr(api_server.config, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(api_server.config, "API_BATCH_WORKERS", 3)
+    monkeypatch.setattr(api_server.config, "API_BATCH_MAX_ITEMS", 6)
+    monkeypatch.delenv("SEVEN_API_TOKEN", raising=False)
+    agent = BatchAgent()
+    server = api_server.start_api_server(port=0, agent=agent, backend=backend)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    headers = {"Authorization": f"Bearer {server.seven_api_token}"}
+    body = {
+        "system": "Answer in one word.",
+        "items": [
+            "slow:0.4",
+            {"id": "b", "message": "fast:0.05", "tools": False},
+            {"message": "boom"},
+            {"message": "mid:0.2", "system": "Be terse."},
+        ],
+    }
+    try:
+        with requests.post(base + "/chat/batch", headers=headers, json=body, stream=True, timeout=10) as response:
+            assert response.headers["Content-Type"].startswith("text/event-stream")
+            events, _ = _sse(response)
+        results = [e["data"] for e in events if e["event"] == "result"]
+        assert [r["index"] for r in results] == [2, 1, 3, 0]
+        by_index = {r["index"]: r for r in results}
+        assert by_index[1]["id"] == "b" and by_index[1]["reply"] == "did fast:0.05"
+        assert by_index[2]["status"] == "error" and "crashed" not in by_index[2]["reply"]
+        assert events[-1]["event"] == "done"
+        assert events[-1]["data"] | {"seconds": 0} == {"items": 4, "ok": 3, "error": 1, "cancelled": 0, "seconds": 0}
+        assert agent.peak == 3  # bounded by API_BATCH_WORKERS
+        assert ("fast:0.05", "Answer in one word.", False) in agent.seen
+        assert ("mid:0.2", "Be terse.", True) in agent.seen
+
+        for payload, status in (
+            ({"items": []}, 400), ({"items": ["x"] * 7}, 413), ({"items": [{"message": ""}]}, 400),
+            ({"items": [{"message": "x", "tools": "yes"}]}, 400), ({"items": [3]}, 400),
+        ):
+            assert requests.post(base + "/chat/batch", headers=headers, json=payload, timeout=3).status_code == status
+        assert requests.post(base + "/chat/batch", json=body, timeout=3).status_code == 401
+    finally:
+        server.shutdown_cleanly()
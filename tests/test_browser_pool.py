@@ -0,0 +1,171 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from seven.runtime import browser_pool
+from seven.runtime.browser_pool import BrowserPool
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.routes = []
+
+    async def route(self, pattern, handler):
+        self.routes.append((pattern, handler))
+
+    async def close(self):
+        self.context.pages_closed += 1
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages_closed = 0
+        self.closed = False
+
+    async def new_page(self):
+        return FakePage(self)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+        self.connected = True
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, viewport):
+        assert viewport == browser_pool.VIEWPORT
+        self.contexts.append(FakeContext())
+        return self.contexts[-1]
+
+
+class Launcher:
+    def __init__(self):
+        self.browsers = []
+        self.stopped = 0
+
+    async def __call__(self):
+        self.browsers.append(FakeBrowser())
+
+        async def stop():
+            self.stopped += 1
+
+        return self.browsers[-1], stop
+
+
+def _pool(launcher, **options):
+    settings = {"size": 2, "pages_per_context": 3, "idle_seconds": 0, "max_rss_mb": 0}
+    settings.update(options)
+    pool = BrowserPool(launch=launcher, **settings)
+    pool.rss_mb = lambda: 100.0
+    return pool
+
+
+async def _where(page):
+    return threading.current_thread().name, page
+
+
+def test_one_warm_browser_serves_pages_and_recycles_contexts():
+    launcher = Launcher()
+    pool = _pool(launcher)
+    try:
+        results = [pool.run(_where) for _ in range(7)]
+        assert {name for name, _ in results} == {"seven-browser"}
+        assert pool.launches == 1 and len(launcher.browsers) == 1
+        contexts = launcher.browsers[0].contexts
+        assert [c.closed for c in contexts] == [True, True, False]
+        assert [c.pages_closed for c in contexts] == [3, 3, 1]
+        assert [pattern for pattern, _ in results[0][1].routes] == ["**/*"]
+        assert pool.run(_where, block_heavy=False)[1].routes == []
+
+        async def fails(page):
+            raise ValueError("navigation failed")
+
+        with pytest.raises(ValueError, match="navigation failed"):
+            pool.run(fails)
+        assert contexts[2].closed and pool.contexts_opened == 3
+        pool.max_rss_mb, pool.rss_mb = 50, lambda: 80.0
+        pool.run(_where)
+        assert contexts[-1].closed and len(contexts) == 4
+        launcher.browsers[0].connected = False
+        pool.run(_where)
+        assert pool.launches == 2 and launcher.stopped == 1
+    finally:
+        pool.close()
+    assert launcher.stopped == 2 and not pool.running()
+    with pytest.raises(RuntimeError, match="closed"):
+        pool.run(_where)
+
+
+def test_contexts_serve_pages_concurrently_up_to_the_pool_size():
+    launcher = Launcher()
+    pool = _pool(launcher, size=2)
+
+    async def slow(page):
+        await asyncio.sleep(0.3)
+        return page.context
+
+    try:
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(pool.run(slow))) for _ in range(3)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+        assert 0.55 < elapsed < 0.85
+        assert len(launcher.browsers[0].contexts) == 2 and len({id(c) for c in results}) == 2
+        with pytest.raises(TimeoutError):
+            pool.run(slow, timeout=0.05)
+    finally:
+        pool.close()
+
+
+def test_idle_browser_shuts_down_and_relaunches_on_demand(monkeypatch):
+    monkeypatch.setattr(browser_pool, "IDLE_CHECK_SECONDS", 0.05)
+    launcher = Launcher()
+    pool = _pool(launcher, idle_seconds=0.2)
+    try:
+        pool.run(_where)
+        assert pool.running()
+        deadline = time.monotonic() + 3
+        while pool.running() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert not pool.running()
+        browsers = [thread for thread in threading.enumerate() if thread.name == "seven-browser"]
+        for thread in browsers:
+            thread.join(2)
+        assert not any(thread.is_alive() for thread in browsers) and launcher.stopped == 1
+        pool.run(_where)
+        assert pool.launches == 2
+    finally:
+        pool.close()
+
+
+def test_text_jobs_abort_heavy_resources():
+    handled = []
+
+    class Route:
+        def __init__(self, kind):
+            self.request = type("Request", (), {"resource_type": kind})()
+
+        async def abort(self):
+            handled.append((self.request.resource_type, "abort"))
+
+        async def continue_(self):
+            handled.append((self.request.resource_type, "continue"))
+
+    async def run():
+        for kind in ("document", "image", "font", "stylesheet", "media", "script"):
+            await browser_pool.block_heavy(Route(kind))
+
+    asyncio.run(run())
+    assert [kind for kind, action in handled if action == "abort"] == ["image", "font", "media"]
@@ -0,0 +1,152 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from seven import config
+from seven.sensors import camera_session
+from seven.sensors.camera_session import CameraSession
+from seven.tools import vision
+
+
+class FakeCamera:
+    """Numbered 4x6 frames at about 500 fps; a frame's pixels hold its number."""
+
+    def __init__(self, fail_after=None):
+        self.reads = 0
+        self.released = threading.Event()
+        self.fail_after = fail_after
+
+    def read(self):
+        time.sleep(0.002)
+        self.reads += 1
+        if self.fail_after is not None and self.reads > self.fail_after:
+            return False, None
+        return True, np.full((4, 6, 3), self.reads, dtype=np.int32)
+
+    def release(self):
+        self.released.set()
+
+
+class Opener:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.cameras = []
+
+    def __call__(self, index, width, height):
+        if self.cameras:
+            assert self.cameras[-1].released.is_set(), "previous session still holds the device"
+        self.cameras.append(FakeCamera(**self.kwargs))
+        return self.cameras[-1]
+
+
+@pytest.fixture(autouse=True)
+def no_session():
+    yield
+    camera_session.stop_session()
+
+
+def test_session_serves_newest_frame_until_closed():
+    cam = FakeCamera()
+    session = CameraSession(2, ttl=30, opener=lambda *args: cam).start()
+    frame, age = session.latest()
+    assert session.frames >= camera_session.WARMUP_FRAMES and age < 1
+    time.sleep(0.05)
+    newer, _ = session.latest()
+    assert newer[0, 0, 0] > frame[0, 0, 0]  # one slot, always the latest read
+    status = session.status()
+    assert status["active"] and (status["width"], status["height"]) == (6, 4) and 0 < status["seconds_left"] <= 30
+
+    session.close()
+    assert cam.released.is_set() and not session.alive()
+    reads = cam.reads
+    time.sleep(0.03)
+    assert cam.reads == reads and session.status()["seconds_left"] == 0.0
+
+
+def test_session_ends_on_ttl_and_on_dead_device(monkeypatch):
+    cam = FakeCamera()
+    session = CameraSession(0, ttl=0.1, opener=lambda *args: cam).start()
+    assert cam.released.wait(2) and not session.alive() and session.error == ""
+
+    monkeypatch.setattr(camera_session, "READ_RETRY_SECONDS", 0.001)
+    dead = FakeCamera(fail_after=2)
+    session = CameraSession(0, ttl=30, opener=lambda *args: dead).start()
+    assert session.latest(timeout=2) is None
+    assert dead.released.is_set() and "stopped returning frames" in session.error
+
+
+def test_start_replaces_session_caps_ttl_and_filters_index(monkeypatch):
+    monkeypatch.setattr(config, "CAMERA_SESSION_MAX_SECONDS", 60)
+    opener = Opener()
+    first = camera_session.start_session(camera_index=1, seconds=10, opener=opener)
+    assert camera_session.active_session() is first and camera_session.active_session(1) is first
+    assert camera_session.active_session(0) is None
+
+    second = camera_session.start_session(camera_index=1, seconds=9999, opener=opener)
+    assert second.ttl == 60 and not first.alive() and opener.cameras[0].released.is_set()
+    assert camera_session.stop_session() is second
+    assert camera_session.active_session() is None and opener.cameras[1].released.is_set()
+    assert camera_session.stop_session() is None
+
+
+def test_session_tools_start_and_stop(monkeypatch):
+    opener = Opener()
+    monkeypatch.setattr(camera_session, "open_camera", opener)
+    out = vision.camera_session_start(camera_index=3, seconds=20)
+    assert out.startswith("Camera 3 session started (6x4) for 20s")
+    assert camera_session.active_session(3) is not None
+    assert vision.camera_session_stop().startswith("Camera 3 session stopped after ")
+    assert vision.camera_session_stop() == "No camera session running."
+
+    def refuse(index, width, height):
+        raise RuntimeError(f"cannot open camera index {index}.")
+
+    monkeypatch.setattr(camera_session, "open_camera", refuse)
+    assert vision.camera_session_start(camera_index=7) == "ERROR: cannot open camera index 7."
+
+
+def test_capture_and_list_use_the_session(tmp_path):
+    cv2 = pytest.importorskip("cv2")
+    from seven.sensors.camera import capture_frame, list_cameras
+
+    camera_session.start_session(camera_index=5, seconds=20, opener=Opener())
+    ok, msg = capture_frame(path=str(tmp_path / "shot.jpg"), camera_index=5)
+    assert ok and "size=6x4" in msg and "session frame" in msg
+    assert cv2.imread(str(tmp_path / "shot.jpg")) is not None
+    assert {"index": 5, "ok": True, "width": 6, "height": 4, "session": True} in list_cameras(max_index=6)
+
+
+def test_only_a_user_command_starts_a_session(tmp_path, monkeypatch):
+    from seven.agent.loop import Seven
+    from seven.memory.store import Memory
+
+    opener = Opener()
+    monkeypatch.setattr(camera_session, "open_camera", opener)
+    agent = Seven(tool_tier="core")
+    agent.memory = Memory(tmp_path / "seven.db")
+    assert "camera_session_start" not in agent.tools.all_names()
+    assert "camera_session_stop" in agent.tools.names()
+
+    # A model turn (heartbeat, planner, free will or chat) that asks for a session cannot get one.
+    calls = []
+
+    def chat(messages, tools=None, **kw):
+        calls.append(tools)
+        if len(calls) == 1:
+            return {"role": "assistant", "content": "", "tool_calls": [
+                {"id": "1", "name": "camera_session_start", "arguments": {"seconds": 3600}},
+            ]}
+        return {"role": "assistant", "content": "done", "tool_calls": []}
+
+    agent.brain.chat = chat  # type: ignore
+    agent.handle("Autonomous heartbeat. User may be away. Real work only. Use tools.")
+    assert len(calls) == 2 and "camera_session_start" not in str(calls[0])
+    assert camera_session.active_session() is None and opener.cameras == []
+
+    assert agent.handle("/camera on 20 3").startswith("Camera 3 session started (6x4) for 20s")
+    assert agent.handle("/camera").startswith("Camera 3 session: 6x4")
+    assert agent.handle("/camera sideways").startswith("Usage: /camera on")
+    assert agent.handle("/camera off").startswith("Camera 3 session stopped")
+    assert agent.handle("/camera").startswith("No camera session running")
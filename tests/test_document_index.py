@@ -0,0 +1,90 @@
+import os
+import zipfile
+
+import pytest
+
+from seven import config
+from seven.memory import document_index
+from seven.memory.document_index import DocumentIndex, chunk_text
+from seven.memory.store import Memory
+from seven.tools.registry import ToolRegistry
+
+
+@pytest.fixture
+def memory(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "DOCUMENT_CACHE_PATH", tmp_path / "document_cache.db")
+    return Memory(tmp_path / "seven.db")
+
+
+def _tools(memory):
+    reg = ToolRegistry(memory=memory)
+    reg.load_module("documents")
+    return {name: reg._tools[name].handler for name in ("ingest_documents", "search_documents")}
+
+
+def test_chunks_overlap_break_on_words_and_keep_offsets():
+    text = " ".join(f"word{n}" for n in range(600)) + "\n\nLast paragraph."
+    chunks = chunk_text(text, size=400, overlap=80)
+    assert len(chunks) > 5
+    for start, end, piece in chunks:
+        assert text[start:end] == piece and len(piece) <= 400
+        assert piece.split()[0].startswith(("word", "Last")) and not piece.endswith("wor")
+    for (_, end, _), (start, _, _) in zip(chunks, chunks[1:]):
+        assert 0 < end - start <= 80
+    assert chunks[-1][2].endswith("Last paragraph.")
+    assert chunk_text("   \n ") == []
+
+
+def test_ingest_reads_only_changed_files_and_search_finds_page(tmp_path, memory, monkeypatch):
+    monkeypatch.setattr(document_index, "WRITE_BATCH", 3)
+    docs = tmp_path / "docs"
+    (docs / "deep").mkdir(parents=True)
+    (docs / "notes.md").write_text("Kettle descaling happens monthly.\n\n" + "Padding sentence for the chunker. " * 120, encoding="utf-8")
+    (docs / "deep" / "pets.txt").write_text("Only cats and dogs live here.", encoding="utf-8")
+    with zipfile.ZipFile(docs / "deck.pptx", "w") as archive:
+        archive.writestr("ppt/slides/slide1.xml", '<p:sld xmlns:p="urn:p" xmlns:a="urn:a"><a:t>Intro slide</a:t></p:sld>')
+        archive.writestr("ppt/slides/slide2.xml", '<p:sld xmlns:p="urn:p" xmlns:a="urn:a"><a:t>Turbine maintenance every six months</a:t></p:sld>')
+    (docs / "broken.docx").write_bytes(b"not a zip")
+    (docs / "broken.pdf").write_bytes(b"%PDF-1.4\n1 0 obj <</Length 99>> stream\ngarbage")
+    (docs / "image.png").write_bytes(b"\x89PNG")
+    index = DocumentIndex(memory)
+
+    first = index.ingest(docs)
+    assert (first["files"], first["new"], first["unchanged"]) == (5, 3, 0)
+    assert [f.split(":")[0] for f in first["failed"]] == [str(docs / "broken.docx"), str(docs / "broken.pdf")]
+    assert "malformed PDF" in first["failed"][1]
+    assert first["chunks"] == memory.document_stats()["chunks"] > 4 and first["chunks_per_second"] > 0
+
+    score, hit = index.search("turbine maintenance")[0]
+    assert hit["path"] == str(docs / "deck.pptx") and hit["unit"] == 2 and score > 0
+    assert document_index.location(hit) == "slide 2, chars 0-36"
+    assert "Turbine maintenance" in hit["snippet"]
+    assert index.search("cats", root=str(docs / "deep"))[0][1]["path"].endswith("pets.txt")
+    assert index.search("kettle", root=str(docs / "deep")) == []
+
+    os.utime(docs / "deep" / "pets.txt", ns=(1, 1))
+    second = index.ingest(docs)
+    assert (second["new"], second["changed"], second["unchanged"], second["chunks"]) == (0, 0, 3, 0)
+    assert memory.document_sources()[str(docs / "deep" / "pets.txt")]["mtime_ns"] == 1
+
+    (docs / "notes.md").write_text("Kettle replaced by an urn.", encoding="utf-8")
+    (docs / "deep" / "pets.txt").unlink()
+    third = index.ingest(docs)
+    assert (third["changed"], third["removed"], third["chunks"]) == (1, 1, 1)
+    assert [row["snippet"] for _, row in index.search("kettle")] == ["Kettle replaced by an urn."]
+    assert index.search("cats") == []
+    assert index.ingest(docs, force=True)["changed"] == 2
+
+
+def test_document_tools_report_throughput_and_hits(tmp_path, memory):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "report.csv").write_text("region,revenue\nnorth,120\nsouth,80\n", encoding="utf-8")
+    tools = _tools(memory)
+    out = tools["ingest_documents"](str(docs))
+    assert out.startswith(f"Ingested {docs}: 1 files (1 new, 0 changed") and "chunks/s)" in out
+    hits = tools["search_documents"]("north revenue")
+    assert hits.splitlines()[1].startswith(f"1. {docs / 'report.csv'} (chars 0-")
+    assert "north | 120" in hits
+    assert "No document hits" in tools["search_documents"]("zebra") and "1 files" in tools["search_documents"]("zebra")
+    assert tools["ingest_documents"](str(tmp_path / "missing")).startswith("ERROR: not found")
@@ -3,7 +3,15 @@ import zipfile
 
 import pytest
 
-from seven.tools.documents import document_status, read_document
+from seven import config
+from seven.memory import document_cache
+from seven.tools import documents
+from seven.tools.documents import document_status, parse_ranges, read_document
+
+
+@pytest.fixture(autouse=True)
+def _cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "DOCUMENT_CACHE_PATH", tmp_path / "document_cache.db")
 
 
 def _zip(path, members):
@@ -32,6 +40,29 @@ def test_text_json_csv_and_limits(tmp_path):
     assert '"truncated": true' in read_document(str(long), max_chars=100)
 
 
+def test_whole_file_formats_keep_the_lower_limits(tmp_path, monkeypatch):
+    monkeypatch.setattr(documents, "MAX_LOADED_FILE_BYTES", 64)
+    monkeypatch.setattr(documents, "MAX_LOADED_ARCHIVE_UNCOMPRESSED", 64)
+    text = tmp_path / "big.txt"
+    text.write_text("x" * 100, encoding="utf-8")
+    assert read_document(str(text)) == "ERROR: file is 100 bytes; limit is 64"
+    with pytest.raises(ValueError, match="limit is 64"):
+        list(documents.document_units(text))
+
+    monkeypatch.setattr(documents, "MAX_LOADED_FILE_BYTES", 10_000)
+    doc = tmp_path / "big.docx"
+    _zip(doc, {"word/document.xml": '<w:document xmlns:w="urn:w"><w:body><w:p><w:r><w:t>' + "y" * 100 + "</w:t></w:r></w:p></w:body></w:document>"})
+    assert "expanded archive exceeds 64 bytes" in read_document(str(doc))
+
+    book = tmp_path / "big.xlsx"
+    _zip(book, {
+        "xl/worksheets/sheet1.xml": '<worksheet><sheetData><row r="1"><c r="A1" t="inlineStr"><is><t>' + "z" * 100 + "</t></is></c></row></sheetData></worksheet>",
+    })
+    assert "z" * 100 in read_document(str(book))
+    status = json.loads(document_status())
+    assert status["max_loaded_file_bytes"] == 10_000 and ".docx" in status["loaded_whole"]
+
+
 def test_docx_extraction(tmp_path):
     path = tmp_path / "sample.docx"
     _zip(path, {"word/document.xml": '<w:document xmlns:w="urn:w"><w:body><w:p><w:r><w:t>Hello Seven</w:t></w:r></w:p><w:p><w:r><w:t>Second paragraph</w:t></w:r></w:p></w:body></w:document>'})
@@ -87,3 +118,119 @@ def test_pdf_backend_reads_real_pdf(tmp_path):
     result = read_document(str(path))
     assert '"pages": 1' in result
     assert "--- Page 1 ---" in result
+
+
+def _header(result):
+    return json.loads(result.split("\n\n", 1)[0])
+
+
+def _text_pdf(pypdf, path, count):
+    from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+    writer = pypdf.PdfWriter()
+    font = DictionaryObject({
+        NameObject("/Type"): NameObject("/Font"),
+        NameObject("/Subtype"): NameObject("/Type1"),
+        NameObject("/BaseFont"): NameObject("/Helvetica"),
+    })
+    for number in range(1, count + 1):
+        page = writer.add_blank_page(width=300, height=100)
+        content = DecodedStreamObject()
+        content.set_data(f"BT /F1 12 Tf 20 50 Td (Text of page {number}) Tj ET".encode("ascii"))
+        page[NameObject("/Contents")] = writer._add_object(content)
+        page[NameObject("/Resources")] = DictionaryObject({
+            NameObject("/Font"): DictionaryObject({NameObject("/F1"): font}),
+        })
+    with path.open("wb") as stream:
+        writer.write(stream)
+
+
+def test_ranges_parse_and_reject():
+    assert parse_ranges("1-3, 7,9-", 10, "pages") == [1, 2, 3, 7, 9, 10]
+    assert parse_ranges("8-20", 10, "pages") == [8, 9, 10]
+    for spec in ("0", "3-1", "a", "12-"):
+        with pytest.raises(ValueError):
+            parse_ranges(spec, 10, "pages")
+
+
+def test_xlsx_windows_stream_into_cached_row_blocks(tmp_path, monkeypatch):
+    monkeypatch.setattr(documents, "ROW_BLOCK", 10)
+    monkeypatch.setattr(document_cache, "ROW_BLOCK", 10)
+    path = tmp_path / "big.xlsx"
+    rows = "".join(f'<row r="{n}"><c><v>{n}</v></c><c t="inlineStr"><is><t>row {n}</t></is></c></row>' for n in range(1, 96))
+    _zip(path, {
+        "xl/worksheets/sheet10.xml": '<worksheet xmlns="urn:x"><sheetData><row><c><v>tenth</v></c></row></sheetData></worksheet>',
+        "xl/worksheets/sheet2.xml": f'<worksheet xmlns="urn:x"><sheetData>{rows}</sheetData></worksheet>',
+        "xl/worksheets/sheet1.xml": '<worksheet xmlns="urn:x"><sheetData><row><c><v>first</v></c></row></sheetData></worksheet>',
+    })
+
+    window = read_document(str(path), sheets="2", rows="12-14")
+    header = _header(window)
+    assert window.endswith("--- Sheet 2 ---\n12 | row 12\n13 | row 13\n14 | row 14")
+    assert header["cache"] == "miss" and header["rows"] == 3 and header["sheet_rows"] == {"2": None}
+    assert header["window"] == {"sheets": "2", "rows": "12-14"}
+    # Rows 1-20 were parsed to finish block 1, so this window is served from the cache.
+    assert _header(read_document(str(path), sheets="2", rows="3-18"))["cache"] == "hit"
+
+    tail = read_document(str(path), sheets="2", rows="90-")
+    assert _header(tail)["cache"] == "miss" and tail.endswith("94 | row 94\n95 | row 95")
+    assert _header(tail)["sheet_rows"] == {"2": 95}
+    again = read_document(str(path), sheets="2", rows="40-60")
+    assert _header(again)["cache"] == "hit" and again.endswith("--- Sheet 2 ---\n" + "\n".join(f"{n} | row {n}" for n in range(40, 61)))
+
+    whole = read_document(str(path))
+    assert whole.index("first") < whole.index("row 1\n") < whole.index("tenth")
+    assert _header(whole)["cache"] == "partial" and _header(whole)["rows"] == 97
+    assert _header(read_document(str(path)))["cache"] == "hit"
+
+    _zip(path, {"xl/worksheets/sheet1.xml": '<worksheet xmlns="urn:x"><sheetData><row><c><v>changed</v></c></row></sheetData></worksheet>'})
+    changed = read_document(str(path))
+    assert _header(changed)["cache"] == "miss" and "changed" in changed
+    assert "applies to PDF" in read_document(str(path), pages="1")
+    assert "out of range" in read_document(str(path), sheets="4")
+
+
+def test_office_units_come_back_from_the_cache(tmp_path):
+    deck = tmp_path / "deck.pptx"
+    _zip(deck, {f"ppt/slides/slide{n}.xml": f'<p:sld xmlns:p="urn:p" xmlns:a="urn:a"><a:t>Slide text {n}</a:t></p:sld>' for n in range(1, 12)})
+    first = read_document(str(deck), pages="10-")
+    assert _header(first)["cache"] == "miss" and first.endswith("--- Slide 10 ---\nSlide text 10\n\n--- Slide 11 ---\nSlide text 11")
+    whole = read_document(str(deck))
+    assert _header(whole)["cache"] == "partial" and whole.index("Slide text 2\n") < whole.index("Slide text 10")
+    assert _header(read_document(str(deck)))["cache"] == "hit"
+
+    doc = tmp_path / "doc.docx"
+    _zip(doc, {"word/document.xml": '<w:document xmlns:w="urn:w"><w:body><w:p><w:r><w:t>One</w:t></w:r></w:p><w:p/><w:p><w:r><w:t>Two</w:t></w:r></w:p></w:body></w:document>'})
+    assert _header(read_document(str(doc)))["cache"] == "miss"
+    cached = read_document(str(doc))
+    assert _header(cached)["cache"] == "hit" and _header(cached)["blocks"] == 2 and cached.endswith("One\nTwo")
+    assert "applies to PDF" in read_document(str(doc), pages="1")
+    assert "apply to XLSX" in read_document(str(doc), rows="1-5")
+
+
+def test_pdf_page_windows_and_parallel_extraction(tmp_path, monkeypatch):
+    pypdf = pytest.importorskip("pypdf")
+    path = tmp_path / "report.pdf"
+    _text_pdf(pypdf, path, 12)
+
+    window = read_document(str(path), pages="2-3,12")
+    header = _header(window)
+    assert header["pages"] == 12 and header["cache"] == "miss"
+    assert "--- Page 2 ---\nText of page 2\n\n--- Page 3 ---" in window and window.endswith("Text of page 12")
+    assert "Text of page 4" not in window
+
+    monkeypatch.setattr(documents, "PDF_PARALLEL_MIN_PAGES", 4)
+    monkeypatch.setattr(config, "DOCUMENT_WORKERS", 2)
+    pools = []
+
+    class Pool(documents.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            pools.append(self)
+
+    monkeypatch.setattr(documents, "ProcessPoolExecutor", Pool)
+    whole = read_document(str(path))
+    assert _header(whole)["cache"] == "partial" and len(pools) == 1
+    assert [f"Text of page {n}" in whole for n in range(1, 13)] == [True] * 12
+    assert whole.index("page 9\n") < whole.index("page 10")
+    assert _header(read_document(str(path), pages="1-"))["cache"] == "hit"
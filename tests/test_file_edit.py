@@ -0,0 +1,100 @@
+import os
+
+from seven.tools import file_edit, files
+
+SOURCE = "import os\n\n\ndef main():\n    value = 1\n    return value\n\n\ndef other():\n    value = 1\n    return value * 2\n"
+
+
+def test_search_replace_edits_apply_atomically_and_report_only_changed_lines(tmp_path):
+    p = tmp_path / "app.py"
+    p.write_text(SOURCE, encoding="utf-8")
+    os.chmod(p, 0o640)
+    out = files.edit_file(str(p), edits=[
+        {"search": "def main():\n    value = 1\n", "replace": "def main():\n    value = 2\n    log(value)\n"},
+        {"search": "import os", "replace": "import os\nimport sys"},
+    ])
+    assert out.splitlines() == [
+        f"OK edited {p.resolve()}: 2 hunk(s), +3 -1 lines, {len(SOURCE)} -> {len(SOURCE) + 26} bytes",
+        "@@ -2,0 +2,1 @@", "+import sys",
+        "@@ -5,1 +6,2 @@", "-    value = 1", "+    value = 2", "+    log(value)",
+    ]
+    assert p.read_text(encoding="utf-8") == SOURCE.replace("import os\n", "import os\nimport sys\n").replace(
+        "def main():\n    value = 1\n", "def main():\n    value = 2\n    log(value)\n")
+    assert os.stat(p).st_mode & 0o777 == 0o640
+    assert [name for name in os.listdir(tmp_path) if name.endswith(".tmp")] == []
+
+
+def test_failed_or_ambiguous_hunks_change_nothing(tmp_path):
+    p = tmp_path / "app.py"
+    p.write_text(SOURCE, encoding="utf-8")
+    out = files.edit_file(str(p), edits=[{"search": "    value = 1", "replace": "    value = 3"}])
+    assert out.startswith("ERROR: hunk 1 matches 2 times (lines 5, 10)")
+    out = files.edit_file(str(p), edits=[{"search": "def main():\n  value = 1", "replace": "x"}])
+    assert "does not match" in out and "line 4 (later lines differ)" in out and "nothing was changed" in out
+    out = files.edit_file(str(p), edits=[{"search": "def  other():", "replace": "x"}])
+    assert "first line found at line 9 (whitespace differs)" in out
+    out = files.edit_file(str(p), edits=[{"search": "import os", "replace": "import re"},
+                                         {"search": "import os\n", "replace": ""}])
+    assert "overlap" in out
+    assert files.edit_file(str(p), edits=[{"search": "import os", "replace": "x"}], diff="@@ -1 +1 @@").startswith("ERROR")
+    dry = files.edit_file(str(p), edits=[{"search": "import os", "replace": "import re"}], dry_run=True)
+    assert dry.startswith("OK would edit") and p.read_text(encoding="utf-8") == SOURCE
+
+
+def test_unified_diff_verifies_context_and_tolerates_line_drift(tmp_path):
+    p = tmp_path / "app.py"
+    p.write_text("# header\n" + SOURCE, encoding="utf-8")
+    diff = (
+        "--- a/app.py\n+++ b/app.py\n"
+        "@@ -9,3 +9,3 @@\n def other():\n-    value = 1\n+    value = 5\n     return value * 2\n"
+    )
+    out = files.edit_file(str(p), diff=diff)
+    assert out.splitlines()[1:] == ["@@ -11,1 +11,1 @@", "-    value = 1", "+    value = 5"]
+    assert "    value = 5\n    return value * 2\n" in p.read_text(encoding="utf-8")
+    assert "    value = 1\n    return value\n" in p.read_text(encoding="utf-8")
+    stale = "@@ -1,2 +1,2 @@\n import os\n-import sys\n+import re\n"
+    assert "does not match" in files.edit_file(str(p), diff=stale)
+    two_files = diff + "--- a/b.py\n+++ b/b.py\n@@ -1 +1 @@\n-x\n+y\n"
+    assert "more than one file" in files.edit_file(str(p), diff=two_files)
+
+
+def test_line_endings_and_missing_final_newline_are_preserved(tmp_path):
+    p = tmp_path / "win.ini"
+    p.write_bytes(b"[a]\r\nkey=1\r\nlast=2")
+    files.edit_file(str(p), edits=[{"search": "key=1", "replace": "key=9\nadded=1"}])
+    assert p.read_bytes() == b"[a]\r\nkey=9\r\nadded=1\r\nlast=2"
+    files.edit_file(str(p), edits=[{"search": "last=2", "replace": "last=3"}])
+    assert p.read_bytes().endswith(b"added=1\r\nlast=3")
+    files.edit_file(str(p), diff="@@ -4,0 +5,1 @@\n+tail=1\n")
+    assert p.read_bytes().endswith(b"last=3\r\ntail=1")
+    hunks = file_edit.hunks_from_diff("@@ -0,0 +1 @@\n+first\n")
+    assert hunks == [file_edit.Hunk((), ("first",), 0)]
+    mixed = tmp_path / "mixed.txt"
+    mixed.write_bytes(b"a\r\nb\nc\n")
+    assert file_edit._scan_chunked(str(mixed), [(b"a", b"b", b"c")], []) is None
+    files.edit_file(str(mixed), edits=[{"search": "a\nb\nc", "replace": "z"}])
+    assert mixed.read_bytes() == b"z\n"
+    tail = tmp_path / "tail.txt"
+    tail.write_bytes(b"a\r\nb\r\nc")
+    files.edit_file(str(tail), edits=[{"search": "c", "replace": ""}])
+    assert tail.read_bytes() == b"a\r\nb"
+    files.edit_file(str(tail), edits=[{"search": "a\nb", "replace": ""}])
+    assert tail.read_bytes() == b""
+    tail.write_bytes(b"a\nb\nc")
+    files.edit_file(str(tail), edits=[{"search": "b", "replace": ""}, {"search": "c", "replace": ""}])
+    assert tail.read_bytes() == b"a"
+
+
+def test_chunked_search_finds_matches_across_buffer_boundaries(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_edit, "COPY_CHUNK", 7)
+    p = tmp_path / "many.txt"
+    p.write_text("".join(f"row {i}\n" for i in range(200)) + "end", encoding="utf-8")
+    needles = [(b"row 57", b"row 58"), (b"end",)]
+    scan = file_edit._scan_chunked(str(p), needles + [()], [0, 57, 200, 201])
+    start = 10 * 6 + 47 * 7
+    assert scan.found[0] == [(57, start, start + 14, b"\n")] and scan.found[1][0][3] == b""
+    slow = file_edit._scan(str(p), needles + [()], [0, 57, 200, 201])
+    assert (scan.found, scan.line_offsets, scan.lines) == (slow.found, slow.line_offsets, 201)
+    assert scan.line_offsets[57] == start
+    files.edit_file(str(p), edits=[{"search": "row 57\nrow 58", "replace": "cut"}, {"search": "end", "replace": "fin"}])
+    assert "row 56\ncut\nrow 59\n" in p.read_text(encoding="utf-8") and p.read_text(encoding="utf-8").endswith("fin")
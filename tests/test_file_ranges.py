@@ -0,0 +1,62 @@
+import os
+
+from seven.tools import file_ranges, files
+
+
+def _log(path, lines=5000, final_newline=True):
+    body = "".join(f"line {i}\n" for i in range(1, lines + 1))
+    path.write_text(body if final_newline else body.rstrip("\n"), encoding="utf-8")
+    return body
+
+
+def test_read_file_head_and_byte_ranges_read_only_the_window(tmp_path, monkeypatch):
+    p = tmp_path / "big.log"
+    body = _log(p)
+    reads = []
+    real_range = file_ranges.read_range
+    monkeypatch.setattr(files, "read_range", lambda *args: reads.append(args[1:]) or real_range(*args))
+
+    out = files.read_file(str(p), max_bytes=14)
+    assert out.endswith("\n\nline 1\nline 2\n\n...[truncated]") and reads == [(0, 14)]
+    out = files.read_file(str(p), offset=7, length=7)
+    assert f"size={len(body)}\nrange=bytes 7-14\n\nline 2\n" in out and not out.endswith("[truncated]")
+    assert files.read_file(str(p), offset=len(body) - 10).endswith("\n\nline 5000\n")
+    assert files.read_file(str(p), offset=7, length=100, max_bytes=7).endswith("line 2\n\n...[truncated]")
+    assert files.read_file(str(p), offset=1, tail_lines=2).startswith("ERROR")
+    assert files.read_file(str(p), tail_lines=-1).startswith("ERROR")
+
+
+def test_tail_lines_seeks_backwards_and_stays_within_max_bytes(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_ranges, "TAIL_CHUNK", 16)
+    p = tmp_path / "app.log"
+    _log(p)
+    assert files.read_file(str(p), tail_lines=3).endswith("range=last 3 lines\n\nline 4998\nline 4999\nline 5000\n")
+    _log(p, final_newline=False)
+    assert file_ranges.read_tail(str(p), 2, 1000) == (b"line 4999\nline 5000", False)
+    assert file_ranges.read_tail(str(p), 4000, 20) == (b"\nline 4999\nline 5000", True)
+    _log(p, lines=2)
+    assert file_ranges.read_tail(str(p), 10, 1000) == (b"line 1\nline 2\n", False)
+
+
+def test_line_windows_use_a_cached_index_invalidated_by_mtime(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_ranges, "LINE_INDEX_BLOCK", 64)
+    monkeypatch.setattr(file_ranges, "_INDEXES", type(file_ranges._INDEXES)())
+    p = tmp_path / "data.txt"
+    _log(p, final_newline=False)
+    out = files.read_file(str(p), start_line=1234, end_line=1236)
+    assert out.endswith("range=lines 1234-1236 of 5000\n\nline 1234\nline 1235\nline 1236\n")
+    assert files.read_file(str(p), start_line=4999).endswith("\n\nline 4999\nline 5000")
+    assert files.read_file(str(p), start_line=6000).endswith("range=lines none of 5000\n\n")
+    window = file_ranges.read_lines(str(p), 10, 20, max_bytes=12)
+    assert (window.data, window.last, window.truncated) == (b"line 10\nline", 11, True)
+    assert files.read_file(str(p), start_line=5, end_line=4).startswith("ERROR")
+
+    built = []
+    real_build = file_ranges._build_index
+    monkeypatch.setattr(file_ranges, "_build_index", lambda *args: built.append(1) or real_build(*args))
+    files.read_file(str(p), start_line=1, end_line=2)
+    assert built == []
+    p.write_text("only\nthree\nlines\n", encoding="utf-8")
+    os.utime(p, ns=(1, 1))
+    assert files.read_file(str(p), start_line=2, end_line=9).endswith("range=lines 2-3 of 3\n\nthree\nlines\n")
+    assert built == [1]
@@ -0,0 +1,88 @@
+from seven.tools import file_search, files
+
+
+def _tree(root):
+    (root / ".git" / "objects").mkdir(parents=True)
+    (root / ".git" / "objects" / "keep.py").write_text("needle\n", encoding="utf-8")
+    (root / ".gitignore").write_text("build/\n*.log\n!keep.log\n/top.txt\n", encoding="utf-8")
+    (root / "build").mkdir()
+    (root / "build" / "out.py").write_text("needle\n", encoding="utf-8")
+    (root / "src" / "pkg").mkdir(parents=True)
+    (root / "src" / ".gitignore").write_text("generated_*.py\n", encoding="utf-8")
+    (root / "src" / "a.py").write_text("first\nsecond needle\nthird\nNEEDLE again\n", encoding="utf-8")
+    (root / "src" / "generated_x.py").write_text("needle\n", encoding="utf-8")
+    (root / "src" / "pkg" / "b.py").write_text("needle in b\n", encoding="utf-8")
+    (root / "src" / "pkg" / "top.txt").write_text("needle nested top\n", encoding="utf-8")
+    (root / "top.txt").write_text("needle\n", encoding="utf-8")
+    (root / "debug.log").write_text("needle\n", encoding="utf-8")
+    (root / "keep.log").write_text("needle kept\n", encoding="utf-8")
+    (root / "blob.bin").write_bytes(b"needle\0\x01\x02")
+
+
+def test_walk_honours_gitignore_vcs_dirs_and_is_breadth_first(tmp_path):
+    _tree(tmp_path)
+    rels = [entry.rel for entry in file_search.walk(str(tmp_path))]
+    assert rels == [
+        ".gitignore", "blob.bin", "keep.log", "src",
+        "src/.gitignore", "src/a.py", "src/pkg",
+        "src/pkg/b.py", "src/pkg/top.txt",
+    ]
+    everything = {entry.rel for entry in file_search.walk(str(tmp_path), ignore=False)}
+    assert {".git/objects/keep.py", "build/out.py", "src/generated_x.py", "top.txt", "debug.log"} <= everything
+    assert [entry.rel for entry in file_search.walk(str(tmp_path), workers=3)] == rels
+
+
+def test_search_files_stops_at_max_hits_and_can_include_ignored(tmp_path):
+    _tree(tmp_path)
+    out = files.search_files(str(tmp_path), "*.py", max_hits=1)
+    assert out.splitlines() == [str(tmp_path / "src" / "a.py"), "... stopped at max_hits=1"]
+    assert "out.py" not in files.search_files(str(tmp_path), "*.py")
+    assert str(tmp_path / "build" / "out.py") in files.search_files(str(tmp_path), "*.py", include_ignored=True)
+    assert files.search_files(str(tmp_path), "pkg/*.py") == str(tmp_path / "src" / "pkg" / "b.py")
+    assert files.search_files(str(tmp_path), "*.rs").startswith("No matches")
+
+
+def test_grep_files_reports_line_numbers_and_skips_binary_and_ignored(tmp_path):
+    _tree(tmp_path)
+    out = files.grep_files(str(tmp_path), "needle")
+    assert out.splitlines() == [
+        f"root={tmp_path.resolve()}",
+        "keep.log:1: needle kept",
+        "src/a.py:2: second needle",
+        "src/pkg/b.py:1: needle in b",
+        "src/pkg/top.txt:1: needle nested top",
+    ]
+    assert "src/a.py:4: NEEDLE again" in files.grep_files(str(tmp_path), "needle", glob="*.py", ignore_case=True)
+    assert files.grep_files(str(tmp_path), r"ne+dle\s+in", regex=True).splitlines()[1] == "src/pkg/b.py:1: needle in b"
+    limited = files.grep_files(str(tmp_path), "needle", max_hits=2).splitlines()
+    assert limited[-1] == "... stopped at max_hits=2" and len(limited) == 4
+    assert "blob.bin" not in files.grep_files(str(tmp_path), "needle", include_ignored=True)
+    assert files.grep_files(str(tmp_path), "(", regex=True).startswith("ERROR: bad regex")
+
+
+def test_double_star_matches_root_and_regex_anchors_each_line(tmp_path):
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "t.py").write_text("def top():\n    pass\n", encoding="utf-8")
+    (tmp_path / "a" / "m.py").write_text("import os\n\ndef one():\n    pass\n\ndef two():\n    pass\n# end\n", encoding="utf-8")
+    (tmp_path / "a" / "b" / "deep.py").write_text("x = 1\n", encoding="utf-8")
+    found = files.search_files(str(tmp_path), "**/*.py").splitlines()
+    assert sorted(found) == sorted(str(tmp_path / rel) for rel in ("t.py", "a/m.py", "a/b/deep.py"))
+    assert files.search_files(str(tmp_path), "a/**/*.py").splitlines() == [str(tmp_path / "a" / "m.py"), str(tmp_path / "a" / "b" / "deep.py")]
+    assert files.search_files(str(tmp_path), "b/*.py") == str(tmp_path / "a" / "b" / "deep.py")
+
+    defs = files.grep_files(str(tmp_path), "^def ", regex=True).splitlines()[1:]
+    assert defs == ["t.py:1: def top():", "a/m.py:3: def one():", "a/m.py:6: def two():"]
+    assert files.grep_files(str(tmp_path), "pass$", regex=True).splitlines()[1:] == [
+        "t.py:2:     pass", "a/m.py:4:     pass", "a/m.py:7:     pass",
+    ]
+    assert files.grep_files(str(tmp_path), "^pass", regex=True).startswith("No matches")
+
+
+def test_large_files_are_searched_through_mmap_with_bounded_lines(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_search, "MMAP_MIN_BYTES", 64)
+    big = tmp_path / "big.txt"
+    big.write_bytes(b"".join(b"row %d\n" % i for i in range(20000)) + b"x" * 100_000 + b" needle\nrow end needle\n")
+    hits = file_search.grep_file(str(big), file_search.compile_query("needle"), 10)
+    assert [hit.line_no for hit in hits] == [20001, 20002]
+    assert len(hits[0].line) == file_search.MAX_LINE_CHARS and hits[1].line == "row end needle"
+    assert file_search.grep_file(str(big), file_search.compile_query("row 1999"), 1)[0].line_no == 2000
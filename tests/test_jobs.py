@@ -0,0 +1,116 @@
+import json
+import os
+import sys
+import time
+
+from seven.memory.store import Memory
+from seven.runtime import jobs as jobs_module
+from seven.runtime.process import run_tracked
+from seven.tools.registry import Tool, ToolRegistry
+
+
+def _registry(tmp_path, monkeypatch, workers=2):
+    monkeypatch.setattr(jobs_module.config, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(jobs_module.config, "JOB_WORKERS", workers)
+    reg = ToolRegistry(Memory(tmp_path / "seven.db"))
+
+    def count(n: int = 3, pause: float = 0.0) -> str:
+        code = f"import time\nfor i in range({int(n)}):\n    print('line', i, flush=True)\n    time.sleep({float(pause)})"
+        result = run_tracked([sys.executable, "-c", code], timeout=60, stream=True)
+        if result.cancelled:
+            return "ERROR: cancelled"
+        return f"exit_code={result.returncode}\n{result.stdout}"
+
+    reg.register(Tool("count", "test", {"type": "object", "properties": {
+        "n": {"type": "integer"}, "pause": {"type": "number"}}}, count))
+    reg.load_module("jobs")
+    return reg
+
+
+def _wait(reg, job_id, statuses=("succeeded", "failed", "cancelled"), timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = reg.memory.get_job(job_id)
+        if job["status"] in statuses:
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f"job {job_id} stuck at {job['status']}")
+
+
+def test_job_returns_at_once_and_streams_output_to_its_log(tmp_path, monkeypatch):
+    reg = _registry(tmp_path, monkeypatch)
+    finished = []
+    try:
+        started = time.monotonic()
+        out = reg.execute("start_job", {"tool": "count", "arguments": {"n": 3, "pause": 0.3}})
+        assert out.startswith("OK started job #1") and time.monotonic() - started < 1
+        reg.jobs.listeners["test"] = finished.append
+        status = json.loads(reg.execute("job_status", {"job_id": 1}))
+        assert status["status"] in ("queued", "running") and status["tool"] == "count"
+
+        job = _wait(reg, 1)
+        assert job["status"] == "succeeded" and job["ok"] == 1 and job["arguments"] == {"n": 3, "pause": 0.3}
+        output = reg.execute("job_output", {"job_id": 1})
+        assert "[stdout] line 0" in output and "[stdout] line 2" in output
+        assert "RESULT:\nexit_code=0" in output
+        # Listeners run just after the finished status is stored.
+        deadline = time.monotonic() + 5
+        while not finished and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert [item["id"] for item in finished] == [1]
+        assert "[1] count succeeded" in reg.execute("list_jobs", {})
+    finally:
+        reg.jobs.close()
+
+
+def test_jobs_run_in_parallel_up_to_the_limit_and_cancel(tmp_path, monkeypatch):
+    reg = _registry(tmp_path, monkeypatch, workers=1)
+    try:
+        reg.execute("start_job", {"tool": "count", "arguments": {"n": 100, "pause": 0.2}})
+        reg.execute("start_job", {"tool": "count", "arguments": {"n": 1}})
+        _wait(reg, 1, statuses=("running",))
+        assert reg.memory.get_job(2)["status"] == "queued"
+
+        assert reg.execute("job_cancel", {"job_id": 2}) == "OK job #2 is cancelled."
+        started = time.monotonic()
+        assert reg.execute("job_cancel", {"job_id": 1}).startswith("OK cancel requested")
+        assert _wait(reg, 1)["status"] == "cancelled"
+        assert time.monotonic() - started < 5
+
+        assert reg.execute("start_job", {"tool": "start_job"}).startswith("ERROR")
+        assert reg.execute("start_job", {"tool": "no_such_tool"}).startswith("ERROR")
+        assert reg.execute("job_status", {"job_id": 99}).startswith("ERROR")
+    finally:
+        reg.jobs.close()
+
+
+def test_orphaned_jobs_are_interrupted_and_foreign_jobs_not_cancelled(tmp_path, monkeypatch):
+    memory = Memory(tmp_path / "seven.db")
+    dead = memory.add_job("count", {}, pid=2 ** 22 + 12345)
+    foreign = memory.add_job("count", {}, pid=os.getppid())
+    memory.start_job(foreign)
+    reg = _registry(tmp_path, monkeypatch)
+    try:
+        assert reg.execute("list_jobs", {"status": "interrupted"}).startswith(f"[{dead}]")
+        assert "belongs to process" in reg.execute("job_cancel", {"job_id": foreign})
+        assert memory.get_job(foreign)["status"] == "running"
+    finally:
+        reg.jobs.close()
+
+
+def test_agent_announces_each_finished_job_once(tmp_path, monkeypatch):
+    from seven.agent.loop import Seven
+    from seven import config
+
+    monkeypatch.setattr(config, "AUTO_SELECT_MODEL", False)
+    agent = Seven(tool_tier="core")
+    agent.memory = Memory(tmp_path / "seven.db")
+    job_id = agent.memory.add_job("run_claude_cli", {"prompt": "fix it"}, os.getpid())
+    agent.memory.finish_job(job_id, "succeeded", "all tests pass\nmore")
+    assert agent._announce_finished_jobs() is False
+
+    spoken = []
+    agent.freewill.on_utter = spoken.append
+    assert agent._announce_finished_jobs() is True
+    assert spoken == [f"Background job #{job_id} (run_claude_cli) succeeded: all tests pass"]
+    assert agent._announce_finished_jobs() is False
@@ -0,0 +1,51 @@
+from seven import config
+from seven.memory.store import Memory
+from seven.tools.registry import build_default_registry, load_tool_manifest
+from scripts.benchmark_startup import benchmark
+
+
+def test_manifest_serves_schemas_and_binds_on_first_execution(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(config, "ENABLE_EXTENSIONS", False)
+    memory = Memory(tmp_path / "lazy.db")
+    eager = build_default_registry(memory, tier="full")
+    assert load_tool_manifest() is not None
+
+    lazy = build_default_registry(memory, tier="full")
+    assert lazy.schemas() == eager.schemas()
+    assert lazy._loaded_modules == set()
+    assert "os=" in lazy.execute("get_system_info", {}) or "time=" in lazy.execute("get_system_info", {})
+    assert lazy._loaded_modules == {"system_info"}
+
+
+def test_stale_manifest_is_rebuilt(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(config, "ENABLE_EXTENSIONS", False)
+    build_default_registry(Memory(tmp_path / "m.db"))
+    path = tmp_path / "tool_manifest.json"
+    path.write_text(path.read_text(encoding="utf-8").replace('"fingerprint": "', '"fingerprint": "x'), encoding="utf-8")
+    assert load_tool_manifest() is None
+    reg = build_default_registry(Memory(tmp_path / "m.db"))
+    assert "run_shell" in reg.all_names()
+    assert load_tool_manifest() is not None
+
+
+def test_agent_context_is_late_bound(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(config, "ENABLE_EXTENSIONS", False)
+    build_default_registry(Memory(tmp_path / "a.db"))
+    reg = build_default_registry(Memory(tmp_path / "a.db"))
+
+    class Agent:
+        class planner:
+            @staticmethod
+            def execute_next_step(plan_id=None):
+                return f"stepped {plan_id}"
+
+    reg.bind_context(agent=Agent())
+    assert reg.execute("advance_plan", {"plan_id": 3}) == "stepped 3"
+
+
+def test_startup_within_budget():
+    report = benchmark()
+    assert report["failures"] == [], report
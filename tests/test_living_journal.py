@@ -0,0 +1,104 @@
+import json
+import threading
+import time
+
+from seven.mind.journal import LivingJournal
+from seven.mind.state import LivingState
+
+
+def test_snapshot_plus_journal_replay(tmp_path, monkeypatch):
+    from seven import config
+    monkeypatch.setattr(config, "LIVING_SNAPSHOT_INTERVAL", 3600)
+    path = tmp_path / "living_state.json"
+    living = LivingState(path=path)
+    living.refresh()
+    snapshot = json.loads(path.read_text(encoding="utf-8"))
+    # Later events only reach the journal until the next snapshot.
+    living.refresh()
+    living.record_action("wrote report", reflection="done")
+    assert json.loads(path.read_text(encoding="utf-8"))["seq"] == snapshot["seq"]
+
+    reloaded = LivingState(path=path)
+    assert reloaded.tick_count == 2
+    assert reloaded.last_action == "wrote report"
+    assert reloaded.last_reflection == "done"
+    assert reloaded.world and reloaded.history[-1]["tick"] == 2
+
+
+def test_torn_journal_line_is_skipped(tmp_path):
+    journal = LivingJournal(tmp_path / "j.jsonl")
+    journal.append("tick", tick=1)
+    with journal.path.open("a", encoding="utf-8") as stream:
+        stream.write('{"seq": 2, "kind": "ti')
+    reopened = LivingJournal(tmp_path / "j.jsonl")
+    assert [e["tick"] for e in reopened.entries(kinds=("tick",))] == [1]
+    assert reopened.append("tick", tick=2)["seq"] == 2
+
+
+def test_compaction_bounds_retention(tmp_path):
+    journal = LivingJournal(tmp_path / "j.jsonl", retention_days=1, max_entries=10)
+    for i in range(12):
+        journal.append("tick", tick=i)
+    assert journal.needs_compaction()
+    journal.compact(now=time.time())
+    assert journal.lines == 5
+    assert [e["tick"] for e in journal.entries()] == [7, 8, 9, 10, 11]
+    journal.compact(now=time.time() + 2 * 86400)
+    assert list(journal.entries()) == []
+
+
+def test_time_window_queries_and_cadence(tmp_path):
+    journal = LivingJournal(tmp_path / "j.jsonl")
+    base = 1_700_000_000.0
+    lines = [{"seq": 1, "unix": base, "kind": "boot"}]
+    lines += [{"seq": i + 2, "unix": base + 60 * i, "kind": "tick", "tick": i + 1} for i in range(5)]
+    lines.append({"seq": 7, "unix": base + 60 * 4 + 7200, "kind": "tick", "tick": 6})
+    journal.path.write_text("".join(json.dumps(x) + "\n" for x in lines), encoding="utf-8")
+
+    window = list(journal.entries(since=base + 60, until=base + 180, kinds=("tick",)))
+    assert [e["tick"] for e in window] == [2, 3, 4]
+    stats = journal.cadence()
+    assert stats["ticks"] == 6 and stats["boots"] == 1
+    assert stats["interval_median_s"] == 60
+    assert stats["downtime_gaps"] == 1
+    assert stats["uptime_s"] == 240
+
+
+def test_two_writers_share_one_increasing_seq_and_compaction_loses_nothing(tmp_path):
+    # Separate instances stand in for the daemon and the CLI: only the file lock serialises them.
+    daemon = LivingJournal(tmp_path / "j.jsonl", max_entries=100_000)
+    cli = LivingJournal(tmp_path / "j.jsonl", max_entries=100_000)
+
+    def write(journal, who):
+        for i in range(150):
+            journal.append("tick", who=who, i=i)
+            if who == "daemon" and i % 25 == 0:
+                journal.compact()
+
+    threads = [threading.Thread(target=write, args=(j, w)) for j, w in ((daemon, "daemon"), (cli, "cli"))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seqs = [e["seq"] for e in daemon.entries()]
+    assert seqs == list(range(1, 301))
+    assert sorted(e["i"] for e in daemon.entries() if e["who"] == "cli") == list(range(150))
+    assert daemon.last_seq() == 300
+
+
+def test_snapshot_folds_in_the_other_process_entries(tmp_path, monkeypatch):
+    from seven import config
+    monkeypatch.setattr(config, "LIVING_SNAPSHOT_INTERVAL", 3600)
+    path = tmp_path / "living_state.json"
+    daemon = LivingState(path=path)
+    cli = LivingState(path=path)
+    cli.record_action("answered from the cli", reflection="cli reflection")
+    daemon.refresh()
+    daemon.refresh()
+    daemon.save()
+    assert json.loads(path.read_text(encoding="utf-8"))["seq"] == daemon.journal.last_seq()
+
+    reloaded = LivingState(path=path)
+    assert reloaded.last_action == "answered from the cli"
+    assert reloaded.last_reflection == "cli reflection"
+    assert reloaded.tick_count == 2
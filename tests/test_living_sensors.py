@@ -0,0 +1,78 @@
+import time
+
+from seven.memory.store import Memory
+from seven.mind.sensors import SensorHub
+from seven.mind.state import LivingState
+
+
+class CountingBrain:
+    def __init__(self):
+        self.pings = 0
+
+    def ping(self):
+        self.pings += 1
+        return {"ok": True, "provider": "ollama", "model": "test", "loaded": []}
+
+
+def test_probe_ttl_caches_ollama_ping(tmp_path):
+    brain = CountingBrain()
+    hub = SensorHub(memory=Memory(tmp_path / "s.db"), brain=brain, ttls={"ollama": 60})
+    assert hub.read("ollama")["ok"] is True
+    hub.read("ollama")
+    hub.snapshot()
+    assert brain.pings == 1
+    hub.invalidate("ollama")
+    hub.read("ollama")
+    assert brain.pings == 2
+    assert len(hub.history("ollama")) == 2
+
+
+def test_seeded_probe_skips_sensing(tmp_path):
+    brain = CountingBrain()
+    hub = SensorHub(brain=brain)
+    hub.seed("ollama", {"ok": False, "error": "offline"})
+    assert hub.read("ollama")["error"] == "offline"
+    assert brain.pings == 0
+    assert hub.freshness()["ollama"] is not None
+
+
+def test_ring_buffer_is_bounded(tmp_path):
+    hub = SensorHub(memory=Memory(tmp_path / "r.db"), ttls={"work": 0}, history=3)
+    for _ in range(5):
+        hub.read("work")
+    assert len(hub.history("work")) == 3
+
+
+def test_background_sampler_serves_cached_snapshot(tmp_path):
+    brain = CountingBrain()
+    hub = SensorHub(memory=Memory(tmp_path / "b.db"), brain=brain,
+                    ttls={"resources": 0.2, "ollama": 0.2, "work": 0.2})
+    hub.start()
+    try:
+        deadline = time.time() + 3
+        while brain.pings < 2 and time.time() < deadline:
+            time.sleep(0.05)
+        assert hub.running()
+        before = brain.pings
+        for _ in range(20):
+            hub.snapshot()
+        # readers never trigger extra pings while the sampler owns freshness
+        assert brain.pings - before <= 1
+    finally:
+        hub.stop()
+    assert not hub.running()
+
+
+def test_living_state_journals_state_only_on_material_change(tmp_path):
+    path = tmp_path / "living_state.json"
+    memory = Memory(tmp_path / "m.db")
+    hub = SensorHub(memory=memory, ttls={"resources": 60, "ollama": 60, "work": 0})
+    living = LivingState(path=path)
+    living.refresh(memory=memory, sensors=hub)
+    living.refresh(memory=memory, sensors=hub)
+    kinds = [e["kind"] for e in living.journal.entries()]
+    assert kinds.count("tick") == 2 and kinds.count("state") == 1
+
+    memory.add_goal("ship sensor hub")
+    living.refresh(memory=memory, sensors=hub)
+    assert [e["kind"] for e in living.journal.entries()].count("state") == 2
@@ -1,7 +1,14 @@
+import asyncio
+import sys
+import time
+from types import SimpleNamespace
+
 import pytest
 
-from seven.mcp_server import SevenMCP, create_server
+from seven.mcp_server import SevenMCP, _progress_notifier, create_server
 from seven.memory.store import Memory
+from seven.runtime.process import run_tracked
+from seven.runtime.progress import report_progress
 from seven.tools.registry import Tool, ToolRegistry
 
 
@@ -38,3 +45,107 @@ def test_low_level_server_lists_and_calls_tools(tmp_path):
     assert options.server_name == "seven-ai"
     assert options.capabilities.tools is not None
     assert server.seven_adapter.call("echo_real", {"text": "mcp"}) == "echo:mcp"
+
+
+def test_spec_list_is_cached_until_the_registry_changes(tmp_path):
+    adapter = _adapter(tmp_path)
+    first = adapter.tool_specs()
+    assert adapter.tool_specs() is first
+    adapter.registry.register(Tool(name="late_tool", description="", parameters={"type": "object"}, handler=lambda: "ok"))
+    second = adapter.tool_specs()
+    assert second is not first and {s["name"] for s in second} == {"echo_real", "late_tool"}
+    adapter.registry.unregister("late_tool")
+    assert [s["name"] for s in adapter.tool_specs()] == ["echo_real"]
+
+
+def test_concurrency_classes_serialize_desktop_and_parallelize_reads(tmp_path):
+    adapter = _adapter(tmp_path)
+    running = {"read": 0, "desktop": 0}
+    peak = {"read": 0, "desktop": 0}
+
+    def make(kind):
+        def handler():
+            running[kind] += 1
+            peak[kind] = max(peak[kind], running[kind])
+            time.sleep(0.05)
+            running[kind] -= 1
+            return kind
+        return handler
+
+    for kind in ("read", "desktop"):
+        adapter.registry.register(Tool(
+            name=f"{kind}_probe", description="", parameters={"type": "object"},
+            handler=make(kind), tags=[f"concurrency:{kind}"],
+        ))
+
+    async def fire():
+        calls = [adapter.call_async(f"{kind}_probe") for kind in ("read", "desktop") for _ in range(6)]
+        return await asyncio.gather(*calls)
+
+    assert sorted(set(asyncio.run(fire()))) == ["desktop", "read"]
+    assert peak["desktop"] == 1 and peak["read"] > 1
+    assert adapter.registry.concurrency_class("mouse_click") == "desktop"
+    assert adapter.registry.concurrency_class("run_claude_cli") == "heavy"
+    assert adapter.registry.concurrency_class("read_file") == "read"
+    assert adapter.registry.concurrency_class("write_file") == "default"
+
+
+def test_cancelled_call_stops_its_process_tree_and_frees_the_slot(tmp_path):
+    adapter = _adapter(tmp_path)
+    marker = tmp_path / "child-survived.txt"
+    results = []
+
+    def slow():
+        code = f"import time; time.sleep(3); open({str(marker)!r}, 'w').write('x')"
+        result = run_tracked([sys.executable, "-c", code], timeout=30)
+        results.append(result)
+        return "cancelled" if result.cancelled else "finished"
+
+    adapter.registry.register(Tool(
+        name="slow_proc", description="", parameters={"type": "object"}, handler=slow, tags=["concurrency:desktop"],
+    ))
+
+    async def scenario():
+        task = asyncio.ensure_future(adapter.call_async("slow_proc"))
+        await asyncio.sleep(0.5)
+        started = time.monotonic()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # Other classes keep working; the desktop slot frees once the tree is gone.
+        assert await adapter.call_async("echo_real", {"text": "after"}) == "echo:after"
+        await asyncio.wait_for(adapter._slot("slow_proc").acquire(), 5)
+        return time.monotonic() - started
+
+    assert asyncio.run(scenario()) < 2.5
+    assert results and results[0].cancelled is True and results[0].terminated_pids
+    time.sleep(0.2)
+    assert marker.exists() is False
+
+
+def test_tool_progress_is_forwarded_as_mcp_notifications(tmp_path):
+    adapter = _adapter(tmp_path)
+
+    def pages():
+        for page in range(1, 4):
+            report_progress(page, 3, f"page {page}/3", unit="pages")
+        return "parsed"
+
+    adapter.registry.register(Tool(name="pages_probe", description="", parameters={"type": "object"}, handler=pages))
+    sent = []
+
+    class Session:
+        async def send_progress_notification(self, token, progress, total=None, message=None, related_request_id=None):
+            sent.append((token, progress, total, message, related_request_id))
+
+    async def scenario():
+        context = SimpleNamespace(meta=SimpleNamespace(progressToken="tok-1"), session=Session(), request_id=7)
+        assert _progress_notifier(SimpleNamespace(meta=None, session=Session(), request_id=8)) is None
+        result = await adapter.call_async("pages_probe", on_progress=_progress_notifier(context))
+        await asyncio.sleep(0.05)  # notifications were scheduled from the worker thread
+        return result
+
+    assert asyncio.run(scenario()) == "parsed"
+    # Throttled to the interval, but the final report always arrives.
+    assert sent[0] == ("tok-1", 1, 3, "page 1/3", 7)
+    assert sent[-1] == ("tok-1", 3, 3, "page 3/3", 7)
@@ -1,4 +1,7 @@
 import json
+import sqlite3
+
+import pytest
 
 from seven.memory.store import Memory
 from seven.runtime.memory_ops import export_memory, memory_check
@@ -51,3 +54,29 @@ def test_invalid_database_is_reported(tmp_path):
     result = memory_check(db)
     assert result["ok"] is False
     assert result["errors"]
+
+
+def test_keyset_pages_filters_and_indexes(tmp_path):
+    memory = Memory(tmp_path / "seven.db")
+    for i in range(450):
+        memory.audit(f"tool{i % 3}", {"n": i}, "done", i % 2 == 0)
+    first = list(memory.page("audit", limit=250, tool="tool1"))
+    assert len(first) == 150 and first[0]["id"] > first[-1]["id"]
+    assert first[0]["arguments"] == {"n": 448} and first[0]["ok"] is True
+    older = list(memory.page("audit", limit=10, before=first[9]["id"], tool="tool1"))
+    assert [row["id"] for row in older] == [row["id"] for row in first[10:20]]
+    newer = list(memory.page("audit", limit=5, after=440, ok=False))
+    assert [row["id"] for row in newer] == [442, 444, 446, 448, 450]
+    assert list(memory.page("audit", since=4102444800)) == []
+    assert len(list(memory.page("audit", limit=1000, until="2999-01-01T00:00:00Z", q="tool2"))) == 150
+    with pytest.raises(ValueError, match="unsupported filter"):
+        list(memory.page("notes", tool="x"))
+    with pytest.raises(ValueError, match="invalid time"):
+        list(memory.page("messages", since="yesterday"))
+    with sqlite3.connect(tmp_path / "seven.db") as conn:
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+        plan = " ".join(row[3] for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM audit WHERE tool = ? AND created_at >= ?", ("tool1", "2000")
+        ))
+    assert {"idx_audit_tool_created", "idx_messages_created"} <= indexes
+    assert "idx_audit_tool_created" in plan
@@ -0,0 +1,132 @@
+import threading
+
+import pytest
+import requests
+
+from seven import metrics
+from seven.memory.store import Memory
+from seven.tools.registry import Tool, ToolRegistry
+from seven.ui import api_server
+
+
+def _sample(text, line_prefix):
+    for line in text.splitlines():
+        if line.startswith(line_prefix):
+            return float(line.rsplit(" ", 1)[1])
+    return None
+
+
+def test_histogram_counter_and_gauge_render_prometheus_text():
+    registry = metrics.Registry()
+    latency = registry.register(metrics.Histogram("t_seconds", "Test latency.", ("op",), buckets=(0.1, 1.0)))
+    calls = registry.register(metrics.Counter("t_calls_total", "Test calls.", ("op",)))
+    depth = registry.register(metrics.Gauge("t_depth", "Test depth.", ("queue",), source=lambda: {("a",): 3, ("b",): 1}))
+    for value in (0.05, 0.5, 5.0):
+        latency.labels('x"y').observe(value)
+    calls.labels("x").inc()
+    calls.labels("x").inc(2)
+    text = registry.render()
+    assert "# TYPE t_seconds histogram" in text
+    assert 't_seconds_bucket{op="x\\"y",le="0.1"} 1' in text
+    assert 't_seconds_bucket{op="x\\"y",le="1"} 2' in text
+    assert 't_seconds_bucket{op="x\\"y",le="+Inf"} 3' in text
+    assert 't_seconds_count{op="x\\"y"} 3' in text
+    assert 't_calls_total{op="x"} 3' in text
+    assert 't_depth{queue="a"} 3' in text and depth.source is not None
+    with pytest.raises(ValueError):
+        calls.labels("x", "extra")
+    # registering the same name again returns the live family
+    assert registry.register(metrics.Counter("t_calls_total", "again", ("op",))) is calls
+
+
+def test_concurrent_observations_are_not_lost():
+    hist = metrics.Histogram("t_concurrent", "x")
+    def work():
+        for _ in range(2000):
+            hist.observe(0.01)
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert hist.labels().count == 16000
+
+
+def test_tool_and_sqlite_operations_are_measured(tmp_path):
+    memory = Memory(tmp_path / "m.db")
+    reg = ToolRegistry(memory=memory)
+    reg.register(Tool("metric_ok", "ok", {"type": "object", "properties": {}}, lambda: "fine"))
+    reg.register(Tool("metric_bad", "bad", {"type": "object", "properties": {}}, lambda: "ERROR nope"))
+    reg.execute("metric_ok", {})
+    reg.execute("metric_bad", {})
+    reg.execute("no_such_tool_xyz", {})
+    text = metrics.render()
+    assert _sample(text, 'seven_tool_seconds_count{tool="metric_ok"}') >= 1
+    assert _sample(text, 'seven_tool_errors_total{tool="metric_bad"}') >= 1
+    assert _sample(text, 'seven_tool_errors_total{tool="unknown"}') >= 1
+    assert "no_such_tool_xyz" not in text
+    assert _sample(text, 'seven_sqlite_seconds_count{op="audit"}') >= 3
+
+
+def test_sqlite_op_label_is_explicit_through_helpers(tmp_path):
+    memory = Memory(tmp_path / "m.db")
+    before = _sample(metrics.render(), 'seven_sqlite_seconds_count{op="remember"}') or 0
+    memory.remember("teal", key="colour")
+    assert _sample(metrics.render(), 'seven_sqlite_seconds_count{op="remember"}') == before + 1
+
+    def shared_query(op):  # a helper frame between the public method and _conn
+        with memory._conn(op) as c:
+            return c.execute("SELECT COUNT(*) FROM facts").fetchone()[0]
+
+    assert shared_query("fact_count") == 1
+    text = metrics.render()
+    assert _sample(text, 'seven_sqlite_seconds_count{op="fact_count"}') == 1
+    assert 'op="shared_query"' not in text
+
+
+def test_llm_calls_record_caller_model_and_tokens(monkeypatch):
+    from seven.brain import llm
+
+    brain = llm.Brain(provider="ollama", model="metric-model")
+    monkeypatch.setattr(brain, "_ollama_chat", lambda *a, **k: {
+        "content": "hi", "tool_calls": [], "model": "metric-model",
+        "raw": {"prompt_eval_count": 11, "eval_count": 4},
+    })
+    brain.generate("hello")
+    text = metrics.render()
+    caller = __name__  # generate() is skipped: the caller is the module outside llm.py
+    assert _sample(text, f'seven_llm_seconds_count{{caller="{caller}",model="metric-model"}}') >= 1
+    assert _sample(text, f'seven_llm_tokens_total{{caller="{caller}",model="metric-model",kind="prompt"}}') >= 11
+    assert _sample(text, f'seven_llm_tokens_total{{caller="{caller}",model="metric-model",kind="completion"}}') >= 4
+
+
+class Agent:
+    class tools:
+        @staticmethod
+        def names(): return []
+    def handle(self, message, on_event=None, cancel=None): return "ok"
+    def start_heartbeat(self): pass
+    def shutdown(self): pass
+
+
+@pytest.mark.parametrize("backend", ["threading", "asyncio"])
+def test_metrics_endpoint_requires_auth_and_reports_api_counters(tmp_path, monkeypatch, backend):
+    monkeypatch.setattr(api_server.config, "DATA_DIR", tmp_path)
+    monkeypatch.delenv("SEVEN_API_TOKEN", raising=False)
+    server = api_server.start_api_server(port=0, agent=Agent(), backend=backend)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    headers = {"Authorization": f"Bearer {server.seven_api_token}"}
+    try:
+        assert requests.get(base + "/metrics", timeout=3).status_code == 401
+        requests.post(base + "/chat", headers=headers, json={"message": "x"}, timeout=3)
+        response = requests.get(base + "/metrics", headers=headers, timeout=3)
+        assert response.status_code == 200
+        assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+        text = response.text
+        assert _sample(text, f'seven_api_requests_total{{backend="{backend}",route="/chat",code="200"}}') >= 1
+        assert _sample(text, f'seven_api_inflight{{backend="{backend}"}}') >= 1  # the scrape itself
+        assert f'seven_api_queue_depth{{backend="{backend}",queue="turns_waiting"}} 0' in text
+        assert "# TYPE seven_handle_seconds histogram" in text
+    finally:
+        server.shutdown_cleanly()
+    assert server not in api_server.LIVE_SERVERS
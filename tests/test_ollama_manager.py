@@ -42,6 +42,24 @@ def test_pull_consumes_stream(monkeypatch):
     assert result["updates"] == 2
 
 
+def test_pull_reports_cumulative_bytes_across_layers(monkeypatch):
+    from seven.runtime.progress import progress_scope
+
+    lines = [
+        '{"status":"pulling manifest"}',
+        '{"status":"pulling a","digest":"a","total":100,"completed":40}',
+        '{"status":"pulling a","digest":"a","total":100,"completed":100}',
+        '{"status":"pulling b","digest":"b","total":50,"completed":10}',
+        '{"status":"success"}',
+    ]
+    monkeypatch.setattr(ollama_manager.requests, "request", lambda *a, **kw: Response(lines=lines))
+    updates = []
+    with progress_scope(updates.append, interval=0):
+        assert json.loads(ollama_manager.ollama_pull("qwen:7b"))["ok"] is True
+    assert [(u["progress"], u["total"]) for u in updates] == [(40, 100), (100, 100), (110, 150)]
+    assert updates[-1]["unit"] == "bytes" and updates[-1]["message"] == "qwen:7b: pulling b"
+
+
 def test_load_unload_copy_delete_payloads(monkeypatch):
     calls = []
     def request(method, url, **kwargs):
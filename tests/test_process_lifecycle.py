@@ -49,3 +49,91 @@ def test_process_tree_signals_descendants_before_parent(monkeypatch):
     monkeypatch.setattr(process_module.psutil, "wait_procs", lambda processes, timeout: (processes, []))
     assert process_module.terminate_process_tree(1) == (2, 3, 1)
     assert order == [2, 3, 1]
+
+
+def test_cancel_scope_stops_a_running_tree_and_skips_new_starts():
+    import threading
+    from seven.runtime.process import cancel_scope
+
+    cancel = threading.Event()
+    threading.Timer(0.3, cancel.set).start()
+    started = time.monotonic()
+    with cancel_scope(cancel):
+        result = run_tracked([sys.executable, "-c", "import time; time.sleep(30)"], timeout=60)
+        assert result.cancelled is True and result.timed_out is False
+        assert result.terminated_pids
+        assert time.monotonic() - started < 5
+        again = run_tracked([sys.executable, "-c", "print('never')"], timeout=5)
+    assert again.cancelled is True and again.returncode is None and again.stdout == ""
+
+
+def test_progress_scope_throttles_and_reports_running_processes():
+    from seven.runtime.progress import progress_scope, report_progress, reporting
+
+    updates = []
+    report_progress(1)  # no scope: ignored
+    with progress_scope(updates.append, interval=60):
+        assert reporting() is True
+        report_progress(1, 10, "first", unit="pages")
+        report_progress(2, 10)  # inside the interval: dropped
+        report_progress(10, 10, "done")  # final always goes out
+        with progress_scope(None):
+            assert reporting() is False
+            report_progress(3)
+    assert updates == [
+        {"progress": 1, "total": 10, "message": "first", "unit": "pages"},
+        {"progress": 10, "total": 10, "message": "done"},
+    ]
+
+    def broken(update):
+        raise RuntimeError("observer gone")
+
+    beats = []
+    with progress_scope(lambda update: (beats.append(update), broken(update)), interval=0):
+        result = run_tracked([sys.executable, "-c", "import time; time.sleep(2.3); print('ok')"], timeout=30)
+    assert result.stdout.strip() == "ok"
+    assert [beat["progress"] for beat in beats] == [1, 2]
+    assert beats[0]["unit"] == "seconds" and "running 1s" in beats[0]["message"]
+
+
+def test_streaming_output_keeps_bounded_head_and_tail_and_counts_bytes():
+    lines = []
+    code = (
+        "import sys\n"
+        "for i in range(20000): print(f'line {i:05d}')\n"
+        "print('warn', file=sys.stderr); sys.stderr.write('no newline')"
+    )
+    result = run_tracked(
+        [sys.executable, "-c", code], timeout=30,
+        stream=True, head_bytes=100, tail_bytes=200, on_line=lambda name, line: lines.append((name, line)),
+    )
+    assert result.returncode == 0 and result.truncated is True
+    assert result.stdout_bytes >= 20000 * len("line 00000\n")
+    head, marker, tail = result.stdout.partition(" bytes of stdout omitted] ...\n")
+    assert head.startswith("line 00000\nline 00001\n") and marker
+    assert tail.endswith("line 19999\n") and len(tail) == 200
+    assert result.stderr == "warn\nno newline" and result.stderr_bytes == len("warn\nno newline")
+    assert [l for n, l in lines if n == "stdout"][-1] == "line 19999"
+    assert [l for n, l in lines if n == "stdout"][:2] == ["line 00000", "line 00001"]
+    assert ("stderr", "no newline") in lines
+
+    small = run_tracked([sys.executable, "-c", "print('hi')"], timeout=30, stream=True)
+    assert small.stdout.strip() == "hi" and small.truncated is False and small.stdout_bytes > 0
+
+
+def test_streaming_timeout_still_terminates_the_tree(tmp_path):
+    marker = tmp_path / "child-survived.txt"
+    child_code = f"import time; time.sleep(1.2); open({str(marker)!r}, 'w').write('survived')"
+    parent = (
+        "import subprocess, sys, time\n"
+        f"subprocess.Popen([sys.executable, '-c', {child_code!r}])\n"
+        "print('started', flush=True)\n"
+        "time.sleep(30)\n"
+    )
+    started = time.monotonic()
+    result = run_tracked([sys.executable, "-c", parent], timeout=0.5, stream=True)
+    assert result.timed_out is True and len(result.terminated_pids) >= 2
+    assert result.stdout == "started\n"
+    assert time.monotonic() - started < 5
+    time.sleep(1.5)
+    assert not marker.exists()
@@ -0,0 +1,136 @@
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from seven.runtime import python_pool
+from seven.runtime.process import cancel_scope
+from seven.runtime.python_pool import PythonPool
+
+
+def _pool(tmp_path, **kwargs):
+    options = {"size": 1, "preload": ["json", "not_a_real_module_xyz"], "max_runs": 50, "max_rss_mb": 4096}
+    options.update(kwargs)
+    pool = PythonPool(cwd=str(tmp_path), **options)
+    pool.warm()
+    deadline = time.monotonic() + 30
+    while not pool.idle and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert pool.idle, "worker never became ready"
+    return pool
+
+
+def _script(tmp_path, name, code):
+    path = tmp_path / name
+    path.write_text(code, encoding="utf-8")
+    return str(path)
+
+
+def test_each_run_gets_a_fresh_main_namespace_and_real_exit_codes(tmp_path):
+    pool = _pool(tmp_path)
+    try:
+        worker = pool.idle[0]
+        assert worker.preloaded == ["json"]
+        first = pool.run(_script(tmp_path, "a.py", "leak = 1\nimport sys\nprint(__name__, sys.argv[0].endswith('a.py'))"), str(tmp_path), 10)
+        assert first.returncode == 0 and first.stdout == "__main__ True\n"
+        second = pool.run(_script(tmp_path, "b.py", "print('leak' in globals())"), str(tmp_path), 10)
+        assert second.stdout == "False\n"
+        failing = pool.run(_script(tmp_path, "c.py", "raise ValueError('boom')"), str(tmp_path), 10)
+        assert failing.returncode == 1
+        assert failing.stderr.startswith("Traceback") and "c.py" in failing.stderr and "python_worker" not in failing.stderr
+        exiting = pool.run(_script(tmp_path, "d.py", "import sys; sys.exit(3)"), str(tmp_path), 10)
+        assert exiting.returncode == 3
+        assert pool.idle == [worker] and worker.runs == 4
+    finally:
+        pool.close()
+
+
+def test_timeout_and_cancel_kill_the_job_tree_but_keep_a_forking_worker(tmp_path):
+    pool = _pool(tmp_path)
+    marker = tmp_path / "grandchild-survived.txt"
+    code = (
+        "import subprocess, sys, time\n"
+        f"subprocess.Popen([sys.executable, '-c', \"import time; time.sleep(1.5); open({str(marker)!r}, 'w').write('x')\"])\n"
+        "print('started', flush=True)\n"
+        "time.sleep(30)\n"
+    )
+    try:
+        worker = pool.idle[0]
+        started = time.monotonic()
+        result = pool.run(_script(tmp_path, "slow.py", code), str(tmp_path), 0.7)
+        assert result.timed_out is True and len(result.terminated_pids) >= 2
+        assert result.stdout == "started\n"
+        assert time.monotonic() - started < 5
+
+        cancel = threading.Event()
+        threading.Timer(0.5, cancel.set).start()
+        with cancel_scope(cancel):
+            cancelled = pool.run(_script(tmp_path, "slow2.py", "import time; time.sleep(30)"), str(tmp_path), 30)
+        assert cancelled.cancelled is True
+        if hasattr(os, "fork"):
+            assert pool.idle == [worker] and worker.alive()
+        time.sleep(1.8)
+        assert not marker.exists()
+    finally:
+        pool.close()
+
+
+def test_workers_are_recycled_by_run_count_and_memory(tmp_path):
+    pool = _pool(tmp_path, max_runs=2)
+    try:
+        first = pool.idle[0]
+        script = _script(tmp_path, "noop.py", "pass")
+        pool.run(script, str(tmp_path), 10)
+        pool.run(script, str(tmp_path), 10)
+        assert not first.alive() or first not in pool.idle
+        # The replacement warms in the background; meanwhile callers fall back.
+        deadline = time.monotonic() + 30
+        while not pool.idle and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert pool.idle and pool.idle[0] is not first
+        assert pool.workers == 1
+    finally:
+        pool.close()
+
+    hungry = _pool(tmp_path, max_rss_mb=0)
+    try:
+        worker = hungry.idle[0]
+        assert hungry.run(_script(tmp_path, "once.py", "print(1)"), str(tmp_path), 10).stdout == "1\n"
+        assert worker not in hungry.idle
+    finally:
+        hungry.close()
+
+
+def test_run_python_uses_warm_worker_and_falls_back_when_none_is_ready(tmp_path, monkeypatch):
+    from seven.tools import code_run
+
+    monkeypatch.setattr(code_run.config, "WORKSPACE_DIR", tmp_path)
+    pool = PythonPool(1, [], 50, 4096, str(tmp_path))
+    monkeypatch.setattr(code_run, "get_pool", lambda: pool)
+    try:
+        cold = code_run.run_python("print('cold')")
+        assert "STDOUT:\ncold" in cold and "runner=warm_worker" not in cold
+        deadline = time.monotonic() + 30
+        while not pool.idle and time.monotonic() < deadline:
+            time.sleep(0.02)
+        warm = code_run.run_python("print('warm')")
+        assert "runner=warm_worker" in warm and "STDOUT:\nwarm" in warm
+    finally:
+        pool.close()
+    monkeypatch.setattr(python_pool.config, "PYTHON_WORKERS", 0)
+    assert python_pool.get_pool() is None
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX output sizes")
+def test_large_output_is_bounded_like_streamed_commands(tmp_path, monkeypatch):
+    monkeypatch.setattr(python_pool.config, "PROCESS_OUTPUT_HEAD_BYTES", 64)
+    monkeypatch.setattr(python_pool.config, "PROCESS_OUTPUT_TAIL_BYTES", 64)
+    pool = _pool(tmp_path)
+    try:
+        result = pool.run(_script(tmp_path, "big.py", "print('x' * 1_000_000)"), str(tmp_path), 10)
+        assert result.truncated is True and result.stdout_bytes == 1_000_001
+        assert "bytes of stdout omitted" in result.stdout and len(result.stdout) < 300
+    finally:
+        pool.close()
@@ -185,6 +185,95 @@ def test_mock_brain_tool_round(tmp_path, monkeypatch):
     assert any(a["tool"] == "get_system_info" for a in audits)
 
 
+def test_handle_streams_turn_events_and_honours_cancel(tmp_path):
+    import threading
+    from seven.agent.loop import Seven
+    s = Seven(tool_tier="core")
+    s.memory = Memory(tmp_path / "stream.db")
+    s.tools = build_default_registry(s.memory, brain=None, tier="core")
+    replies = iter([
+        {"content": None, "tool_calls": [{"id": "1", "name": "get_system_info", "arguments": {}}]},
+        {"content": "All good.", "tool_calls": []},
+    ])
+
+    def fake_chat(messages, tools=None, on_token=None, **kwargs):
+        result = next(replies)
+        for word in (result["content"] or "").split(" "):
+            if word:
+                on_token(word)
+        return result
+
+    s.brain.chat = fake_chat  # type: ignore
+    events = []
+    assert s.handle("check", on_event=lambda kind, data: events.append((kind, data))) == "All good."
+    kinds = [k for k, _ in events]
+    assert kinds == ["round", "tool_call", "tool_result", "round", "token", "token"]
+    assert events[2][1]["name"] == "get_system_info" and events[2][1]["ok"] is True
+
+    cancel = threading.Event()
+    replies = iter([{"content": None, "tool_calls": [{"id": "1", "name": "get_system_info", "arguments": {}}]}] * 3)
+    s.brain.chat = lambda messages, tools=None, **kw: next(replies)  # type: ignore
+    def on_event(kind, data):
+        if kind == "tool_result":
+            cancel.set()
+    assert s.handle("again", on_event=on_event, cancel=cancel).startswith("Cancelled.")
+
+
+def test_handle_streams_tool_progress_and_cancels_tool_subprocesses(tmp_path):
+    import threading
+    from seven.agent.loop import Seven
+    from seven.runtime.process import run_tracked
+    from seven.runtime.progress import report_progress
+    s = Seven(tool_tier="core")
+    s.memory = Memory(tmp_path / "progress.db")
+    s.tools = ToolRegistry(memory=s.memory, tier="full")
+    outcomes = []
+
+    def long_job():
+        report_progress(1, 2, "half", unit="steps")
+        report_progress(2, 2, "all", unit="steps")
+        result = run_tracked([sys.executable, "-c", "import time; time.sleep(30)"], timeout=60)
+        outcomes.append(result)
+        return "stopped" if result.cancelled else "finished"
+
+    s.tools.register(Tool(name="long_job", description="", parameters={"type": "object"}, handler=long_job))
+    s.brain.chat = lambda messages, tools=None, **kw: {  # type: ignore
+        "content": None, "tool_calls": [{"id": "t1", "name": "long_job", "arguments": {}}],
+    }
+    cancel = threading.Event()
+    events = []
+
+    def on_event(kind, data):
+        events.append((kind, data))
+        if kind == "tool_progress" and data["progress"] == 2:
+            cancel.set()
+
+    assert s.handle("go", on_event=on_event, cancel=cancel).startswith("Cancelled.")
+    progress = [data for kind, data in events if kind == "tool_progress"]
+    assert progress == [
+        {"round": 0, "id": "t1", "name": "long_job", "progress": 1, "total": 2, "message": "half", "unit": "steps"},
+        {"round": 0, "id": "t1", "name": "long_job", "progress": 2, "total": 2, "message": "all", "unit": "steps"},
+    ]
+    assert outcomes[0].cancelled is True and outcomes[0].returncode is None
+
+
+def test_brain_folds_ollama_stream_into_one_reply():
+    class Stream:
+        def __enter__(self): return self
+        def __exit__(self, *exc): pass
+        def iter_lines(self):
+            yield b'{"message":{"role":"assistant","content":"Hel"},"done":false}'
+            yield b'{"message":{"role":"assistant","content":"lo"},"done":false}'
+            yield b'{"message":{"role":"assistant","content":"","tool_calls":[{"function":{"name":"x","arguments":{}}}]},"done":false}'
+            yield b'{"message":{"role":"assistant","content":""},"done":true,"eval_count":3}'
+
+    deltas = []
+    data = Brain._read_ollama_stream(Stream(), deltas.append)
+    assert deltas == ["Hel", "lo"]
+    assert data["message"]["content"] == "Hello" and data["eval_count"] == 3
+    assert Brain._parse_ollama_tool_calls(data["message"])[0]["name"] == "x"
+
+
 def test_local_commands(tmp_path):
     from seven.agent.loop import Seven
     s = Seven(tool_tier="core")
@@ -196,6 +285,70 @@ def test_local_commands(tmp_path):
     assert s.handle("/clear")
 
 
+def test_run_ephemeral_is_isolated_from_conversation_history(tmp_path):
+    import threading
+    from seven.agent.loop import Seven
+    s = Seven(tool_tier="core")
+    s.memory = Memory(tmp_path / "eph.db")
+    s.memory.add_message("user", "main thread secret")
+    seen = []
+
+    def chat(messages, tools=None, **kw):
+        seen.append((list(messages), tools))
+        if tools and len(seen) == 1:
+            return {"role": "assistant", "content": "", "tool_calls": [{"id": "1", "name": "list_dir", "arguments": {"path": "."}}]}
+        return {"role": "assistant", "content": "eph-ok", "tool_calls": []}
+
+    s.brain.chat = chat  # type: ignore
+    result = s.run_ephemeral("summarize", system="One word.")
+    assert result["status"] == "ok" and result["reply"] == "eph-ok"
+    assert result["tools"] and result["tools"][0].startswith("list_dir:")
+    messages, tools = seen[0]
+    assert [m["role"] for m in messages] == ["system", "user"] and tools
+    assert messages[0]["content"].endswith("One word.")
+    assert "main thread secret" not in str(messages)
+    assert s.memory.message_count() == 1  # nothing written back
+
+    seen.clear()
+    assert s.run_ephemeral("plain", use_tools=False)["reply"] == "eph-ok"
+    assert seen[0][1] is None
+    cancel = threading.Event()
+    cancel.set()
+    assert s.run_ephemeral("stop", cancel=cancel)["status"] == "cancelled"
+    assert s.memory.message_count() == 1
+
+
+def test_status_snapshot_reads_cached_state_without_turn_lock(tmp_path):
+    import threading
+    import time
+    from seven.agent.loop import Seven
+    s = Seven(tool_tier="core")
+    s.memory = Memory(tmp_path / "snap.db")
+    s.memory.add_message("user", "hello")
+    held = threading.Event()
+    release = threading.Event()
+
+    def hold():
+        with s._lock:
+            held.set()
+            release.wait(5)
+
+    worker = threading.Thread(target=hold)
+    worker.start()
+    try:
+        assert held.wait(2)
+        started = time.monotonic()
+        snap = s.status_snapshot(max_age=0)
+        assert time.monotonic() - started < 1
+    finally:
+        release.set()
+        worker.join(5)
+    assert snap["counts"]["messages"] == 1
+    assert set(snap["freshness"]) == {"ollama", "living", "counts"}
+    assert "Seven Real" in s.status_text(snap)
+    assert s.status_snapshot()["freshness"]["counts"] == snap["freshness"]["counts"]  # TTL-cached
+
+
 def test_api_handler_chat(tmp_path, monkeypatch):
     """stdlib API /chat uses Seven.handle — no live network bind required for logic."""
     from seven.ui import api_server
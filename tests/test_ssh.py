@@ -19,8 +19,8 @@ def test_run_builds_strict_noninteractive_argv(monkeypatch, tmp_path):
     known.write_text("host key", encoding="utf-8")
     captured = {}
 
-    def fake_run(args, timeout):
-        captured.update(args=args, timeout=timeout)
+    def fake_run(args, timeout, **kwargs):
+        captured.update(args=args, timeout=timeout, **kwargs)
         return ProcessResult(args, 0, "remote output", "")
 
     monkeypatch.setattr(ssh.shutil, "which", lambda name: f"/usr/bin/{name}")
@@ -33,6 +33,7 @@ def test_run_builds_strict_noninteractive_argv(monkeypatch, tmp_path):
     assert "PasswordAuthentication=no" in args
     assert args[-2:] == ["seven-user@server.example", "uname -a"]
     assert captured["timeout"] == 17
+    assert captured["stream"] is True
 
 
 def test_invalid_target_and_missing_identity_never_start(monkeypatch, tmp_path):
@@ -45,19 +46,28 @@ def test_invalid_target_and_missing_identity_never_start(monkeypatch, tmp_path):
 
 def test_timeout_and_output_bounds_are_visible(monkeypatch):
     monkeypatch.setattr(ssh.shutil, "which", lambda name: f"/usr/bin/{name}")
-    monkeypatch.setattr(ssh, "run_tracked", lambda args, timeout: ProcessResult(args, -9, "x" * 60000, "y" * 30000, True, (10, 11)))
+    caps = {}
+
+    def bounded(args, timeout, **kwargs):
+        caps.update(kwargs)
+        return ProcessResult(
+            args, -9, "x" * 10 + "\n... [59960 bytes of stdout omitted] ...\n" + "x" * 40, "", True, (10, 11),
+            stdout_bytes=60_010, stderr_bytes=0, truncated=True,
+        )
+
+    monkeypatch.setattr(ssh, "run_tracked", bounded)
     result = json.loads(ssh.ssh_run("host", "user", "sleep 99", timeout=2))
     assert result["ok"] is False
     assert result["timed_out"] is True
     assert result["terminated_pids"] == [10, 11]
-    assert result["output_truncated"] is True
-    assert len(result["stdout"]) == 50000
+    assert result["output_truncated"] is True and result["stdout_bytes"] == 60_010
+    assert caps["stream"] is True and caps["head_bytes"] + caps["tail_bytes"] == 50_000
 
 
 def test_copy_directions_and_local_preconditions(monkeypatch, tmp_path):
     calls = []
     monkeypatch.setattr(ssh.shutil, "which", lambda name: f"/usr/bin/{name}")
-    monkeypatch.setattr(ssh, "run_tracked", lambda args, timeout: calls.append(args) or ProcessResult(args, 0, "", ""))
+    monkeypatch.setattr(ssh, "run_tracked", lambda args, timeout, **kwargs: calls.append(args) or ProcessResult(args, 0, "", ""))
     source = tmp_path / "source.txt"
     source.write_text("seven", encoding="utf-8")
     assert json.loads(ssh.ssh_copy_to("host", "user", str(source), "/tmp/remote file"))["ok"] is True
@@ -67,7 +77,7 @@ def test_copy_directions_and_local_preconditions(monkeypatch, tmp_path):
     assert missing["state"] == "not_started"
 
     destination = tmp_path / "nested" / "download.txt"
-    def download(args, timeout):
+    def download(args, timeout, **kwargs):
         destination.write_text("received", encoding="utf-8")
         calls.append(args)
         return ProcessResult(args, 0, "", "")
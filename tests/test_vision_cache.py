@@ -0,0 +1,101 @@
+import io
+import logging
+
+import pytest
+from PIL import Image, ImageDraw
+
+from seven.tools import vision, vision_cache
+from seven.tools.vision_cache import HASH_BITS, VisionCache, dhash, hamming
+
+
+def _screen(label="Inbox (3)", seed=0):
+    img = Image.new("RGB", (1280, 800), (235, 235, 235))
+    draw = ImageDraw.Draw(img)
+    for n in range(12):
+        x, y = (n * 97 + seed * 311) % 1100, (n * 61 + seed * 127) % 700
+        draw.rectangle([x, y, x + 160, y + 90], fill=((n * 40 + seed * 90) % 255, 90, (n * 17) % 255))
+    draw.text((40, 40), label, fill=(0, 0, 0))
+    return img
+
+
+def _jpeg(img, quality=75):
+    buf = io.BytesIO()
+    img.save(buf, format="JPEG", quality=quality)
+    return Image.open(io.BytesIO(buf.getvalue()))
+
+
+class FakeBrain:
+    vision_model = "fake-vision"
+
+    def __init__(self):
+        self.calls = []
+        self.answer = "A desktop with colored windows."
+
+    def vision(self, prompt, image_b64, system=None):
+        self.calls.append(prompt)
+        return self.answer
+
+
+@pytest.fixture
+def brain(monkeypatch):
+    fake = FakeBrain()
+    monkeypatch.setattr(vision, "_brain", fake)
+    monkeypatch.setattr(vision_cache, "_CACHE", VisionCache(max_distance=4, ttl=60))
+    return fake
+
+
+def test_dhash_tolerates_reencoding_and_separates_scenes():
+    base = dhash(_screen())
+    assert 0 < base < 2 ** HASH_BITS
+    assert hamming(base, dhash(_jpeg(_screen(), 60))) <= 4
+    assert hamming(base, dhash(_screen(seed=1))) > 40
+
+
+def test_unchanged_image_reuses_answer_and_logs_skipped_swap(tmp_path, brain, caplog):
+    path = tmp_path / "shot.jpg"
+    _screen().save(path, quality=75)
+    first = vision.analyze_image(str(path), "What is open?")
+    assert first == brain.answer and len(brain.calls) == 1
+
+    _jpeg(_screen()).save(path, quality=70)
+    with caplog.at_level(logging.INFO, logger="seven.vision"):
+        second = vision.analyze_image(str(path), "  what is OPEN? ")
+    assert len(brain.calls) == 1
+    assert second.startswith("[cached vision answer: image within ") and second.endswith(brain.answer)
+    assert "skipped fake-vision call" in caplog.text
+
+    vision.analyze_image(str(path), "Any error dialogs?")
+    vision.analyze_image(str(path), "What is open?", fresh=True)
+    _screen(seed=2).save(path)
+    vision.analyze_image(str(path), "What is open?")
+    assert len(brain.calls) == 4
+    assert vision_cache.get_vision_cache().hits == 1
+
+    brain.answer = ""
+    _screen(seed=3).save(path)
+    assert "empty vision response" in vision.analyze_image(str(path), "Describe")
+    assert "empty vision response" in vision.analyze_image(str(path), "Describe")
+    assert len(brain.calls) == 6
+
+
+def test_cache_expires_bounds_entries_and_can_be_disabled(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(vision_cache.time, "monotonic", lambda: clock[0])
+    cache = VisionCache(max_distance=2, ttl=30, max_prompts=2)
+    cache.store(0b1011, "q", "m", "old")
+    cache.store(0b1010, "q", "m", "new")  # within distance: replaces the near-duplicate
+    assert cache.lookup(0b1011, "q", "m").answer == "new"
+    assert cache.lookup(0b1011, "q", "other-model") is None
+    assert cache.lookup(0b1111_0000, "q", "m") is None
+    clock[0] += 31
+    assert cache.lookup(0b1010, "q", "m") is None
+
+    for n in range(vision_cache.PER_PROMPT + 5):
+        cache.store(0xFFFF << (16 * n), "many", "m", str(n))
+    assert len(cache._entries[("many", "m")]) == vision_cache.PER_PROMPT
+    cache.store(1, "third", "m", "x")
+    assert ("q", "m") not in cache._entries and len(cache._entries) == 2
+
+    off = VisionCache(max_distance=4, ttl=0)
+    off.store(1, "q", "m", "a")
+    assert off.lookup(1, "q", "m") is None and not off.enabled
@@ -0,0 +1,126 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from seven.tools import http_client, web
+
+PAGE = (
+    b"<html><head><title>Demo &amp; test</title><style>p{color:red}</style></head>"
+    b"<body><script>var x = '<p>no</p>';</script><h1>Heading</h1><p>First   para\n with <b>bold</b> text.</p>"
+    b"<ul><li>one</li><li>two</li></ul></body></html>"
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    hits: dict = {}
+    ports: set = set()
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        type(self).hits[self.path] = type(self).hits.get(self.path, 0) + 1
+        type(self).ports.add(self.client_address[1])
+        headers = {"Content-Type": "text/html; charset=utf-8"}
+        body = PAGE
+        if self.path == "/etag":
+            headers.update({"ETag": '"v1"', "Cache-Control": "no-cache"})
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.send_header("ETag", '"v1"')
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+        elif self.path == "/fresh":
+            headers["Cache-Control"] = "max-age=60"
+        elif self.path == "/nostore":
+            headers.update({"Cache-Control": "no-store", "ETag": '"x"'})
+        elif self.path == "/big":
+            headers.update({"Content-Type": "text/plain", "Cache-Control": "max-age=60"})
+            body = b"abcdefghij" * 300_000
+        elif self.path == "/missing":
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_client.config, "HTTP_CACHE_DIR", tmp_path / "http_cache")
+    monkeypatch.setattr(http_client.config, "HTTP_CACHE_MB", 50)
+    monkeypatch.setattr(http_client, "_CACHE", None)
+    _Handler.hits, _Handler.ports = {}, set()
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_repeated_fetches_hit_or_revalidate_over_one_pooled_connection(server):
+    first = web.web_fetch(server + "/etag")
+    assert "cache=miss" in first and first.endswith("\n\nDemo & test\nHeading\nFirst para with bold text.\none\ntwo")
+    assert "cache=revalidated" in web.web_fetch(server + "/etag")
+    assert _Handler.hits["/etag"] == 2
+
+    assert "cache=miss" in web.web_fetch(server + "/fresh")
+    assert "cache=hit" in web.web_fetch(server + "/fresh") and _Handler.hits["/fresh"] == 1
+    web.web_fetch(server + "/nostore")
+    assert "cache=miss" in web.web_fetch(server + "/nostore") and _Handler.hits["/nostore"] == 2
+    assert len(_Handler.ports) == 1  # keep-alive: every request reused one socket
+    assert web.web_fetch(server + "/missing").startswith("ERROR web_fetch: 404")
+
+
+def test_bodies_stop_at_the_byte_cap_and_partial_entries_serve_smaller_caps(server):
+    result = http_client.fetch(server + "/big", max_bytes=100_000)
+    assert (len(result.body), result.truncated, result.cache) == (100_000, True, "miss")
+    again = http_client.fetch(server + "/big", max_bytes=50_000)
+    assert (len(again.body), again.truncated, again.cache) == (50_000, True, "hit")
+    bigger = http_client.fetch(server + "/big", max_bytes=200_000)
+    assert (len(bigger.body), bigger.cache) == (200_000, "miss") and _Handler.hits["/big"] == 2
+    assert web.web_fetch(server + "/big", max_chars=25).endswith("\n\nabcdefghijabcdefghijabcde\n...[truncated]")
+
+
+def test_cache_rules_and_pruning(tmp_path):
+    assert http_client.freshness_lifetime({"cache-control": "public, max-age=120"}) == 120
+    assert http_client.freshness_lifetime({"cache-control": "no-cache, max-age=120"}) == 0
+    dated = {"date": "Mon, 01 Jan 2024 00:00:00 GMT", "last-modified": "Fri, 22 Dec 2023 00:00:00 GMT"}
+    assert http_client.freshness_lifetime(dated) == 10 * 24 * 3600 * 0.1
+    assert http_client.freshness_lifetime({**dated, "expires": "Mon, 01 Jan 2024 00:01:00 GMT"}) == 60
+    assert not http_client.storable(200, {"cache-control": "max-age=60", "vary": "*"})
+    assert not http_client.storable(200, {})
+    assert http_client.storable(200, {"etag": '"a"'})
+
+    store = http_client.HttpCache(tmp_path, max_bytes=25)
+    for index in range(4):
+        store.put(f"http://x/{index}", 200, {"etag": '"a"'}, bytes([index]) * 10, complete=True)
+    store.put("http://x/dup", 200, {"etag": '"a"'}, bytes([3]) * 10, complete=True)
+    store.prune()
+    assert [url for url in ("http://x/0", "http://x/1", "http://x/2", "http://x/3", "http://x/dup") if store.get(url)] == [
+        "http://x/2", "http://x/3", "http://x/dup",
+    ]
+    assert len(list((tmp_path / "bodies").glob("*/*"))) == 2
+
+
+def test_html_text_is_extracted_in_one_streaming_pass():
+    text, cut = http_client.extract_text(iter([PAGE[:40], PAGE[40:90], PAGE[90:]]), "utf-8", 1000, html=True)
+    assert (text, cut) == ("Demo & test\nHeading\nFirst para with bold text.\none\ntwo", False)
+    latin = b'<meta charset="iso-8859-1"><p>caf\xe9</p>'
+    assert http_client.html_to_text(latin, {"content-type": "text/html"}, 100) == ("café", False)
+
+    fed = []
+    chunks = (fed.append(n) or b"<p>" + b"word " * 50 + b"</p>" for n in range(100))
+    text, cut = http_client.extract_text(chunks, "utf-8", 300, html=True)
+    assert cut and len(text) == 300 and len(fed) < 5
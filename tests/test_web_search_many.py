@@ -0,0 +1,109 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, urlsplit
+
+import pytest
+
+from seven.tools import http_client, web
+
+RESULTS = {
+    "alpha": [("Shared", "/shared/?utm_source=ddg"), ("Alpha only", "/alpha"), ("Third", "/third")],
+    "beta": [("Beta only", "/beta"), ("Shared again", "/shared#top"), ("Third", "/third")],
+    "gamma": [("Shared", "/shared")],
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    lock = threading.Lock()
+    active = peak = 0
+    pages: list = []
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        if parts.path != "/html/":
+            type(self).pages.append(parts.path)
+            return self._send(200, f"<html><body><p>Page {parts.path} body text.</p></body></html>".encode())
+        query = parse_qs(parts.query)["q"][0]
+        with self.lock:
+            type(self).active += 1
+            type(self).peak = max(type(self).peak, type(self).active)
+        time.sleep(0.2)
+        with self.lock:
+            type(self).active -= 1
+        if query == "broken":
+            return self._send(500, b"")
+        base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        rows = "".join(
+            f'<div class="result"><h2><a rel="nofollow" class="result__a" '
+            f'href="//duckduckgo.com/l/?uddg={quote(base + path, safe="")}&amp;rut=x">{title}</a></h2>'
+            f'<a class="result__snippet" href="#">About <b>{title}</b></a></div>'
+            for title, path in RESULTS.get(query, [])
+        )
+        self._send(200, f"<html><body>{rows}</body></html>".encode())
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_client.config, "HTTP_CACHE_DIR", tmp_path / "http_cache")
+    monkeypatch.setattr(http_client, "_CACHE", None)
+    monkeypatch.setattr(web.config, "WEB_SEARCH_WORKERS", 4)
+    _Handler.active = _Handler.peak = 0
+    _Handler.pages = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{httpd.server_address[1]}"
+    monkeypatch.setattr(web, "SEARCH_URL", base + "/html/?q={query}")
+    try:
+        yield base
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_queries_run_concurrently_and_merge_by_canonical_url(engine):
+    started = time.perf_counter()
+    out = web.web_search_many(["alpha", "beta", "gamma", "alpha"])
+    assert time.perf_counter() - started < 0.5 and _Handler.peak == 3
+    lines = out.splitlines()
+    assert lines[:4] == ["Search results for 3 queries (4 unique URLs):", "  q1: alpha", "  q2: beta", "  q3: gamma"]
+    assert lines[4:8] == [
+        "1. Shared", f"   {engine}/shared/?utm_source=ddg", "   [q1,q2,q3]", "   > About Shared",
+    ]
+    assert [line for line in lines if line[:1].isdigit()] == ["1. Shared", "2. Third", "3. Beta only", "4. Alpha only"]
+    assert _Handler.pages == []
+
+
+def test_prefetch_reads_top_pages_and_failures_are_reported(engine):
+    out = web.web_search_many("alpha\nbroken", max_results=2, prefetch=2, prefetch_chars=12)
+    assert "  query 2 failed: 500" in out
+    assert "   > Page /shared ..." in out and "   > Page /alpha ..." in out and "\n3. " not in out
+    assert sorted(_Handler.pages) == ["/alpha", "/shared/"]
+    assert web.web_search_many(["broken"]).startswith("ERROR web_search_many: query 1 failed: 500")
+    assert web.web_search_many([" "]) == "ERROR web_search_many: no queries"
+
+
+def test_result_parsing_and_canonical_urls():
+    page = (
+        '<a class="result__a" href="//duckduckgo.com/l/?uddg=https%3A%2F%2Fa.org%2Fx%3Fy%3D1&amp;rut=z">A &amp; <b>B</b></a>'
+        '<a class="result__snippet">first</a><a class="result__a" href="https://b.org/">Plain</a>'
+    )
+    assert web.parse_results(page) == [
+        web.SearchResult("A & B", "https://a.org/x?y=1", "first"), web.SearchResult("Plain", "https://b.org/", ""),
+    ]
+    assert web.canonical_url("https://www.A.org/x/?utm_medium=m&id=2#f") == web.canonical_url("http://a.org/x?id=2")
+    assert web.canonical_url("https://a.org:8443/") == "a.org:8443/"
+    assert web.canonical_url("https://a.org/x/?id=2&utm_source=s") == "a.org/x?id=2"
+    assert web.canonical_url("/l/?q=x") == "/l?q=x"
+    assert web.canonical_url("/l/?q=x") != web.canonical_url("/m/?q=x")
@@ -0,0 +1,107 @@
+import os
+import sys
+import time
+
+import pytest
+
+from seven.memory import file_index
+from seven.memory.file_index import FileIndex
+from seven.tools import workspace
+
+
+def _tree(root):
+    root.mkdir()
+    (root / ".gitignore").write_text("build/\n", encoding="utf-8")
+    (root / "build").mkdir()
+    (root / "build" / "out.py").write_text("def compiled_thing(): pass\n", encoding="utf-8")
+    (root / "src").mkdir()
+    (root / "src" / "parser.py").write_text("def parse_config(text):\n    return text\n", encoding="utf-8")
+    (root / "notes.md").write_text("Meeting notes about the parser rewrite\n", encoding="utf-8")
+    (root / "blob.bin").write_bytes(b"parser\0\x01")
+
+
+def test_first_build_indexes_text_heads_and_logs_no_changes(tmp_path):
+    _tree(tmp_path / "ws")
+    index = FileIndex(tmp_path / "ws", db_path=tmp_path / "index.db", watch=False)
+    assert index.refresh()["mode"] == "walk" and index.refresh()["mode"] == "cached"
+    assert index.summary()["files"] == 4
+    assert [hit["path"] for hit in index.find("parse_config")] == ["src/parser.py"]
+    assert {hit["path"] for hit in index.find("parser")} == {"src/parser.py", "notes.md"}  # binary heads are not indexed
+    assert index.find("compiled") == [] and index.find("   ") == []
+    assert index.changes_since(0) == []
+
+
+def test_rescan_rereads_only_changed_files_and_logs_changes(tmp_path, monkeypatch):
+    root = tmp_path / "ws"
+    _tree(root)
+    index = FileIndex(root, db_path=tmp_path / "index.db", watch=False)
+    index.refresh()
+    read = []
+    fingerprint = file_index._fingerprint
+    monkeypatch.setattr(file_index, "_fingerprint", lambda path, size: read.append(path) or fingerprint(path, size))
+
+    (root / "notes.md").write_text("Meeting notes about the lexer\n", encoding="utf-8")
+    os.utime(root / "src" / "parser.py", ns=(1, 1))  # touched, same bytes
+    (root / "blob.bin").unlink()
+    (root / "src" / "new.py").write_text("x = 1\n", encoding="utf-8")
+    stats = index.refresh(max_age=0)
+    assert (stats["added"], stats["modified"], stats["deleted"]) == (1, 1, 1)
+    assert sorted(os.path.basename(path) for path in read) == ["new.py", "notes.md", "parser.py"]
+    assert {(change["path"], change["kind"]) for change in index.changes_since(0)} == {
+        ("notes.md", "modified"), ("blob.bin", "deleted"), ("src/new.py", "added"),
+    }
+    assert index.find("lexer")[0]["path"] == "notes.md" and index.find("rewrite") == []
+
+    read.clear()
+    index.refresh(max_age=0)
+    assert read == []
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux only")
+def test_watcher_updates_single_paths_and_rescans_new_directories(tmp_path):
+    root = tmp_path / "ws"
+    _tree(root)
+    index = FileIndex(root, db_path=tmp_path / "index.db", watch=True)
+    try:
+        index.refresh()
+        assert index.watcher is not None
+        (root / "src" / "parser.py").write_text("def parse_yaml(text):\n    pass\n", encoding="utf-8")
+        (root / "build" / "ignored.py").write_text("x\n", encoding="utf-8")
+        time.sleep(0.3)
+        assert index.refresh()["mode"] == "watch"
+        assert index.find("parse_yaml")[0]["path"] == "src/parser.py"
+        assert index.find("ignored") == []
+
+        (root / "docs").mkdir()
+        (root / "docs" / "guide.md").write_text("installation guide\n", encoding="utf-8")
+        time.sleep(0.3)
+        assert index.refresh()["mode"] == "walk"
+        assert index.find("installation")[0]["path"] == "docs/guide.md"
+    finally:
+        index.close()
+
+
+def test_workspace_tools_report_matches_and_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_index.config, "FILE_INDEX_DIR", tmp_path / "index")
+    monkeypatch.setattr(file_index.config, "FILE_INDEX_WATCH", False)
+    monkeypatch.setattr(file_index.config, "FILE_INDEX_MAX_AGE", 0)
+    monkeypatch.setattr(file_index, "_INDEXES", {})
+    root = tmp_path / "ws"
+    _tree(root)
+    # A fresh index has logged no changes; the answer still shows what the workspace holds.
+    survey = workspace.workspace_changes_since("", 20, root=str(root)).splitlines()
+    assert survey[0].startswith(f"root={root.resolve()} files=4") and survey[1].startswith("No changes since ")
+    assert sorted(line.split(" (")[0] for line in survey[2:]) == [".gitignore", "blob.bin", "notes.md", "src/parser.py"]
+    out = workspace.find_indexed("parse config", root=str(root))
+    assert out.splitlines()[0].startswith(f"root={root.resolve()} files=4")
+    assert out.splitlines()[1].startswith("src/parser.py (")
+    assert workspace.find_indexed("zebra", root=str(root)).startswith("No indexed files")
+
+    started = time.time()
+    (root / "todo.txt").write_text("ship it\n", encoding="utf-8")
+    changes = workspace.workspace_changes_since(str(started - 1), root=str(root))
+    assert changes.splitlines()[1].startswith("added    todo.txt")
+    quiet = workspace.workspace_changes_since(str(time.time() + 60), limit=2, root=str(root)).splitlines()
+    assert quiet[1].startswith("No changes since ") and len(quiet) == 4 and quiet[2].startswith("todo.txt (8 bytes)")
+    assert workspace.workspace_changes_since("yesterday", root=str(root)).startswith("ERROR")
+    assert workspace.find_indexed("x", root=str(tmp_path / "missing")).startswith("ERROR")